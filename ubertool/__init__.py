@@ -1,10 +1,13 @@
+import logging
 import sys
 import os
 
 # Add the root of the "ubertool" (git) submodule to Python PATH
 # This allows the REST_UBER modules to import models from ubertool module
 # E.g.: from terrplant import terrplant_exe as terrplant
+# (the models themselves are imported on first use, see base.model_registry)
 
 ubertool_dir = os.path.dirname(__file__)
-sys.path.append(ubertool_dir)
-print("Added to PYTHONPATH: {}".format(ubertool_dir))
+if ubertool_dir not in sys.path:
+    sys.path.append(ubertool_dir)
+    logging.info("Added to PYTHONPATH: {}".format(ubertool_dir))
@@ -0,0 +1,73 @@
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import logging
+import numpy as np
+import os
+import sqlite3
+import threading
+
+
+class AgdriftDepositionStore(object):
+    """
+    Read-only, in-memory copy of the agdrift distance vs deposition database table.
+    The whole table is read once (one connection, one query) and every column (the distance column and each
+    deposition scenario) is held as a numpy array that is served by column name.
+    """
+
+    def __init__(self, db_name, db_table):
+        """Load all columns of 'db_table' from the sqlite database 'db_name'"""
+        self.db_name = db_name
+        self.db_table = db_table
+        self.mtime = os.path.getmtime(db_name)
+
+        conn = sqlite3.connect(db_name)
+        try:
+            result = conn.execute("SELECT * from " + db_table)
+            self.column_names = [description[0] for description in result.description]
+            rows = result.fetchall()
+        finally:
+            conn.close()
+
+        self.columns = {}
+        for j, name in enumerate(self.column_names):
+            column = np.array([self.to_float(row[j]) for row in rows], dtype='float')
+            column.flags.writeable = False  # shared across model runs; callers receive copies
+            self.columns[name] = column
+        logging.info('loaded agdrift deposition data: ' + str(db_name))
+
+    @staticmethod
+    def to_float(value):
+        # blank database fields become 'nan' (for later filtering)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def get_column(self, name):
+        """
+        :description returns the (read-only) array of values of a database column
+        :param name: column name (the distance column or a deposition scenario name)
+        :return:
+        """
+        return self.columns[name]
+
+
+_deposition_stores = {}
+_deposition_stores_lock = threading.Lock()
+
+
+def get_deposition_store(db_name, db_table):
+    """
+    :description returns the process-wide deposition data store for a database table; the table is (re)loaded the
+    :            first time it is requested and whenever the modification time of the database file changes
+    :param db_name: path of sqlite database file
+    :param db_table: name of database table holding the distance vs deposition data
+    :return:
+    """
+    key = (os.path.abspath(db_name), db_table)
+    mtime = os.path.getmtime(db_name)
+    with _deposition_stores_lock:
+        store = _deposition_stores.get(key)
+        if store is None or store.mtime != mtime:
+            store = AgdriftDepositionStore(db_name, db_table)
+            _deposition_stores[key] = store
+    return store
@@ -3,12 +3,10 @@ import logging
 import numpy as np
 import os
 import pandas as pd
-import scipy.interpolate as interp
-from scipy import integrate
-from scipy.optimize import curve_fit
+# scipy (interpolate, integrate) is imported when deposition curves are first built (it is the bulk of the import time
+# of agdrift)
 # import sqlalchemy_utils as sqlu
 import sys
-import csv
 
 
 #find parent directory and import model
@@ -17,6 +15,7 @@ import csv
 
 from base.uber_model import UberModel, ModelSharedInputs
 from .agdrift_functions import AgdriftFunctions
+from .agdrift_extended_curves import load_extended_curves
 
 class AgdriftInputs(ModelSharedInputs):
     """
@@ -116,301 +115,250 @@ class Agdrift(UberModel, AgdriftInputs, AgdriftOutputs, AgdriftFunctions):
 
     def determine_model_exe_direction(self):
         """
-        :description decide per simulation which model direction to execute (forward or inverse calculation)
+        :description decide per group of simulations which model direction to execute (forward or inverse calculation)
+        :            simulations are grouped by scenario, calculation input and ecosystem type; each group is processed
+        :            with array operations and the results are placed in the output series of its simulations
         :param
         :param
         :NOTE
         :return:
         """
 
-        # loop through simulations calculating necessary interopolations/integrations and units conversions
-        for i in range(self.num_simulations):
-            if 'Invalid' not in self.out_sim_scenario_chk[i]:  # process only valid simulation scenarios
-
-                # locate index of scenario that applies to this simulation
-                for j in range(self.num_scenarios):
-                    if self.out_sim_scenario_id[i] == self.scenario_name[j]:
-                        scenario_index = j
-
-                #for debugging purposes
-                #self.write_arrays_to_csv(self.scenario_distance_data[scenario_index],
-                #                    self.scenario_deposition_data[scenario_index], "dist_dep.csv")
-
-                # determine area/length/depth of area of concern
-                self.out_area_width[i], self.out_area_length[i], self.out_area_depth[i] = self.determine_area_dimensions(i)
-
-                #initalize internal variables
-                avg_dep_foa = avg_dep_lbac = avg_dep_gha = avg_field_dep_mgcm2 = \
-                                  avg_waterconc_ngl = np.nan
-
-                #choose and execute path through model (there are 5 inverse calculation paths and 1 forward calculation path)
-
-                #inverse calculations
-                if (self.calculation_input[i] == "fraction_of_applied"):
-
-                    avg_dep_foa = self.user_frac_applied[i]  #from the user input
-
-                    avg_dep_lbac = self.calc_avg_dep_lbac(avg_dep_foa, self.application_rate[i])
-                    avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
-
-                    if (self.ecosystem_type[i] == "terrestrial_assessment"):
-                        avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
-                    else: #this is an Aquatic assessment, thus calculate the water concentration
-                        avg_waterconc_ngl = self.calc_avg_waterconc_ngl(avg_dep_lbac, self.out_area_width[i],
-                                                                        self.out_area_length[i], self.out_area_depth[i])
-                    #set variables for inverse calculations
-                    npts = len(self.scenario_distance_data[scenario_index])
-                    x_in = self.scenario_distance_data[scenario_index]
-                    y_in = self.scenario_deposition_data[scenario_index]
-                    width = self.out_area_width[i]
-
-
-                    #call inverse calculation method
-                    if (self.ecosystem_type[i] == "aquatic_assessment" or
-                                self.terrestrial_field_type[i] == "user_defined_terrestrial"):
-                        x_out, y_out, npts_out, self.out_distance_downwind[i], self.out_range_chk[i]  = \
-                            self.locate_integrated_avg(npts, x_in, y_in, width, avg_dep_foa)
-                        #self.out_distance_downwind[i] = out_dist
-                        #self.out_range_chk[i] = out_range
-                    else:  #this is an EPA Defined Terrestrial (which calculates for a 'point' rather than an area)
-                        self.out_distance_downwind[i], self.out_range_chk[i] = \
-                            self.find_dep_pt_location(x_in, y_in, npts, avg_dep_foa)
-
-                elif (self.calculation_input[i] == "initial_deposition_gha"):
-
-                    avg_dep_gha = self.user_avg_dep_gha[i]    #from the user input
-
-                    avg_dep_lbac = self.calc_avg_dep_lbac_from_gha(avg_dep_gha)
-                    avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, self.application_rate[i])
-
-                    if (self.ecosystem_type[i] == "terrestrial_assessment"):
-                        avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
-                    else: #this is an Aquatic assessment, thus calculate the water concentration
-                        avg_waterconc_ngl = self.calc_avg_waterconc_ngl(avg_dep_lbac, self.out_area_width[i],
-                                                                        self.out_area_length[i], self.out_area_depth[i])
-                    #set variables for inverse calculations
-                    npts = len(self.scenario_distance_data[scenario_index])
-                    x_in = self.scenario_distance_data[scenario_index]
-                    y_in = self.scenario_deposition_data[scenario_index]
-                    width = self.out_area_width[i]
-
-                    #call inverse calculation method
-                    if (self.ecosystem_type[i] == "aquatic_assessment" or
-                                self.terrestrial_field_type[i] == "user_defined_terrestrial"):
-                        x_out, y_out, npts_out, self.out_distance_downwind[i], self.out_range_chk[i]  = \
-                            self.locate_integrated_avg(npts, x_in, y_in, width, avg_dep_foa)
-                        #self.out_distance_downwind[i] = out_dist
-                        #self.out_range_chk[i] = out_range
-                    else:  #this is an EPA Defined Terrestrial (which calculates for a 'point' rather than an area)
-                        self.out_distance_downwind[i], self.out_range_chk[i] = \
-                            self.find_dep_pt_location(x_in, y_in, npts, avg_dep_foa)
-
-                elif (self.calculation_input[i] == "initial_deposition_lbac"):
-
-                    avg_dep_lbac = self.user_avg_dep_lbac[i]
-
-                    avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
-                    avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, self.application_rate[i])
-
-                    if (self.ecosystem_type[i] == "terrestrial_assessment"):
-                        avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
-                    else:  #this is an Aquatic assessment, thus calculate the water concentration
-                        avg_waterconc_ngl = self.calc_avg_waterconc_ngl(avg_dep_lbac, self.out_area_width[i],
-                                                                        self.out_area_length[i], self.out_area_depth[i])
-                    #set variables for inverse calculations
-                    npts = len(self.scenario_distance_data[scenario_index])
-                    x_in = self.scenario_distance_data[scenario_index]
-                    y_in = self.scenario_deposition_data[scenario_index]
-                    width = self.out_area_width[i]
-
-                    #call inverse calculation method
-                    if (self.ecosystem_type[i] == "aquatic_assessment" or
-                                self.terrestrial_field_type[i] == "user_defined_terrestrial"):
-                        x_out, y_out, npts_out, self.out_distance_downwind[i], self.out_range_chk[i]  = \
-                            self.locate_integrated_avg(npts, x_in, y_in, width, avg_dep_foa)
-                        #self.out_distance_downwind[i] = out_dist
-                        #self.out_range_chk[i] = out_range
-                    else:  #this is an EPA Defined Terrestrial (which calculates for a 'point' rather than an area)
-                        self.out_distance_downwind[i], self.out_range_chk[i] = \
-                            self.find_dep_pt_location(x_in, y_in, npts, avg_dep_foa)
-
-
-                elif (self.calculation_input[i] == "initial_concentration_ngL"):
-
-                    avg_waterconc_ngl = self.user_avg_conc_ngl[i]
-
-                    avg_dep_lbac = self.calc_avg_dep_lbac_from_waterconc_ngl(avg_waterconc_ngl, self.out_area_width[i],
-                                                                             self.out_area_length[i], self.out_area_depth[i])
-                    avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
-                    avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, self.application_rate[i])
-
-                    # call inverse calculation method
-                    npts = len(self.scenario_distance_data[scenario_index])
-                    x_in = self.scenario_distance_data[scenario_index]
-                    y_in = self.scenario_deposition_data[scenario_index]
-                    width = self.out_area_width[i]
-
-                    x_out, y_out, npts_out, out_dist, out_range = self.locate_integrated_avg(npts, x_in, y_in, width,
-                                                                                              avg_dep_foa)
-                    self.out_distance_downwind[i] = out_dist
-                    self.out_range_chk[i] = out_range
-
-
-                elif (self.calculation_input[i] == "initial_deposition_mgcm2"):
-
-                    avg_field_dep_mgcm2 = self.user_avg_dep_mgcm2[i]
-
-                    avg_dep_lbac = self.calc_avg_dep_lbac_from_mgcm2(avg_field_dep_mgcm2)
-                    avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
-                    avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, self.application_rate[i])
-
-                    # call inverse calculation method
-                    npts = len(self.scenario_distance_data[scenario_index])
-                    x_in = self.scenario_distance_data[scenario_index]
-                    y_in = self.scenario_deposition_data[scenario_index]
-                    width = self.out_area_width[i]
-
-                    if (self.terrestrial_field_type[i] == 'user_defined_terrestrial'):
-                        #for User Defined Terrestrial we're looking for an average deposition over a field
-                        x_out, y_out, npts_out, out_dist, out_range = self.locate_integrated_avg(npts, x_in, y_in,
-                                                                                                  width, avg_dep_foa)
-                        self.out_distance_downwind[i] = out_dist
-                        self.out_range_chk[i] = out_range
-                    else:  # EPA Defined Terrestrial: this option simply locates a point deposition distance rather than an area average
-                        continuing = True
-                        j = 0
-                        while continuing:
-                            if (x_in[j] <= self.max_distance):  #only allow point depositions within the max distance of the original deposition vs distance data
-                                if (y_in[j] < avg_dep_foa):
-                                    if (j > 0):
-                                        fraction = (y_in[j-1] - avg_dep_foa) / (y_in[j-1] - y_in[j])
-                                        out_dist = x_in[j-1] + fraction * (x_in[j] - x_in[j-1])
-
-                                        # the following code represents OPP protocol to round up x_dist_of_interest to nearest x midpoint or boundary value
-                                        # (except when x_dist_of_interest is in the range of the first 2 meters (i.e., 6.5616 ft)
-                                        if (fraction <= 0.5 and out_dist > 3.2808):
-                                            round_up_x_dist = 0.5 * (x_in[j] + x_in[j-1])
-                                        elif (fraction > 0.5 and out_dist > 3.2808):
-                                            round_up_x_dist = x_in[j]
-                                        else:
-                                            round_up_x_dist = 3.2808
-                                        if (out_dist > 3.2808 and out_dist < 6.5616):
-                                            round_up_x_dist = 6.5616
-                                        self.out_distance_downwind[i] = round_up_x_dist  #i is simulation number
-                                    else:
-                                        self.out_distance_downwind[i] = 0.0
-                                    continuing = False
-                                j += 1
-                            else:
-                                self.out_distance_downwind[i] = np.nan
-                                self.out_range_chk[i] = "out of range"
-                                continuing = False
-
-                elif (self.calculation_input[i] == "distance_to_point_or_area_ft"):  # forward calculation
-                    avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2 = \
-                        self.execute_interpolations_integrations(i, scenario_index)
-                    self.out_distance_downwind[i] = self.downwind_distance[i] #just placing this in the output for clarity and consistency
+        # process only valid simulation scenarios
+        sims = np.array([i for i in range(self.num_simulations) if 'Invalid' not in self.out_sim_scenario_chk[i]],
+                        dtype='int')
 
-                else:
-                    sys.exit("Invalid choice of calculation method")
+        # determine area/length/depth of area of concern
+        self.determine_area_dimensions(sims)
 
-                if self.round:
-                    self.round_model_outputs(avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl,
-                                             avg_field_dep_mgcm2, i)
-                else:
-                    self.out_avg_dep_foa[i] = avg_dep_foa
-                    self.out_avg_dep_lbac[i] = avg_dep_lbac
-                    self.out_avg_dep_gha[i] = avg_dep_gha
-                    self.out_avg_waterconc_ngl[i] = avg_waterconc_ngl
-                    self.out_avg_field_dep_mgcm2[i] = avg_field_dep_mgcm2
-        return
+        # group simulations by (index of scenario that applies to the simulation, calculation input, ecosystem type)
+        scenario_indices = dict((self.scenario_name[j], j) for j in range(self.num_scenarios))
+        sim_groups = {}
+        for i in sims:
+            sim_groups.setdefault((scenario_indices[self.out_sim_scenario_id[i]], self.calculation_input[i],
+                                   self.ecosystem_type[i]), []).append(i)
 
-    def execute_interpolations_integrations(self,i, scenario_index):
-        #for current simulation calculate necessary interopolations/integrations and units conversions
+        for (scenario_index, calculation_input, ecosystem_type), group_sims in sim_groups.items():
+            group_sims = np.array(group_sims, dtype='int')
+            avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2 = \
+                self.execute_sim_group(scenario_index, calculation_input, ecosystem_type, group_sims)
 
-        #intialize internal variable datatypes and set as nan
-        avg_dep_foa = avg_dep_lbac = avg_dep_gha = avg_waterconc_ngl = \
-                            avg_field_dep_mgcm2 = np.nan #float('nan')
+            if self.round:
+                self.round_model_outputs(avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl,
+                                         avg_field_dep_mgcm2, group_sims)
+            else:
+                self.out_avg_dep_foa[group_sims] = avg_dep_foa
+                self.out_avg_dep_lbac[group_sims] = avg_dep_lbac
+                self.out_avg_dep_gha[group_sims] = avg_dep_gha
+                self.out_avg_waterconc_ngl[group_sims] = avg_waterconc_ngl
+                self.out_avg_field_dep_mgcm2[group_sims] = avg_field_dep_mgcm2
+        return
 
-        # set distance from edge of application area to user specified initial point of interest
-        distance_downwind_short = self.downwind_distance[i]
+    def execute_sim_group(self, scenario_index, calculation_input, ecosystem_type, sims):
+        """
+        :description execute the model direction of a group of simulations sharing scenario, calculation input and
+        :            ecosystem type (there are 5 inverse calculation paths and 1 forward calculation path)
+        :param scenario_index: index of scenario that applies to the simulations
+        :param calculation_input: calculation input of the simulations
+        :param ecosystem_type: ecosystem type of the simulations
+        :param sims: array of simulation numbers
+        :return: arrays of avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2
+        """
 
-         # perform integration across areas and calculate relevant average water concentrations and aerial deposition rates
-        if (self.ecosystem_type[i] == 'aquatic_assessment' or
-                (self.ecosystem_type[i] == 'terrestrial_assessment' and
-                         self.terrestrial_field_type[i] == 'user_defined_terrestrial')):
+        #for debugging purposes
+        #self.write_arrays_to_csv(self.scenario_distance_data[scenario_index],
+        #                    self.scenario_deposition_data[scenario_index], "dist_dep.csv")
+
+        #initalize internal variables
+        avg_dep_foa = np.full(len(sims), np.nan)
+        avg_dep_lbac = np.full(len(sims), np.nan)
+        avg_dep_gha = np.full(len(sims), np.nan)
+        avg_field_dep_mgcm2 = np.full(len(sims), np.nan)
+        avg_waterconc_ngl = np.full(len(sims), np.nan)
+
+        application_rate = np.asarray(self.application_rate[sims], dtype='float')
+        area_width = np.asarray(self.out_area_width[sims], dtype='float')
+        area_length = np.asarray(self.out_area_length[sims], dtype='float')
+        area_depth = np.asarray(self.out_area_depth[sims], dtype='float')
+        terrestrial_field_type = np.asarray(self.terrestrial_field_type[sims], dtype='object')
+
+        #set variables for inverse calculations
+        npts = len(self.scenario_distance_data[scenario_index])
+        x_in = self.scenario_distance_data[scenario_index]
+        y_in = self.scenario_deposition_data[scenario_index]
+
+        #inverse calculations
+        if (calculation_input in ["fraction_of_applied", "initial_deposition_gha", "initial_deposition_lbac"]):
+
+            if (calculation_input == "fraction_of_applied"):
+                avg_dep_foa = np.asarray(self.user_frac_applied[sims], dtype='float')  #from the user input
+                avg_dep_lbac = self.calc_avg_dep_lbac(avg_dep_foa, application_rate)
+                avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
+            elif (calculation_input == "initial_deposition_gha"):
+                avg_dep_gha = np.asarray(self.user_avg_dep_gha[sims], dtype='float')  #from the user input
+                avg_dep_lbac = self.calc_avg_dep_lbac_from_gha(avg_dep_gha)
+                avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, application_rate)
+            else:
+                avg_dep_lbac = np.asarray(self.user_avg_dep_lbac[sims], dtype='float')
+                avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
+                avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, application_rate)
 
-            # set distance value to downwind side of area for which  integration is needed
-            distance_downwind_long = distance_downwind_short + self.out_area_width[i]
+            if (ecosystem_type == "terrestrial_assessment"):
+                avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
+            else: #this is an Aquatic assessment, thus calculate the water concentration
+                avg_waterconc_ngl = self.calc_avg_waterconc_ngl(avg_dep_lbac, area_width, area_length, area_depth)
 
-            # check if distance (from edge of application area) to upwind edge of waterbody is <= 997 and that
-            # self.out_area_width[i] >= 6.56 & <= 997
-            # if these conditions are not met then invalidate this simulation (997 is the furthest distance for which deposition data is available)
-            if (distance_downwind_short <= self.max_distance and self.out_area_width[i] <= self.max_distance and
-                        self.out_area_width[i] >= self.min_area_width):
+            #call inverse calculation method
+            if (ecosystem_type == "aquatic_assessment"):
+                area_avg = np.ones(len(sims), dtype='bool')
+            else:  #EPA Defined Terrestrial calculates for a 'point' rather than an area
+                area_avg = (terrestrial_field_type == "user_defined_terrestrial")
+            self.out_distance_downwind[sims[area_avg]], self.out_range_chk[sims[area_avg]] = \
+                self.locate_integrated_avgs(x_in, y_in, area_width[area_avg], avg_dep_foa[area_avg])
+            self.out_distance_downwind[sims[~area_avg]], self.out_range_chk[sims[~area_avg]] = \
+                self.find_dep_pt_locations(x_in, y_in, npts, avg_dep_foa[~area_avg])
 
-                # integrate over distance from nearest to furthest downwind points of pond/wetland/field
-                integration_result = integrate.romberg(self.scenario_interp_func[scenario_index],
-                                                       distance_downwind_short, distance_downwind_long, divmax=15)
+        elif (calculation_input == "initial_concentration_ngL"):
 
-                # calculate output variables
-                avg_dep_foa = self.calc_avg_dep_foa(integration_result, self.out_area_width[i])
-                avg_dep_lbac = self.calc_avg_dep_lbac(avg_dep_foa, self.application_rate[i])
-                avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
+            avg_waterconc_ngl = np.asarray(self.user_avg_conc_ngl[sims], dtype='float')
 
-                # calculate water concentration for waterbody or area avg deposition rate for terrestrial area
-                if (self.ecosystem_type[i] == 'aquatic_assessment'):
-                    avg_waterconc_ngl = self.calc_avg_waterconc_ngl(avg_dep_lbac,
-                                        self.out_area_width[i], self.out_area_length[i], self.out_area_depth[i])
-                elif (self.ecosystem_type[i] == 'terrestrial_assessment'):
-                    avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
+            avg_dep_lbac = self.calc_avg_dep_lbac_from_waterconc_ngl(avg_waterconc_ngl, area_width, area_length,
+                                                                     area_depth)
+            avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
+            avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, application_rate)
 
-            else:
-                # set simulation_check variable to invalid
-                self.out_sim_scenario_chk[i] = self.out_sim_scenario_chk[i].replace('Valid', 'Invalid') + \
-                                               ' Due to Distance Violation'
+            # call inverse calculation method
+            self.out_distance_downwind[sims], self.out_range_chk[sims] = \
+                self.locate_integrated_avgs(x_in, y_in, area_width, avg_dep_foa)
 
-        elif (self.ecosystem_type[i] == 'terrestrial_assessment' and
-                      self.terrestrial_field_type[i] == 'epa_defined_terrestrial'):
+        elif (calculation_input == "initial_deposition_mgcm2"):
 
-            # just interested in point deposition (no integration)
+            avg_field_dep_mgcm2 = np.asarray(self.user_avg_dep_mgcm2[sims], dtype='float')
 
-            # calculate output variables
-            #call interpolation function for downwind distance short
-            avg_dep_foa = self.scenario_interp_func[scenario_index](distance_downwind_short)  # simply the fraction of applied deposition value at the point of intesest
-            avg_dep_lbac = self.calc_avg_dep_lbac(avg_dep_foa, self.application_rate[i])
+            avg_dep_lbac = self.calc_avg_dep_lbac_from_mgcm2(avg_field_dep_mgcm2)
             avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
-            avg_field_dep_mgcm2 = self.calc_avg_fielddep_mgcm2(avg_dep_lbac)
+            avg_dep_foa = self.calc_avg_dep_foa_from_lbac(avg_dep_lbac, application_rate)
+
+            # call inverse calculation method
+            #for User Defined Terrestrial we're looking for an average deposition over a field
+            area_avg = (terrestrial_field_type == 'user_defined_terrestrial')
+            self.out_distance_downwind[sims[area_avg]], self.out_range_chk[sims[area_avg]] = \
+                self.locate_integrated_avgs(x_in, y_in, area_width[area_avg], avg_dep_foa[area_avg])
+            # EPA Defined Terrestrial: this option simply locates a point deposition distance rather than an area average
+            # (only allow point depositions within the max distance of the original deposition vs distance data)
+            self.out_distance_downwind[sims[~area_avg]], self.out_range_chk[sims[~area_avg]] = \
+                self.find_dep_pt_locations(x_in, y_in, npts, avg_dep_foa[~area_avg], self.max_distance)
+
+        elif (calculation_input == "distance_to_point_or_area_ft"):  # forward calculation
+            avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2 = \
+                self.execute_interpolations_integrations(sims, scenario_index)
+            self.out_distance_downwind[sims] = self.downwind_distance[sims] #just placing this in the output for clarity and consistency
+
+        else:
+            sys.exit("Invalid choice of calculation method")
+
+        return avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2
+
+    def execute_interpolations_integrations(self, sims, scenario_index):
+        #for a group of simulations calculate necessary interopolations/integrations and units conversions
+
+        #intialize internal variable datatypes and set as nan
+        avg_dep_foa = np.full(len(sims), np.nan)
+        avg_dep_lbac = np.full(len(sims), np.nan)
+        avg_dep_gha = np.full(len(sims), np.nan)
+        avg_waterconc_ngl = np.full(len(sims), np.nan)
+        avg_field_dep_mgcm2 = np.full(len(sims), np.nan)
+
+        ecosystem_type = np.asarray(self.ecosystem_type[sims], dtype='object')
+        terrestrial_field_type = np.asarray(self.terrestrial_field_type[sims], dtype='object')
+        application_rate = np.asarray(self.application_rate[sims], dtype='float')
+        area_width = np.asarray(self.out_area_width[sims], dtype='float')
+
+        # set distance from edge of application area to user specified initial point of interest
+        distance_downwind_short = np.asarray(self.downwind_distance[sims], dtype='float')
+
+        # perform integration across areas and calculate relevant average water concentrations and aerial deposition rates
+        aquatic = (ecosystem_type == 'aquatic_assessment')
+        user_terrestrial = ((ecosystem_type == 'terrestrial_assessment') &
+                            (terrestrial_field_type == 'user_defined_terrestrial'))
+        epa_terrestrial = ((ecosystem_type == 'terrestrial_assessment') &
+                           (terrestrial_field_type == 'epa_defined_terrestrial'))
+
+        # check if distance (from edge of application area) to upwind edge of waterbody is <= 997 and that
+        # self.out_area_width[i] >= 6.56 & <= 997
+        # if these conditions are not met then invalidate this simulation (997 is the furthest distance for which deposition data is available)
+        area = aquatic | user_terrestrial
+        in_range = ((distance_downwind_short <= self.max_distance) & (area_width <= self.max_distance) &
+                    (area_width >= self.min_area_width))
+        for i in sims[area & ~in_range]:
+            # set simulation_check variable to invalid
+            self.out_sim_scenario_chk[i] = self.out_sim_scenario_chk[i].replace('Valid', 'Invalid') + \
+                                           ' Due to Distance Violation'
+        area = area & in_range
+
+        # integrate over distance from nearest to furthest downwind points of pond/wetland/field
+        integration_result = self.integrate_deposition(scenario_index, distance_downwind_short[area],
+                                                       distance_downwind_short[area] + area_width[area])
+
+        # calculate output variables
+        avg_dep_foa[area] = self.calc_avg_dep_foa(integration_result, area_width[area])
+
+        # just interested in point deposition (no integration) for EPA Defined Terrestrial
+        #call interpolation function for downwind distance short
+        avg_dep_foa[epa_terrestrial] = self.scenario_interp_func[scenario_index](distance_downwind_short[epa_terrestrial])  # simply the fraction of applied deposition value at the point of intesest
+
+        avg_dep_lbac = self.calc_avg_dep_lbac(avg_dep_foa, application_rate)
+        avg_dep_gha = self.calc_avg_dep_gha(avg_dep_lbac)
+
+        # calculate water concentration for waterbody or area avg deposition rate for terrestrial area
+        aquatic = aquatic & area
+        avg_waterconc_ngl[aquatic] = self.calc_avg_waterconc_ngl(avg_dep_lbac[aquatic], area_width[aquatic],
+                                                                 np.asarray(self.out_area_length[sims], dtype='float')[aquatic],
+                                                                 np.asarray(self.out_area_depth[sims], dtype='float')[aquatic])
+        terrestrial = (user_terrestrial & area) | epa_terrestrial
+        avg_field_dep_mgcm2[terrestrial] = self.calc_avg_fielddep_mgcm2(avg_dep_lbac[terrestrial])
 
         return avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl, avg_field_dep_mgcm2
 
+    def integrate_deposition(self, scenario_index, distance_short, distance_long):
+        """
+        :description integrates the deposition curve of a scenario from each near to far downwind distance
+        :            (linear interpolation is integrated exactly from cumulative areas; other interpolators via romberg)
+        :param scenario_index: index of scenario
+        :param distance_short: array of near downwind distances
+        :param distance_long: array of far downwind distances
+        :return: array of integration results
+        """
+        x_in = np.asarray(self.scenario_distance_data[scenario_index], dtype='float')
+        if (np.any(distance_short < x_in[0]) or np.any(distance_long > x_in[-1])):
+            raise ValueError("A value in x_new is outside the interpolation range.")
+        if (self.interpolator == 'linear'):
+            y_in = self.scenario_deposition_data[scenario_index]
+            return (self.cumulative_area(x_in, y_in, distance_long) -
+                    self.cumulative_area(x_in, y_in, distance_short))
+        from scipy import integrate
+        return np.array([integrate.romberg(self.scenario_interp_func[scenario_index], short, long, divmax=15)
+                         for short, long in zip(distance_short, distance_long)], dtype='float')
+
     def create_deposition_curve(self):
         # load, process/filter, and create interpolation function for deposition data for all deposition scenarios incluced
         # in this model simulation run
+        # use the precomputed extended curves stored next to the database when they are current
+        # (see agdrift_extended_curves; built by build_extended_curves)
+        import scipy.interpolate as interp
+        extended_curves = load_extended_curves(self.db_name, self.extended_curve_params())
         for i in range(self.num_scenarios):
             if (self.num_scenario_sims[i] > 0):  # only get data if scenario is included in 1 or more simulations
-                self.scenario_raw_data[i] = self.get_scenario_deposition_data(self.scenario_name[i], self.num_db_values)
-
-                # process raw data to remove blank values from distance and deposition arrays
-                self.scenario_distance_data[i], self.scenario_deposition_data[i] = self.filter_arrays(
-                    self.distances_temp, self.scenario_raw_data[i])  # always send in the original distance_temp array
-
-                # extend distance vs deposition curve data (done for all curves)
-
-                x_values = self.scenario_distance_data[i]
-                y_values = self.scenario_deposition_data[i]
-                self.scenario_distance_data[i], self.scenario_deposition_data[i] = \
-                    self.extend_curve_opp(x_values, y_values, self.max_distance, self.distance_inc, self.num_pts_extend,
-                                      self.extend_ln_ln)
-
-                #verify monotonicity and whether increasing/decreasing
-                dep_series = np.asarray(self.scenario_deposition_data[i])
-                if (np.all(dep_series[1:] >= dep_series[:-1])):
-                    self.data_series_type[i] = 'monotonic-increasing'
-                elif (np.all(dep_series[1:] <= dep_series[:-1])):
-                    self.data_series_type[i] = 'monotonic-decreasing'
+                if (extended_curves is not None and self.scenario_name[i] in extended_curves):
+                    self.scenario_raw_data[i] = self.get_scenario_deposition_data(self.scenario_name[i],
+                                                                                  self.num_db_values)
+                    x_values, y_values, self.data_series_type[i] = extended_curves[self.scenario_name[i]]
+                    self.scenario_distance_data[i] = pd.Series(np.array(x_values))
+                    self.scenario_deposition_data[i] = pd.Series(np.array(y_values))
                 else:
-                    self.data_series_type[i] = 'non-monotonic'
+                    # process raw data (remove blank values), extend curve and verify monotonicity
+                    self.scenario_raw_data[i], self.scenario_distance_data[i], self.scenario_deposition_data[i], \
+                        self.data_series_type[i] = self.extend_scenario_curve(self.scenario_name[i])
 
                 # establish functions for deposition curve to facilitate interpolation and integration
                 self.scenario_interp_func[i] = interp.interp1d(self.scenario_distance_data[i],
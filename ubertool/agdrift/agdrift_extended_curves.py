@@ -0,0 +1,114 @@
+"""
+Precomputed (extended) distance vs deposition curves for agdrift.
+
+The extended curves and their monotonicity flags depend only on the deposition database and a few model constants,
+so they can be built once (see AgdriftFunctions.build_extended_curves) and stored next to the database:
+    <db>_extended_curves.npy   (2 x total number of curve points; row 0 distances, row 1 depositions; memory-mapped)
+    <db>_extended_curves.json  (scenario names, curve offsets, monotonicity flags, constants, database checksum)
+The stored curves are used only if the database content and the constants match those used to build them.
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import sys
+import threading
+
+
+def extended_curves_paths(db_name):
+    """
+    :description names of the data (.npy) and description (.json) files holding the extended curves for a database
+    :param db_name: path of sqlite database file
+    :return:
+    """
+    root = os.path.splitext(db_name)[0]
+    return root + '_extended_curves.npy', root + '_extended_curves.json'
+
+
+def db_checksum(db_name):
+    # content based identification of the database (file modification times do not survive copies/checkouts)
+    with open(db_name, 'rb') as db_file:
+        return hashlib.sha1(db_file.read()).hexdigest()
+
+
+def write_extended_curves(db_name, params, curves):
+    """
+    :description stores extended curves next to the database
+    :param db_name: path of sqlite database file the curves are derived from
+    :param params: dictionary of model constants used to build the curves
+    :param curves: list of (scenario name, distance array, deposition array, data series type) tuples
+    :return: paths of the data and description files
+    """
+    data_path, desc_path = extended_curves_paths(db_name)
+
+    offsets = np.zeros(len(curves) + 1, dtype=int)
+    offsets[1:] = np.cumsum([len(curve[1]) for curve in curves])
+    data = np.zeros((2, offsets[-1]), dtype='float')
+    for i, (name, x_values, y_values, series_type) in enumerate(curves):
+        data[0, offsets[i]:offsets[i + 1]] = x_values
+        data[1, offsets[i]:offsets[i + 1]] = y_values
+    np.save(data_path, data)
+
+    description = {'db_checksum': db_checksum(db_name),
+                   'params': params,
+                   'scenario_name': [curve[0] for curve in curves],
+                   'data_series_type': [curve[3] for curve in curves],
+                   'offsets': offsets.tolist()}
+    with open(desc_path, 'w') as desc_file:
+        json.dump(description, desc_file, indent=2)
+    logging.info('wrote agdrift extended curves: ' + data_path)
+    return data_path, desc_path
+
+
+_loaded_curves = {}
+_loaded_curves_lock = threading.Lock()
+
+
+def load_extended_curves(db_name, params):
+    """
+    :description loads the stored extended curves of a database (curve arrays are read-only memory-mapped views)
+    :param db_name: path of sqlite database file
+    :param params: dictionary of model constants the curves must have been built with
+    :return: dictionary of scenario name -> (distance array, deposition array, data series type), or None if no
+    :        stored curves exist or they do not match the database content/constants
+    """
+    data_path, desc_path = extended_curves_paths(db_name)
+    if not (os.path.isfile(data_path) and os.path.isfile(desc_path)):
+        return None
+
+    key = (os.path.abspath(desc_path), os.path.getmtime(desc_path), os.path.getmtime(data_path),
+           os.path.getmtime(db_name))
+    with _loaded_curves_lock:
+        if key not in _loaded_curves:
+            with open(desc_path) as desc_file:
+                description = json.load(desc_file)
+            if description['db_checksum'] != db_checksum(db_name):
+                logging.info('agdrift extended curves are out of date: ' + desc_path)
+                _loaded_curves[key] = None
+            else:
+                data = np.load(data_path, mmap_mode='r')
+                offsets = description['offsets']
+                curves = {}
+                for i, name in enumerate(description['scenario_name']):
+                    curves[name] = (data[0, offsets[i]:offsets[i + 1]], data[1, offsets[i]:offsets[i + 1]],
+                                    description['data_series_type'][i])
+                _loaded_curves[key] = (description['params'], curves)
+        loaded = _loaded_curves[key]
+
+    if loaded is None or loaded[0] != params:
+        return None
+    return loaded[1]
+
+
+if __name__ == '__main__':
+    # build step: python -m ubertool.agdrift.agdrift_extended_curves [path to sqlite_agdrift_distance.db]
+    import pandas as pd
+    from .agdrift_exe import Agdrift
+
+    agdrift = Agdrift(pd.DataFrame(), pd.DataFrame())
+    if len(sys.argv) > 1:
+        agdrift.db_name = sys.argv[1]
+    agdrift.set_global_constants()
+    print(agdrift.build_extended_curves())
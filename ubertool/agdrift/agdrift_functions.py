@@ -4,16 +4,17 @@ import logging
 import numpy as np
 import os
 import pandas as pd
-from scipy.optimize import curve_fit
 # from sqlalchemy import Column, Table, Integer, Float, String, create_engine
 # from sqlalchemy.ext.declarative import declarative_base
 # from sqlalchemy.orm import sessionmaker, scoped_session
 # from sqlalchemy import *
 # import sqlalchemy_utils as sqlu
-import sqlite3
 import time
 import csv
 
+from .agdrift_deposition_store import get_deposition_store
+from .agdrift_extended_curves import write_extended_curves
+
 # metadata = MetaData()
 
 
@@ -356,7 +357,7 @@ class AgdriftFunctions(object):
     def determine_area_dimensions(self, i):
         """
         :description determine relevant area/length/depth of waterbody or terrestrial area
-        :param i: simulation number
+        :param i: simulation number (or array of simulation numbers)
         :param ecosystem_type: type of assessment to be conducted
         :param aquatic_body_type: source of dimensional data for area (EPA or User defined)
         :param terrestrial_field_type: source of dimensional data for area (EPA or User defined)
@@ -369,32 +370,37 @@ class AgdriftFunctions(object):
         :return:
         """
 
-        if (self.ecosystem_type[i] == 'aquatic_assessment'):
-            if (self.aquatic_body_type[i] == 'epa_defined_pond'):
-                self.out_area_width[i] = self.default_width
-                self.out_area_length[i] = self.default_length
-                self.out_area_depth[i] = self.default_pond_depth
-            elif (self.aquatic_body_type[i] == 'epa_defined_wetland'):
-                self.out_area_width[i] = self.default_width
-                self.out_area_length[i] = self.default_length
-                self.out_area_depth[i] = self.default_wetland_depth
-            elif (self.aquatic_body_type[i] == 'user_defined_pond'):
-                self.out_area_width[i] = self.user_pond_width[i]
-                self.out_area_length[i] = self.sqft_per_hectare / self.out_area_width[i]
-                self.out_area_depth[i] = self.user_pond_depth[i]
-            elif (self.aquatic_body_type[i] == 'user_defined_wetland'):
-                self.out_area_width[i] = self.user_wetland_width[i]
-                self.out_area_length[i] = self.sqft_per_hectare / self.out_area_width[i]
-                self.out_area_depth[i] = self.user_wetland_depth[i]
-        elif (self.ecosystem_type[i] == 'terrestrial_assessment'):
-            if (self.terrestrial_field_type[i] == 'user_defined_terrestrial'):  # implies user to specify an area width
-                self.out_area_width[i] = self.user_terrestrial_width[i]
-                self.out_area_length[i] = self.sqft_per_hectare / self.out_area_width[i]
-                self.out_area_depth[i] = 0.  # terrestrial areas have no depth
-            else:  #this is the EPA Defined Terrestrial (i.e., a point as opposed to an area) for which we don't need dimensions
-                self.out_area_width[i] = 0.
-                self.out_area_length[i] = 0.
-                self.out_area_depth[i] = 0.
+        sims = np.atleast_1d(i)  # a single simulation or an array of simulations
+        ecosystem_type = np.asarray(self.ecosystem_type[sims], dtype='object')
+        aquatic_body_type = np.asarray(self.aquatic_body_type[sims], dtype='object')
+        terrestrial_field_type = np.asarray(self.terrestrial_field_type[sims], dtype='object')
+        user_pond_width = np.asarray(self.user_pond_width[sims], dtype='float')
+        user_wetland_width = np.asarray(self.user_wetland_width[sims], dtype='float')
+        user_terrestrial_width = np.asarray(self.user_terrestrial_width[sims], dtype='float')
+
+        aquatic = (ecosystem_type == 'aquatic_assessment')
+        terrestrial = (ecosystem_type == 'terrestrial_assessment')
+        area_types = [aquatic & (aquatic_body_type == 'epa_defined_pond'),
+                      aquatic & (aquatic_body_type == 'epa_defined_wetland'),
+                      aquatic & (aquatic_body_type == 'user_defined_pond'),
+                      aquatic & (aquatic_body_type == 'user_defined_wetland'),
+                      terrestrial & (terrestrial_field_type == 'user_defined_terrestrial'),  # implies user to specify an area width
+                      terrestrial & (terrestrial_field_type != 'user_defined_terrestrial')]  # EPA Defined Terrestrial is a point (no dimensions)
+
+        # simulations matching none of the area types keep their current dimensions
+        with np.errstate(divide='ignore'):
+            self.out_area_width[sims] = np.select(area_types, [self.default_width, self.default_width, user_pond_width,
+                                                               user_wetland_width, user_terrestrial_width, 0.],
+                                                  default=np.asarray(self.out_area_width[sims], dtype='float'))
+            self.out_area_length[sims] = np.select(area_types, [self.default_length, self.default_length,
+                                                                self.sqft_per_hectare / user_pond_width,
+                                                                self.sqft_per_hectare / user_wetland_width,
+                                                                self.sqft_per_hectare / user_terrestrial_width, 0.],
+                                                   default=np.asarray(self.out_area_length[sims], dtype='float'))
+            self.out_area_depth[sims] = np.select(area_types, [self.default_pond_depth, self.default_wetland_depth,
+                                                               self.user_pond_depth[sims], self.user_wetland_depth[sims],
+                                                               0., 0.],  # terrestrial areas have no depth
+                                                  default=np.asarray(self.out_area_depth[sims], dtype='float'))
         return self.out_area_width[i], self.out_area_length[i], self.out_area_depth[i]
     
     def extend_dist_dep_curve(self,i):
@@ -458,6 +464,7 @@ class AgdriftFunctions(object):
             return a * x_array + b
 
         # use scipy's curve fit and get the coefficients for the established function
+        from scipy.optimize import curve_fit
         coefficients, pcov = curve_fit(func, x_array, y_array)
         coef_a = coefficients[0]
         coef_b = coefficients[1]
@@ -550,6 +557,7 @@ class AgdriftFunctions(object):
             return a * x_fitting_pts + b
 
         # use scipy's curve fit and get the coefficients for the established function
+        from scipy.optimize import curve_fit
         coefficients, pcov = curve_fit(func, x_fitting_pts, y_fitting_pts)
         coef_a = coefficients[0]
         coef_b = coefficients[1]
@@ -680,13 +688,9 @@ class AgdriftFunctions(object):
         :return:
         """
 
-        # connect to the sql database and get column names (1st column will be the distances
+        # get column names from the (cached) sql database table (1st column will be the distances
         # rather than a scenario name)
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        get_table = cursor.execute("SELECT * from " + self.db_table)
-        conn.close()
-        col_names = [description[0] for description in get_table.description]
+        col_names = list(get_deposition_store(self.db_name, self.db_table).column_names)
         # col_names = get_table.keys() sql_alchemy
         print(col_names)
         if len(col_names) > 0:
@@ -721,19 +725,7 @@ class AgdriftFunctions(object):
         :NOTE any blank fields are filled with 'nan'
         :return:
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        result = cursor.execute("SELECT " + self.distance_name + " from " + self.db_table)
-
-        data = pd.Series(np.zeros(num_values))
-        for i, row in enumerate(result):
-            try:
-                temp = float(row[0])
-                data[i] = temp.real
-            except:
-                data[i] = 'nan'  # fill in empty elements (should not be any empty elements for distance array)
-        conn.close()
-        return data
+        return self.get_column_data(self.distance_name, num_values)
 
     def get_scenario_deposition_data(self, scenario, num_values):
         """
@@ -744,28 +736,72 @@ class AgdriftFunctions(object):
         :return:
         """
 
-        # establish connection and target scenario data
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        return self.get_column_data(scenario, num_values)
 
-        #testing for column names
-        string_query = 'SELECT * from ' + self.db_table
-        logging.info(string_query)
-        result1 = cursor.execute(string_query)
-                             #col_names = result1.keys()
-                             #logging.info(col_names)
+    def get_column_data(self, column_name, num_values):
+        """
+        :description retrieves the values of a column (distances or deposition data for a scenario) from the
+        :            process-wide in-memory copy of the sql database table (see agdrift_deposition_store)
+        :param column_name: name of the sql database column
+        :param num_values: number of values included in scenario datasets
+        :NOTE any blank fields are filled with 'nan'
+        :return:
+        """
+        values = get_deposition_store(self.db_name, self.db_table).get_column(column_name)
+        data = pd.Series(np.zeros(max(num_values, len(values))))
+        data[:len(values)] = values
+        return data
 
-        result = conn.execute("SELECT " + scenario + " from " + self.db_table)
+    def extended_curve_params(self):
+        # model constants that determine the extended curves (stored curves are only used if these match)
+        return {'num_db_values': int(self.num_db_values), 'max_distance': float(self.max_distance),
+                'distance_inc': float(self.distance_inc), 'num_pts_extend': int(self.num_pts_extend),
+                'extend_ln_ln': bool(self.extend_ln_ln), 'meters_per_ft': float(self.meters_per_ft)}
 
-        data = pd.Series(np.zeros(num_values))
-        for i, row in enumerate(result):
-            try:
-                temp = float(row[0])
-                data[i] = temp.real
-            except:
-                data[i] = 'nan'  # fill in empty elements (for later filtering)
-        conn.close()
-        return data
+    def extend_scenario_curve(self, scenario):
+        """
+        :description processes the database deposition data of a scenario into its extended distance vs deposition curve
+        :            (blank values removed, curve extended to max_distance) and determines the monotonicity of the curve
+        :param scenario: name of scenario (database column)
+        :NOTE self.distances_temp must hold the database distance array
+        :return: raw scenario data, extended distance and deposition arrays, data series type
+        """
+        raw_data = self.get_scenario_deposition_data(scenario, self.num_db_values)
+
+        # process raw data to remove blank values from distance and deposition arrays
+        x_values, y_values = self.filter_arrays(self.distances_temp, raw_data)  # always send in the original distance_temp array
+
+        # extend distance vs deposition curve data (done for all curves)
+        x_values, y_values = self.extend_curve_opp(x_values, y_values, self.max_distance, self.distance_inc,
+                                                   self.num_pts_extend, self.extend_ln_ln)
+
+        # verify monotonicity and whether increasing/decreasing
+        dep_series = np.asarray(y_values)
+        if (np.all(dep_series[1:] >= dep_series[:-1])):
+            data_series_type = 'monotonic-increasing'
+        elif (np.all(dep_series[1:] <= dep_series[:-1])):
+            data_series_type = 'monotonic-decreasing'
+        else:
+            data_series_type = 'non-monotonic'
+        return raw_data, x_values, y_values, data_series_type
+
+    def build_extended_curves(self):
+        """
+        :description build step: computes the extended curves of all scenarios in the database and stores them next to
+        :            the database (see agdrift_extended_curves); must be rerun whenever the database or the constants
+        :            in extended_curve_params change
+        :return: paths of the stored data and description files
+        """
+        self.column_names = self.get_column_names()
+        self.num_scenarios = len(self.column_names) - 1
+        self.assign_column_names()
+        self.distances_temp = self.get_distances(self.num_db_values)
+
+        curves = []
+        for scenario in self.scenario_name:
+            raw_data, x_values, y_values, data_series_type = self.extend_scenario_curve(scenario)
+            curves.append((scenario, np.asarray(x_values), np.asarray(y_values), data_series_type))
+        return write_extended_curves(self.db_name, self.extended_curve_params(), curves)
 
     def calc_avg_dep_foa(self, integration_result, integration_distance):
         """
@@ -900,13 +936,60 @@ class AgdriftFunctions(object):
         return avg_dep_lbac
 
 
+    def cumulative_area(self, x_array, y_array, x_values):
+        """
+        :description area under a piecewise linear x/y curve from x[0] to each of the x_values; the cumulative
+        :            trapezoid areas at the x points are summed once and each x value is located via searchsorted and
+        :            linearly interpolated within its segment
+        :param x_array: x values of x vs y data points (non-decreasing)
+        :param y_array: y values of x vs y data points
+        :param x_values: x values (within the range of x_array) up to which the area is calculated
+        :return:
+        """
+        x_array = np.asarray(x_array, dtype='float')
+        y_array = np.asarray(y_array, dtype='float')
+        x_values = np.asarray(x_values, dtype='float')
+
+        # cumulative area under curve at each x point (assuming linearity of y between x points)
+        cum_area = np.zeros(len(x_array))
+        cum_area[1:] = np.cumsum(0.5 * (y_array[1:] + y_array[:-1]) * np.diff(x_array))
+
+        # locate segment holding each x value and add the area from the segment start to the x value
+        j = np.clip(np.searchsorted(x_array, x_values, side='right') - 1, 0, len(x_array) - 2)
+        y_interp = (y_array[j] * (x_array[j+1] - x_values) +
+                    y_array[j+1] * (x_values - x_array[j])) / (x_array[j+1] - x_array[j])
+        return cum_area[j] + (0.5 * (y_interp + y_array[j])) * (x_values - x_array[j])
+
+    def running_avg_windows(self, npts_orig, x_array_in, y_array, x_dist):
+        """
+        :description calculates the running weighted averages of a piecewise linear x/y curve over windows of length
+        :            x_dist starting at each x[i] (for all x[i] whose window ends before the last x value)
+        :            the area of each window is the difference of the cumulative areas (see cumulative_area) at the
+        :            window end and at the window start
+        :param npts_orig: number of points in orginal x vs y data points
+        :param x_array_in: x values of original x vs y data points (non-decreasing)
+        :param y_array: y values of original x vs y data points
+        :param x_dist: length (in x units) for which running weighted average is to be calculated
+        :return: x values (window starts) and y values (running weighted averages) as numpy arrays
+        """
+        x_array = np.asarray(x_array_in, dtype='float')[:npts_orig]
+        y_array = np.asarray(y_array, dtype='float')[:npts_orig]
+
+        # windows must end before the last x value
+        npts_out = np.count_nonzero(x_array[:-1] < (x_array[-1] - x_dist))
+        x_start = x_array[:npts_out]
+
+        area = self.cumulative_area(x_array, y_array, x_start)
+        end_area = self.cumulative_area(x_array, y_array, x_start + x_dist)
+
+        return x_start, (end_area - area) / x_dist
+
     def generate_running_avg(self, npts_orig, x_array_in, y_array, x_dist):
         """
         :description this method takes an x/y array and creates a x_out/y_out array of running weighted averages;
                      the algorithm mimics the AGAVE.FOR routine created by OPP and found in the collection of
-                     software delivered from OPP related to AGDRIFT; this routine is not used here  because it is
-                     computationally inefficient; it was produced here simply to provide a check on the new
-                     routine found in "locate_integrated_avg"
+                     software delivered from OPP related to AGDRIFT; the running averages are calculated from
+                     cumulative areas (see running_avg_windows)
 
                      The method generates the running average for each x value (as opposed to establishing
                      redefining the x values to reflect a value for each x_dist increment; thus if the specified
@@ -926,39 +1009,10 @@ class AgdriftFunctions(object):
         :return:
         """
 
-        x_array_out = pd.Series([], dtype='float')
-        y_array_out = pd.Series([], dtype='float')
-
-        for i in range (npts_orig-1): #calculate running average for these points
-            continuing = True
-            if(x_array_in[i] < (x_array_in[npts_orig-1] - x_dist)):
-                 j = i
-                 #calculate area under curve for this increment of x (assuming linearity of y between x points)
-                 cum_area =  (0.5 * (y_array[j] + y_array[j+1])) * (x_array_in[j+1] - x_array_in[j])
-
-                    #if x_dist is completely within this x[i] to x[i+1] segment then interpolate the one needed value of cum_area
-                 if (x_array_in[j+1] > (x_array_in[i] + x_dist)):
-                     x_interp = x_array_in[i] + x_dist
-                     y_interp = (y_array[j] * (x_array_in[j+1] - x_interp) +
-                                 y_array[j+1] * (x_interp - x_array_in[j])) / (x_array_in[j + 1] - x_array_in[j])
-                     cum_area = (0.5 * (y_interp + y_array[j])) * (x_interp - x_array_in[j])
-                     continuing = False
- 
-                 #if x_dist extends beyond x[i+1], i.e., next x value; then calculate and accumulate all necessary cum_area
-                 while continuing:
-                    j += 1
-                    if (x_array_in[j+1] < (x_array_in[i] + x_dist)):
-                        cum_area = cum_area + (0.5 * (y_array[j] + y_array[j+1])) * (x_array_in[j+1] - x_array_in[j])
-                    else:
-                        x_interp = x_array_in[i] + x_dist
-                        y_interp = (y_array[j] * (x_array_in[j+1] - x_interp) +
-                                    y_array[j+1] * (x_interp - x_array_in[j])) / (x_array_in[j+1] - x_array_in[j])
-                        cum_area = cum_area + (0.5 * (y_interp + y_array[j])) * (x_interp - x_array_in[j])
-
-                        continuing = False
-                 x_array_out[i] = x_array_in[i]
-                 y_array_out[i] = cum_area / x_dist
-                 npts_out = len(x_array_out)
+        x_out, y_out = self.running_avg_windows(npts_orig, x_array_in, y_array, x_dist)
+        x_array_out = pd.Series(x_out, dtype='float')
+        y_array_out = pd.Series(y_out, dtype='float')
+        npts_out = len(x_array_out)
 
         return x_array_out, y_array_out, npts_out
 
@@ -973,6 +1027,8 @@ class AgdriftFunctions(object):
         :            the specified integrated average and if no match it would move to subsequent days and repeat the process
         :            until it finds the integrated average of interest
         :            integrated average (which represents a value of the running average of interest to the user
+        :            (all running averages are calculated at once from cumulative areas, see running_avg_windows; the
+        :            first running average that reaches the specified integrated average is then located)
         :param npts_orig: number of points in orginal x vs y data points
         :param x_array_in: x values of original x vs y data points
         :param y_array: y values of original x vs y data points
@@ -983,142 +1039,97 @@ class AgdriftFunctions(object):
         :param npts_out: number of points in running weighted average output array
         :param x_dist_of_interest: x location of trailing edge of x_dist for which the specified integrated_avg applies
         :NOTE We assume we have a monotonically decreasing y_array
-        :NOTE This code could use better documentation; there are multiple indices in use and it is not
-              easy to follow at this point
-              segment: distance (in x-axis units) associated with length of running weighted average (e.g., 7-day averaging)
-              increment: step (x-asix distance between x_array_in points) included in calculation of segment weighted average
         :return:
         """
 
-        x_array_out = pd.Series([], dtype='float') #array of x pts associated with y_array_out
-        y_array_out = pd.Series([], dtype='float') #array of running weighted averages
-        range_chk = 'in range'  #for reporting when user specified integrated average is not found within the data series
-        continuing = True
-        x_tot = 0   #total x-axis distance from start point of current averaging
-        j_init = 0 #index of initial x[] of current averaging
-        for i in range (npts_orig-1): #calculate running weighted average for these points
-            if(x_array_in[i] < (x_array_in[npts_orig-1] - x_dist)):
-                if (i == 0):   #first time through process full extent of x_dist (i.e., all x_array_in pts included in x dist)
-                    j = 0
-                    integrated_tot = 0
-
-                    while continuing:
-                        x_tot = x_tot + (x_array_in[j+1] - x_array_in[j])
-                        integrated_inc = (0.5 * (y_array[j] + y_array[j+1])) * (x_array_in[j+1] - x_array_in[j])
-                        if(j == 0): init_inc = integrated_inc  #save first increment of running average integration
-
-                        if (x_tot <= x_dist):
-                            integrated_tot = integrated_tot + integrated_inc
-                            j += 1
-                        else:  #last segment
-                            x_interp = x_array_in[i] + x_dist
-                            y_interp = (y_array[j] * (x_array_in[j+1] - x_interp) +
-                                        y_array[j+1] * (x_interp - x_array_in[j])) / (
-                                       x_array_in[j+1] - x_array_in[j])
-                            integrated_inc = (0.5 * (y_interp + y_array[j])) * (x_interp - x_array_in[j])
-                            if (j == 0): #save last increment?
-                                last_inc = 0.  #don't double count if last increment is same as 1st for this segment
-                            else:
-                                last_inc = integrated_inc
-                            integrated_tot = integrated_tot + integrated_inc
-                            continuing = False
-
-                    #populate output array that holds values of running integrated averages
-                    x_array_out[i] = x_array_in[i]
-                    y_array_out[i] = integrated_tot / x_dist
-                    npts_out = len(x_array_out)  # not really necessary; at this point it will always be equal to 1
-
-                    #determine if the user specified integrated average has been located
-                    if (y_array[1] < y_array[0]):     #y is decreasing function of x
-                        if (y_array_out[i] < integrated_avg):  #if true then we have achieved the integrated_avg before completing the first x_dist
-                            # if we surpass the user supplied integrated_avg before reaching the edge of the first running average then
-                            # output the message and set the x_dist_of_interest to zero (as is done in the original AGDRIFT model)
-
-                            x_dist_of_interest = x_array_in[0]  #original AGDRIFT model sets this value to zero (i.e., first x point value)
-                            return x_array_out, y_array_out, npts_out, x_dist_of_interest, range_chk
-                    else:
-                        if (y_array_out[i] > integrated_avg):  #if true then we have achieved the integrated_avg before completing the first x_dist
-                            # if we surpass the user supplied integrated_avg before reaching the edge of the first running average then
-                            # output the message and set the x_dist_of_interest to zero (as is done in the original AGDRIFT model)
-
-                            x_dist_of_interest = x_array_in[0]  #original AGDRIFT model sets this value to zero (i.e., first x point value)
-                            return x_array_out, y_array_out, npts_out, x_dist_of_interest, range_chk
-
-                else:  #need to process only edges of running weighted average segment (i.e., subtract 1st and last
-                       #increments from previous segment; then start adding new segments)
-
-                    #initialize next segment (i.e., beginning at x[i])
-                    if (j == 0 or j == i or j == i-1):  #3 conditions for a new segment without overlap with previous one
-                        #new segment has no overlap with previous segment
-                        j = j_init = i
-                        x_tot = 0.
-                        integrated_tot = 0.
-                    else:
-                        #new segment includes portion of previous segment
-                        j_init = j  #j_init is the lower bound of 1st 'new' segment to be processed for this new average
-                        x_tot = x_tot - ((x_array_in[j+1] - x_array_in[j]) + (x_array_in[i] - x_array_in[i-1]))
-                        integrated_tot = integrated_tot - init_inc - last_inc
-                    continuing = True
-
-                    while continuing:
-                        x_tot = x_tot + (x_array_in[j+1] - x_array_in[j])
-                        integrated_inc = (0.5 * (y_array[j] + y_array[j+1])) * (x_array_in[j+1] - x_array_in[j])
-                        if (j == j_init): init_inc = (0.5 * (y_array[i] + y_array[i+1])) * \
-                                                     (x_array_in[i+1] - x_array_in[i])  #note 'i' index to denote 1st increment of current averaging
-
-                        if (x_tot <= x_dist):
-                            integrated_tot = integrated_tot + integrated_inc
-                            j += 1
-                        else:
-                            x_interp = x_array_in[i] + x_dist
-                            y_interp = (y_array[j] * (x_array_in[j+1] - x_interp) +
-                                        y_array[j+1] * (x_interp - x_array_in[j])) / (
-                                       x_array_in[j+1] - x_array_in[j])
-                            integrated_inc = (0.5 * (y_interp + y_array[j])) * (x_interp - x_array_in[j])
-                            if (j == i): #save last increment?
-                                last_inc = 0. #don't double count if last increment is same as 1st for this segment
-                            else:
-                                last_inc = integrated_inc
-                            integrated_tot = integrated_tot + integrated_inc
-                            continuing = False
-
-                    #populate output arrays with latest running weighted average
-                    x_array_out[i] = x_array_in[i]
-                    y_array_out[i] = integrated_tot / x_dist
-                    npts_out = len(x_array_out)
-
-                    #determine if the user supplied integrated average has been surpassed; if so compute the interpolated distance to the point of interest
-                    if (y_array[1] < y_array[0]):  #y is decreasing function of x
-                        if (y_array_out[i] <= integrated_avg):
-                            fraction = (y_array_out[i-1] - integrated_avg) / (y_array_out[i-1] - y_array_out[i])
-                            if(self.find_nearest_x):  #if true then round to nearest half x unit
-                                #above is precise x_dist_of_interest; below is OPP protocol for rounding the distance up to the nearest segment midpoint or segment boundary
-                                if (fraction >= 0.5):
-                                    x_dist_of_interest = x_array_out[i]
-                                else:
-                                    x_dist_of_interest = x_array_out[i-1] + 0.5 * (x_array_out[i] - x_array_out[i-1])
-                                #this is crazy but it is what the OPP Agdrift appears to do
-                                if(x_dist_of_interest <= 3.2808): x_dist_of_interest = 3.2808
-                                if(x_dist_of_interest > 3.2808 and x_dist_of_interest <= 6.5616): x_dist_of_interest = 6.5616
-                                if(x_dist_of_interest > 6.5616 and x_dist_of_interest <= 9.8424): x_dist_of_interest = 9.8424
-                                if(x_dist_of_interest > 9.8424 and x_dist_of_interest <= 13.1232): x_dist_of_interest = 13.1232
-                            else:
-                                x_dist_of_interest = x_array_out[i-1] + fraction * (x_array_out[i] - x_array_out[i-1])
-                            #write output arrays to excel file  --  just for debugging
-                            #self.write_arrays_to_csv(x_array_out, y_array_out, "output_array.csv")
-
-                            return x_array_out, y_array_out, npts_out, x_dist_of_interest, range_chk
+        x_out, y_out = self.running_avg_windows(npts_orig, x_array_in, y_array, x_dist)
+        y_decreasing = (y_array[1] < y_array[0])  #y is decreasing function of x
+        npts_out, x_dist_of_interest, range_chk = self.locate_avg_crossings(x_out, y_out, y_decreasing,
+                                                                            [integrated_avg])
+        npts_out = npts_out[0]
+        x_array_out = pd.Series(x_out[:npts_out], dtype='float')
+        y_array_out = pd.Series(y_out[:npts_out], dtype='float')
 
-                    else:
-                        #this increasing function does not navigate to the nearest 1/2 x point as done above for decreasing function
-                        if (y_array_out[i] > integrated_avg):
-                            fraction = (integrated_avg - y_array_out[i-1]) / (y_array_out[i] - y_array_out[i-1])
-                            x_dist_of_interest = x_array_out[i-1] + fraction * (x_array_out[i] - x_array_out[i-1])
-                            return x_array_out, y_array_out, npts_out, x_dist_of_interest, range_chk
+        return x_array_out, y_array_out, npts_out, x_dist_of_interest[0], range_chk[0]
 
-        #some extent of the area-of-interest (e.g., pond) lies outside the data range
-        range_chk = 'out of range'
-        return x_array_out, y_array_out, npts_out, np.nan, range_chk
+    def locate_integrated_avgs(self, x_array_in, y_array, x_dists, integrated_avgs):
+        """
+        :description locates the specified integrated averages for a group of simulations sharing one x/y curve
+        :            (see locate_integrated_avg); the running weighted averages are calculated once per distinct x_dist
+        :param x_array_in: x values of original x vs y data points
+        :param y_array: y values of original x vs y data points
+        :param x_dists: lengths (in x units) for which running weighted averages are to be calculated (per simulation)
+        :param integrated_avgs: weighted averages of y_array over x_dist (per simulation)
+        :return: x_dist_of_interest and range_chk arrays (per simulation)
+        """
+        x_dists = np.asarray(x_dists, dtype='float')
+        integrated_avgs = np.asarray(integrated_avgs, dtype='float')
+        y_decreasing = (y_array[1] < y_array[0])  #y is decreasing function of x
+
+        x_dist_of_interest = np.full(len(x_dists), np.nan)
+        range_chk = np.full(len(x_dists), 'out of range', dtype='object')
+        for x_dist in np.unique(x_dists[np.isfinite(x_dists)]):
+            sims = (x_dists == x_dist)
+            x_out, y_out = self.running_avg_windows(len(x_array_in), x_array_in, y_array, x_dist)
+            npts_out, x_dist_of_interest[sims], range_chk[sims] = \
+                self.locate_avg_crossings(x_out, y_out, y_decreasing, integrated_avgs[sims])
+        return x_dist_of_interest, range_chk
+
+    def locate_avg_crossings(self, x_out, y_out, y_decreasing, integrated_avgs):
+        """
+        :description locates where a series of running weighted averages first surpasses each of a set of specified
+        :            integrated averages and interpolates the x location of interest (see locate_integrated_avg)
+        :param x_out: x values of running weighted averages
+        :param y_out: running weighted averages
+        :param y_decreasing: True if y is a decreasing function of x
+        :param integrated_avgs: array of specified integrated averages
+        :return: number of running weighted averages processed to locate each integrated average (npts_out),
+        :        x_dist_of_interest and range_chk arrays
+        """
+        integrated_avgs = np.asarray(integrated_avgs, dtype='float')
+        npts_out = np.full(len(integrated_avgs), len(y_out), dtype='int')
+        x_dist_of_interest = np.full(len(integrated_avgs), np.nan)
+        range_chk = np.full(len(integrated_avgs), 'out of range', dtype='object')  #some extent of the area-of-interest (e.g., pond) lies outside the data range
+        if (len(y_out) == 0):
+            return npts_out, x_dist_of_interest, range_chk
+
+        # if we surpass the user supplied integrated_avg before reaching the edge of the first running average then
+        # set the x_dist_of_interest to the first x point value (original AGDRIFT model sets this value to zero)
+        # otherwise locate first subsequent running weighted average that surpasses the user supplied integrated average
+        if (y_decreasing):
+            first = (y_out[0] < integrated_avgs)
+            surpassed = (y_out[np.newaxis, 1:] <= integrated_avgs[:, np.newaxis])
+        else:
+            first = (y_out[0] > integrated_avgs)
+            surpassed = (y_out[np.newaxis, 1:] > integrated_avgs[:, np.newaxis])
+        found = surpassed.any(axis=1) & ~first
+        i = np.argmax(surpassed, axis=1)[found] + 1
+
+        npts_out[first] = 1
+        x_dist_of_interest[first] = x_out[0]
+        range_chk[first] = 'in range'
+
+        #compute the interpolated distance to the point of interest
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if (y_decreasing):
+                fraction = (y_out[i-1] - integrated_avgs[found]) / (y_out[i-1] - y_out[i])
+                if(self.find_nearest_x):  #if true then round to nearest half x unit
+                    #above is precise x_dist_of_interest; below is OPP protocol for rounding the distance up to the nearest segment midpoint or segment boundary
+                    x_dist = np.where(fraction >= 0.5, x_out[i], x_out[i-1] + 0.5 * (x_out[i] - x_out[i-1]))
+                    #this is crazy but it is what the OPP Agdrift appears to do
+                    x_dist = np.select([x_dist <= 3.2808, x_dist <= 6.5616, x_dist <= 9.8424, x_dist <= 13.1232],
+                                       [3.2808, 6.5616, 9.8424, 13.1232], default=x_dist)
+                else:
+                    x_dist = x_out[i-1] + fraction * (x_out[i] - x_out[i-1])
+            else:
+                #this increasing function does not navigate to the nearest 1/2 x point as done above for decreasing function
+                fraction = (integrated_avgs[found] - y_out[i-1]) / (y_out[i] - y_out[i-1])
+                x_dist = x_out[i-1] + fraction * (x_out[i] - x_out[i-1])
+
+        npts_out[found] = i + 1
+        x_dist_of_interest[found] = x_dist
+        range_chk[found] = 'in range'
+        return npts_out, x_dist_of_interest, range_chk
 
     def find_dep_pt_location(self, x_in, y_in, npts, foa):
         """
@@ -1129,35 +1140,46 @@ class AgdriftFunctions(object):
         :param foa: value of deposition (y value) of interest
         :return:
         """
-        range_chk = 'in range'
-        continuing = True
-        j = 0
-        while continuing:
-            if (j == 0 and y_in[j] < foa): #means we're in the spray area and not 'downwind'
-                out_dist = 0.
-                continuing = False
-            elif (j > npts-1): #means we are beyond the data range
-                out_dist = np.nan
-                range_chk = 'out of range'
-                continuing = False
-            else:
-                if (y_in[j] < foa):
-                    fraction = (y_in[j-1] - foa) / (y_in[j-1] - y_in[j])
-                    out_dist = x_in[j-1] + fraction * (x_in[j] - x_in[j-1])
-
-                    # the following code represents OPP protocol to round up x_dist_of_interest to nearest x midpoint or boundary value
-                    # (except when x_dist_of_interest is in the range of the first 2 meters (i.e., 6.5616 ft)
-                    if (fraction <= 0.5 and out_dist > 3.2808):
-                        round_up_x_dist = 0.5 * (x_in[j] + x_in[j-1])
-                    elif (fraction > 0.5 and out_dist > 3.2808):
-                        round_up_x_dist = x_in[j]
-                    else:
-                        round_up_x_dist = 3.2808
-                    if (out_dist > 3.2808 and out_dist < 6.5616):
-                        round_up_x_dist = 6.5616
-                    out_dist = round_up_x_dist  # i is simulation number
-                    continuing = False
-                j += 1
+        out_dist, range_chk = self.find_dep_pt_locations(x_in, y_in, npts, [foa])
+        return out_dist[0], range_chk[0]
+
+    def find_dep_pt_locations(self, x_in, y_in, npts, foas, max_dist=np.inf):
+        """
+        :description this method locates the downwind distances associated with a set of deposition rates
+        :            (the first x at which the deposition drops below each value, see find_dep_pt_location)
+        :param x_in: array of distance values
+        :param y_in: array of deposition values
+        :param npts: number of values in x/y arrays
+        :param foas: array of values of deposition (y values) of interest
+        :param max_dist: only locate distances within this distance (i.e., the extent of the original deposition data)
+        :return: out_dist and range_chk arrays
+        """
+        x_in = np.asarray(x_in, dtype='float')[:npts]
+        y_in = np.asarray(y_in, dtype='float')[:npts]
+        foas = np.asarray(foas, dtype='float')
+        y_in = y_in[x_in <= max_dist]
+
+        out_dist = np.full(len(foas), np.nan)  #means we are beyond the data range
+        range_chk = np.full(len(foas), 'out of range', dtype='object')
+
+        below = (y_in[np.newaxis, :] < foas[:, np.newaxis])
+        found = below.any(axis=1)
+        j = np.argmax(below, axis=1)
+        range_chk[found] = 'in range'
+        out_dist[found & (j == 0)] = 0.  #means we're in the spray area and not 'downwind'
+
+        interp = found & (j > 0)
+        j = j[interp]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = (y_in[j-1] - foas[interp]) / (y_in[j-1] - y_in[j])
+            dist = x_in[j-1] + fraction * (x_in[j] - x_in[j-1])
+
+            # the following code represents OPP protocol to round up x_dist_of_interest to nearest x midpoint or boundary value
+            # (except when x_dist_of_interest is in the range of the first 2 meters (i.e., 6.5616 ft)
+            round_up_x_dist = np.where(dist > 3.2808, np.where(fraction <= 0.5, 0.5 * (x_in[j] + x_in[j-1]), x_in[j]),
+                                       3.2808)
+            round_up_x_dist[(dist > 3.2808) & (dist < 6.5616)] = 6.5616
+        out_dist[interp] = round_up_x_dist
         return out_dist, range_chk
 
     def round_model_outputs(self, avg_dep_foa, avg_dep_lbac, avg_dep_gha, avg_waterconc_ngl,
@@ -1172,61 +1194,36 @@ class AgdriftFunctions(object):
         :param avg_dep_gha:
         :param avg_waterconc_ngl:
         :param avg_field_dep_mgcm2:
-        :param i: simulation number
+        :param i: simulation number (or array of simulation numbers with arrays of values)
         :return:
         """
 
-        if (np.isfinite(avg_dep_foa)):
-            if (avg_dep_foa > 1e-4 and avg_dep_foa < 1.):
-                self.out_avg_dep_foa[i] = np.round(avg_dep_foa, 4)
-            elif (avg_dep_foa > 1.):
-                self.out_avg_dep_foa[i] = np.round(avg_dep_foa, 2)
-            else :
-                self.out_avg_dep_foa[i] = float('{:0.2e}'.format(float(avg_dep_foa)))
-        else:
-            self.out_avg_dep_foa[i] = avg_dep_foa
-
-        if (np.isfinite(avg_dep_lbac)):
-            if (avg_dep_lbac > 1e-4 and avg_dep_lbac < 1.):
-                self.out_avg_dep_lbac[i] = np.round(avg_dep_lbac, 4)
-            elif (avg_dep_lbac > 1.):
-                self.out_avg_dep_lbac[i] = np.round(avg_dep_lbac, 2)
-            else :
-                self.out_avg_dep_lbac[i] = float('{:0.2e}'.format(float(avg_dep_lbac)))
-        else:
-            self.out_avg_dep_lbac[i] = avg_dep_lbac
-
-        if (np.isfinite(avg_dep_gha)):
-            if (avg_dep_gha > 1e-4 and avg_dep_gha < 1.):
-                self.out_avg_dep_gha[i] = np.round(avg_dep_gha, 4)
-            elif (avg_dep_gha > 1.):
-                self.out_avg_dep_gha[i] = np.round(avg_dep_gha, 2)
-            else :
-                self.out_avg_dep_gha[i] = float('{:0.2e}'.format(float(avg_dep_gha)))
-        else:
-            self.out_avg_dep_gha[i] = avg_dep_gha
-
-        if (np.isfinite(avg_waterconc_ngl)):
-            if (avg_waterconc_ngl > 1e-4 and avg_waterconc_ngl < 1.):
-                self.out_avg_waterconc_ngl[i] = np.round(avg_waterconc_ngl, 4)
-            elif (avg_waterconc_ngl > 1.):
-                self.out_avg_waterconc_ngl[i] = np.round(avg_waterconc_ngl, 2)
-            else :
-                self.out_avg_waterconc_ngl[i] = float('{:0.2e}'.format(float(avg_waterconc_ngl)))
-        else:
-            self.out_avg_waterconc_ngl[i] = avg_waterconc_ngl
-
-        if(np.isfinite(avg_field_dep_mgcm2)):
-            if (avg_field_dep_mgcm2 > 1e-4 and avg_field_dep_mgcm2 < 1.):
-                self.out_avg_field_dep_mgcm2[i] = np.round(avg_field_dep_mgcm2, 4)
-            elif (avg_field_dep_mgcm2 > 1.):
-                self.out_avg_field_dep_mgcm2[i] = np.round(avg_field_dep_mgcm2, 2)
-            else:
-                self.out_avg_field_dep_mgcm2[i] = float('{:0.2e}'.format(float(avg_field_dep_mgcm2)))
-        else:
-            self.out_avg_field_dep_mgcm2[i] = avg_field_dep_mgcm2
+        sims = np.atleast_1d(i)  # a single simulation or an array of simulations
+        self.out_avg_dep_foa[sims] = self.round_output_values(avg_dep_foa)
+        self.out_avg_dep_lbac[sims] = self.round_output_values(avg_dep_lbac)
+        self.out_avg_dep_gha[sims] = self.round_output_values(avg_dep_gha)
+        self.out_avg_waterconc_ngl[sims] = self.round_output_values(avg_waterconc_ngl)
+        self.out_avg_field_dep_mgcm2[sims] = self.round_output_values(avg_field_dep_mgcm2)
         return
 
+    def round_output_values(self, values):
+        """
+        :description rounds output values as presented in the OPP AGDRIFT model interface: 4 decimals between 1e-4
+        :            and 1, 2 decimals above 1 and 3 significant digits otherwise (non-finite values are not changed)
+        :param values: value or array of values
+        :return: array of rounded values
+        """
+        values = np.atleast_1d(np.asarray(values, dtype='float'))
+        rounded = values.copy()
+        finite = np.isfinite(values)
+        mid_range = finite & (values > 1e-4) & (values < 1.)
+        high_range = finite & (values > 1.)
+        low_range = finite & ~mid_range & ~high_range
+        rounded[mid_range] = np.round(values[mid_range], 4)
+        rounded[high_range] = np.round(values[high_range], 2)
+        rounded[low_range] = [float('{:0.2e}'.format(value)) for value in values[low_range]]
+        return rounded
+
     def write_arrays_to_csv(self, x_in, y_in, db_name):
 
         # just a quick method to help debugging
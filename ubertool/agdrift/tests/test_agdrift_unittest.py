@@ -5,8 +5,10 @@ import numpy as np
 import numpy.testing as npt
 import os.path
 import pandas as pd
+import shutil
 import sys
 from tabulate import tabulate
+import tempfile
 import unittest
 
 ##find parent directory and import model
@@ -14,6 +16,8 @@ import unittest
 #sys.path.append(parentddir)
 
 from ..agdrift_exe import Agdrift
+from ..agdrift_deposition_store import get_deposition_store
+from ..agdrift_extended_curves import load_extended_curves
 
 test = {}
 
@@ -605,6 +609,97 @@ class TestAgdrift(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_deposition_store(self):
+        """
+        :description checks the process-wide in-memory copy of the sql database table: repeated requests are served
+        :            by the same store (no database access) and the table is reloaded once the database file changes
+        :return:
+        """
+        # create empty pandas dataframes to create empty object for this unittest
+        agdrift_empty = self.create_agdrift_object()
+
+        location = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+        tmp_dir = tempfile.mkdtemp()
+        agdrift_empty.db_name = os.path.join(tmp_dir, 'sqlite_agdrift_distance.db')
+        shutil.copyfile(os.path.join(location, 'sqlite_agdrift_distance.db'), agdrift_empty.db_name)
+        agdrift_empty.db_table = 'output'
+
+        result = pd.Series([], dtype='float')
+        expected_result = [0.50013, 0.041273, 161.0]
+
+        try:
+            store = get_deposition_store(agdrift_empty.db_name, agdrift_empty.db_table)
+            self.assertIs(store, get_deposition_store(agdrift_empty.db_name, agdrift_empty.db_table))
+
+            scenario_data = agdrift_empty.get_scenario_deposition_data('aerial_vf2f', 161)
+            result = [scenario_data[0], scenario_data[160], float(len(scenario_data))]
+            npt.assert_allclose(result, expected_result, rtol=1e-5, atol=0, err_msg='', verbose=True)
+
+            # returned data are copies; the store itself is read-only
+            scenario_data[0] = -1.
+            self.assertFalse(store.get_column('aerial_vf2f').flags.writeable)
+            npt.assert_allclose(store.get_column('aerial_vf2f')[0], expected_result[0], rtol=1e-5)
+
+            # a modified database file is reloaded
+            os.utime(agdrift_empty.db_name, (store.mtime + 10., store.mtime + 10.))
+            self.assertIsNot(store, get_deposition_store(agdrift_empty.db_name, agdrift_empty.db_table))
+        finally:
+            shutil.rmtree(tmp_dir)
+            tab = [result, expected_result]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_extended_curves(self):
+        """
+        :description checks the precomputed extended curves stored next to the database: the stored curves and
+        :            monotonicity flags equal those computed from the database; they are not used once the database
+        :            content or the curve constants change
+        :return:
+        """
+        # create empty pandas dataframes to create empty object for this unittest
+        agdrift_empty = self.create_agdrift_object()
+
+        location = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+        tmp_dir = tempfile.mkdtemp()
+        agdrift_empty.db_name = os.path.join(tmp_dir, 'sqlite_agdrift_distance.db')
+        shutil.copyfile(os.path.join(location, 'sqlite_agdrift_distance.db'), agdrift_empty.db_name)
+        agdrift_empty.set_global_constants()
+
+        result = pd.Series([], dtype='object')
+        expected_result = pd.Series([], dtype='object')
+
+        try:
+            self.assertIsNone(load_extended_curves(agdrift_empty.db_name, agdrift_empty.extended_curve_params()))
+            agdrift_empty.build_extended_curves()
+            curves = load_extended_curves(agdrift_empty.db_name, agdrift_empty.extended_curve_params())
+
+            for scenario in ['aerial_vf2f', 'ground_low_vf', 'airblast_orchard']:
+                raw_data, x_values, y_values, data_series_type = agdrift_empty.extend_scenario_curve(scenario)
+                result[scenario] = curves[scenario][2]
+                expected_result[scenario] = data_series_type
+                npt.assert_array_equal(curves[scenario][0], x_values, err_msg='', verbose=True)
+                npt.assert_array_equal(curves[scenario][1], y_values, err_msg='', verbose=True)
+            npt.assert_array_equal(result, expected_result, err_msg='', verbose=True)
+
+            # stored curves do not apply to other curve constants
+            agdrift_empty.num_pts_extend = 20
+            self.assertIsNone(load_extended_curves(agdrift_empty.db_name, agdrift_empty.extended_curve_params()))
+            agdrift_empty.num_pts_extend = 16
+
+            # stored curves do not apply to a modified database
+            with open(agdrift_empty.db_name, 'ab') as db_file:
+                db_file.write(b'\0')
+            self.assertIsNone(load_extended_curves(agdrift_empty.db_name, agdrift_empty.extended_curve_params()))
+        finally:
+            shutil.rmtree(tmp_dir)
+            tab = [result, expected_result]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_filter_arrays(self):
         """
         :description  eliminate blank data cells (i.e., distances for which no deposition value is provided)
@@ -1054,6 +1149,42 @@ class TestAgdrift(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_running_avg_windows(self):
+        """
+        :description running weighted averages over windows of width x_dist calculated from cumulative areas
+        :param x_array_in: array of x-axis values (non-uniformly spaced)
+        :param y_array_in: array of y-axis values
+        :param x_dist: width in x_axis units of running weighted average
+        :NOTE windows end within the first, within later and exactly on segment boundaries
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        agdrift_empty = self.create_agdrift_object()
+
+        expected_result_x = [0., 1., 3., 6.]
+        expected_result_y = [2.4, 1.9666667, 1.1666667, 0.]
+        x_array_out = pd.Series([], dtype='float')
+        y_array_out = pd.Series([], dtype='float')
+
+        try:
+            x_array_in = pd.Series([0., 1., 3., 6., 10.])
+            y_array_in = pd.Series([4., 2., 2., 0., 0.])
+            x_dist = 2.5
+
+            x_array_out, y_array_out = agdrift_empty.running_avg_windows(len(x_array_in), x_array_in, y_array_in,
+                                                                         x_dist)
+            npt.assert_allclose(x_array_out, expected_result_x, rtol=1e-5, atol=0, err_msg='', verbose=True)
+            npt.assert_allclose(y_array_out, expected_result_y, rtol=1e-5, atol=0, err_msg='', verbose=True)
+        finally:
+            tab1 = [x_array_out, expected_result_x]
+            tab2 = [y_array_out, expected_result_y]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab1, headers='keys', tablefmt='rst'))
+            print(tabulate(tab2, headers='keys', tablefmt='rst'))
+        return
+
     def test_generate_running_avg(self):
         """
         :description retrieves values for distance and the first deposition scenario from the sql database
@@ -1682,6 +1813,55 @@ class TestAgdrift(unittest.TestCase):
             print(tabulate(tab2, headers='keys', tablefmt='rst'))
         return
 
+    def test_locate_integrated_avgs(self):
+        """
+        :description locates the specified integrated averages (and point depositions) for a group of simulations
+        :            sharing one x/y curve; results must equal those of the single simulation methods
+        :param x_array_in: array of x-axis values
+        :param y_array_in: array of y-axis values (monotonically decreasing)
+        :param x_dists: widths in x_axis units of running weighted averages (per simulation)
+        :param weighted_avgs: weighted averages to be located (per simulation)
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        agdrift_empty = self.create_agdrift_object()
+
+        result = pd.Series([], dtype='float')
+        expected_result = pd.Series([], dtype='float')
+
+        try:
+            agdrift_empty.find_nearest_x = True
+            x_array_in = pd.Series(np.arange(0., 200., 6.56), dtype='float')
+            y_array_in = pd.Series(np.exp(-x_array_in / 40.), dtype='float')
+            x_dists = np.array([6.56, 6.56, 20., 20., 20., 150., np.nan])
+            weighted_avgs = np.array([0.5, 2., 0.3, 0.01, 1e-6, 0.05, 0.5])
+
+            out_dists, range_chks = agdrift_empty.locate_integrated_avgs(x_array_in, y_array_in, x_dists, weighted_avgs)
+            pt_dists, pt_range_chks = agdrift_empty.find_dep_pt_locations(x_array_in, y_array_in, len(x_array_in),
+                                                                          weighted_avgs)
+            result = pd.Series(np.append(out_dists, pt_dists), dtype='float')
+
+            for i in range(len(x_dists)):
+                x_out, y_out, npts_out, x_dist_of_interest, range_chk = \
+                    agdrift_empty.locate_integrated_avg(len(x_array_in), x_array_in, y_array_in, x_dists[i],
+                                                        weighted_avgs[i])
+                expected_result[i] = x_dist_of_interest
+                self.assertEqual(range_chks[i], range_chk)
+            for i in range(len(weighted_avgs)):
+                x_dist_of_interest, range_chk = agdrift_empty.find_dep_pt_location(x_array_in, y_array_in,
+                                                                                   len(x_array_in), weighted_avgs[i])
+                expected_result[len(x_dists) + i] = x_dist_of_interest
+                self.assertEqual(pt_range_chks[i], range_chk)
+
+            npt.assert_allclose(result, expected_result, rtol=1e-10, atol=0, equal_nan=True, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_result]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_round_model_outputs(self):
         """
         :description round output variable values (and place in output variable series) so that they can be directly
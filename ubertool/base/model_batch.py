@@ -0,0 +1,190 @@
+"""
+Batch runs of the ubertool models.
+
+run_batch splits a (large) DataFrame of model inputs into chunks of rows and runs the model (execute_model) on each
+chunk in a pool of worker processes; the output DataFrames (pd_obj_out) of the chunks are concatenated in the order of
+the input rows. Unless a chunk size is given, the chunk size is set from the run time of the model, measured on the first
+rows of the batch (which are run in this process, in chunks of 1, 2, 4, ... rows): the run time of a chunk is taken
+as a fixed cost per model run (inputs/outputs set up, tables loaded, ...) plus a cost per row. Only models with one
+row of outputs per input row can be run in chunks (not TED, whose per simulation results go to its result sink).
+
+run_stream runs a model on a stream of input chunks (e.g. read_input_chunks, a csv file read a chunk of rows at a time)
+and appends the outputs of each chunk to an output csv file as the chunk finishes, so the memory used does not grow with
+the number of rows. The outputs are written as csv only: a Parquet writer would need pyarrow, which is not a dependency
+of ubertool.
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import collections
+import functools
+import logging
+import math
+import multiprocessing
+import pandas as pd
+import time
+
+# share of the run time of a chunk that may be spent on the fixed cost of a model run
+fixed_cost_share = 0.1
+# minimum number of chunks per worker (load balance)
+chunks_per_worker = 4
+
+
+def run_chunk(model_cls, df_chunk, model_kwargs=None):
+    """
+    :description runs a model (populate_inputs, run_methods, fill_output_dataframe; see execute_model) on a chunk of input
+    :            rows; the model runs on the rows renumbered from 0 (as expected by the models)
+    :param model_cls: model class (e.g. Trex)
+    :param df_chunk: Pandas DataFrame of model inputs
+    :param model_kwargs: dictionary of keyword arguments of the model class (e.g. maxima_only)
+    :return: Pandas DataFrame of model outputs (pd_obj_out), with the index of df_chunk
+    :raises ValueError: if the model outputs are not one row per input row (e.g. TED, whose per simulation results
+    :                   go to its result sink); the outputs of such models cannot be split into chunks
+    """
+    model = model_cls(df_chunk.reset_index(drop=True), None, **(model_kwargs or {}))
+    model.execute_model()
+    df_out = model.pd_obj_out
+    if len(df_out) != len(df_chunk):
+        raise ValueError("{} outputs are not one row per input row and cannot be run in chunks".format(
+            model_cls.__name__))
+    df_out.index = df_chunk.index
+    return df_out
+
+
+def fit_chunk_cost(timings):
+    """
+    :description fits the run time of a chunk of rows as a fixed cost per model run plus a cost per row
+    :param timings: list of (number of rows, run time) of chunks of increasing size
+    :return: (seconds per model run, seconds per row)
+    """
+    rows, seconds = timings[-1]
+    seconds_per_row = 0.
+    if len(timings) > 1 and rows > timings[-2][0]:
+        seconds_per_row = max(0., (seconds - timings[-2][1]) / (rows - timings[-2][0]))
+    return max(0., seconds - seconds_per_row * rows), seconds_per_row
+
+
+def adapt_chunk_size(seconds_per_run, seconds_per_row, num_rows, workers):
+    """
+    :description number of rows per chunk; chunks are large enough for the fixed cost of a model run to be a small
+    :            share of their run time (see fixed_cost_share) and small enough to give each worker several chunks
+    :param seconds_per_run: measured fixed run time of the model
+    :param seconds_per_row: measured run time of the model per row
+    :param num_rows: number of rows to be distributed among the workers
+    :param workers: number of worker processes
+    :return:
+    """
+    balanced_size = math.ceil(num_rows / (workers * chunks_per_worker))
+    if seconds_per_row > 0.:
+        timed_size = seconds_per_run * (1. - fixed_cost_share) / (fixed_cost_share * seconds_per_row)
+    else:
+        timed_size = balanced_size
+    return int(max(1, min(timed_size, balanced_size)))
+
+
+def run_batch(model_cls, df, workers=None, chunk_size=None, **model_kwargs):
+    """
+    :description runs a model on the rows of an input DataFrame, in chunks of rows distributed among worker processes
+    :param model_cls: model class (e.g. Trex); must be importable by the worker processes
+    :param df: Pandas DataFrame of model inputs (one row per model run)
+    :param workers: number of worker processes (default: number of cpus; 1 - chunks are run in sequence in this process)
+    :param chunk_size: number of rows per chunk (default: adapted to the measured run time per row)
+    :param model_kwargs: keyword arguments of the model class (e.g. maxima_only=True); each chunk has its own model
+                         instance
+    :return: Pandas DataFrame of model outputs, one row per input row (in input order, with the index of df)
+    :raises ValueError: if the model outputs are not one row per input row (see run_chunk)
+    """
+    workers = workers or multiprocessing.cpu_count()
+    num_rows = len(df)
+    if num_rows == 0:
+        return run_chunk(model_cls, df, model_kwargs)
+
+    outputs = []
+    start = 0
+    if chunk_size is None:
+        # run the first rows in this process, in chunks of 1, 2, 4, ... rows, until the cost per row dominates the
+        # run time of a chunk (or about one chunk's worth of rows has been run)
+        max_pilot_rows = math.ceil(num_rows / (workers * chunks_per_worker))
+        timings = []
+        pilot_size = 1
+        while start < num_rows:
+            pilot_start = time.time()
+            df_pilot = df.iloc[start:start + pilot_size]
+            outputs.append(run_chunk(model_cls, df_pilot, model_kwargs))
+            timings.append((len(df_pilot), time.time() - pilot_start))
+            start += len(df_pilot)
+            if start >= max_pilot_rows or timings[-1][1] >= 2. * timings[0][1]:
+                break
+            pilot_size *= 2
+        seconds_per_run, seconds_per_row = fit_chunk_cost(timings)
+        chunk_size = adapt_chunk_size(seconds_per_run, seconds_per_row, num_rows - start, workers)
+        logging.info('{} batch: {:.2e} s per run, {:.2e} s per row, {} rows per chunk'.format(
+            model_cls.__name__, seconds_per_run, seconds_per_row, chunk_size))
+
+    chunks = (df.iloc[chunk_start:chunk_start + chunk_size] for chunk_start in range(start, num_rows, chunk_size))
+    run_model_chunk = functools.partial(run_chunk, model_cls, model_kwargs=model_kwargs)
+    if start + chunk_size >= num_rows:
+        workers = 1  # a single chunk left
+    outputs.extend(map_chunks(run_model_chunk, chunks, workers))
+
+    return pd.concat(outputs, sort=False)
+
+
+def map_chunks(function, chunks, workers):
+    """
+    :description applies a function to each of a stream of chunks, in worker processes; the results are returned in
+    :            chunk order and at most 2 chunks per worker are read ahead of the results returned
+    :param function: function of a chunk
+    :param chunks: iterable of chunks
+    :param workers: number of worker processes (1 - chunks are processed in sequence in this process)
+    :return: generator of function results
+    """
+    if workers == 1:
+        for chunk in chunks:
+            yield function(chunk)
+        return
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(function, (chunk,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.close()
+        pool.join()
+
+
+def read_input_chunks(filename, chunk_size, **read_csv_kwargs):
+    """
+    :description reads a csv file of model inputs (one row per model run) a chunk of rows at a time
+    :param filename: path of csv file
+    :param chunk_size: number of rows per chunk
+    :param read_csv_kwargs: keyword arguments of pandas.read_csv (e.g. index_col=0)
+    :return: generator of Pandas DataFrames of model inputs
+    """
+    for df_chunk in pd.read_csv(filename, chunksize=chunk_size, **read_csv_kwargs):
+        yield df_chunk
+
+
+def run_stream(model_cls, input_chunks, output_filename, workers=1, **model_kwargs):
+    """
+    :description runs a model on a stream of input chunks; the outputs of each chunk are appended to a csv file (one row
+    :            per input row, in input order, indexed as the input rows) as soon as the chunk (and the chunks before
+    :            it) have been run
+    :param model_cls: model class (e.g. Trex); must be importable by the worker processes
+    :param input_chunks: iterable of Pandas DataFrames of model inputs (e.g. read_input_chunks(...))
+    :param output_filename: path of output csv file (overwritten; csv only, Parquet output would need pyarrow)
+    :param workers: number of worker processes (1 - chunks are run in sequence in this process)
+    :param model_kwargs: keyword arguments of the model class (e.g. maxima_only=True)
+    :return: number of output rows written
+    """
+    run_model_chunk = functools.partial(run_chunk, model_cls, model_kwargs=model_kwargs)
+    num_rows = 0
+    with open(output_filename, 'w') as output_file:
+        for chunk_num, df_out in enumerate(map_chunks(run_model_chunk, input_chunks, workers)):
+            df_out.to_csv(output_file, header=(chunk_num == 0))
+            num_rows += len(df_out)
+    logging.info('{} stream: {} rows written to {}'.format(model_cls.__name__, num_rows, output_filename))
+    return num_rows
@@ -0,0 +1,262 @@
+"""
+Memoization of model runs.
+
+A ModelResultCache holds the model outputs of single input rows, keyed on a hash of the model (name, version and keyword
+arguments, e.g. maxima_only) and of the input row normalized by the model's input schema (see UberModel.input_schema:
+inputs are coerced to the dtypes of the model inputs, optional inputs such as the csrf token are left out and text
+inputs are stripped of surrounding whitespace). The outputs are held in two tiers:
+    memory  the least recently used outputs are dropped beyond 'max_memory_entries' rows
+    disk    (optional) sqlite database; the least recently used outputs are deleted when the size of the stored
+            outputs exceeds 'max_disk_bytes' (rows found in memory count as used on disk too)
+run_cached runs a model only on the input rows whose outputs are not in the cache and combines their outputs with the
+cached ones; the outputs of a row must depend on the inputs of that row only (as for the rows of T-REX, AgDrift, STIR).
+Models without one row of outputs per input row (e.g. TED, whose per simulation results go to its result sink) are not
+cached (see model_batch.run_chunk).
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import collections
+import glob
+import hashlib
+import logging
+import os
+import pandas as pd
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+from .model_batch import run_batch, run_chunk
+
+# number of keys per sqlite query
+query_size = 500
+# files of a model package that are part of the model version (source files and data files, e.g. the agdrift tables)
+version_patterns = ('*.py', '*.csv', '*.db', '*.json', '*.npy')
+
+
+class ModelResultCache(object):
+    """
+    Two tier (memory, disk) least recently used cache of the model outputs of input rows.
+    """
+
+    def __init__(self, max_memory_entries=100000, filename=None, max_disk_bytes=2 ** 30):
+        """
+        Class representing a cache of model outputs
+        :param max_memory_entries: number of rows held in memory
+        :param filename: path of sqlite database holding the disk tier (created if it does not exist); None - memory only
+        :param max_disk_bytes: size of the (pickled) outputs held on disk
+        """
+        self.max_memory_entries = max_memory_entries
+        self.filename = filename
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.conn = None
+        if filename is not None:
+            self.conn = sqlite3.connect(filename, check_same_thread=False)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS model_results "
+                              "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS model_results_last_used ON model_results (last_used)")
+            self.conn.commit()
+
+    def get_many(self, keys):
+        """
+        :description looks up the outputs of input rows (outputs found on disk are moved to the memory tier)
+        :param keys: list of row keys (see input_row_keys)
+        :return: dictionary of key -> cached outputs, for the keys found
+        """
+        with self.lock:
+            found = {}
+            for key in keys:
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    found[key] = self.memory[key]
+            disk_found = set()
+            if self.conn is not None:
+                # rows found in memory are used on disk too (or the most used rows would be evicted from disk first)
+                now = time.time()
+                self.conn.executemany("UPDATE model_results SET last_used = ? WHERE key = ?",
+                                      [(now, key) for key in found])
+                disk_keys = [key for key in set(keys) if key not in found]
+                for start in range(0, len(disk_keys), query_size):
+                    batch = disk_keys[start:start + query_size]
+                    rows = self.conn.execute("SELECT key, value FROM model_results WHERE key IN ({})".format(
+                        ','.join('?' * len(batch))), batch).fetchall()
+                    for key, value in rows:
+                        found[key] = self.memory[key] = pickle.loads(value)
+                        disk_found.add(key)
+                    self.conn.executemany("UPDATE model_results SET last_used = ? WHERE key = ?",
+                                          [(now, key) for key, value in rows])
+                self.conn.commit()
+
+            for key in keys:
+                if key not in found:
+                    self.misses += 1
+                elif key in disk_found:
+                    self.disk_hits += 1
+                    disk_found.discard(key)  # later rows with the same key are found in memory
+                else:
+                    self.memory_hits += 1
+            self.evict_memory()
+            return found
+
+    def put_many(self, entries):
+        """
+        :description stores the outputs of input rows
+        :param entries: dictionary of row key -> outputs
+        :return:
+        """
+        with self.lock:
+            for key, value in entries.items():
+                self.memory[key] = value
+                self.memory.move_to_end(key)
+            self.evict_memory()
+            if self.conn is not None:
+                now = time.time()
+                rows = []
+                for key, value in entries.items():
+                    blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                    rows.append((key, sqlite3.Binary(blob), len(blob), now))
+                self.conn.executemany("INSERT OR REPLACE INTO model_results (key, value, size, last_used) "
+                                      "VALUES (?, ?, ?, ?)", rows)
+                self.evict_disk()
+                self.conn.commit()
+
+    def evict_memory(self):
+        # drop the least recently used rows beyond the size of the memory tier
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def evict_disk(self):
+        # delete the least recently used rows until the outputs on disk fit in 'max_disk_bytes'
+        total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM model_results").fetchone()[0]
+        if total_bytes <= self.max_disk_bytes:
+            return
+        evicted = []
+        for key, size in self.conn.execute("SELECT key, size FROM model_results ORDER BY last_used"):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            evicted.append((key,))
+            total_bytes -= size
+        self.conn.executemany("DELETE FROM model_results WHERE key = ?", evicted)
+        logging.info('model result cache: {} rows evicted from {}'.format(len(evicted), self.filename))
+
+    def stats(self):
+        """
+        :description hit/miss counters of the cache (counted per input row looked up)
+        :return: dictionary of counter name -> value
+        """
+        with self.lock:
+            stats = {'memory_hits': self.memory_hits,
+                     'disk_hits': self.disk_hits,
+                     'misses': self.misses,
+                     'memory_entries': len(self.memory)}
+            if self.conn is not None:
+                stats['disk_entries'], stats['disk_bytes'] = self.conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM model_results").fetchone()
+            return stats
+
+    def close(self):
+        """
+        :description closes the disk tier
+        :return:
+        """
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+_model_versions = {}
+
+
+def model_version(model_cls):
+    """
+    :description version of a model: checksum of the source and data files of its package (see version_patterns), of
+    :            the data files declared by the model class (see UberModel.version_sources) and of the source files of
+    :            the base package (e.g. the input schema); cached outputs are not reused once one of them changes
+    :param model_cls: model class (e.g. Trex)
+    :return:
+    """
+    version = _model_versions.get(model_cls)
+    if version is None:
+        model_dir = os.path.dirname(os.path.abspath(sys.modules[model_cls.__module__].__file__))
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        filenames = glob.glob(os.path.join(base_dir, '*.py'))
+        for pattern in version_patterns:
+            filenames.extend(glob.glob(os.path.join(model_dir, pattern)))
+        filenames.extend(os.path.normpath(os.path.join(model_dir, source))
+                         for source in getattr(model_cls, 'version_sources', ()))
+        checksum = hashlib.sha1()
+        for filename in sorted(set(filenames)):
+            checksum.update(os.path.relpath(filename, model_dir).encode('utf-8'))
+            with open(filename, 'rb') as version_file:
+                checksum.update(version_file.read())
+        version = _model_versions.setdefault(model_cls, checksum.hexdigest())
+    return version
+
+
+def input_row_keys(model_cls, df, version=None, model_kwargs=None):
+    """
+    :description cache keys of the rows of a DataFrame of model inputs
+    :param model_cls: model class (e.g. Trex)
+    :param df: Pandas DataFrame of model inputs (one row per model run)
+    :param version: model version (default: see model_version)
+    :param model_kwargs: dictionary of keyword arguments of the model class (e.g. maxima_only)
+    :return: list of keys (one per row)
+    """
+    schema = model_cls.input_schema()
+    coerced = schema.coerce(df)
+    names = sorted(name for name in coerced if schema.required[name])
+    columns = []
+    for name in names:
+        values = coerced[name].tolist()
+        if coerced[name].dtype == 'object':
+            values = [value.strip() if isinstance(value, str) else value for value in values]
+        columns.append(values)
+    model_key = (model_cls.__name__, version or model_version(model_cls), sorted((model_kwargs or {}).items()))
+    prefix = repr(model_key + (names,))
+    return [hashlib.sha1((prefix + repr(row)).encode('utf-8')).hexdigest() for row in zip(*columns)]
+
+
+def run_cached(model_cls, df, cache, version=None, workers=1, **model_kwargs):
+    """
+    :description runs a model on the rows of an input DataFrame, reusing the cached outputs of rows run before
+    :param model_cls: model class (e.g. Trex)
+    :param df: Pandas DataFrame of model inputs (one row per model run)
+    :param cache: ModelResultCache
+    :param version: model version (default: see model_version)
+    :param workers: number of worker processes running the rows not in the cache (see model_batch.run_batch)
+    :param model_kwargs: keyword arguments of the model class (e.g. maxima_only=True); part of the cache keys
+    :return: Pandas DataFrame of model outputs, one row per input row (in input order, with the index of df)
+    :raises ValueError: if the model outputs are not one row per input row (see model_batch.run_chunk)
+    """
+    keys = input_row_keys(model_cls, df, version, model_kwargs)
+    found = cache.get_many(keys)
+
+    # run the first row of each key not in the cache
+    missing = collections.OrderedDict()
+    for position, key in enumerate(keys):
+        if key not in found:
+            missing.setdefault(key, position)
+    if missing:
+        df_missing = df.iloc[list(missing.values())]
+        if workers == 1:
+            df_out = run_chunk(model_cls, df_missing, model_kwargs)
+        else:
+            df_out = run_batch(model_cls, df_missing, workers=workers, **model_kwargs)
+        columns = tuple(df_out.columns)
+        computed = dict((key, (columns, row)) for key, row in zip(missing, df_out.itertuples(index=False, name=None)))
+        cache.put_many(computed)
+        found.update(computed)
+        if len(missing) == len(keys):
+            df_out.index = df.index
+            return df_out
+
+    if not keys:
+        return run_chunk(model_cls, df, model_kwargs)
+    entries = [found[key] for key in keys]
+    return pd.DataFrame([row for columns, row in entries], columns=entries[0][0], index=df.index).infer_objects()
@@ -0,0 +1,155 @@
+"""
+Registry of the ubertool models.
+
+Maps the name of each model (the name of its package, e.g. 'ted') to its model, inputs and outputs classes
+(e.g. Ted, TedInputs, TedOutputs). The package of a model is imported the first time one of its classes is requested,
+so a process only pays the import cost of the models it runs (model dependencies such as scipy are imported by the
+models when they first run); the time taken to import each model is recorded (see import_times).
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import importlib
+import logging
+import sys
+import threading
+import time
+
+# model name and model class name of each model; the model class is defined in <model name>/<model name>_exe.py
+# together with its inputs and outputs classes (<model class name>Inputs, <model class name>Outputs)
+model_classes = (('agdrift', 'Agdrift'),
+                 ('beerex', 'Beerex'),
+                 ('earthworm', 'Earthworm'),
+                 ('exponential', 'Exponential'),
+                 ('fellerarley', 'Fellerarley'),
+                 ('foxsurplus', 'Foxsurplus'),
+                 ('gompertz', 'Gompertz'),
+                 ('iec', 'Iec'),
+                 ('kabam', 'Kabam'),
+                 ('leslie', 'Leslie'),
+                 ('leslie_logistic', 'LeslieLogistic'),
+                 ('leslie_probit', 'Leslie_probit'),
+                 ('logistic', 'Logistic'),
+                 ('maxsus', 'Maxsus'),
+                 ('rice', 'Rice'),
+                 ('screenip', 'Screenip'),
+                 ('stir', 'Stir'),
+                 ('ted', 'Ted'),
+                 ('terrplant', 'Terrplant'),
+                 ('therps', 'Therps'),
+                 ('trex', 'Trex'),
+                 ('varroapop', 'Varroapop'),
+                 ('yulefurry', 'YuleFurry'))
+
+# package holding the model packages (the parent of this module's 'base' package; empty if 'base' is top level)
+models_package = __name__.rsplit('.', 2)[0] if __name__.count('.') > 1 else ''
+
+
+class ModelEntry(object):
+    """
+    Registry entry of a model; the model module is imported on first use.
+    """
+
+    def __init__(self, name, class_name):
+        """Class representing a registered model"""
+        self.name = name
+        self.class_name = class_name
+        self.module_name = '.'.join(filter(None, (models_package, name, name + '_exe')))
+        self.module = None
+        self.import_time = None
+
+    def load(self):
+        """
+        :description imports the model module and records the time taken
+        :return: model module
+        """
+        start = time.time()
+        module = importlib.import_module(self.module_name)
+        self.import_time = time.time() - start
+        logging.info('imported ubertool model {} in {:.3f} s'.format(self.name, self.import_time))
+        return module
+
+
+_models = dict((name, ModelEntry(name, class_name)) for name, class_name in model_classes)
+_models_lock = threading.Lock()
+
+
+def model_names():
+    """
+    :description names of the registered models
+    :return: list of model names
+    """
+    return [name for name, class_name in model_classes]
+
+
+def get_model_module(name):
+    """
+    :description returns the module of a model (e.g. ted.ted_exe); the module is imported the first time it is requested
+    :param name: model name (e.g. 'ted')
+    :return:
+    """
+    entry = _models.get(name)
+    if entry is None:
+        raise ValueError("{} is not a registered ubertool model".format(name))
+    with _models_lock:
+        if entry.module is None:
+            entry.module = entry.load()
+    return entry.module
+
+
+def get_model(name):
+    """
+    :description returns the model class of a model (e.g. Ted)
+    :param name: model name (e.g. 'ted')
+    :return:
+    """
+    return getattr(get_model_module(name), _models[name].class_name)
+
+
+def get_model_inputs(name):
+    """
+    :description returns the inputs class of a model (e.g. TedInputs)
+    :param name: model name (e.g. 'ted')
+    :return:
+    """
+    return getattr(get_model_module(name), _models[name].class_name + 'Inputs')
+
+
+def get_model_outputs(name):
+    """
+    :description returns the outputs class of a model (e.g. TedOutputs)
+    :param name: model name (e.g. 'ted')
+    :return:
+    """
+    return getattr(get_model_module(name), _models[name].class_name + 'Outputs')
+
+
+def import_times():
+    """
+    :description time taken to import each model imported so far (measured in this process, on first import)
+    :return: dictionary of model name -> seconds
+    """
+    return dict((name, entry.import_time) for name, entry in _models.items() if entry.import_time is not None)
+
+
+def preload(names=None):
+    """
+    :description imports models ahead of their first run (e.g. when a worker process starts)
+    :param names: names of models to import (default: all registered models)
+    :return: dictionary of model name -> import time (seconds) of the models imported
+    """
+    for name in (model_names() if names is None else names):
+        get_model_module(name)
+    return import_times()
+
+
+if __name__ == '__main__':
+    # report import times: python -m ubertool.base.model_registry [model name ...]
+    import pandas  # shared by all models (not counted in the import time of the first model)
+    times = {}
+    for model_name in (sys.argv[1:] or model_names()):
+        try:
+            get_model_module(model_name)
+            times[model_name] = _models[model_name].import_time
+        except ImportError as err:
+            print('{:<16} import failed: {}'.format(model_name, err))
+    for model_name, seconds in sorted(times.items(), key=lambda item: -item[1]):
+        print('{:<16} {:8.1f} ms'.format(model_name, 1000. * seconds))
@@ -0,0 +1,313 @@
+import datetime
+import inspect
+import numpy.testing as npt
+import os.path
+import pandas as pd
+import pandas.util.testing as pdt
+import shutil
+import sys
+from tabulate import tabulate
+import tempfile
+import unittest
+
+from ...stir.stir_exe import Stir
+from ...ted.ted_exe import Ted
+from ...trex.trex_exe import Trex
+from ..model_batch import read_input_chunks, run_batch, run_stream
+from .. import model_cache
+from ..model_cache import ModelResultCache, input_row_keys, run_cached
+from ..model_registry import get_model, get_model_outputs, import_times, model_names
+
+print("Python version: " + sys.version)
+
+test = {}
+
+def read_qaqc_inputs(model_name):
+    """
+    :description reads the qaqc inputs of a model (<model name>/tests/<model name>_qaqc_in_transpose.csv)
+    :param model_name: model name (e.g. 'stir')
+    :return: Pandas DataFrame of model inputs
+    """
+    csv_path = os.path.join(os.path.dirname(__file__), '..', '..', model_name, 'tests',
+                            model_name + "_qaqc_in_transpose.csv")
+    return pd.read_csv(csv_path, index_col=0, engine='python')
+
+class TestBase(unittest.TestCase):
+    """
+    Unit tests for the modules shared by the ubertool models (model registry, batch runs, cache).
+    """
+    print("base unittests conducted at " + str(datetime.datetime.today()))
+
+    def setUp(self):
+        """
+        Setup routine for base unit tests.
+        :return:
+        """
+        pass
+
+    def tearDown(self):
+        """
+        Teardown routine for base unit tests.
+        :return:
+        """
+        pass
+
+    def test_model_registry(self):
+        """
+        :description the model registry resolves a model name to its model, inputs and outputs classes (importing the
+                     model package on first use and recording its import time); model outputs are named by the outputs class
+
+        :return:
+        """
+        expected_results = ['ted']
+        result = []
+
+        try:
+            self.assertIs(get_model('ted'), Ted)
+            self.assertIs(Ted.model_base_class('Outputs'), get_model_outputs('ted'))
+            self.assertEqual(Ted.output_names(), list(get_model_outputs('ted')().__dict__))
+            self.assertRaises(ValueError, get_model, 'not_a_model')
+            result = [name for name in import_times() if name == 'ted']
+            self.assertIn('ted', model_names())
+            self.assertEqual(result, expected_results)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_run_batch(self):
+        """
+        unittest for function model_batch.run_batch
+        the model outputs of a batch run in chunks (in this process and in worker processes) are those of a single run
+        :return:
+        """
+        df_inputs = pd.concat([read_qaqc_inputs('stir')] * 3, ignore_index=True)
+        df_inputs.index = df_inputs.index + 10
+
+        stir_single = Stir(df_inputs.reset_index(drop=True), None)
+        stir_single.execute_model()
+        expected_results = stir_single.pd_obj_out.set_index(df_inputs.index)
+        result = None
+        try:
+            result = run_batch(Stir, df_inputs, workers=1)
+            pdt.assert_frame_equal(result, expected_results)
+            result = run_batch(Stir, df_inputs, workers=2, chunk_size=2)
+            pdt.assert_frame_equal(result, expected_results)
+        finally:
+            tab = [result.out_sat_air_conc if result is not None else [], expected_results.out_sat_air_conc]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_run_batch_trex(self):
+        """
+        unittest for function model_batch.run_batch
+        models filling in their outputs row by row (e.g. trex) give the outputs of a single run in chunks of rows
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('trex')
+        df_inputs.index = df_inputs.index + 10
+
+        trex_single = Trex(df_inputs.reset_index(drop=True), None)
+        trex_single.execute_model()
+        expected_results = trex_single.pd_obj_out.set_index(df_inputs.index)
+        result = None
+        try:
+            result = run_batch(Trex, df_inputs, workers=1, chunk_size=3)
+            pdt.assert_frame_equal(result, expected_results)
+        finally:
+            tab = [result.out_c_0_sg if result is not None else [], expected_results.out_c_0_sg]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_run_batch_ted(self):
+        """
+        unittest for function model_batch.run_batch
+        models without one row of outputs per input row (e.g. ted, whose results go to its result sink) are not run
+        in chunks
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('ted')
+        with self.assertRaises(ValueError):
+            run_batch(Ted, df_inputs, workers=1, chunk_size=1)
+        return
+
+    def test_run_stream(self):
+        """
+        unittest for function model_batch.run_stream
+        the model outputs streamed to a csv file, a chunk of input rows at a time, are those of a single run
+        :return:
+        """
+        df_inputs = pd.concat([read_qaqc_inputs('stir')] * 3, ignore_index=True)
+
+        stir_single = Stir(df_inputs, None)
+        stir_single.execute_model()
+        expected_results = stir_single.pd_obj_out
+        result = None
+        stream_dir = tempfile.mkdtemp()
+        try:
+            input_path = os.path.join(stream_dir, "stir_inputs.csv")
+            output_path = os.path.join(stream_dir, "stir_outputs.csv")
+            df_inputs.to_csv(input_path)
+            num_rows = run_stream(Stir, read_input_chunks(input_path, 4, index_col=0), output_path)
+            result = pd.read_csv(output_path, index_col=0)
+            self.assertEqual(num_rows, len(df_inputs))
+            self.assertEqual(list(result.columns), list(expected_results.columns))
+            npt.assert_allclose(result.out_sat_air_conc, expected_results.out_sat_air_conc, rtol=1e-12, atol=0,
+                                err_msg='', verbose=True)
+            pdt.assert_series_equal(result.out_loc_vid_avian, expected_results.out_loc_vid_avian)
+        finally:
+            shutil.rmtree(stream_dir, ignore_errors=True)
+            tab = [result.out_sat_air_conc if result is not None else [], expected_results.out_sat_air_conc]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_run_cached(self):
+        """
+        unittest for function model_cache.run_cached
+        outputs of input rows run before come from the cache (memory, then disk tier); only new rows are run
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('stir')
+
+        stir_single = Stir(df_inputs.copy(), None)
+        stir_single.execute_model()
+        expected_results = stir_single.pd_obj_out
+        result = None
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache_path = os.path.join(cache_dir, "stir_cache.db")
+            cache = ModelResultCache(max_memory_entries=5, filename=cache_path)
+            result = run_cached(Stir, df_inputs, cache)
+            pdt.assert_frame_equal(result, expected_results)
+            self.assertEqual(cache.stats()['misses'], len(df_inputs))
+
+            # rows with surrounding whitespace in text inputs are the same (normalized) rows
+            df_edited = df_inputs.copy()
+            df_edited['chemical_name'] = df_edited['chemical_name'] + ' '
+            result = run_cached(Stir, df_edited, cache)
+            pdt.assert_frame_equal(result, expected_results)
+            stats = cache.stats()
+            self.assertEqual([stats['memory_hits'], stats['disk_hits'], stats['misses']],
+                             [5, len(df_inputs) - 5, len(df_inputs)])
+            self.assertEqual(stats['memory_entries'], 5)
+            cache.close()
+
+            # a disk tier too small for all rows keeps the most recently used rows
+            cache = ModelResultCache(max_memory_entries=5, filename=cache_path, max_disk_bytes=stats['disk_bytes'] // 2)
+            result = run_cached(Stir, df_inputs.iloc[:1], cache)
+            pdt.assert_frame_equal(result, expected_results.iloc[:1])
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+            df_changed = df_inputs.iloc[:1].copy()
+            df_changed['molecular_weight'] = df_changed['molecular_weight'] * 2.
+            run_cached(Stir, df_changed, cache)
+            stats = cache.stats()
+            self.assertEqual(stats['misses'], 1)
+            self.assertLessEqual(stats['disk_bytes'], cache.max_disk_bytes)
+            cache.close()
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            tab = [result.out_sat_air_conc if result is not None else [], expected_results.out_sat_air_conc]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_input_row_keys(self):
+        """
+        unittest for function model_cache.input_row_keys
+        the cache keys of input rows depend on the keyword arguments of the model class (e.g. maxima_only)
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('stir')
+        expected_results = input_row_keys(Stir, df_inputs, 'v1')
+        result = None
+        try:
+            result = input_row_keys(Stir, df_inputs, 'v1', {})
+            self.assertEqual(result, expected_results)
+            result = input_row_keys(Stir, df_inputs, 'v1', {'maxima_only': True})
+            self.assertEqual(len(set(result) & set(expected_results)), 0)
+            self.assertEqual(input_row_keys(Stir, df_inputs, 'v1', {'maxima_only': True, 'num_workers': 2}),
+                             input_row_keys(Stir, df_inputs, 'v1', dict([('num_workers', 2), ('maxima_only', True)])))
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_model_result_cache_last_used(self):
+        """
+        unittest for function ModelResultCache.get_many
+        rows found in the memory tier are marked as used in the disk tier as well
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('stir')
+        expected_results = [True] * len(df_inputs)
+        result = None
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache = ModelResultCache(filename=os.path.join(cache_dir, "stir_cache.db"))
+            run_cached(Stir, df_inputs, cache, version='v1')
+            cache.conn.execute("UPDATE model_results SET last_used = 0")
+            keys = input_row_keys(Stir, df_inputs, 'v1')
+            found = cache.get_many(keys)
+            self.assertEqual(cache.stats()['memory_hits'], len(df_inputs))
+            last_used = dict(cache.conn.execute("SELECT key, last_used FROM model_results").fetchall())
+            result = [key in found and last_used[key] > 0 for key in keys]
+            self.assertEqual(result, expected_results)
+            cache.close()
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_model_version_data_files(self):
+        """
+        unittest for function model_cache.model_version
+        a change to a data file of a model (see UberModel.version_sources) gives new cache keys of its input rows
+        :return:
+        """
+        df_inputs = read_qaqc_inputs('stir')
+        # keys shared with the keys of the original table: changed table, original table restored
+        expected_results = [0, len(df_inputs)]
+        result = []
+        data_dir = tempfile.mkdtemp()
+        try:
+            data_path = os.path.join(data_dir, "stir_table.csv")
+            Stir.version_sources = (data_path,)
+            keys = []
+            for table in ("a,b\n1,2\n", "a,b\n1,3\n", "a,b\n1,2\n"):
+                with open(data_path, 'w') as data_file:
+                    data_file.write(table)
+                model_cache._model_versions.pop(Stir, None)
+                keys.append(input_row_keys(Stir, df_inputs))
+            result = [len(set(keys[0]) & set(row_keys)) for row_keys in keys[1:]]
+            self.assertEqual(result, expected_results)
+        finally:
+            del Stir.version_sources
+            model_cache._model_versions.pop(Stir, None)
+            shutil.rmtree(data_dir, ignore_errors=True)
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+
+# unittest will
+# 1) call the setup method,
+# 2) then call every method starting with "test",
+# 3) then the teardown method
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,82 @@
-import importlib
 import pandas as pd
 from pandas import compat
 from .parser import Parser
 import logging
+import threading
+
+
+class InputSchema(object):
+    """
+    Compiled description of the inputs of a model: the name, dtype and required flag of each attribute of the
+    model's *ModelName*Inputs class (e.g. TedInputs). The schema is built once per model class (see
+    UberModel.input_schema) and binds a whole DataFrame of user supplied inputs at a time.
+    """
+
+    def __init__(self, model_inputs):
+        """
+        :param model_inputs: *ModelName*Inputs() class instance
+        """
+        optional = getattr(model_inputs, 'optional_inputs', ())
+        self.names = list(model_inputs.__dict__)
+        self.dtypes = dict((name, str(getattr(model_inputs, name).dtype)) for name in self.names)
+        self.required = dict((name, name not in optional) for name in self.names)
+
+    def validate(self, user_inputs):
+        """
+        Compare the columns of the user supplied inputs with the model inputs, ensuring all required inputs are present
+        (extra columns are allowed and ignored)
+
+        :param user_inputs: Pandas DataFrame object of model input parameters
+        :return: Boolean
+        """
+        received = set(user_inputs.columns)
+        missing = [name for name in self.names if self.required[name] and name not in received]
+        if not missing:
+            return True
+        msg_err1 = "Inputs parameters do not have all required inputs. Please see API documentation.\n"
+        msg_err2 = "Expected: \n{}\n".format(sorted(self.names))
+        msg_err3 = "Received: \n{}\n".format(sorted(received, key=str))
+        msg_missing = "missing the following field(s): \n{}\n".format(missing)
+        extras = [item for item in user_inputs.columns if item not in self.dtypes]
+        msg_extras = "the following extra field(s) were found: \n{}\n".format(extras)
+        raise ValueError(msg_err1 + msg_err2 + msg_err3 + msg_missing + msg_extras)
+
+    def coerce(self, user_inputs):
+        """
+        Coerce the user supplied inputs to the dtypes of the model inputs; columns sharing the same conversion are
+        converted together
+
+        :param user_inputs: Pandas DataFrame object of model input parameters
+        :return: dictionary of input name -> Pandas Series
+        """
+        incoming_dtypes = user_inputs.dtypes
+        columns = [column for column in user_inputs.columns if column in self.dtypes]
+        conversions = {}
+        for column in columns:
+            coerce_dtype = self.dtypes[column]
+            incoming_dtype = str(incoming_dtypes[column])
+            if coerce_dtype == 'object':
+                conversion = 'object'
+            elif incoming_dtype == 'object':
+                # strings are coerced to np.nans
+                conversion = 'numeric'
+            elif coerce_dtype == 'float64':
+                conversion = None if incoming_dtype == 'float64' else 'float64'
+            else:
+                conversion = 'int64'
+            conversions.setdefault(conversion, []).append(column)
+
+        coerced = {}
+        for conversion, names in conversions.items():
+            if conversion is None:
+                coerced.update((name, user_inputs[name]) for name in names)
+            elif conversion == 'numeric':
+                coerced.update((name, pd.to_numeric(user_inputs[name], errors='coerce')) for name in names)
+            else:
+                converted = user_inputs[names].astype(conversion)
+                coerced.update((name, converted[name]) for name in names)
+        return coerced
+
 
 
 class UberModel(object):
@@ -10,6 +84,14 @@ class UberModel(object):
     Collection of static methods used across all the ubertool models.
     """
 
+    # compiled input schema and output names of each model class (see input_schema, output_names)
+    _input_schemas = {}
+    _input_schemas_lock = threading.Lock()
+    _output_names = {}
+    # data files (paths relative to the model package) kept outside the model package directory whose changes change
+    # the model outputs (see model_cache.model_version)
+    version_sources = ()
+
     def __init__(self):
         """Main utility class for building Ubertool model classes for model execution."""
         super(UberModel, self).__init__()
@@ -18,67 +100,43 @@ class UberModel(object):
         self.pd_obj_exp = None
         self.pd_obj_out = None
 
-    def validate_input_names(self, model_inputs, user_inputs):
+    @classmethod
+    def input_schema(cls):
         """
-        Compare the user supplied inputs with the ModelInputs() class attributes, ensuring they match by name
+        Return the compiled input schema of the model; the model's input class (e.g. TedInputs, a base class of Ted)
+        is inspected the first time the schema is requested and the schema is shared by all instances of the model
+        :return: InputSchema
+        """
+        schema = cls._input_schemas.get(cls)
+        if schema is None:
+            model_inputs_class = cls.model_base_class("Inputs")
+            with cls._input_schemas_lock:
+                schema = cls._input_schemas.setdefault(cls, InputSchema(model_inputs_class()))
+        return schema
 
-        :param model_inputs: ModelInputs() class instance
-        :return: Boolean
+    @classmethod
+    def output_names(cls):
         """
-        # Create temporary DataFrame where each column name is the same as ModelInputs attributes
-        df = pd.DataFrame()
-        for input_param in model_inputs.__dict__:
-            df[input_param] = getattr(self, input_param)
-        keys_a = set(df.keys())
-        keys_b = set(self.pd_obj.keys())
-        extras = keys_b - keys_a
-        n_extras = len(extras)
-        print(f'There are {n_extras} extra keys.')
-        if(n_extras > 0): print(extras)
-        missing = keys_a - keys_b
-        n_missing = len(missing)
-        print(f'There are {n_missing} missing keys.')
-        if(n_missing > 0): print(missing)
-        # Compare column names of temporary DataFrame (created above) to user-supply DataFrame from JSON
-        #if df.columns.sort_values().equals(user_inputs.columns.sort_values()):
-        if n_extras >= 0 and n_missing == 0:
-            print('Input parameters match what is expected.')
-            print(set(df.keys()))
-            return True
-        else:
-            print('Inputs parameters do not have all required inputs.')
-            msg_err1 = "Inputs parameters do not have all required inputs. Please see API documentation.\n"
-            msg_err2 = "Expected: \n{}\n".format(df.columns.sort_values())
-            msg_err3 = "Received: \n{}\n".format(self.pd_obj.columns.sort_values())
-            missing = [item for item in keys_a if item not in keys_b]
-            msg_missing = "missing the following field(s): \n{}\n".format(missing)
-            extras = [item for item in keys_b if item not in keys_a]
-            msg_extras = "the following extra field(s) were found: \n{}\n".format(extras)
-            print(msg_err1 + msg_err2 + msg_err3 + msg_missing + msg_extras)
-            raise ValueError(msg_err1 + msg_err2 + msg_err3 + msg_missing + msg_extras)
-
-    def coerce_input_dtype(self, incoming_dtype, coerce_dtype, input_series):
-        #logging.info(incoming_dtype)
-        if coerce_dtype == 'object':
-            return input_series.astype('object')
-        elif coerce_dtype == 'float64':
-            if incoming_dtype == 'object':
-                #coerces strings to np.nans
-                return pd.to_numeric(input_series, errors='coerce')
-            elif incoming_dtype == 'float64':
-                return input_series
-            else:
-                return input_series.astype('float64')
-        elif coerce_dtype == 'int64' or 'int32':
-            if incoming_dtype == 'object':
-                #coerces strings to np.nans
-                return pd.to_numeric(input_series, errors='coerce', downcast='int64')
-            else:
-                return input_series.astype('int64')
-        else:
-            print("dtype of {} is {}\n"
-                  "This format is not handled by UberModel.coerce_input_dtype()".format(input_series.name, coerce_dtype))
-            return input_series
+        Return the names of the model outputs (the attributes of e.g. TedOutputs, a base class of Ted)
+        :return: list of output names
+        """
+        names = cls._output_names.get(cls)
+        if names is None:
+            names = cls._output_names.setdefault(cls, list(cls.model_base_class("Outputs")().__dict__))
+        return names
+
+    @classmethod
+    def model_base_class(cls, suffix):
+        """
+        Return the input or output class of the model (e.g. TedInputs for Ted and suffix "Inputs")
+        :param suffix: "Inputs" or "Outputs"
+        :return: class
+        """
+        class_name = cls.__name__ + suffix
+        for base in cls.__mro__:
+            if base.__name__ == class_name:
+                return base
+        raise ValueError("{} has no {} class {}".format(cls.__name__, suffix.lower(), class_name))
 
     @staticmethod
     def convert_index(df_in):
@@ -91,35 +149,21 @@ class UberModel(object):
         """
         Validate and assign user-provided model inputs to their respective class attributes
         :param df_in: Pandas DataFrame object of model input parameters
+        :raises ValueError: if a required input is missing (see InputSchema.validate)
         """
         df_user = self.convert_index(df_in)
-        # mod_name = self.name.lower() + '.' + self.name.lower() + '_exe'
-        mod_name = "pram_flask.ubertool.ubertool." + self.name.lower() + "." + self.name.lower() + '_exe'
-        #print(mod_name)
         try:
-            # Import the model's input class (e.g. TedInputs) to compare user supplied inputs to
-            module = importlib.import_module(mod_name)
-            model_inputs_class = getattr(module, self.name + "Inputs")
-            model_inputs = model_inputs_class()
-        except ValueError as err:
-            logging.info(mod_name)
-            logging.info(err.args)
-
-        try:
-            if self.validate_input_names(model_inputs, df_user):
-                # If the user-supplied DataFrame has the same column names as required by ModelInputs...
-                # set each Series in the DataFrame to the corresponding ModelInputs attribute (member variable)
-                # user_inputs_df = self._sanitize(df)
-                for column in df_user.columns:
-                    coerce_dtype = str(getattr(model_inputs, column).dtype)
-                    df_series = df_user[column]
-                    initial_dtype = str(df_series.dtype)
-                    #if initial_dtype != coerce_dtype:
-                        #logging.info('var:' + column + ' coerce to: ' + coerce_dtype + ' from: ' + initial_dtype)
-                    setattr(self, column, self.coerce_input_dtype(initial_dtype, coerce_dtype, df_series))
+            # Compare user supplied inputs to the model's input schema (compiled once from e.g. TedInputs)
+            schema = self.input_schema()
+            schema.validate(df_user)
         except ValueError as err:
             logging.info('input validation problem')
             logging.info(err.args)
+            raise
+        # The user-supplied DataFrame has all the inputs required by ModelInputs...
+        # set each Series in the DataFrame to the corresponding ModelInputs attribute (member variable)
+        for column, series in schema.coerce(df_user).items():
+            setattr(self, column, series)
 
     def populate_outputs(self):
         # Create temporary DataFrame where each column name is the same as *ModelName*Outputs attributes
@@ -129,16 +173,11 @@ class UberModel(object):
         :param model_obj: class instance, instance of the model class for which the
         :return:
         """
-        # Import the model's output class (e.g. TerrplantOutputs) to create a DF to store the model outputs in
-        mod_name = self.name.lower() + '.' + self.name.lower() + '_exe'
-        #mod_name = "ubertool_ecorest.ubertool.ubertool." + self.name.lower() + "." + self.name.lower() + '_exe'
-        module = importlib.import_module(mod_name)
-        model_outputs = getattr(module, self.name + "Outputs")
-        model_outputs_obj = model_outputs()
+        # Use the names of the model's outputs (e.g. TerrplantOutputs attributes) to create a DF to store the model outputs in
         df = pd.DataFrame()
-        for input_param in model_outputs_obj.__dict__:
+        for input_param in self.output_names():
+            # the output attributes stay standalone Series (models fill them in element by element)
             df[input_param] = getattr(self, input_param)
-            setattr(self, input_param, df[input_param])
         return df
 
     def fill_output_dataframe(self):
@@ -214,6 +253,9 @@ class UberModel(object):
 
 
 class ModelSharedInputs(object):
+    # inputs that users may leave out (see InputSchema)
+    optional_inputs = ('csrfmiddlewaretoken',)
+
     def __init__(self):
         """
         Container for the shared model inputs amongst most models (e.g. version, chemical name, & PC Code)
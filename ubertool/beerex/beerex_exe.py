@@ -10,6 +10,33 @@ sys.path.append(parentddir)
 
 from base.uber_model import UberModel, ModelSharedInputs
 
+# food types of the bees, the input holding their empirical residue concentration (ug a.i./g) and the divisor of the
+# EEC giving their residue concentration (ug a.i./mg) when no empirical residues are provided
+bee_foods = (('jelly', 'empirical_jelly', 100.),
+             ('nectar', 'empirical_nectar', 1.),
+             ('pollen', 'empirical_pollen', 1.))
+
+# castes/ages of the bees (as named in the model outputs), the inputs holding their consumption rates (mg/day) of each
+# food type (see 'bee_foods'; None where the food type is not consumed) and whether larval toxicity endpoints apply
+bee_castes = (('lw1', ('lw1_jelly', None, None), True),
+              ('lw2', ('lw2_jelly', None, None), True),
+              ('lw3', ('lw3_jelly', None, None), True),
+              ('lw4', (None, 'lw4_nectar', 'lw4_pollen'), True),
+              ('lw5', (None, 'lw5_nectar', 'lw5_pollen'), True),
+              ('ld6', (None, 'ld6_nectar', 'ld6_pollen'), True),
+              ('lq1', ('lq1_jelly', None, None), True),
+              ('lq2', ('lq2_jelly', None, None), True),
+              ('lq3', ('lq3_jelly', None, None), True),
+              ('lq4', ('lq4_jelly', None, None), True),
+              ('aw_cell', (None, 'aw_cell_nectar', 'aw_cell_pollen'), False),
+              ('aw_brood', (None, 'aw_brood_nectar', 'aw_brood_pollen'), False),
+              ('aw_comb', (None, 'aw_comb_nectar', 'aw_comb_pollen'), False),
+              ('aw_pollen', (None, 'aw_fpollen_nectar', 'aw_fpollen_pollen'), False),
+              ('aw_nectar', (None, 'aw_fnectar_nectar', 'aw_fnectar_pollen'), False),
+              ('aw_winter', (None, 'aw_winter_nectar', 'aw_winter_pollen'), False),
+              ('ad', (None, 'ad_nectar', 'ad_pollen'), False),
+              ('aq', ('aq_jelly', None, None), False))
+
 class BeerexInputs(ModelSharedInputs):
     """
     Input class for Beerex
@@ -175,66 +202,16 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
         """Execute the model's methods to generate the model output"""
         self.set_global_constants()
         self.eec()
-        self.lw1_total_dose()
-        self.lw2_total_dose()
-        self.lw3_total_dose()
-        self.lw4_total_dose()
-        self.lw5_total_dose()
-        self.ld6_total_dose()
-        self.lq1_total_dose()
-        self.lq2_total_dose()
-        self.lq3_total_dose()
-        self.lq4_total_dose()
-        self.aw_cell_total_dose()
-        self.aw_brood_total_dose()
-        self.aw_comb_total_dose()
-        self.aw_pollen_total_dose()
-        self.aw_nectar_total_dose()
-        self.aw_winter_total_dose()
-        self.ad_total_dose()
-        self.aq_total_dose()
-        self.lw1_acute_rq()
-        self.lw2_acute_rq()
-        self.lw3_acute_rq()
-        self.lw4_acute_rq()
-        self.lw5_acute_rq()
-        self.ld6_acute_rq()
-        self.lq1_acute_rq()
-        self.lq2_acute_rq()
-        self.lq3_acute_rq()
-        self.lq4_acute_rq()
-        self.aw_cell_acute_rq()
-        self.aw_brood_acute_rq()
-        self.aw_comb_acute_rq()
-        self.aw_pollen_acute_rq()
-        self.aw_nectar_acute_rq()
-        self.aw_winter_acute_rq()
-        self.ad_acute_rq()
-        self.aq_acute_rq()
-        self.lw1_chronic_rq()
-        self.lw2_chronic_rq()
-        self.lw3_chronic_rq()
-        self.lw4_chronic_rq()
-        self.lw5_chronic_rq()
-        self.ld6_chronic_rq()
-        self.lq1_chronic_rq()
-        self.lq2_chronic_rq()
-        self.lq3_chronic_rq()
-        self.lq4_chronic_rq()
-        self.aw_cell_chronic_rq()
-        self.aw_brood_chronic_rq()
-        self.aw_comb_chronic_rq()
-        self.aw_pollen_chronic_rq()
-        self.aw_nectar_chronic_rq()
-        self.aw_winter_chronic_rq()
-        self.ad_chronic_rq()
-        self.aq_chronic_rq()
+        # doses and risk quotients of all castes/ages for all model simulation runs at once
+        self.total_doses()
+        self.risk_quotients()
     #   except TypeError:
     #
 
     def eec_spray(self, i):
         """
         EEC for foliar spray
+        :param i: model simulation run (or boolean mask of model simulation runs)
         """
         self.out_eec_spray[i] = (110. * self.application_rate[i]) / 1000
         self.out_eec_soil[i] = np.nan
@@ -245,6 +222,7 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
     def eec_soil(self, i):
         """
         EEC for soil application
+        :param i: model simulation run (or boolean mask of model simulation runs)
         """
         self.out_eec_soil[i] = ((10.**(0.95*self.log_kow[i]-2.05)+0.82) *
                              (-0.0648*(self.log_kow[i]**2)+0.2431*self.log_kow[i]+0.5822) *
@@ -257,6 +235,7 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
     def eec_seed(self, i):
         """
         EEC for seed treatment
+        :param i: model simulation run (or boolean mask of model simulation runs)
         """
         self.out_eec_seed[i] = 1./1000.
         self.out_eec_soil[i] = np.nan
@@ -267,6 +246,7 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
     def eec_tree(self, i):
         """
         EEC for tree trunk
+        :param i: model simulation run (or boolean mask of model simulation runs)
         """
         self.out_eec_tree[i] = (self.application_rate[i]/self.mass_tree_vegetation[i]) / 1000.
         self.out_eec_soil[i] = np.nan
@@ -277,223 +257,223 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
     def eec(self):
         """
         determine which application method is used for subsequent EEC and RQ calculations
-        """
-        print('eec method')
-        print(self.n_runs)
-        for i in range(self.n_runs):
-            if self.application_method[i] == 'foliar spray':
-                self.eec_spray(i)
-                self.out_eec[i] = self.out_eec_spray[i]
-            elif self.application_method[i] == 'soil application':
-                print('running beerex soil application')
-                self.eec_soil(i)
-                self.out_eec[i] = self.out_eec_soil[i]
-            elif self.application_method[i] == 'seed treatment':
-                self.eec_seed(i)
-                self.out_eec[i] = self.out_eec_seed[i]
-            elif self.application_method[i] == 'tree trunk':
-                self.eec_tree(i)
-                self.out_eec[i] = self.out_eec_tree[i]
-        #print(self.out_eec)
+        (the EECs of all model simulation runs are computed at once, selecting the runs of each application method
+        with a mask)
+        """
+        application_method = np.asarray(self.application_method, dtype='object')[:self.n_runs]
+        method_masks = [application_method == 'foliar spray', application_method == 'soil application',
+                        application_method == 'seed treatment', application_method == 'tree trunk']
+        for method_mask, eec_method in zip(method_masks, (self.eec_spray, self.eec_soil, self.eec_seed, self.eec_tree)):
+            if method_mask.any():
+                eec_method(method_mask)
+        self.out_eec = pd.Series(np.select(method_masks, [self.out_eec_spray, self.out_eec_soil, self.out_eec_seed,
+                                                          self.out_eec_tree], np.nan), name="out_eec", dtype="float")
         return self.out_eec
 
+    def caste_consumption_rates(self, castes):
+        """
+        food consumption rates (mg/day) of bee castes/ages for all model simulation runs
+        :param castes: entries of 'bee_castes'
+        :return: (n_runs x castes x food types) array of consumption rates and (castes x food types) boolean array
+                 identifying the food types consumed by each caste
+        """
+        consumption = np.zeros((self.n_runs, len(castes), len(bee_foods)))
+        consumed = np.zeros((len(castes), len(bee_foods)), dtype=bool)
+        for k, (caste, food_inputs, larval) in enumerate(castes):
+            for f, food_input in enumerate(food_inputs):
+                if food_input is not None:
+                    consumption[:, k, f] = np.asarray(getattr(self, food_input), dtype=float)[:self.n_runs]
+                    consumed[k, f] = True
+        return consumption, consumed
+
+    def food_residue_concentrations(self, foods):
+        """
+        residue concentrations (ug a.i./mg) of the food types for all model simulation runs; empirical residues are used
+        in runs where 'empirical_residue' is "yes" and the EEC in runs where it is "no" (NaN otherwise)
+        :param foods: boolean array identifying the food types (see 'bee_foods') to be computed (NaN otherwise)
+        :return: (n_runs x food types) array
+        """
+        empirical_residue = np.asarray(self.empirical_residue, dtype='object')[:self.n_runs]
+        empirical_runs = np.flatnonzero(empirical_residue == "yes")
+        eec_runs = np.flatnonzero(empirical_residue == "no")
+        eec = np.asarray(self.out_eec, dtype=float)
+
+        concentrations = np.full((self.n_runs, len(bee_foods)), np.nan)
+        for f, (food, empirical_input, eec_divisor) in enumerate(bee_foods):
+            if foods[f]:
+                concentrations[empirical_runs, f] = \
+                    np.asarray(getattr(self, empirical_input), dtype=float)[empirical_runs] / 1000.
+                concentrations[eec_runs, f] = eec[eec_runs] / eec_divisor
+        return concentrations
+
+    def total_doses(self, castes=bee_castes):
+        """
+        Pesticide doses in ug a.i./bee of bee castes/ages for all model simulation runs; the food residue
+        concentrations (n_runs x food types) are multiplied into the consumption rates (n_runs x castes x food types)
+        and summed over the food types
+        :param castes: entries of 'bee_castes' (all castes/ages by default)
+        :return: (n_runs x castes) array
+        """
+        consumption, consumed = self.caste_consumption_rates(castes)
+        concentrations = self.food_residue_concentrations(consumed.any(axis=0))
+        doses = np.where(consumed, concentrations[:, None, :] * consumption, 0.).sum(axis=2)
+        for k, (caste, food_inputs, larval) in enumerate(castes):
+            name = "out_" + caste + "_total_dose"
+            setattr(self, name, pd.Series(doses[:, k], name=name, dtype="float"))
+        return doses
+
+    def caste_total_dose(self, caste):
+        """
+        Pesticide dose in ug a.i./bee of a single bee caste/age (see 'total_doses')
+        """
+        return self.total_doses([entry for entry in bee_castes if entry[0] == caste])[:, 0]
+
+    def risk_quotients(self, castes=bee_castes):
+        """
+        Acute and chronic risk quotients of bee castes/ages for all model simulation runs; the doses (castes x n_runs)
+        are divided by the larval or adult toxicity endpoints of each caste/age
+        :param castes: entries of 'bee_castes' (all castes/ages by default)
+        :return: (castes x n_runs) arrays of acute and chronic risk quotients
+        """
+        doses = np.array([np.asarray(getattr(self, "out_" + caste + "_total_dose"), dtype=float)
+                          for caste, food_inputs, larval in castes])
+        larval = np.array([entry[2] for entry in castes])[:, None]
+        acute_rq = doses / np.where(larval, np.asarray(self.larval_ld50, dtype=float),
+                                    np.asarray(self.adult_oral_ld50, dtype=float))
+        chronic_rq = doses / np.where(larval, np.asarray(self.larval_noael, dtype=float),
+                                      np.asarray(self.adult_oral_noael, dtype=float))
+        for k, (caste, food_inputs, larval) in enumerate(castes):
+            setattr(self, "out_" + caste + "_acute_rq",
+                    pd.Series(acute_rq[k], name="out_" + caste + "_acute_rq", dtype="float"))
+            setattr(self, "out_" + caste + "_chronic_rq",
+                    pd.Series(chronic_rq[k], name="out_" + caste + "_chronic_rq", dtype="float"))
+        return acute_rq, chronic_rq
+
     def lw1_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval worker day 1
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lw1_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lw1_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lw1_total_dose[i] = (self.out_eec[i]/100.) * self.lw1_jelly[i]
-        return # self.out_lw1_total_dose[i]
+        self.caste_total_dose("lw1")
+        return # self.out_lw1_total_dose
 
     def lw2_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval worker day 2
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lw2_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lw2_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lw2_total_dose[i] = (self.out_eec[i]/100.) * self.lw2_jelly[i]
-        return # self.out_lw2_total_dose[i]
+        self.caste_total_dose("lw2")
+        return # self.out_lw2_total_dose
 
     def lw3_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval worker day 3
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lw3_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lw3_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lw3_total_dose[i] = (self.out_eec[i]/100.) * self.lw3_jelly[i]
-        return # self.out_lw3_total_dose[i]
+        self.caste_total_dose("lw3")
+        return # self.out_lw3_total_dose
 
     def lw4_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval worker day 4
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lw4_total_dose[i] = ((self.empirical_pollen[i]/1000.) * self.lw4_pollen[i]) + ((self.empirical_nectar[i]/1000.) * self.lw4_nectar[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_lw4_total_dose[i] = (self.out_eec[i] * self.lw4_pollen[i]) + (self.out_eec[i] * self.lw4_nectar[i])
-        return # self.out_lw4_total_dose[i]
+        self.caste_total_dose("lw4")
+        return # self.out_lw4_total_dose
 
     def lw5_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval worker day 5
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lw5_total_dose[i] = ((self.empirical_pollen[i]/1000.) * self.lw5_pollen[i]) + ((self.empirical_nectar[i]/1000.) * self.lw5_nectar[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_lw5_total_dose[i] = (self.out_eec[i] * self.lw5_pollen[i]) + (self.out_eec[i] * self.lw5_nectar[i])
-        return # self.out_lw5_total_dose[i]
+        self.caste_total_dose("lw5")
+        return # self.out_lw5_total_dose
 
     def ld6_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval drone aged 6+ days
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_ld6_total_dose[i] = ((self.empirical_pollen[i]/1000.) * self.ld6_pollen[i]) + ((self.empirical_nectar[i]/1000.) * self.ld6_nectar[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_ld6_total_dose[i] = (self.out_eec[i] * self.ld6_pollen[i]) + (self.out_eec[i] * self.ld6_nectar[i])
-        return # self.out_ld6_total_dose[i]
+        self.caste_total_dose("ld6")
+        return # self.out_ld6_total_dose
 
     def lq1_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval queen day 1
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lq1_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lq1_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lq1_total_dose[i] = (self.out_eec[i]/100.) * self.lq1_jelly[i]
-        return # self.out_lq1_total_dose[i]
+        self.caste_total_dose("lq1")
+        return # self.out_lq1_total_dose
 
     def lq2_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval queen day 2
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lq2_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lq2_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lq2_total_dose[i] = (self.out_eec[i]/100.) * self.lq2_jelly[i]
-        return # self.out_lq2_total_dose[i]
+        self.caste_total_dose("lq2")
+        return # self.out_lq2_total_dose
 
     def lq3_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval queen day 3
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lq3_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lq3_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lq3_total_dose[i] = (self.out_eec[i]/100.) * self.lq3_jelly[i]
-        return # self.out_lq3_total_dose[i]
+        self.caste_total_dose("lq3")
+        return # self.out_lq3_total_dose
 
     def lq4_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for larval queen aged 4+ days
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_lq4_total_dose[i] = (self.empirical_jelly[i]/1000.) * self.lq4_jelly[i]
-            elif self.empirical_residue[i] == "no":
-                self.out_lq4_total_dose[i] = (self.out_eec[i]/100.) * self.lq4_jelly[i]
-        return # self.out_lq4_total_dose[i]
+        self.caste_total_dose("lq4")
+        return # self.out_lq4_total_dose
 
     def aw_cell_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (cell cleaning and capping)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_cell_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_cell_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_cell_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_cell_total_dose[i] = (self.out_eec[i] * self.aw_cell_nectar[i]) + (self.out_eec[i] * self.aw_cell_pollen[i])
-        return # self.out_aw_cell_total_dose[i]
+        self.caste_total_dose("aw_cell")
+        return # self.out_aw_cell_total_dose
 
     def aw_brood_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (brood and queen tending, nurse bees)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_brood_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_brood_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_brood_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_brood_total_dose[i] = (self.out_eec[i] * self.aw_brood_nectar[i]) + (self.out_eec[i] * self.aw_brood_pollen[i])
-        return # self.out_aw_brood_total_dose[i]
+        self.caste_total_dose("aw_brood")
+        return # self.out_aw_brood_total_dose
 
     def aw_comb_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (comb building, cleaning, and food handling)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_comb_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_comb_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_comb_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_comb_total_dose[i] = (self.out_eec[i] * self.aw_comb_nectar[i]) + (self.out_eec[i] * self.aw_comb_pollen[i])
-        return # self.out_aw_comb_total_dose[i]
+        self.caste_total_dose("aw_comb")
+        return # self.out_aw_comb_total_dose
 
     def aw_pollen_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (foraging for pollen)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_pollen_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_fpollen_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_fpollen_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_pollen_total_dose[i] = (self.out_eec[i] * self.aw_fpollen_nectar[i]) + (self.out_eec[i] * self.aw_fpollen_pollen[i])
-        return # self.out_aw_pollen_total_dose[i]
+        self.caste_total_dose("aw_pollen")
+        return # self.out_aw_pollen_total_dose
 
     def aw_nectar_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (foraging for nectar)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_nectar_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_fnectar_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_fnectar_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_nectar_total_dose[i] = (self.out_eec[i] * self.aw_fnectar_nectar[i]) + (self.out_eec[i] * self.aw_fnectar_pollen[i])
-        return # self.out_aw_nectar_total_dose[i]
+        self.caste_total_dose("aw_nectar")
+        return # self.out_aw_nectar_total_dose
 
     def aw_winter_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult worker (maintenance of hive in winter)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aw_winter_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.aw_winter_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.aw_winter_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aw_winter_total_dose[i] = (self.out_eec[i] * self.aw_winter_nectar[i]) + (self.out_eec[i] * self.aw_winter_pollen[i])
-        return # self.out_aw_winter_total_dose[i]
+        self.caste_total_dose("aw_winter")
+        return # self.out_aw_winter_total_dose
 
     def ad_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult drone
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_ad_total_dose[i] = ((self.empirical_nectar[i]/1000.) * self.ad_nectar[i]) + ((self.empirical_pollen[i]/1000.) * self.ad_pollen[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_ad_total_dose[i] = (self.out_eec[i] * self.ad_nectar[i]) + (self.out_eec[i] * self.ad_pollen[i])
-        return # self.out_ad_total_dose[i]
+        self.caste_total_dose("ad")
+        return # self.out_ad_total_dose
 
     def aq_total_dose(self):
         """
         Pesticide dose in ug a.i./bee for adult queen (laying 1500 eggs/day)
         """
-        for i in range(self.n_runs):
-            if self.empirical_residue[i] == "yes":
-                self.out_aq_total_dose[i] = ((self.empirical_jelly[i]/1000.) * self.aq_jelly[i])
-            elif self.empirical_residue[i] == "no":
-                self.out_aq_total_dose[i] = (self.out_eec[i]/100.) * self.aq_jelly[i]
-        return # self.out_aq_total_dose[i]
+        self.caste_total_dose("aq")
+        return # self.out_aq_total_dose
 
     def lw1_acute_rq(self):
         """
@@ -757,29 +737,29 @@ class Beerex(UberModel, BeerexInputs, BeerexOutputs):
             print(self.application_method)
             print('number of runs')
             print(self.n_runs)
-        self.out_eec_spray = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_eec_spray", dtype="float")
-        self.out_eec_soil = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_eec_soil", dtype="float")
-        self.out_eec_seed = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_eec_seed", dtype="float")
-        self.out_eec_tree = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_eec_tree", dtype="float")
-        self.out_eec = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_eec", dtype="float")
-        self.out_lw1_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lw1_total_dose", dtype="float")
-        self.out_lw2_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lw2_total_dose", dtype="float")
-        self.out_lw3_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lw3_total_dose", dtype="float")
-        self.out_ld6_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_ld6_total_dose", dtype="float")
-        self.out_lq1_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lq1_total_dose", dtype="float")
-        self.out_lq2_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lq2_total_dose", dtype="float")
-        self.out_lq3_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lq3_total_dose", dtype="float")
-        self.out_lq4_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lq4_total_dose", dtype="float")
-        self.out_lw4_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lw4_total_dose", dtype="float")
-        self.out_lw5_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_lw5_total_dose", dtype="float")
-        self.out_aw_cell_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_cell_total_dose", dtype="float")
-        self.out_aw_brood_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_brood_total_dose", dtype="float")
-        self.out_aw_comb_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_comb_total_dose", dtype="float")
-        self.out_aw_pollen_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_pollen_total_dose", dtype="float")
-        self.out_aw_nectar_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_nectar_total_dose", dtype="float")
-        self.out_aw_winter_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aw_winter_total_dose", dtype="float")
-        self.out_ad_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_ad_total_dose", dtype="float")
-        self.out_aq_total_dose = pd.Series(np.nan, index=list(range(self.n_runs)), name="out_aq_total_dose", dtype="float")
+        self.out_eec_spray = pd.Series(np.nan, index=range(self.n_runs), name="out_eec_spray", dtype="float")
+        self.out_eec_soil = pd.Series(np.nan, index=range(self.n_runs), name="out_eec_soil", dtype="float")
+        self.out_eec_seed = pd.Series(np.nan, index=range(self.n_runs), name="out_eec_seed", dtype="float")
+        self.out_eec_tree = pd.Series(np.nan, index=range(self.n_runs), name="out_eec_tree", dtype="float")
+        self.out_eec = pd.Series(np.nan, index=range(self.n_runs), name="out_eec", dtype="float")
+        self.out_lw1_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lw1_total_dose", dtype="float")
+        self.out_lw2_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lw2_total_dose", dtype="float")
+        self.out_lw3_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lw3_total_dose", dtype="float")
+        self.out_ld6_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_ld6_total_dose", dtype="float")
+        self.out_lq1_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lq1_total_dose", dtype="float")
+        self.out_lq2_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lq2_total_dose", dtype="float")
+        self.out_lq3_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lq3_total_dose", dtype="float")
+        self.out_lq4_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lq4_total_dose", dtype="float")
+        self.out_lw4_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lw4_total_dose", dtype="float")
+        self.out_lw5_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_lw5_total_dose", dtype="float")
+        self.out_aw_cell_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_cell_total_dose", dtype="float")
+        self.out_aw_brood_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_brood_total_dose", dtype="float")
+        self.out_aw_comb_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_comb_total_dose", dtype="float")
+        self.out_aw_pollen_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_pollen_total_dose", dtype="float")
+        self.out_aw_nectar_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_nectar_total_dose", dtype="float")
+        self.out_aw_winter_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aw_winter_total_dose", dtype="float")
+        self.out_ad_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_ad_total_dose", dtype="float")
+        self.out_aq_total_dose = pd.Series(np.nan, index=range(self.n_runs), name="out_aq_total_dose", dtype="float")
 
 # if __name__ == '__main__':
 #     pd_in = pd.DataFrame({
@@ -13,7 +13,7 @@ import unittest
 parentddir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
 sys.path.append(parentddir)
 #from beerex_exe import Beerex
-from ..beerex_exe import Beerex
+from ..beerex_exe import Beerex, bee_castes
 
 # load transposed qaqc data for inputs and expected outputs
 # csv_transpose_path_in = "./beerex_qaqc_in_transpose.csv"
@@ -1363,3 +1363,60 @@ class TestBeerex(unittest.TestCase):
             print(inspect.currentframe().f_code.co_name)
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
+
+    def test_beerex_total_doses(self):
+        """
+        unittest for function beerex.total_doses (doses of all castes/ages at once)
+        """
+        # jelly consuming castes: (self.out_eec/100.) * jelly or (self.empirical_jelly/1000.) * jelly
+        # nectar/pollen consuming castes: (self.out_eec * nectar) + (self.out_eec * pollen) or
+        #                                 ((self.empirical_nectar/1000.) * nectar) + ((self.empirical_pollen/1000.) * pollen)
+        try:
+            jelly_castes = ['lw1', 'lw2', 'lw3', 'lq1', 'lq2', 'lq3', 'lq4', 'aq']
+            expected_results = [[0.022, 0.0015, np.nan] if caste in jelly_castes else [4.4, 0.0273, np.nan]
+                                for caste, food_inputs, larval in bee_castes]
+            beerex_empty.n_runs = 3
+            beerex_empty.empirical_residue = pd.Series(["no", "yes", "unknown"])
+            beerex_empty.empirical_jelly = pd.Series([np.nan, 0.5, 0.5])
+            beerex_empty.empirical_nectar = pd.Series([np.nan, 5.4, 5.4])
+            beerex_empty.empirical_pollen = pd.Series([np.nan, 3.7, 3.7])
+            beerex_empty.out_eec = pd.Series([1.1, 1.1, 1.1])
+            for caste, food_inputs, larval in bee_castes:
+                for food_input in food_inputs:
+                    if food_input is not None:
+                        setattr(beerex_empty, food_input, pd.Series([2., 3., 4.]))
+            result = beerex_empty.total_doses().T
+            npt.assert_array_almost_equal(result, expected_results, 4, '', True)
+            npt.assert_array_almost_equal(beerex_empty.out_aw_pollen_total_dose, [4.4, 0.0273, np.nan], 4, '', True)
+        finally:
+            tab = [np.ravel(result), np.ravel(expected_results)]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_beerex_risk_quotients(self):
+        """
+        unittest for function beerex.risk_quotients (risk quotients of all castes/ages at once)
+        """
+        # larval castes: total_dose/self.larval_ld50 and total_dose/self.larval_noael
+        # adult castes: total_dose/self.adult_oral_ld50 and total_dose/self.adult_oral_noael
+        try:
+            expected_acute = [[5.259259, 0.34929577] if larval else [0.5, 2.0] for caste, food_inputs, larval in bee_castes]
+            expected_chronic = [[1.0, 0.2] if larval else [0.25, 1.0] for caste, food_inputs, larval in bee_castes]
+            for caste, food_inputs, larval in bee_castes:
+                setattr(beerex_empty, "out_" + caste + "_total_dose", pd.Series([14.2, 12.4] if larval else [5., 10.]))
+            beerex_empty.larval_ld50 = pd.Series([2.7, 35.5])
+            beerex_empty.larval_noael = pd.Series([14.2, 62.])
+            beerex_empty.adult_oral_ld50 = pd.Series([10., 5.])
+            beerex_empty.adult_oral_noael = pd.Series([20., 10.])
+            result_acute, result_chronic = beerex_empty.risk_quotients()
+            npt.assert_array_almost_equal(result_acute, expected_acute, 4, '', True)
+            npt.assert_array_almost_equal(result_chronic, expected_chronic, 4, '', True)
+            npt.assert_array_almost_equal(beerex_empty.out_ad_chronic_rq, [0.25, 1.0], 4, '', True)
+        finally:
+            tab = [np.ravel(result_acute), np.ravel(expected_acute), np.ravel(result_chronic), np.ravel(expected_chronic)]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
@@ -2,7 +2,6 @@ from __future__ import division  #brings in Python 3.0 mixed type calculation ru
 import logging
 import numpy as np
 import pandas as pd
-from scipy.special import erfc
 
 class IecFunctions(object):
     """
@@ -26,6 +25,7 @@ class IecFunctions(object):
         Use error function to get probability based on z-score.
         :return:
         """
+        from scipy.special import erfc  # imported on first use (scipy is most of the import time of iec)
         self.out_f8_f = 0.5 * erfc(-self.out_z_score_f / np.sqrt(2))
         return self.out_f8_f
 
@@ -455,26 +455,21 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.lfish_mo = pd.Series([], dtype='float')
         self.lfish_mp = pd.Series([], dtype='float')
 
-        for i in range(self.num_simulations):
-            self.phytoplankton_mp[i] = self.zoo_mp[i] = self.beninv_mp[i] = self.filterfeeders_mp[i] =  \
-            self.sfish_mp[i] = self.mfish_mp[i] = self.lfish_mp[i] = 0.0
-
-            if (self.phyto_respire[i] == 'yes'): self.phytoplankton_mp[i] = 0.05
-            if (self.zoo_respire[i] == 'yes'): self.zoo_mp[i] = 0.05
-            if (self.beninv_respire[i] == 'yes'): self.beninv_mp[i] = 0.05
-            if (self.filterfeeders_respire[i] == 'yes'): self.filterfeeders_mp[i] = 0.05
-            if (self.sfish_respire[i] == 'yes'): self.sfish_mp[i] = 0.05
-            if (self.mfish_respire[i] == 'yes'): self.mfish_mp[i] = 0.05
-            if (self.lfish_respire[i] == 'yes'): self.lfish_mp[i] = 0.05
-
-            self.phytoplankton_mo[i] = 1. - self.phytoplankton_mp[i]
-            self.zoo_mo[i] = 1. - self.zoo_mp[i]
-            self.beninv_mo[i] = 1. - self.beninv_mp[i]
-            self.filterfeeders_mo[i] = 1. - self.filterfeeders_mp[i]
-            self.sfish_mo[i] = 1. - self.sfish_mp[i]
-            self.mfish_mo[i] = 1. - self.mfish_mp[i]
-            self.lfish_mo[i] = 1. - self.lfish_mp[i]
-
+        self.phytoplankton_mp = self.frac_respire_pore_water(self.phyto_respire)
+        self.zoo_mp = self.frac_respire_pore_water(self.zoo_respire)
+        self.beninv_mp = self.frac_respire_pore_water(self.beninv_respire)
+        self.filterfeeders_mp = self.frac_respire_pore_water(self.filterfeeders_respire)
+        self.sfish_mp = self.frac_respire_pore_water(self.sfish_respire)
+        self.mfish_mp = self.frac_respire_pore_water(self.mfish_respire)
+        self.lfish_mp = self.frac_respire_pore_water(self.lfish_respire)
+
+        self.phytoplankton_mo = 1. - self.phytoplankton_mp
+        self.zoo_mo = 1. - self.zoo_mp
+        self.beninv_mo = 1. - self.beninv_mp
+        self.filterfeeders_mo = 1. - self.filterfeeders_mp
+        self.sfish_mo = 1. - self.sfish_mp
+        self.mfish_mo = 1. - self.mfish_mp
+        self.lfish_mo = 1. - self.lfish_mp
 
         # aquatic animal ventilation rates (Kabam Eq. A5.2b)
         self.gv_zoo = self.ventilation_rate(self.zoo_wb)
@@ -499,42 +494,20 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.mfish_k1 = pd.Series([], dtype = 'float')
         self.lfish_k1 = pd.Series([], dtype = 'float')
 
-        for i in range(self.num_simulations):
-            if (self.phytoplankton_k1_temp[i] == 'calculated'):
-                self.phytoplankton_k1[i] = self.phytoplankton_k1_calc(self.kow[i])
-            else:
-                self.phytoplankton_k1[i] = float(self.phytoplankton_k1_temp[i])
-
-            if (self.zoo_k1_temp[i]  == 'calculated'):
-                self.zoo_k1[i]  = self.aq_animal_k1_calc(self.ew_zoo[i] , self.gv_zoo[i] , self.zoo_wb[i] )
-            else:
-                self.zoo_k1[i]  = float(self.zoo_k1_temp[i] )
-
-            if (self.beninv_k1_temp[i] == 'calculated'):
-                self.beninv_k1[i] = self.aq_animal_k1_calc(self.ew_beninv[i], self.gv_beninv[i], self.beninv_wb[i])
-            else:
-                self.beninv_k1[i] = float(self.beninv_k1_temp[i])
-
-            if (self.filterfeeders_k1_temp[i] == 'calculated'):
-                self.filterfeeders_k1[i] = self.aq_animal_k1_calc(self.ew_filterfeeders[i], self.gv_filterfeeders[i],
-                                                               self.filterfeeders_wb[i])
-            else:
-                self.filterfeeders_k1[i] = float(self.filterfeeders_k1_temp[i])
-
-            if (self.sfish_k1_temp[i] == 'calculated'):
-                self.sfish_k1[i] = self.aq_animal_k1_calc(self.ew_sfish[i], self.gv_sfish[i], self.sfish_wb[i])
-            else:
-                self.sfish_k1[i] = float(self.sfish_k1_temp[i])
-
-            if (self.mfish_k1_temp[i] == 'calculated'):
-                self.mfish_k1[i] = self.aq_animal_k1_calc(self.ew_mfish[i], self.gv_mfish[i], self.mfish_wb[i])
-            else:
-                self.mfish_k1[i] = float(self.mfish_k1_temp[i])
-
-            if (self.lfish_k1_temp[i] == 'calculated'):
-                self.lfish_k1[i] = self.aq_animal_k1_calc(self.ew_lfish[i], self.gv_lfish[i], self.lfish_wb[i])
-            else:
-                self.lfish_k1[i] = float(self.lfish_k1_temp[i])
+        self.phytoplankton_k1 = self.select_rate_const(self.phytoplankton_k1_temp, self.phytoplankton_k1_calc(self.kow))
+        self.zoo_k1 = self.select_rate_const(self.zoo_k1_temp,
+                                             self.aq_animal_k1_calc(self.ew_zoo, self.gv_zoo, self.zoo_wb))
+        self.beninv_k1 = self.select_rate_const(self.beninv_k1_temp,
+                                                self.aq_animal_k1_calc(self.ew_beninv, self.gv_beninv, self.beninv_wb))
+        self.filterfeeders_k1 = self.select_rate_const(self.filterfeeders_k1_temp,
+                                                       self.aq_animal_k1_calc(self.ew_filterfeeders,
+                                                                              self.gv_filterfeeders, self.filterfeeders_wb))
+        self.sfish_k1 = self.select_rate_const(self.sfish_k1_temp,
+                                               self.aq_animal_k1_calc(self.ew_sfish, self.gv_sfish, self.sfish_wb))
+        self.mfish_k1 = self.select_rate_const(self.mfish_k1_temp,
+                                               self.aq_animal_k1_calc(self.ew_mfish, self.gv_mfish, self.mfish_wb))
+        self.lfish_k1 = self.select_rate_const(self.lfish_k1_temp,
+                                               self.aq_animal_k1_calc(self.ew_lfish, self.gv_lfish, self.lfish_wb))
 
         #Aquatic animal-Water partition coeficient (Kabam Eq. A6a)
         # beta_* represent the proportionality constant expressing the sorption capacity of NLOM to that of octanol
@@ -572,41 +545,16 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.mfish_k2 = pd.Series([], dtype = 'float')
         self.lfish_k2 = pd.Series([], dtype = 'float')
 
-        for i in range(self.num_simulations):
-            if (self.phytoplankton_k2_temp[i] == 'calculated'):
-                self.phytoplankton_k2[i] = self.aq_animal_k2_calc(self.phytoplankton_k1[i], self.k_bw_phytoplankton[i])
-            else:
-                self.phytoplankton_k2[i] = float(self.phytoplankton_k2_temp[i])
-
-            if (self.zoo_k2_temp[i] == 'calculated'):
-                self.zoo_k2[i] = self.aq_animal_k2_calc(self.zoo_k1[i], self.k_bw_zoo[i])
-            else:
-                self.zoo_k2[i] = float(self.zoo_k2_temp[i])
-
-            if (self.beninv_k2_temp[i] == 'calculated'):
-                self.beninv_k2[i] = self.aq_animal_k2_calc(self.beninv_k1[i], self.k_bw_beninv[i])
-            else:
-                self.beninv_k2[i] = float(self.beninv_k2_temp[i])
-
-            if (self.filterfeeders_k2_temp[i] == 'calculated'):
-                self.filterfeeders_k2[i] = self.aq_animal_k2_calc(self.filterfeeders_k1[i], self.k_bw_filterfeeders[i])
-            else:
-                self.filterfeeders_k2[i] = float(self.filterfeeders_k2_temp[i])
-
-            if (self.sfish_k2_temp[i] == 'calculated'):
-                self.sfish_k2[i] = self.aq_animal_k2_calc(self.sfish_k1[i], self.k_bw_sfish[i])
-            else:
-                self.sfish_k2[i] = float(self.sfish_k2_temp[i])
-
-            if (self.mfish_k2_temp[i] == 'calculated'):
-                self.mfish_k2[i] = self.aq_animal_k2_calc(self.mfish_k1[i], self.k_bw_mfish[i])
-            else:
-                self.mfish_k2[i] = float(self.mfish_k2_temp[i])
-
-            if (self.lfish_k2_temp[i] == 'calculated'):
-                self.lfish_k2[i] = self.aq_animal_k2_calc(self.lfish_k1[i], self.k_bw_lfish[i])
-            else:
-                self.lfish_k2[i] = float(self.lfish_k2_temp[i])
+        self.phytoplankton_k2 = self.select_rate_const(self.phytoplankton_k2_temp,
+                                        self.aq_animal_k2_calc(self.phytoplankton_k1, self.k_bw_phytoplankton))
+        self.zoo_k2 = self.select_rate_const(self.zoo_k2_temp, self.aq_animal_k2_calc(self.zoo_k1, self.k_bw_zoo))
+        self.beninv_k2 = self.select_rate_const(self.beninv_k2_temp,
+                                                self.aq_animal_k2_calc(self.beninv_k1, self.k_bw_beninv))
+        self.filterfeeders_k2 = self.select_rate_const(self.filterfeeders_k2_temp,
+                                        self.aq_animal_k2_calc(self.filterfeeders_k1, self.k_bw_filterfeeders))
+        self.sfish_k2 = self.select_rate_const(self.sfish_k2_temp, self.aq_animal_k2_calc(self.sfish_k1, self.k_bw_sfish))
+        self.mfish_k2 = self.select_rate_const(self.mfish_k2_temp, self.aq_animal_k2_calc(self.mfish_k1, self.k_bw_mfish))
+        self.lfish_k2 = self.select_rate_const(self.lfish_k2_temp, self.aq_animal_k2_calc(self.lfish_k1, self.k_bw_lfish))
 
         # aquatic animal/organism growth rate constants (Kabam Eq. A7.1 & A7.2)
         #self.phytoplankton_kg = pd.Series([], dtype = 'float')
@@ -656,269 +604,32 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.mfish_kd = pd.Series([], dtype = 'float')
         self.lfish_kd = pd.Series([], dtype = 'float')
 
-        for i in range(self.num_simulations):
-            self.phytoplankton_kd[i] = self.phytoplankton_kd_temp[i]  #should be 0.0 as per Appendix A.5 of Kabam Documentation
-            if (self.zoo_kd_temp[i] == 'calculated'):
-                self.zoo_kd[i] = self.diet_uptake_rate_const(self.ed_zoo[i], self.gd_zoo[i], self.zoo_wb[i])
-            else:
-                self.zoo_kd[i] = float(self.zoo_kd_temp[i])
-
-            if (self.beninv_kd_temp[i] == 'calculated'):
-                self.beninv_kd[i] = self.diet_uptake_rate_const(self.ed_beninv[i], self.gd_beninv[i], self.beninv_wb[i])
-            else:
-                self.beninv_kd[i] = float(self.beninv_kd_temp[i])
-
-            if (self.filterfeeders_kd_temp[i] == 'calculated'):
-                self.filterfeeders_kd[i] = self.diet_uptake_rate_const(self.ed_filterfeeders[i],
-                                                                    self.gd_filterfeeders[i], self.filterfeeders_wb[i])
-            else:
-                self.filterfeeders_kd[i] = float(self.filterfeeders_kd_temp[i])
-
-            if (self.sfish_kd_temp[i] == 'calculated'):
-                self.sfish_kd[i] = self.diet_uptake_rate_const(self.ed_sfish[i], self.gd_sfish[i], self.sfish_wb[i])
-            else:
-                self.sfish_kd[i] = float(self.sfish_kd_temp[i])
-
-            if (self.mfish_kd_temp[i] == 'calculated'):
-                self.mfish_kd[i] = self.diet_uptake_rate_const(self.ed_mfish[i], self.gd_mfish[i], self.mfish_wb[i])
-            else:
-                self.mfish_kd[i] = float(self.mfish_kd_temp[i])
-
-            if (self.lfish_kd_temp[i] == 'calculated'):
-                self.lfish_kd[i] = self.diet_uptake_rate_const(self.ed_lfish[i], self.gd_lfish[i], self.lfish_wb[i])
-            else:
-                self.lfish_kd[i] = float(self.lfish_kd_temp[i])
+        self.phytoplankton_kd = pd.to_numeric(pd.Series(self.phytoplankton_kd_temp)).astype('float')  #should be 0.0 as per Appendix A.5 of Kabam Documentation
+        self.zoo_kd = self.select_rate_const(self.zoo_kd_temp,
+                                             self.diet_uptake_rate_const(self.ed_zoo, self.gd_zoo, self.zoo_wb))
+        self.beninv_kd = self.select_rate_const(self.beninv_kd_temp,
+                                                self.diet_uptake_rate_const(self.ed_beninv, self.gd_beninv, self.beninv_wb))
+        self.filterfeeders_kd = self.select_rate_const(self.filterfeeders_kd_temp,
+                                        self.diet_uptake_rate_const(self.ed_filterfeeders, self.gd_filterfeeders,
+                                                                    self.filterfeeders_wb))
+        self.sfish_kd = self.select_rate_const(self.sfish_kd_temp,
+                                               self.diet_uptake_rate_const(self.ed_sfish, self.gd_sfish, self.sfish_wb))
+        self.mfish_kd = self.select_rate_const(self.mfish_kd_temp,
+                                               self.diet_uptake_rate_const(self.ed_mfish, self.gd_mfish, self.mfish_wb))
+        self.lfish_kd = self.select_rate_const(self.lfish_kd_temp,
+                                               self.diet_uptake_rate_const(self.ed_lfish, self.gd_lfish, self.lfish_wb))
 
         #overall lipid, NLOM, and Water content of aquatic animal/organism diet (associated with Eq A9 VLD, VND, VWD
-            #loops reflect stepping through model simulation runs one at a time
-            #notes: 1. there is some room here for reduction of code; the 'diet_content_*_*' variable
-            #          could be reduced to a single set that is used for each trophic level
-            #       2. for future consideration: this processing might be optimized with matrix based calculations
-
-        #zooplankton lipid content of diet
-        self.diet_frac_zoo = pd.Series([], dtype = 'float')
-        self.diet_content_zoo_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_zoo = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_frac_zoo[i] = [self.zoo_diet_sediment_frac[i],
-                             self.zoo_diet_phytoplankton_frac[i]]
-            self.diet_content_zoo_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i]]
-            self.v_ld_zoo[i] = self.overall_diet_content(self.diet_frac_zoo[i], self.diet_content_zoo_lipid[i])
-
-        #zooplankton NLOM content of diet
-        self.diet_content_zoo_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_zoo = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_zoo_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i]]
-            self.v_nd_zoo[i] = self.overall_diet_content(self.diet_frac_zoo[i], self.diet_content_zoo_nlom[i])
-
-        #zooplankton water content of diet
-        self.diet_content_zoo_water = pd.Series([], dtype = 'float')
-        self.v_wd_zoo = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_zoo_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i]]
-            self.v_wd_zoo[i] = self.overall_diet_content(self.diet_frac_zoo[i], self.diet_content_zoo_water[i])
-
-        #benthic invertebrates lipid content of diet
-        self.diet_frac_beninv = pd.Series([], dtype = 'float')
-        self.diet_content_beninv_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_beninv = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_frac_beninv[i] = [self.beninv_diet_sediment_frac[i],
-                             self.beninv_diet_phytoplankton_frac[i],
-                             self.beninv_diet_zooplankton_frac[i]]
-            self.diet_content_beninv_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i],
-                             self.zoo_lipid_frac[i]]
-            self.v_ld_beninv[i] = self.overall_diet_content(self.diet_frac_beninv[i], self.diet_content_beninv_lipid[i])
-
-        #benthic invertebrates NLOM content of diet
-        self.diet_content_beninv_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_beninv = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_beninv_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i],
-                             self.zoo_nlom_frac[i]]
-            self.v_nd_beninv[i] = self.overall_diet_content(self.diet_frac_beninv[i], self.diet_content_beninv_nlom[i])
-
-        #benthic invertebrates water content of diet
-        self.diet_content_beninv_water = pd.Series([], dtype = 'float')
-        self.v_wd_beninv = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_beninv_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i],
-                             self.zoo_water_frac[i]]
-            self.v_wd_beninv[i] = self.overall_diet_content(self.diet_frac_beninv[i], self.diet_content_beninv_water[i])
-
-        #filterfeeders lipid content of diet
-        self.diet_frac_filterfeeders = pd.Series([], dtype = 'float')
-        self.diet_content_filterfeeders_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_filterfeeders = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-           self.diet_frac_filterfeeders[i] = [self.filterfeeders_diet_sediment_frac[i],
-                             self.filterfeeders_diet_phytoplankton_frac[i],
-                             self.filterfeeders_diet_zooplankton_frac[i],
-                             self.filterfeeders_diet_beninv_frac[i]]
-           self.diet_content_filterfeeders_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i],
-                             self.zoo_lipid_frac[i],
-                             self.beninv_lipid_frac[i]]
-           self.v_ld_filterfeeders[i] = self.overall_diet_content(self.diet_frac_filterfeeders[i],
-                                                            self.diet_content_filterfeeders_lipid[i])
-
-        #filterfeeders NLOM content of diet
-        self.diet_content_filterfeeders_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_filterfeeders = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_filterfeeders_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i],
-                             self.zoo_nlom_frac[i],
-                             self.beninv_nlom_frac[i]]
-            self.v_nd_filterfeeders[i] = self.overall_diet_content(self.diet_frac_filterfeeders[i],
-                                                            self.diet_content_filterfeeders_nlom[i])
-
-        #filterfeeders water content of diet
-        self.diet_content_filterfeeders_water = pd.Series([], dtype = 'float')
-        self.v_wd_filterfeeders = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_filterfeeders_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i],
-                             self.zoo_water_frac[i],
-                             self.beninv_water_frac[i]]
-            self.v_wd_filterfeeders[i] = self.overall_diet_content(self.diet_frac_filterfeeders[i],
-                                                            self.diet_content_filterfeeders_water[i])
-
-        #small fish lipid content of diet
-        self.diet_frac_sfish = pd.Series([], dtype = 'float')
-        self.diet_content_sfish_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_sfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_frac_sfish[i] = [self.sfish_diet_sediment_frac[i],
-                             self.sfish_diet_phytoplankton_frac[i],
-                             self.sfish_diet_zooplankton_frac[i],
-                             self.sfish_diet_beninv_frac[i],
-                             self.sfish_diet_filterfeeders_frac[i]]
-            self.diet_content_sfish_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i],
-                             self.zoo_lipid_frac[i],
-                             self.beninv_lipid_frac[i],
-                             self.filterfeeders_lipid_frac[i]]
-            self.v_ld_sfish[i] = self.overall_diet_content(self.diet_frac_sfish[i], self.diet_content_sfish_lipid[i])
-
-        #small fish NLOM content of diet
-        self.diet_content_sfish_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_sfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_sfish_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i],
-                             self.zoo_nlom_frac[i],
-                             self.beninv_nlom_frac[i],
-                             self.filterfeeders_nlom_frac[i]]
-            self.v_nd_sfish[i] = self.overall_diet_content(self.diet_frac_sfish[i], self.diet_content_sfish_nlom[i])
-
-        #small fish water
-        self.diet_content_sfish_water = pd.Series([], dtype = 'float')
-        self.v_wd_sfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_sfish_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i],
-                             self.zoo_water_frac[i],
-                             self.beninv_water_frac[i],
-                             self.filterfeeders_water_frac[i]]
-            self.v_wd_sfish[i] = self.overall_diet_content(self.diet_frac_sfish[i], self.diet_content_sfish_water[i])
-
-        #medium fish lipid content of diet
-        self.diet_frac_mfish = pd.Series([], dtype = 'float')
-        self.diet_content_mfish_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_mfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_frac_mfish[i] = [self.mfish_diet_sediment_frac[i],
-                             self.mfish_diet_phytoplankton_frac[i],
-                             self.mfish_diet_zooplankton_frac[i],
-                             self.mfish_diet_beninv_frac[i],
-                             self.mfish_diet_filterfeeders_frac[i],
-                             self.mfish_diet_sfish_frac[i]]
-            self.diet_content_mfish_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i],
-                             self.zoo_lipid_frac[i],
-                             self.beninv_lipid_frac[i],
-                             self.filterfeeders_lipid_frac[i],
-                             self.sfish_lipid_frac[i]]
-            self.v_ld_mfish[i] = self.overall_diet_content(self.diet_frac_mfish[i], self.diet_content_mfish_lipid[i])
-
-        #medium fish NLOM content of diet
-        self.diet_content_mfish_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_mfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_mfish_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i],
-                             self.zoo_nlom_frac[i],
-                             self.beninv_nlom_frac[i],
-                             self.filterfeeders_nlom_frac[i],
-                             self.sfish_nlom_frac[i]]
-            self.v_nd_mfish[i] = self.overall_diet_content(self.diet_frac_mfish[i], self.diet_content_mfish_nlom[i])
-
-        #medium fish water content of diet
-        self.diet_content_mfish_water = pd.Series([], dtype = 'float')
-        self.v_wd_mfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_mfish_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i],
-                             self.zoo_water_frac[i],
-                             self.beninv_water_frac[i],
-                             self.filterfeeders_water_frac[i],
-                             self.sfish_water_frac[i]]
-            self.v_wd_mfish[i] = self.overall_diet_content(self.diet_frac_mfish[i], self.diet_content_mfish_water[i])
-
-        #large fish lipid content of diet
-        self.diet_frac_lfish = pd.Series([], dtype = 'float')
-        self.diet_content_lfish_lipid = pd.Series([], dtype = 'float')
-        self.v_ld_lfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_frac_lfish[i] = [self.lfish_diet_sediment_frac[i],
-                             self.lfish_diet_phytoplankton_frac[i],
-                             self.lfish_diet_zooplankton_frac[i],
-                             self.lfish_diet_beninv_frac[i],
-                             self.lfish_diet_filterfeeders_frac[i],
-                             self.lfish_diet_sfish_frac[i],
-                             self.lfish_diet_mfish_frac[i]]
-            self.diet_content_lfish_lipid[i] = [self.sediment_lipid_frac[i],
-                             self.phytoplankton_lipid_frac[i],
-                             self.zoo_lipid_frac[i],
-                             self.beninv_lipid_frac[i],
-                             self.filterfeeders_lipid_frac[i],
-                             self.sfish_lipid_frac[i],
-                             self.mfish_lipid_frac[i]]
-            self.v_ld_lfish[i] = self.overall_diet_content(self.diet_frac_lfish[i], self.diet_content_lfish_lipid[i])
-
-        #large fish NLOM content of diet
-        self.diet_content_lfish_nlom = pd.Series([], dtype = 'float')
-        self.v_nd_lfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_lfish_nlom[i] = [self.sediment_nlom_frac[i],
-                             self.phytoplankton_nlom_frac[i],
-                             self.zoo_nlom_frac[i],
-                             self.beninv_nlom_frac[i],
-                             self.filterfeeders_nlom_frac[i],
-                             self.sfish_nlom_frac[i],
-                             self.mfish_nlom_frac[i]]
-            self.v_nd_lfish[i] = self.overall_diet_content(self.diet_frac_lfish[i], self.diet_content_lfish_nlom[i])
-
-        #large fish water content of diet
-        self.diet_content_lfish_water = pd.Series([], dtype = 'float')
-        self.v_wd_lfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):
-            self.diet_content_lfish_water[i] = [self.sediment_water_frac[i],
-                             self.phytoplankton_water_frac[i],
-                             self.zoo_water_frac[i],
-                             self.beninv_water_frac[i],
-                             self.filterfeeders_water_frac[i],
-                             self.sfish_water_frac[i],
-                             self.mfish_water_frac[i]]
-            self.v_wd_lfish[i] = self.overall_diet_content(self.diet_frac_lfish[i], self.diet_content_lfish_water[i])
+            #computed for all trophic levels and model simulation runs at once from the diet fraction tensor
+            #(model simulation runs x trophic levels x prey items; see 'diet_frac_tensor')
+        self.diet_frac = self.diet_frac_tensor()
+        v_ld = self.overall_diet_content_levels(self.diet_frac, self.prey_content('lipid'))
+        v_nd = self.overall_diet_content_levels(self.diet_frac, self.prey_content('nlom'))
+        v_wd = self.overall_diet_content_levels(self.diet_frac, self.prey_content('water'))
+        for j, level in enumerate(self.food_web_levels):  # e.g., self.v_ld_zoo, self.v_nd_zoo, self.v_wd_zoo
+            setattr(self, 'v_ld_' + level, pd.Series(v_ld[:, j], dtype='float'))
+            setattr(self, 'v_nd_' + level, pd.Series(v_nd[:, j], dtype='float'))
+            setattr(self, 'v_wd_' + level, pd.Series(v_wd[:, j], dtype='float'))
 
         # overall diet assimilation factor and egestion rate of fecal matter  Eq A9 GF
         self.diet_assim_factor_zoo = pd.Series([], dtype = 'float')
@@ -1028,43 +739,24 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.mfish_ke = pd.Series([], dtype = 'float')
         self.lfish_ke = pd.Series([], dtype = 'float')
 
-        for i in range(self.num_simulations):
-            self.phytoplankton_ke[i] = self.phytoplankton_ke_temp[i]  #should be 0.0 as per Appendix A.5 of Kabam Documentation
-            if (self.zoo_ke_temp[i] == 'calculated'):
-                self.zoo_ke[i] = self.fecal_elim_rate_const(self.gf_zoo[i], self.ed_zoo[i], self.kgb_zoo[i],
-                                                            self.zoo_wb[i])
-            else:
-                self.zoo_ke[i] = float(self.zoo_ke_temp[i])
-
-            if (self.beninv_ke_temp[i] == 'calculated'):
-                self.beninv_ke[i] = self.fecal_elim_rate_const(self.gf_beninv[i], self.ed_beninv[i],
-                                                               self.kgb_beninv[i], self.beninv_wb[i])
-            else:
-                self.beninv_ke[i] = float(self.beninv_ke_temp[i])
-
-            if (self.filterfeeders_ke_temp[i] == 'calculated'):
-                self.filterfeeders_ke[i] = self.fecal_elim_rate_const(self.gf_filterfeeders[i], self.ed_filterfeeders[i],
-                                                                   self.kgb_filterfeeders[i], self.filterfeeders_wb[i])
-            else:
-                self.filterfeeders_ke[i] = float(self.filterfeeders_ke_temp[i])
-
-            if (self.sfish_ke_temp[i] == 'calculated'):
-                self.sfish_ke[i] = self.fecal_elim_rate_const(self.gf_sfish[i], self.ed_sfish[i], self.kgb_sfish[i],
-                                                              self.sfish_wb[i])
-            else:
-                self.sfish_ke[i] = float(self.sfish_ke_temp[i])
-
-            if (self.mfish_ke_temp[i] == 'calculated'):
-                self.mfish_ke[i] = self.fecal_elim_rate_const(self.gf_mfish[i], self.ed_mfish[i], self.kgb_mfish[i],
-                                                              self.mfish_wb[i])
-            else:
-                self.mfish_ke[i] = float(self.mfish_ke_temp[i])
-
-            if (self.lfish_ke_temp[i] == 'calculated'):
-                self.lfish_ke[i] = self.fecal_elim_rate_const(self.gf_lfish[i], self.ed_lfish[i], self.kgb_lfish[i],
-                                                              self.lfish_wb[i])
-            else:
-                self.lfish_ke[i] = float(self.lfish_ke_temp[i])
+        self.phytoplankton_ke = pd.to_numeric(pd.Series(self.phytoplankton_ke_temp)).astype('float')  #should be 0.0 as per Appendix A.5 of Kabam Documentation
+        self.zoo_ke = self.select_rate_const(self.zoo_ke_temp,
+                                             self.fecal_elim_rate_const(self.gf_zoo, self.ed_zoo, self.kgb_zoo, self.zoo_wb))
+        self.beninv_ke = self.select_rate_const(self.beninv_ke_temp,
+                                                self.fecal_elim_rate_const(self.gf_beninv, self.ed_beninv,
+                                                                           self.kgb_beninv, self.beninv_wb))
+        self.filterfeeders_ke = self.select_rate_const(self.filterfeeders_ke_temp,
+                                        self.fecal_elim_rate_const(self.gf_filterfeeders, self.ed_filterfeeders,
+                                                                   self.kgb_filterfeeders, self.filterfeeders_wb))
+        self.sfish_ke = self.select_rate_const(self.sfish_ke_temp,
+                                               self.fecal_elim_rate_const(self.gf_sfish, self.ed_sfish, self.kgb_sfish,
+                                                                          self.sfish_wb))
+        self.mfish_ke = self.select_rate_const(self.mfish_ke_temp,
+                                               self.fecal_elim_rate_const(self.gf_mfish, self.ed_mfish, self.kgb_mfish,
+                                                                          self.mfish_wb))
+        self.lfish_ke = self.select_rate_const(self.lfish_ke_temp,
+                                               self.fecal_elim_rate_const(self.gf_lfish, self.ed_lfish, self.kgb_lfish,
+                                                                          self.lfish_wb))
 
         # calculate fraction of overlying water concentration of pesticide that is freely dissolved and can
         # be absorbed via membrane diffusion  Eq A2
@@ -1112,128 +804,18 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.out_cb_phytoplankton = self.pest_conc_organism(self.phytoplankton_k1, self.phytoplankton_k2,
                                              self.phytoplankton_kd, self.phytoplankton_ke, self.phytoplankton_kg,
                                              self.phytoplankton_km, self.phytoplankton_mp, self.phytoplankton_mo, 0.0)
-        #zooplankton
-        self.diet_frac_zoo = pd.Series([], dtype = 'float')
-        self.diet_conc_zoo = pd.Series([], dtype = 'float')
-        self.total_diet_conc_zoo = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_zoo = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_zoo = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_zoo[i] = [self.zoo_diet_sediment_frac[i], self.zoo_diet_phytoplankton_frac[i]]
-            self.diet_conc_zoo[i] = [self.c_s[i], self.out_cb_phytoplankton[i]]
-            self.diet_lipid_content_zoo[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i]]
-        self.total_diet_conc_zoo, self.lipid_norm_diet_conc_zoo = self.diet_pest_conc(self.diet_frac_zoo,
-                                                                  self.diet_conc_zoo, self.diet_lipid_content_zoo)
-        self.out_cb_zoo = self.pest_conc_organism(self.zoo_k1, self.zoo_k2, self.zoo_kd, self.zoo_ke, self.zoo_kg,
-                                                  self.zoo_km, self.zoo_mp, self.zoo_mo, self.total_diet_conc_zoo)
- 
-        #benthic invertebrates
-        self.diet_frac_beninv = pd.Series([], dtype = 'float')
-        self.diet_conc_beninv = pd.Series([], dtype = 'float')
-        self.total_diet_conc_beninv = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_beninv = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_beninv = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_beninv[i] = [self.beninv_diet_sediment_frac[i], self.beninv_diet_phytoplankton_frac[i],
-                                        self.beninv_diet_zooplankton_frac[i]]
-            self.diet_conc_beninv[i] = [self.c_s[i], self.out_cb_phytoplankton[i], self.out_cb_zoo[i]]
-            self.diet_lipid_content_beninv[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i],
-                                              self.zoo_lipid_frac[i]]
-        self.total_diet_conc_beninv, self.lipid_norm_diet_conc_beninv = self.diet_pest_conc(self.diet_frac_beninv,
-                                                                  self.diet_conc_beninv, self.diet_lipid_content_beninv)
-        self.out_cb_beninv = self.pest_conc_organism(self.beninv_k1, self.beninv_k2, self.beninv_kd, self.beninv_ke,
-                                                      self.beninv_kg, self.beninv_km, self.beninv_mp, self.beninv_mo,
-                                                      self.total_diet_conc_beninv)
- 
-        #filterfeeders
-        self.diet_frac_filterfeeders = pd.Series([], dtype = 'float')
-        self.diet_conc_filterfeeders = pd.Series([], dtype = 'float')
-        self.total_diet_conc_filterfeeders = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_filterfeeders = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_filterfeeders = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_filterfeeders[i] = [self.filterfeeders_diet_sediment_frac[i],
-                                               self.filterfeeders_diet_phytoplankton_frac[i],
-                                               self.filterfeeders_diet_zooplankton_frac[i],
-                                               self.filterfeeders_diet_beninv_frac[i]]
-            self.diet_conc_filterfeeders[i] = [self.c_s[i], self.out_cb_phytoplankton[i], self.out_cb_zoo[i],
-                                                self.out_cb_beninv[i]]
-            self.diet_lipid_content_filterfeeders[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i],
-                                              self.zoo_lipid_frac[i], self.beninv_lipid_frac[i]]
-        self.total_diet_conc_filterfeeders, self.lipid_norm_diet_conc_filterfeeders = \
-            self.diet_pest_conc(self.diet_frac_filterfeeders, self.diet_conc_filterfeeders,
-            self.diet_lipid_content_filterfeeders)
-        self.out_cb_filterfeeders = self.pest_conc_organism(self.filterfeeders_k1, self.filterfeeders_k2,
-                                                            self.filterfeeders_kd, self.filterfeeders_ke,
-                                                            self.filterfeeders_kg, self.filterfeeders_km,
-                                                            self.filterfeeders_mp, self.filterfeeders_mo,
-                                                            self.total_diet_conc_filterfeeders)
- 
-        #small fish
-        self.diet_frac_sfish = pd.Series([], dtype = 'float')
-        self.diet_conc_sfish = pd.Series([], dtype = 'float')
-        self.total_diet_conc_sfish = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_sfish = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_sfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_sfish[i] = [self.sfish_diet_sediment_frac[i], self.sfish_diet_phytoplankton_frac[i],
-                                       self.sfish_diet_zooplankton_frac[i], self.sfish_diet_beninv_frac[i],
-                                       self.sfish_diet_filterfeeders_frac[i]]
-            self.diet_conc_sfish[i] = [self.c_s[i], self.out_cb_phytoplankton[i], self.out_cb_zoo[i],
-                                       self.out_cb_beninv[i], self.out_cb_filterfeeders[i]]
-            self.diet_lipid_content_sfish[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i],
-                                              self.zoo_lipid_frac[i], self.beninv_lipid_frac[i], self.filterfeeders_lipid_frac[i]]
-        self.total_diet_conc_sfish, self.lipid_norm_diet_conc_sfish = self.diet_pest_conc(self.diet_frac_sfish,
-                                                                  self.diet_conc_sfish, self.diet_lipid_content_sfish)
-        self.out_cb_sfish = self.pest_conc_organism(self.sfish_k1, self.sfish_k2, self.sfish_kd, self.sfish_ke,
-                                                      self.sfish_kg, self.sfish_km, self.sfish_mp, self.sfish_mo,
-                                                      self.total_diet_conc_sfish)
- 
-        #medium fish
-        self.diet_frac_mfish = pd.Series([], dtype = 'float')
-        self.diet_conc_mfish = pd.Series([], dtype = 'float')
-        self.total_diet_conc_mfish = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_mfish = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_mfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_mfish[i] = [self.mfish_diet_sediment_frac[i], self.mfish_diet_phytoplankton_frac[i],
-                                       self.mfish_diet_zooplankton_frac[i], self.mfish_diet_beninv_frac[i],
-                                       self.mfish_diet_filterfeeders_frac[i], self.mfish_diet_sfish_frac[i]]
-            self.diet_conc_mfish[i] = [self.c_s[i], self.out_cb_phytoplankton[i], self.out_cb_zoo[i],
-                                        self.out_cb_beninv[i], self.out_cb_filterfeeders[i], self.out_cb_sfish[i]]
-            self.diet_lipid_content_mfish[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i],
-                                              self.zoo_lipid_frac[i], self.beninv_lipid_frac[i],
-                                                self.filterfeeders_lipid_frac[i], self.sfish_lipid_frac[i]]
-        self.total_diet_conc_mfish, self.lipid_norm_diet_conc_mfish = self.diet_pest_conc(self.diet_frac_mfish,
-                                                                  self.diet_conc_mfish, self.diet_lipid_content_mfish)
-        self.out_cb_mfish = self.pest_conc_organism(self.mfish_k1, self.mfish_k2, self.mfish_kd, self.mfish_ke,
-                                                      self.mfish_kg, self.mfish_km, self.mfish_mp, self.mfish_mo,
-                                                      self.total_diet_conc_mfish)
-        
-        #large fish
-        self.diet_frac_lfish = pd.Series([], dtype = 'float')
-        self.diet_conc_lfish = pd.Series([], dtype = 'float')
-        self.total_diet_conc_lfish = pd.Series([], dtype = 'float')
-        self.diet_lipid_content_lfish = pd.Series([], dtype = 'float')
-        self.lipid_norm_diet_conc_lfish = pd.Series([], dtype = 'float')
-        for i in range(self.num_simulations):     #loop through model simulation runs
-            self.diet_frac_lfish[i] = [self.lfish_diet_sediment_frac[i], self.lfish_diet_phytoplankton_frac[i],
-                                       self.lfish_diet_zooplankton_frac[i], self.lfish_diet_beninv_frac[i],
-                                       self.lfish_diet_filterfeeders_frac[i], self.lfish_diet_sfish_frac[i],
-                                       self.lfish_diet_mfish_frac[i]]
-            self.diet_conc_lfish[i] = [self.c_s[i], self.out_cb_phytoplankton[i], self.out_cb_zoo[i],
-                                        self.out_cb_beninv[i], self.out_cb_filterfeeders[i], self.out_cb_sfish[i],
-                                        self.out_cb_mfish[i]]
-            self.diet_lipid_content_lfish[i] = [self.sediment_lipid_frac[i], self.phytoplankton_lipid_frac[i],
-                                                self.zoo_lipid_frac[i], self.beninv_lipid_frac[i],
-                                                self.filterfeeders_lipid_frac[i], self.sfish_lipid_frac[i],
-                                                self.mfish_lipid_frac[i]]
-        self.total_diet_conc_lfish, self.lipid_norm_diet_conc_lfish = self.diet_pest_conc(self.diet_frac_lfish,
-                                                                  self.diet_conc_lfish, self.diet_lipid_content_lfish)
-        self.out_cb_lfish = self.pest_conc_organism(self.lfish_k1, self.lfish_k2, self.lfish_kd, self.lfish_ke,
-                                                    self.lfish_kg, self.lfish_km, self.lfish_mp, self.lfish_mo,
-                                                    self.total_diet_conc_lfish)
-        
+        #zooplankton through large fish
+            #the diet of each trophic level consists of sediment, phytoplankton, and lower trophic levels; the
+            #concentrations are solved in order up the food chain, each level for all model simulation runs at once
+        rate_consts = [tuple(getattr(self, level + '_' + const) for const in ('k1', 'k2', 'kd', 'ke', 'kg', 'km', 'mp', 'mo'))
+                       for level in self.food_web_levels]
+        cb, total_diet_conc, lipid_norm_diet_conc = self.food_web_pest_conc(self.diet_frac, self.prey_content('lipid'),
+                                                        self.c_s, self.out_cb_phytoplankton, rate_consts)
+        for j, level in enumerate(self.food_web_levels):  # e.g., self.out_cb_zoo, self.total_diet_conc_zoo
+            setattr(self, 'out_cb_' + level, pd.Series(cb[:, j], dtype='float'))
+            setattr(self, 'total_diet_conc_' + level, pd.Series(total_diet_conc[:, j], dtype='float'))
+            setattr(self, 'lipid_norm_diet_conc_' + level, pd.Series(lipid_norm_diet_conc[:, j], dtype='float'))
+
         #LIPID NORMALIZED PESTICIDE TISSUE RESIDUE
 
         self.out_cbl_phytoplankton = self.lipid_norm_residue_conc(self.out_cb_phytoplankton,self.phytoplankton_lipid_frac)
@@ -1618,6 +1200,11 @@ class Kabam(UberModel, KabamInputs, KabamOutputs, KabamFunctions):
         self.aquatic_animals = np.array(['pytoplankton', 'zooplankton', 'benthic_invertebrates', 'filterfeeders',
                                           'small_fish', 'medium_fish', 'large_fish'], dtype = 'str')
 
+        #aquatic food web: trophic levels (animals/organisms with a diet) and prey items in order up the food chain
+        #(variable name prefixes; e.g., 'zoo' -> self.zoo_lipid_frac, self.zoo_k1, self.beninv_diet_zooplankton_frac)
+        self.food_web_levels = ['zoo', 'beninv', 'filterfeeders', 'sfish', 'mfish', 'lfish']
+        self.food_web_prey = ['sediment', 'phytoplankton', 'zoo', 'beninv', 'filterfeeders', 'sfish', 'mfish']
+
         #list of mammals (data in related arrays will reflect this order)
         self.mammals = np.array(['fog/water shrew', 'rice rat/nosed mole', 'small mink', 'large mink',
                                  'small river otter', 'large river otter'], dtype = 'str')
@@ -21,6 +21,31 @@ class KabamFunctions(object):
         fraction = percent / 100.
         return fraction
 
+    def select_rate_const(self, user_input, calculated):
+        """
+        :description Rate constant set depending on user option for input (either specified by user or calculated
+                     internally); model simulation runs whose input is 'calculated' take the internally calculated
+                     value, all other runs take the (numerical) user specified value
+        :param user_input: user inputs for all model simulation runs (numerical values or 'calculated')
+        :param calculated: internally calculated rate constants for all model simulation runs
+        :return:
+        """
+
+        user_input = pd.Series(user_input).reset_index(drop=True)
+        is_calculated = (user_input.astype(str) == 'calculated').values
+        user_value = pd.to_numeric(user_input.mask(is_calculated)).values
+        return pd.Series(np.where(is_calculated, np.asarray(calculated, dtype='float'), user_value), dtype='float')
+
+    def frac_respire_pore_water(self, respire):
+        """
+        :description Fraction of respiratory ventilation that involves pore-water of sediment
+        :unit fraction
+        :param respire: user option ('yes'/'no') indicating whether animal/organism respires pore-water of sediment
+        :return: mP (0.05 for 'yes', 0.0 otherwise)
+        """
+
+        return pd.Series(np.where(pd.Series(respire).values == 'yes', 0.05, 0.0), dtype='float')
+
     def ventilation_rate(self, wet_wgt):
         """
         :description Ventilation rate of aquatic animal
@@ -380,24 +405,98 @@ class KabamFunctions(object):
         :return:
         """
 
-        overall_diet_conc = pd.Series([], dtype = 'float')
-        overall_lipid_norm_conc = pd.Series([], dtype = 'float')
-        overall_diet_conc = len(prey_frac) * [0.0]
-        overall_lipid_norm_conc = len(prey_frac) * [0.0]
+        # all model simulation runs at once: (model simulation runs x prey items) arrays
+        # (a series of per model simulation run lists is accepted as well)
+        prey_frac, prey_pest_conc, diet_lipid_frac = \
+            [np.asarray(item.tolist() if isinstance(item, pd.Series) else item, dtype='float')
+             for item in (prey_frac, prey_pest_conc, diet_lipid_frac)]
 
-        for j in range(len(prey_frac)):  # process model simulation runs
-            for i in range(len(prey_frac[j])):  # process individual prey items
-                prey_conc = prey_frac[j][i] * prey_pest_conc[j][i]
-                if (diet_lipid_frac[j][i] > 0.0):
-                    lipid_norm_prey_conc = prey_conc / diet_lipid_frac[j][i]
-                else:
-                    lipid_norm_prey_conc = 0.0
-
-                overall_diet_conc[j] = overall_diet_conc[j] + prey_conc
-                overall_lipid_norm_conc[j] = overall_lipid_norm_conc[j] + lipid_norm_prey_conc
+        prey_conc = prey_frac * prey_pest_conc
+        lipid_norm_prey_conc = np.zeros_like(prey_conc)
+        np.divide(prey_conc, diet_lipid_frac, out=lipid_norm_prey_conc, where=diet_lipid_frac > 0.0)
 
+        overall_diet_conc = pd.Series(prey_conc.sum(axis=1), dtype='float')
+        overall_lipid_norm_conc = pd.Series(lipid_norm_prey_conc.sum(axis=1), dtype='float')
         return overall_diet_conc, overall_lipid_norm_conc
 
+    def diet_frac_tensor(self):
+        """
+        :description Fractions of the diet of each aquatic animal/organism (trophic level) attributed to each prey item
+        :unit fraction
+        :expression Pi in Kabam Eq. A1 (and the diet fractions associated with Eq. A9) for all trophic levels
+        :notes trophic levels (self.food_web_levels) are zooplankton through large fish; prey items
+               (self.food_web_prey) are sediment, phytoplankton, and all trophic levels below large fish; trophic
+               level j feeds only on the first j + 2 prey items (i.e., prey item j + 2 is trophic level j itself),
+               all other entries are 0.0
+        :return: array (model simulation runs x trophic levels x prey items)
+        """
+
+        diet_frac = np.zeros((self.num_simulations, len(self.food_web_levels), len(self.food_web_prey)))
+        for j, level in enumerate(self.food_web_levels):
+            for i, prey in enumerate(self.food_web_prey[:j + 2]):
+                prey_name = 'zooplankton' if prey == 'zoo' else prey  # diet inputs spell out 'zooplankton'
+                diet_frac[:, j, i] = getattr(self, level + '_diet_' + prey_name + '_frac')
+        return diet_frac
+
+    def prey_content(self, component):
+        """
+        :description Fraction of each prey item attributed to a specific component (i.e., lipid, NLOM, or water)
+        :unit fraction
+        :param component: 'lipid', 'nlom', or 'water'
+        :return: array (model simulation runs x prey items)
+        """
+
+        return np.column_stack([np.asarray(getattr(self, prey + '_' + component + '_frac'), dtype='float')
+                                for prey in self.food_web_prey])
+
+    def overall_diet_content_levels(self, diet_frac, content_frac):
+        """
+        :description Overall fraction of the diet of each trophic level attributed to a diet component (i.e., lipids
+                     or NLOM or water); equivalent to 'overall_diet_content' applied to every trophic level and
+                     model simulation run
+        :unit kg diet / kg organism
+        :param diet_frac: diet fractions (model simulation runs x trophic levels x prey items; see 'diet_frac_tensor')
+        :param content_frac: component fraction of each prey item (model simulation runs x prey items)
+        :return: array (model simulation runs x trophic levels)
+        """
+
+        return (diet_frac * content_frac[:, np.newaxis, :]).sum(axis=2)
+
+    def food_web_pest_conc(self, diet_frac, prey_lipid_frac, conc_sed, conc_phytoplankton, rate_consts):
+        """
+        :description Concentration of pesticide in each aquatic animal/organism of the food web along with the overall
+                     (and lipid normalized overall) concentration of pesticide in its diet
+        :unit ug/(kg wet weight)
+        :expression Kabam Eq. A1 (CB) with SUM(Pi * CDi) from the diet fraction tensor; the diet of each trophic level
+                    contains only sediment, phytoplankton, and lower trophic levels, so the trophic levels are solved
+                    in order up the food chain (forward substitution), each for all model simulation runs at once
+        :param diet_frac: diet fractions (model simulation runs x trophic levels x prey items; see 'diet_frac_tensor')
+        :param prey_lipid_frac: fraction of each prey item that is lipid (model simulation runs x prey items)
+        :param conc_sed: pesticide concentration in sediment (sediment dry weight basis; Eq. A4)
+        :param conc_phytoplankton: pesticide concentration in phytoplankton (ug/kg-ww)
+        :param rate_consts: per trophic level tuple of (k1, k2, kD, kE, kG, kM, mP, mO) as used in 'pest_conc_organism'
+        :return: arrays (model simulation runs x trophic levels) of organism concentrations, overall diet concentrations,
+                 and lipid normalized overall diet concentrations
+        """
+
+        num_sims, num_levels, num_prey = diet_frac.shape
+        prey_conc = np.zeros((num_sims, num_prey))
+        prey_conc[:, 0] = conc_sed
+        prey_conc[:, 1] = conc_phytoplankton
+
+        pest_conc = np.zeros((num_sims, num_levels))
+        total_diet_conc = np.zeros((num_sims, num_levels))
+        lipid_norm_diet_conc = np.zeros((num_sims, num_levels))
+        for j in range(num_levels):
+            num_diet_items = min(j + 2, num_prey)
+            total_diet_conc[:, j], lipid_norm_diet_conc[:, j] = self.diet_pest_conc(
+                diet_frac[:, j, :num_diet_items], prey_conc[:, :num_diet_items], prey_lipid_frac[:, :num_diet_items])
+            k1, k2, kD, kE, kG, kM, mP, mO = rate_consts[j]
+            pest_conc[:, j] = self.pest_conc_organism(k1, k2, kD, kE, kG, kM, mP, mO, total_diet_conc[:, j])
+            if j + 2 < num_prey:
+                prey_conc[:, j + 2] = pest_conc[:, j]  # this trophic level is prey for the levels above it
+        return pest_conc, total_diet_conc, lipid_norm_diet_conc
+
     def pest_conc_organism(self, k1, k2, kD, kE, kG, kM, mP, mO, pest_diet_conc):
         """
         :description Concentration of pesticide in aquatic animal/organism
@@ -56,6 +56,36 @@ class TestKabam(unittest.TestCase):
         kabam_empty = Kabam(df_empty, df_empty)
         return kabam_empty
 
+    def test_select_rate_const(self):
+        """
+        :description Rate constant set depending on user option for input (either specified by user or calculated
+                     internally) for all model simulation runs at once; also checks the fraction of respiratory
+                     ventilation that involves pore-water of sediment (mP) set from the user 'respire' option
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        kabam_empty = self.create_kabam_object()
+
+        result = pd.Series([], dtype='float')
+        expected_results = pd.Series([1.5, 0.299082964, 2.5, 0.0], dtype = 'float')
+        expected_mp = pd.Series([0.05, 0.0, 0.0, 0.05], dtype = 'float')
+
+        try:
+            user_input = pd.Series(['calculated', '0.299082964', 'calculated', '0'], dtype = 'object')
+            calculated = pd.Series([1.5, 2.0, 2.5, 3.0], dtype = 'float')
+            result = kabam_empty.select_rate_const(user_input, calculated)
+            npt.assert_allclose(result, expected_results, rtol=1e-10, atol=0, err_msg='', verbose=True)
+
+            result_mp = kabam_empty.frac_respire_pore_water(pd.Series(['yes', 'no', np.nan, 'yes'], dtype = 'object'))
+            npt.assert_allclose(result_mp, expected_mp, rtol=1e-10, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_ventilation_rate(self):
         """
         :description Ventilation rate of aquatic animal
@@ -857,6 +887,56 @@ class TestKabam(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_food_web_pest_conc(self):
+        """
+        concentration of pesticide in each aquatic animal/organism of the food web (zooplankton through large fish)
+        :unit g/(kg wet weight)
+        :expression Kabam Eq. A1 (CB) solved in order up the food chain for all model simulation runs at once
+        :notes all trophic levels use the same rate constants (k1 = k2 = 1, kD = 0.5, kE = kG = kM = 0, mO = 1), thus
+               CB = water_column_eec + 0.5 * SUM(Pi * CDi); in the 1st model simulation run each trophic level feeds
+               entirely on the level below it (zooplankton on phytoplankton), in the 2nd run each level feeds half on
+               sediment and half on the level below it
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        kabam_empty = self.create_kabam_object()
+
+        result = pd.Series([], dtype='float')
+        expected_results = pd.Series([0.003, 0.0025, 0.00225, 0.002125, 0.0020625, 0.00203125,
+                                      0.0045, 0.004625, 0.00465625, 0.0046640625, 0.004666015625, 0.00466650390625],
+                                     dtype = 'float')
+        expected_diet_conc_lfish = pd.Series([0.0020625, 0.0073330078125], dtype = 'float')
+
+        try:
+            kabam_empty.phi = pd.Series([1.0, 1.0], dtype = 'float')
+            kabam_empty.water_column_eec = pd.Series([1.e-3, 1.e-3], dtype = 'float')
+            kabam_empty.pore_water_eec = pd.Series([0.0, 0.0], dtype = 'float')
+            ones = pd.Series([1.0, 1.0], dtype = 'float')
+            zeros = pd.Series([0.0, 0.0], dtype = 'float')
+            rate_consts = 6 * [(ones, ones, 0.5 * ones, zeros, zeros, zeros, zeros, ones)]
+
+            diet_frac = np.zeros((2, 6, 7))
+            for j in range(6):
+                diet_frac[0, j, j + 1] = 1.0
+                diet_frac[1, j, 0] = diet_frac[1, j, j + 1] = 0.5
+            lipid_frac = np.full((2, 7), 0.05)
+
+            cb, total_diet_conc, lipid_norm_diet_conc = kabam_empty.food_web_pest_conc(diet_frac, lipid_frac,
+                                                                    [0.0, 0.01], [0.004, 0.004], rate_consts)
+            result = pd.Series(cb.ravel(), dtype = 'float')
+            npt.assert_allclose(result, expected_results, rtol=1e-10, atol=0, err_msg='', verbose=True)
+            npt.assert_allclose(total_diet_conc[:, 5], expected_diet_conc_lfish, rtol=1e-10, atol=0, err_msg='',
+                                verbose=True)
+            npt.assert_allclose(lipid_norm_diet_conc, total_diet_conc / 0.05, rtol=1e-10, atol=0, err_msg='',
+                                verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_lipid_norm_residue_conc(self):
         """
         Lipid normalized pesticide residue in aquatic animal/organism
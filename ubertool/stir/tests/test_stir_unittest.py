@@ -559,6 +559,41 @@ class TestStir(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_stir_populate_inputs(self):
+        """
+        unittest for function UberModel.populate_inputs (compiled input schema of stir)
+        inputs are coerced to the dtypes of StirInputs; the csrf token may be left out
+        :return:
+        """
+        # create empty pandas dataframes to create empty object for this unittest
+        stir_empty = self.create_stir_object()
+
+        expected_results = pd.Series([200., 98.443, float('nan')], name='molecular_weight')
+        result = None
+        try:
+            schema = stir_empty.input_schema()
+            self.assertIs(schema, Stir.input_schema())
+            self.assertEqual(schema.dtypes['molecular_weight'], 'float64')
+            self.assertFalse(schema.required['csrfmiddlewaretoken'])
+            df_inputs = pd.DataFrame(dict((name, [1, 2, 3]) for name in schema.names if schema.required[name]))
+            df_inputs['molecular_weight'] = ['200.', '98.443', 'n/a']
+            df_inputs['extra_input'] = 0
+            stir_empty.populate_inputs(df_inputs)
+            result = stir_empty.molecular_weight
+            pdt.assert_series_equal(result, expected_results, test)
+            self.assertEqual(str(stir_empty.vapor_pressure.dtype), 'float64')
+            self.assertEqual(str(stir_empty.chemical_name.dtype), 'object')
+            self.assertFalse(hasattr(stir_empty, 'extra_input'))
+            # a missing required input is an error
+            with self.assertRaises(ValueError):
+                stir_empty.populate_inputs(df_inputs.drop('molecular_weight', axis=1))
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
 
 # unittest will
 # 1) call the setup method,
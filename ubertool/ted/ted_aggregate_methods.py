@@ -27,6 +27,9 @@ class TedAggregateMethods(object):
         self.num_ts = 11   # number of food item daily time series to be processed to determine number of exceedances of EECs
         self.num_tox = 13  # number of toxicity measures to be processed to determine number of exceedances of EECs
 
+        # prefixes of the names of per simulation results (collected for each simulation; see 'Ted.simulation_results')
+        self.sim_result_prefixes = ('out_', 'eec_exc_', 'eec_dist_', 'eec_tox_frac_')
+
         # constants and conversions
         self.density_h2o = 1.  # kg/L
         self.stan_temp_kelvin = 298.  # temperature in Kelvin for 25degC
@@ -56,6 +59,13 @@ class TedAggregateMethods(object):
         self.food_multiplier_mean_fp = 7.  # fruits/pods
         self.food_multiplier_mean_arthro = 65.  # arthropods
 
+        # all food item multipliers (upper bound then mean; short grass, tall grass, broad-leafed plants, fruits/pods, arthropods)
+        # in the row order of the food item timeseries stack generated in 'conc_based_eec_timeseries'
+        self.food_multipliers = np.array([self.food_multiplier_upper_sg, self.food_multiplier_upper_tg, self.food_multiplier_upper_blp,
+                                          self.food_multiplier_upper_fp, self.food_multiplier_upper_arthro,
+                                          self.food_multiplier_mean_sg, self.food_multiplier_mean_tg, self.food_multiplier_mean_blp,
+                                          self.food_multiplier_mean_fp, self.food_multiplier_mean_arthro])
+
         # soil properties
         self.soil_depth = 2.6  # cm
         self.soil_foc = 0.015
@@ -132,6 +142,51 @@ class TedAggregateMethods(object):
         self.h2ointake_param_b2_rep_amphi = 0.726
         self.h2ointake_param_c2_rep_amphi = 1.0 # this number is in question; in OPP sreadsheet it is 3.7; in table A 1-7.7 it is 1.0
 
+        # food and water intake parameters per intake group (indexed by 'species_intake_group': passerine birds, non-passerine birds,
+        # amphibians/reptiles, rodent mammals, non-rodent mammals; last entry (NaN) for species of unidentified taxa)
+        self.intake_group_param_a1 = np.array([self.intake_param_a1_birds_pass, self.intake_param_a1_birds_nonpass, self.intake_param_a1_rep_amphi,
+                                               self.intake_param_a1_mamm_rodent, self.intake_param_a1_mamm_nonrodent, np.nan])
+        self.intake_group_param_b1 = np.array([self.intake_param_b1_birds_pass, self.intake_param_b1_birds_nonpass, self.intake_param_b1_rep_amphi,
+                                               self.intake_param_b1_mamm_rodent, self.intake_param_b1_mamm_nonrodent, np.nan])
+        self.h2ointake_group_param_a2 = np.array([self.h2ointake_param_a2_birds_pass, self.h2ointake_param_a2_birds_nonpass, self.h2ointake_param_a2_rep_amphi,
+                                                  self.h2ointake_param_a2_mamm, self.h2ointake_param_a2_mamm, np.nan])
+        self.h2ointake_group_param_b2 = np.array([self.h2ointake_param_b2_birds_pass, self.h2ointake_param_b2_birds_nonpass, self.h2ointake_param_b2_rep_amphi,
+                                                  self.h2ointake_param_b2_mamm, self.h2ointake_param_b2_mamm, np.nan])
+        self.h2ointake_group_param_c2 = np.array([self.h2ointake_param_c2_birds_pass, self.h2ointake_param_c2_birds_nonpass, self.h2ointake_param_c2_rep_amphi,
+                                                  self.h2ointake_param_c2_mamm, self.h2ointake_param_c2_mamm, np.nan])
+
+        # diet categories (the food items for which dietary concentrations are derived) and the category of each diet item
+        # listed in the species properties table (diet items not listed here have no dietary concentration)
+        self.diet_categories = ('arthro', 'soil_inv', 'sm_amphi', 'sm_mamm', 'inverts', 'sm_bird', 'fish', 'plant_algae',
+                                'sg', 'blp', 'fp', 'lg_mamm', 'tg')
+        self.diet_item_categories = {'arthropods': 'arthro',
+                                     'soil inverts': 'soil_inv',
+                                     'amphibians': 'sm_amphi',
+                                     'mammals (small)': 'sm_mamm',
+                                     'benthic inverts': 'inverts',
+                                     'birds': 'sm_bird',
+                                     'fish, aq amphibians': 'fish',
+                                     'fish and aq amphibians': 'fish',
+                                     'fish': 'fish',
+                                     'filter feeders': 'inverts',
+                                     'reptiles': 'sm_amphi',
+                                     'algae': 'plant_algae',
+                                     'grass': 'sg',
+                                     'leaves': 'blp',
+                                     'seeds': 'fp',
+                                     'fruit': 'fp',
+                                     'leaves, flowers': 'blp',
+                                     'zooplankton': 'inverts',
+                                     'aquatic plants': 'plant_algae',
+                                     'carrion': 'lg_mamm',
+                                     'nectar': 'tg',
+                                     'leaves (surrogate for fungi)': 'blp',
+                                     'mammals (large)': 'lg_mamm',
+                                     'nectar, pollen': 'tg',
+                                     'pollen': 'tg',
+                                     'bark (twigs), pine  needles (grass as surrogate': 'sg',
+                                     'aquatic plants, algae': 'plant_algae'}
+
         # set constants for dermal dose calculations (from Table A 1-7.9 and Eq 16)
         self.foliar_residue_factor = 0.62
         self.foliar_contact_rate = 6.01
@@ -179,6 +234,17 @@ class TedAggregateMethods(object):
         self.bird_sm_bodywgt = 20.   # gms
         self.rep_amphi_bodywgt = 2.  # gms
 
+        # prey items (small mammals, large mammals, small birds, small terrestrial phase amphibians/reptiles) allometric dietary
+        # consumption parameters and the food item each consumes (row of the food item timeseries stack; upper bound/mean)
+        self.prey_intake_param_a1 = np.array([self.intake_param_a1_mamm_rodent, self.intake_param_a1_mamm_rodent,
+                                              self.intake_param_a1_birds_gen, self.intake_param_a1_rep_amphi])
+        self.prey_intake_param_b1 = np.array([self.intake_param_b1_mamm_rodent, self.intake_param_b1_mamm_rodent,
+                                              self.intake_param_b1_birds_gen, self.intake_param_b1_rep_amphi])
+        self.prey_bodywgt = np.array([self.mamm_sm_bodywgt, self.mamm_lg_bodywgt, self.bird_sm_bodywgt, self.rep_amphi_bodywgt])
+        self.prey_frac_h2o = np.array([self.frac_h2o_aq_plant, self.frac_h2o_aq_plant, self.frac_h2o_arthro, self.frac_h2o_arthro])
+        self.prey_food_item_upper = np.array([0, 0, 4, 4])  # short grass, short grass, arthropods, arthropods
+        self.prey_food_item_mean = np.array([5, 5, 9, 9])
+
     def spray_drift_params(self, sim_num):
         """
         :description sets spray drift parameters for calculations of distance from source area associated with pesticide concentrations
@@ -250,31 +316,22 @@ class TedAggregateMethods(object):
         self.app_flags_min_scenario = self.daily_app_flag(self.num_apps_min[sim_num], self.app_interval_min[sim_num])
         self.app_flags_max_scenario = self.daily_app_flag(self.num_apps_max[sim_num], self.app_interval_max[sim_num])
 
+        # daily response to the min/max application scenarios (unit initial concentration); shared by all food items
+        self.plant_decay_response_min = self.daily_decay_response(self.foliar_diss_hlife[sim_num], self.app_flags_min_scenario)
+        self.plant_decay_response_max = self.daily_decay_response(self.foliar_diss_hlife[sim_num], self.app_flags_max_scenario)
+
         # calculate upper bound and mean concentration based EECs for food items (daily values for a year) - min application scenario
-        self.out_diet_eec_upper_min_sg = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_upper_sg, self.app_flags_min_scenario)  # short grass
-        self.out_diet_eec_upper_min_tg = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_upper_tg, self.app_flags_min_scenario)  # tall grass
-        self.out_diet_eec_upper_min_blp = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_upper_blp, self.app_flags_min_scenario)  # broad-leafed plants
-        self.out_diet_eec_upper_min_fp = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_upper_fp, self.app_flags_min_scenario)  # seeds/fruits/pods
-        self.out_diet_eec_upper_min_arthro  = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_upper_arthro, self.app_flags_min_scenario)  # arthropods
-
-        self.out_diet_eec_mean_min_sg = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_mean_sg, self.app_flags_min_scenario)  # short grass
-        self.out_diet_eec_mean_min_tg = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_mean_tg, self.app_flags_min_scenario)  # tall grass
-        self.out_diet_eec_mean_min_blp = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_mean_blp, self.app_flags_min_scenario)  # broad-leafed plants
-        self.out_diet_eec_mean_min_fp = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_mean_fp, self.app_flags_min_scenario)  # seeds/fruits/pods
-        self.out_diet_eec_mean_min_arthro = self.daily_plant_timeseries(sim_num, self.app_rate_min[sim_num], self.food_multiplier_mean_arthro, self.app_flags_min_scenario)  # arthropods
+        # (short grass, tall grass, broad-leafed plants, seeds/fruits/pods, arthropods)
+        self.diet_eec_min_stack = self.daily_plant_timeseries_stack(self.app_rate_min[sim_num], self.food_multipliers, self.plant_decay_response_min)
+        (self.out_diet_eec_upper_min_sg, self.out_diet_eec_upper_min_tg, self.out_diet_eec_upper_min_blp, self.out_diet_eec_upper_min_fp,
+         self.out_diet_eec_upper_min_arthro, self.out_diet_eec_mean_min_sg, self.out_diet_eec_mean_min_tg, self.out_diet_eec_mean_min_blp,
+         self.out_diet_eec_mean_min_fp, self.out_diet_eec_mean_min_arthro) = self.diet_eec_min_stack
 
         # calculate upper bound and mean concentration based EECs for food items (daily values for a year) - max application scenario
-        self.out_diet_eec_upper_max_sg = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_upper_sg, self.app_flags_max_scenario)  # short grass
-        self.out_diet_eec_upper_max_tg = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_upper_tg, self.app_flags_max_scenario)  # tall grass
-        self.out_diet_eec_upper_max_blp = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_upper_blp, self.app_flags_max_scenario)  # broad-leafed plants
-        self.out_diet_eec_upper_max_fp = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_upper_fp, self.app_flags_max_scenario)  # seeds/fruits/pods
-        self.out_diet_eec_upper_max_arthro = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_upper_arthro, self.app_flags_max_scenario)  # arthropods
-
-        self.out_diet_eec_mean_max_sg = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_mean_sg, self.app_flags_max_scenario)  # short grass
-        self.out_diet_eec_mean_max_tg = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_mean_tg, self.app_flags_max_scenario)  # tall grass
-        self.out_diet_eec_mean_max_blp = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_mean_blp, self.app_flags_max_scenario)  # broad-leafed plants
-        self.out_diet_eec_mean_max_fp = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_mean_fp, self.app_flags_max_scenario)  # seeds/fruits/pods
-        self.out_diet_eec_mean_max_arthro = self.daily_plant_timeseries(sim_num, self.app_rate_max[sim_num], self.food_multiplier_mean_arthro, self.app_flags_max_scenario)  # arthropods
+        self.diet_eec_max_stack = self.daily_plant_timeseries_stack(self.app_rate_max[sim_num], self.food_multipliers, self.plant_decay_response_max)
+        (self.out_diet_eec_upper_max_sg, self.out_diet_eec_upper_max_tg, self.out_diet_eec_upper_max_blp, self.out_diet_eec_upper_max_fp,
+         self.out_diet_eec_upper_max_arthro, self.out_diet_eec_mean_max_sg, self.out_diet_eec_mean_max_tg, self.out_diet_eec_mean_max_blp,
+         self.out_diet_eec_mean_max_fp, self.out_diet_eec_mean_max_arthro) = self.diet_eec_max_stack
 
         # calculate daily soil pore water, soil, puddles, and dew concentrations (min/max application scenarios)
         self.out_conc_pore_h2o_min = self.daily_soil_h2o_timeseries(sim_num, self.app_rate_min[sim_num], self.app_flags_min_scenario, "pore_water")
@@ -300,41 +357,53 @@ class TedAggregateMethods(object):
 
         # calculate daily whole body concentrations for prey items (small mammals, large mammals, small birds, small terrestrial phase amphibians/reptiles
         # (min/max application scenarios & upper/mean food multipliers)
-        self.out_diet_eec_upper_min_sm_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_sm_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_upper_min_sg,
-                                                                                 self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_upper_min_lg_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_lg_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_upper_min_sg,
-                                                                                 self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_upper_min_sm_bird = self.daily_animal_dose_timeseries(self.intake_param_a1_birds_gen, self.intake_param_b1_birds_gen, self.bird_sm_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_upper_min_arthro,
-                                                                                 self.frac_retained_birds[sim_num])
-        self.out_diet_eec_upper_min_sm_amphi = self.daily_animal_dose_timeseries(self.intake_param_a1_rep_amphi, self.intake_param_b1_rep_amphi, self.rep_amphi_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_upper_min_arthro,
-                                                                                  self.frac_retained_birds[sim_num])
-
-        self.out_diet_eec_mean_min_sm_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_sm_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_mean_min_sg,
-                                                                                self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_mean_min_lg_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_lg_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_mean_min_sg,
-                                                                                self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_mean_min_sm_bird = self.daily_animal_dose_timeseries(self.intake_param_a1_birds_gen, self.intake_param_b1_birds_gen, self.bird_sm_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_mean_min_arthro,
-                                                                                self.frac_retained_birds[sim_num])
-        self.out_diet_eec_mean_min_sm_amphi = self.daily_animal_dose_timeseries(self.intake_param_a1_rep_amphi, self.intake_param_b1_rep_amphi, self.rep_amphi_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_mean_min_arthro,
-                                                                                 self.frac_retained_birds[sim_num])
-
-        self.out_diet_eec_upper_max_sm_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_sm_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_upper_max_sg,
-                                                                                 self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_upper_max_lg_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_lg_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_upper_max_sg,
-                                                                                 self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_upper_max_sm_bird = self.daily_animal_dose_timeseries(self.intake_param_a1_birds_gen, self.intake_param_b1_birds_gen, self.bird_sm_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_upper_max_arthro,
-                                                                                 self.frac_retained_birds[sim_num])
-        self.out_diet_eec_upper_max_sm_amphi = self.daily_animal_dose_timeseries(self.intake_param_a1_rep_amphi, self.intake_param_b1_rep_amphi, self.rep_amphi_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_upper_max_arthro,
-                                                                                  self.frac_retained_birds[sim_num])
-
-        self.out_diet_eec_mean_max_sm_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_sm_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_mean_max_sg,
-                                                                                self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_mean_max_lg_mamm = self.daily_animal_dose_timeseries(self.intake_param_a1_mamm_rodent, self.intake_param_b1_mamm_rodent, self.mamm_lg_bodywgt, self.frac_h2o_aq_plant, self.out_diet_eec_mean_max_sg,
-                                                                                self.frac_retained_mamm[sim_num])
-        self.out_diet_eec_mean_max_sm_bird = self.daily_animal_dose_timeseries(self.intake_param_a1_birds_gen, self.intake_param_b1_birds_gen, self.bird_sm_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_mean_max_arthro,
-                                                                                self.frac_retained_birds[sim_num])
-        self.out_diet_eec_mean_max_sm_amphi = self.daily_animal_dose_timeseries(self.intake_param_a1_rep_amphi, self.intake_param_b1_rep_amphi, self.rep_amphi_bodywgt, self.frac_h2o_arthro, self.out_diet_eec_mean_max_arthro,
-                                                                                 self.frac_retained_birds[sim_num])
+        # (rows: upper bound/min, mean/min, upper bound/max, mean/max application scenario for each of the 4 prey items)
+        prey_food_items = np.concatenate((self.prey_food_item_upper, self.prey_food_item_mean))
+        prey_food_conc = np.concatenate((self.diet_eec_min_stack[prey_food_items], self.diet_eec_max_stack[prey_food_items]))
+        prey_frac_retained = np.array([self.frac_retained_mamm[sim_num], self.frac_retained_mamm[sim_num],
+                                       self.frac_retained_birds[sim_num], self.frac_retained_birds[sim_num]])
+        self.prey_dose_stack = self.daily_animal_dose_timeseries_stack(np.tile(self.prey_intake_param_a1, 4), np.tile(self.prey_intake_param_b1, 4),
+                                                                       np.tile(self.prey_bodywgt, 4), np.tile(self.prey_frac_h2o, 4),
+                                                                       prey_food_conc, np.tile(prey_frac_retained, 4))
+        (self.out_diet_eec_upper_min_sm_mamm, self.out_diet_eec_upper_min_lg_mamm, self.out_diet_eec_upper_min_sm_bird, self.out_diet_eec_upper_min_sm_amphi,
+         self.out_diet_eec_mean_min_sm_mamm, self.out_diet_eec_mean_min_lg_mamm, self.out_diet_eec_mean_min_sm_bird, self.out_diet_eec_mean_min_sm_amphi,
+         self.out_diet_eec_upper_max_sm_mamm, self.out_diet_eec_upper_max_lg_mamm, self.out_diet_eec_upper_max_sm_bird, self.out_diet_eec_upper_max_sm_amphi,
+         self.out_diet_eec_mean_max_sm_mamm, self.out_diet_eec_mean_max_lg_mamm, self.out_diet_eec_mean_max_sm_bird, self.out_diet_eec_mean_max_sm_amphi) = self.prey_dose_stack
+
+    def conc_based_eec_maxima(self):
+        """
+        :description calculates the maximum daily upper bound and mean concentration based EECs for food items (min/max
+                     application scenarios) for all simulations without generating the daily time series
+                     (used when only the yearly maxima are requested; see 'conc_based_eec_timeseries')
+
+        :return:
+        """
+
+        # maximum daily upper bound and mean concentration based EECs for food items - min application scenario
+        self.out_diet_eec_upper_min_sg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_upper_sg, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # short grass
+        self.out_diet_eec_upper_min_tg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_upper_tg, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # tall grass
+        self.out_diet_eec_upper_min_blp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_upper_blp, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # broad-leafed plants
+        self.out_diet_eec_upper_min_fp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_upper_fp, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # seeds/fruits/pods
+        self.out_diet_eec_upper_min_arthro_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_upper_arthro, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # arthropods
+
+        self.out_diet_eec_mean_min_sg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_mean_sg, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # short grass
+        self.out_diet_eec_mean_min_tg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_mean_tg, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # tall grass
+        self.out_diet_eec_mean_min_blp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_mean_blp, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # broad-leafed plants
+        self.out_diet_eec_mean_min_fp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_mean_fp, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # seeds/fruits/pods
+        self.out_diet_eec_mean_min_arthro_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_min, self.food_multiplier_mean_arthro, self.num_apps_min, self.app_interval_min, self.foliar_diss_hlife), dtype='float')  # arthropods
+
+        # maximum daily upper bound and mean concentration based EECs for food items - max application scenario
+        self.out_diet_eec_upper_max_sg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_upper_sg, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # short grass
+        self.out_diet_eec_upper_max_tg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_upper_tg, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # tall grass
+        self.out_diet_eec_upper_max_blp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_upper_blp, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # broad-leafed plants
+        self.out_diet_eec_upper_max_fp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_upper_fp, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # seeds/fruits/pods
+        self.out_diet_eec_upper_max_arthro_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_upper_arthro, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # arthropods
+
+        self.out_diet_eec_mean_max_sg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_mean_sg, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # short grass
+        self.out_diet_eec_mean_max_tg_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_mean_tg, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # tall grass
+        self.out_diet_eec_mean_max_blp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_mean_blp, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # broad-leafed plants
+        self.out_diet_eec_mean_max_fp_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_mean_fp, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # seeds/fruits/pods
+        self.out_diet_eec_mean_max_arthro_maxdaily = pd.Series(self.daily_plant_max(self.app_rate_max, self.food_multiplier_mean_arthro, self.num_apps_max, self.app_interval_max, self.foliar_diss_hlife), dtype='float')  # arthropods
 
     def eec_exceedances(self, sim_num):
         """
@@ -346,7 +415,7 @@ class TedAggregateMethods(object):
         :return:
         """
 
-        na_series = pd.Series(366*['NA']) # dummy daily time series containing 'NA' to be used when food item is not relevant to a speicies specific toxicity measure
+        na_series = np.full(self.num_simulation_days, np.nan) # dummy daily time series containing NaN to be used when food item is not relevant to a speicies specific toxicity measure
 
         # collect concentration based toxicity data into a single series for each taxa
         self.tox_cbt_mamm = pd.Series([self.cbt_mamm_1inmill_mort[sim_num], self.cbt_mamm_1inten_mort[sim_num], self.cbt_mamm_low_lc50[sim_num], self.cbt_mamm_sub_direct[sim_num],
@@ -366,72 +435,72 @@ class TedAggregateMethods(object):
                             self.cbt_inv_food_grow_noec[sim_num],self.cbt_inv_food_grow_loec[sim_num],self.cbt_inv_food_repro_noec[sim_num],self.cbt_inv_food_repro_loec[sim_num],self.cbt_inv_food_behav_noec[sim_num],
                             self.cbt_inv_food_behav_loec[sim_num],self.cbt_inv_food_sensory_noec[sim_num],self.cbt_inv_food_sensory_loec[sim_num],self.cbt_inv_food_sub_indirect[sim_num]])
 
-        #         collect/aggregate timeseries of food item concentrations into a single series (upper bound/mean and min/max application scenario)
+        #         collect/aggregate timeseries of food item concentrations into a single (food items x days) array (upper bound/mean and min/max application scenario)
         #         notice that the time series have an _1 an _2 associated with them; the difference is associated with the list of food items
         #         that are relevant to the taxa; the _1 aggregates food item time series are relevant to mammals/birds/reptiles while the
         #         _2 aggregates time series relevant to terrestrial invertebrates  --
-        #         for all non-relevant food items per taxa a dummy time series filled with 'NA' is used in the aggregation; this allows the
+        #         for all non-relevant food items per taxa a dummy time series filled with NaN is used in the aggregation; this allows the
         #         OPP TED spreadsheet to be replicated
 
         # process minimum application scenario time series with upper bound & mean residue concentration multipliers for food items
 
-        self.eec_ts_upper_min_1 = pd.Series([[self.out_diet_eec_upper_min_sg], [self.out_diet_eec_upper_min_tg], [self.out_diet_eec_upper_min_blp], \
-                                  [self.out_diet_eec_upper_min_fp], [self.out_diet_eec_upper_min_arthro], [self.out_diet_eec_min_soil_inv],
-                                  [self.out_diet_eec_upper_min_sm_mamm], [self.out_diet_eec_upper_min_lg_mamm], [self.out_diet_eec_upper_min_sm_bird],
-                                  [self.out_diet_eec_upper_min_sm_amphi], [na_series]])
+        self.eec_ts_upper_min_1 = np.array([self.out_diet_eec_upper_min_sg, self.out_diet_eec_upper_min_tg, self.out_diet_eec_upper_min_blp,
+                                            self.out_diet_eec_upper_min_fp, self.out_diet_eec_upper_min_arthro, self.out_diet_eec_min_soil_inv,
+                                            self.out_diet_eec_upper_min_sm_mamm, self.out_diet_eec_upper_min_lg_mamm, self.out_diet_eec_upper_min_sm_bird,
+                                            self.out_diet_eec_upper_min_sm_amphi, na_series], dtype='float')
 
-        self.eec_ts_upper_min_2 = pd.Series([[self.out_diet_eec_upper_min_sg], [self.out_diet_eec_upper_min_tg], [self.out_diet_eec_upper_min_blp], \
-                                                [self.out_diet_eec_upper_min_fp], [self.out_diet_eec_upper_min_arthro], [self.out_diet_eec_min_soil_inv],
-                                                [na_series], [na_series], [na_series], [na_series], [self.out_soil_conc_min]])
+        self.eec_ts_upper_min_2 = np.array([self.out_diet_eec_upper_min_sg, self.out_diet_eec_upper_min_tg, self.out_diet_eec_upper_min_blp,
+                                            self.out_diet_eec_upper_min_fp, self.out_diet_eec_upper_min_arthro, self.out_diet_eec_min_soil_inv,
+                                            na_series, na_series, na_series, na_series, self.out_soil_conc_min], dtype='float')
 
-        self.eec_exc_upper_min_mamm = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_mamm)
-        self.eec_exc_upper_min_bird = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_bird)
-        self.eec_exc_upper_min_reptile = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_reptile)
-        self.eec_exc_upper_min_inv = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_min_2, self.tox_cbt_inv)
+        self.eec_exc_upper_min_mamm = self.sum_exceedances(self.eec_ts_upper_min_1, self.tox_cbt_mamm)
+        self.eec_exc_upper_min_bird = self.sum_exceedances(self.eec_ts_upper_min_1, self.tox_cbt_bird)
+        self.eec_exc_upper_min_reptile = self.sum_exceedances(self.eec_ts_upper_min_1, self.tox_cbt_reptile)
+        self.eec_exc_upper_min_inv = self.sum_exceedances(self.eec_ts_upper_min_2, self.tox_cbt_inv)
 
-        self.eec_ts_mean_min_1 = pd.Series([[self.out_diet_eec_mean_min_sg], [self.out_diet_eec_mean_min_tg], [self.out_diet_eec_mean_min_blp], \
-                                  [self.out_diet_eec_mean_min_fp], [self.out_diet_eec_mean_min_arthro], [na_series],
-                                  [self.out_diet_eec_mean_min_sm_mamm], [self.out_diet_eec_mean_min_lg_mamm], [self.out_diet_eec_mean_min_sm_bird],
-                                  [self.out_diet_eec_mean_min_sm_amphi], [na_series]])
+        self.eec_ts_mean_min_1 = np.array([self.out_diet_eec_mean_min_sg, self.out_diet_eec_mean_min_tg, self.out_diet_eec_mean_min_blp,
+                                           self.out_diet_eec_mean_min_fp, self.out_diet_eec_mean_min_arthro, na_series,
+                                           self.out_diet_eec_mean_min_sm_mamm, self.out_diet_eec_mean_min_lg_mamm, self.out_diet_eec_mean_min_sm_bird,
+                                           self.out_diet_eec_mean_min_sm_amphi, na_series], dtype='float')
 
-        self.eec_ts_mean_min_2 = pd.Series([[self.out_diet_eec_mean_min_sg], [self.out_diet_eec_mean_min_tg], [self.out_diet_eec_mean_min_blp], \
-                                               [self.out_diet_eec_mean_min_fp], [self.out_diet_eec_mean_min_arthro], [na_series],
-                                               [na_series], [na_series], [na_series], [na_series], [na_series]])  # soil concentration timeseries same as upper bound case
+        self.eec_ts_mean_min_2 = np.array([self.out_diet_eec_mean_min_sg, self.out_diet_eec_mean_min_tg, self.out_diet_eec_mean_min_blp,
+                                           self.out_diet_eec_mean_min_fp, self.out_diet_eec_mean_min_arthro, na_series,
+                                           na_series, na_series, na_series, na_series, na_series], dtype='float')  # soil concentration timeseries same as upper bound case
 
-        self.eec_exc_mean_min_mamm = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_min_1, self.tox_cbt_mamm)
-        self.eec_exc_mean_min_bird = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_min_1, self.tox_cbt_bird)
-        self.eec_exc_mean_min_reptile = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_min_1, self.tox_cbt_reptile)
-        self.eec_exc_mean_min_inv = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_min_2, self.tox_cbt_inv)
+        self.eec_exc_mean_min_mamm = self.sum_exceedances(self.eec_ts_mean_min_1, self.tox_cbt_mamm)
+        self.eec_exc_mean_min_bird = self.sum_exceedances(self.eec_ts_mean_min_1, self.tox_cbt_bird)
+        self.eec_exc_mean_min_reptile = self.sum_exceedances(self.eec_ts_mean_min_1, self.tox_cbt_reptile)
+        self.eec_exc_mean_min_inv = self.sum_exceedances(self.eec_ts_mean_min_2, self.tox_cbt_inv)
 
         # process maximum application scenario time series with upper bound & mean residue concentration multipliers for food items
 
-        self.eec_ts_upper_max_1 = pd.Series([[self.out_diet_eec_upper_max_sg], [self.out_diet_eec_upper_max_tg], [self.out_diet_eec_upper_max_blp], \
-                                  [self.out_diet_eec_upper_max_fp], [self.out_diet_eec_upper_max_arthro], [self.out_diet_eec_max_soil_inv],
-                                  [self.out_diet_eec_upper_max_sm_mamm], [self.out_diet_eec_upper_max_lg_mamm], [self.out_diet_eec_upper_max_sm_bird],
-                                  [self.out_diet_eec_upper_max_sm_amphi], [na_series]])
+        self.eec_ts_upper_max_1 = np.array([self.out_diet_eec_upper_max_sg, self.out_diet_eec_upper_max_tg, self.out_diet_eec_upper_max_blp,
+                                            self.out_diet_eec_upper_max_fp, self.out_diet_eec_upper_max_arthro, self.out_diet_eec_max_soil_inv,
+                                            self.out_diet_eec_upper_max_sm_mamm, self.out_diet_eec_upper_max_lg_mamm, self.out_diet_eec_upper_max_sm_bird,
+                                            self.out_diet_eec_upper_max_sm_amphi, na_series], dtype='float')
 
-        self.eec_ts_upper_max_2 = pd.Series([[self.out_diet_eec_upper_max_sg], [self.out_diet_eec_upper_max_tg], [self.out_diet_eec_upper_max_blp],
-                                                [self.out_diet_eec_upper_max_fp], [self.out_diet_eec_upper_max_arthro], [self.out_diet_eec_max_soil_inv],
-                                                [na_series], [na_series], [na_series], [na_series], [self.out_soil_conc_max]])
+        self.eec_ts_upper_max_2 = np.array([self.out_diet_eec_upper_max_sg, self.out_diet_eec_upper_max_tg, self.out_diet_eec_upper_max_blp,
+                                            self.out_diet_eec_upper_max_fp, self.out_diet_eec_upper_max_arthro, self.out_diet_eec_max_soil_inv,
+                                            na_series, na_series, na_series, na_series, self.out_soil_conc_max], dtype='float')
 
-        self.eec_exc_upper_max_mamm = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_mamm)
-        self.eec_exc_upper_max_bird = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_bird)
-        self.eec_exc_upper_max_reptile = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_reptile)
-        self.eec_exc_upper_max_inv = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_upper_max_2, self.tox_cbt_inv)
+        self.eec_exc_upper_max_mamm = self.sum_exceedances(self.eec_ts_upper_max_1, self.tox_cbt_mamm)
+        self.eec_exc_upper_max_bird = self.sum_exceedances(self.eec_ts_upper_max_1, self.tox_cbt_bird)
+        self.eec_exc_upper_max_reptile = self.sum_exceedances(self.eec_ts_upper_max_1, self.tox_cbt_reptile)
+        self.eec_exc_upper_max_inv = self.sum_exceedances(self.eec_ts_upper_max_2, self.tox_cbt_inv)
 
-        self.eec_ts_mean_max_1 = pd.Series([[self.out_diet_eec_mean_max_sg], [self.out_diet_eec_mean_max_tg], [self.out_diet_eec_mean_max_blp], \
-                                  [self.out_diet_eec_mean_max_fp], [self.out_diet_eec_mean_max_arthro], [na_series],
-                                  [self.out_diet_eec_mean_max_sm_mamm], [self.out_diet_eec_mean_max_lg_mamm], [self.out_diet_eec_mean_max_sm_bird],
-                                  [self.out_diet_eec_mean_max_sm_amphi], [na_series]])
+        self.eec_ts_mean_max_1 = np.array([self.out_diet_eec_mean_max_sg, self.out_diet_eec_mean_max_tg, self.out_diet_eec_mean_max_blp,
+                                           self.out_diet_eec_mean_max_fp, self.out_diet_eec_mean_max_arthro, na_series,
+                                           self.out_diet_eec_mean_max_sm_mamm, self.out_diet_eec_mean_max_lg_mamm, self.out_diet_eec_mean_max_sm_bird,
+                                           self.out_diet_eec_mean_max_sm_amphi, na_series], dtype='float')
 
-        self.eec_ts_mean_max_2 = pd.Series([[self.out_diet_eec_mean_max_sg], [self.out_diet_eec_mean_max_tg], [self.out_diet_eec_mean_max_blp], \
-                                 [self.out_diet_eec_mean_max_fp], [self.out_diet_eec_mean_max_arthro], [na_series],
-                                 [na_series], [na_series], [na_series], [na_series], [na_series]]) # soil concentration timeseries same as upper bound case
+        self.eec_ts_mean_max_2 = np.array([self.out_diet_eec_mean_max_sg, self.out_diet_eec_mean_max_tg, self.out_diet_eec_mean_max_blp,
+                                           self.out_diet_eec_mean_max_fp, self.out_diet_eec_mean_max_arthro, na_series,
+                                           na_series, na_series, na_series, na_series, na_series], dtype='float') # soil concentration timeseries same as upper bound case
 
-        self.eec_exc_mean_max_mamm = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_max_1, self.tox_cbt_mamm)
-        self.eec_exc_mean_max_bird = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_max_1, self.tox_cbt_bird)
-        self.eec_exc_mean_max_reptile = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_max_1, self.tox_cbt_reptile)
-        self.eec_exc_mean_max_inv = self.sum_exceedances(self.num_ts, self.num_tox, self.eec_ts_mean_max_2, self.tox_cbt_inv)
+        self.eec_exc_mean_max_mamm = self.sum_exceedances(self.eec_ts_mean_max_1, self.tox_cbt_mamm)
+        self.eec_exc_mean_max_bird = self.sum_exceedances(self.eec_ts_mean_max_1, self.tox_cbt_bird)
+        self.eec_exc_mean_max_reptile = self.sum_exceedances(self.eec_ts_mean_max_1, self.tox_cbt_reptile)
+        self.eec_exc_mean_max_inv = self.sum_exceedances(self.eec_ts_mean_max_2, self.tox_cbt_inv)
 
     def eec_drift_distances(self, sim_num):
         """
@@ -447,30 +516,28 @@ class TedAggregateMethods(object):
         # represent aggregations of the toxicity measures per taxa into panda series for processing (the series were constructed
         # in method 'eec_exceedances'
 
-        na_series = pd.Series(366*['NA']) # dummy daily time series containing 'NA' to be used when food item is not relevant to a speicies specific toxicity measure
-
-        #         collect/aggregate maximum concentrations from timeseries of food item concentrations into a single series (upper bound/mean and min/max application scenario)
+        #         collect/aggregate maximum concentrations from timeseries of food item concentrations into a single array (upper bound/mean and min/max application scenario)
         #         notice that the time series have an _1 an _2 associated with them; the difference is associated with the list of food items
         #         that are relevant to the taxa; the _1 aggregates food item time series are relevant to mammals/birds/reptiles while the
         #         _2 aggregates time series relevant to terrestrial invertebrates  --
-        #         for all non-relevant food items per taxa a dummy time series filled with 'NA' is used in the aggregation; this allows the
+        #         for all non-relevant food items per taxa NaN is used in the aggregation; this allows the
         #         OPP TED spreadsheet to be replicated
 
         # process minimum application scenario time series with upper bound residue concentration multipliers for food items
 
-        self.eec_ts_upper_min_1 = pd.Series([self.out_diet_eec_upper_min_sg.max(), self.out_diet_eec_upper_min_tg.max(), self.out_diet_eec_upper_min_blp.max(), \
-                                  self.out_diet_eec_upper_min_fp.max(), self.out_diet_eec_upper_min_arthro.max(), self.out_diet_eec_min_soil_inv.max(),
-                                  self.out_diet_eec_upper_min_sm_mamm.max(), self.out_diet_eec_upper_min_lg_mamm.max(), self.out_diet_eec_upper_min_sm_bird.max(),
-                                  self.out_diet_eec_upper_min_sm_amphi.max(), na_series.max()])
+        self.eec_ts_upper_min_1 = np.array([self.out_diet_eec_upper_min_sg.max(), self.out_diet_eec_upper_min_tg.max(), self.out_diet_eec_upper_min_blp.max(),
+                                            self.out_diet_eec_upper_min_fp.max(), self.out_diet_eec_upper_min_arthro.max(), self.out_diet_eec_min_soil_inv.max(),
+                                            self.out_diet_eec_upper_min_sm_mamm.max(), self.out_diet_eec_upper_min_lg_mamm.max(), self.out_diet_eec_upper_min_sm_bird.max(),
+                                            self.out_diet_eec_upper_min_sm_amphi.max(), np.nan], dtype='float')
 
-        self.eec_ts_upper_min_2 = pd.Series([self.out_diet_eec_upper_min_sg.max(), self.out_diet_eec_upper_min_tg.max(), self.out_diet_eec_upper_min_blp.max(), \
-                                                self.out_diet_eec_upper_min_fp.max(), self.out_diet_eec_upper_min_arthro.max(), self.out_diet_eec_min_soil_inv.max(),
-                                                na_series.max(), na_series.max(), na_series.max(), na_series.max(), self.out_soil_conc_min.max()])
+        self.eec_ts_upper_min_2 = np.array([self.out_diet_eec_upper_min_sg.max(), self.out_diet_eec_upper_min_tg.max(), self.out_diet_eec_upper_min_blp.max(),
+                                            self.out_diet_eec_upper_min_fp.max(), self.out_diet_eec_upper_min_arthro.max(), self.out_diet_eec_min_soil_inv.max(),
+                                            np.nan, np.nan, np.nan, np.nan, self.out_soil_conc_min.max()], dtype='float')
 
-        self.eec_tox_frac_mamm_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_mamm)
-        self.eec_tox_frac_bird_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_bird)
-        self.eec_tox_frac_reptile_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_reptile)
-        self.eec_tox_frac_inv_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_min_1, self.tox_cbt_inv)
+        self.eec_tox_frac_mamm_1 = self.calc_eec_tox_frac(self.eec_ts_upper_min_1, self.tox_cbt_mamm)
+        self.eec_tox_frac_bird_1 = self.calc_eec_tox_frac(self.eec_ts_upper_min_1, self.tox_cbt_bird)
+        self.eec_tox_frac_reptile_1 = self.calc_eec_tox_frac(self.eec_ts_upper_min_1, self.tox_cbt_reptile)
+        self.eec_tox_frac_inv_1 = self.calc_eec_tox_frac(self.eec_ts_upper_min_1, self.tox_cbt_inv)
 
         # calculate distances from source area related to max daily concentration (minimum application scenario)
         self.eec_dist_upper_min_mamm = self.calc_maxeec_distance(self.eec_tox_frac_mamm_1, self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
@@ -479,19 +546,19 @@ class TedAggregateMethods(object):
         self.eec_dist_upper_min_inv = self.calc_maxeec_distance(self.eec_tox_frac_inv_1, self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
 
         # process maximum application scenario time series with upper bound residue concentration multipliers for food items
-        self.eec_ts_upper_max_1 = pd.Series([self.out_diet_eec_upper_max_sg.max(), self.out_diet_eec_upper_max_tg.max(), self.out_diet_eec_upper_max_blp.max(), \
-                                  self.out_diet_eec_upper_max_fp.max(), self.out_diet_eec_upper_max_arthro.max(), self.out_diet_eec_max_soil_inv.max(),
-                                  self.out_diet_eec_upper_max_sm_mamm.max(), self.out_diet_eec_upper_max_lg_mamm.max(), self.out_diet_eec_upper_max_sm_bird.max(),
-                                  self.out_diet_eec_upper_max_sm_amphi.max(), na_series.max()])
-
-        self.eec_ts_upper_max_2 = pd.Series([self.out_diet_eec_upper_max_sg.max(), self.out_diet_eec_upper_max_tg.max(), self.out_diet_eec_upper_max_blp.max(), \
-                                                self.out_diet_eec_upper_max_fp.max(), self.out_diet_eec_upper_max_arthro.max(), self.out_diet_eec_max_soil_inv.max(),
-                                                na_series.max(), na_series.max(), na_series.max(), na_series.max(), self.out_soil_conc_max.max()])
-
-        self.eec_tox_frac_mamm_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_mamm)
-        self.eec_tox_frac_bird_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_bird)
-        self.eec_tox_frac_reptile_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_reptile)
-        self.eec_tox_frac_inv_1 = self.calc_eec_tox_frac(self.num_ts, self.num_tox, self.eec_ts_upper_max_1, self.tox_cbt_inv)
+        self.eec_ts_upper_max_1 = np.array([self.out_diet_eec_upper_max_sg.max(), self.out_diet_eec_upper_max_tg.max(), self.out_diet_eec_upper_max_blp.max(),
+                                            self.out_diet_eec_upper_max_fp.max(), self.out_diet_eec_upper_max_arthro.max(), self.out_diet_eec_max_soil_inv.max(),
+                                            self.out_diet_eec_upper_max_sm_mamm.max(), self.out_diet_eec_upper_max_lg_mamm.max(), self.out_diet_eec_upper_max_sm_bird.max(),
+                                            self.out_diet_eec_upper_max_sm_amphi.max(), np.nan], dtype='float')
+
+        self.eec_ts_upper_max_2 = np.array([self.out_diet_eec_upper_max_sg.max(), self.out_diet_eec_upper_max_tg.max(), self.out_diet_eec_upper_max_blp.max(),
+                                            self.out_diet_eec_upper_max_fp.max(), self.out_diet_eec_upper_max_arthro.max(), self.out_diet_eec_max_soil_inv.max(),
+                                            np.nan, np.nan, np.nan, np.nan, self.out_soil_conc_max.max()], dtype='float')
+
+        self.eec_tox_frac_mamm_1 = self.calc_eec_tox_frac(self.eec_ts_upper_max_1, self.tox_cbt_mamm)
+        self.eec_tox_frac_bird_1 = self.calc_eec_tox_frac(self.eec_ts_upper_max_1, self.tox_cbt_bird)
+        self.eec_tox_frac_reptile_1 = self.calc_eec_tox_frac(self.eec_ts_upper_max_1, self.tox_cbt_reptile)
+        self.eec_tox_frac_inv_1 = self.calc_eec_tox_frac(self.eec_ts_upper_max_1, self.tox_cbt_inv)
 
         # calculate distances from source area related to max daily concentration (maximum application scenario)
         self.eec_dist_upper_max_mamm = self.calc_maxeec_distance(self.eec_tox_frac_mamm_1, self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
@@ -6,10 +6,12 @@ import time
 import csv, sys
 import os.path
 import logging
+import multiprocessing
 
 
 from .ted_functions import TedFunctions
 from .ted_aggregate_methods import TedAggregateMethods
+from .ted_species_store import get_species_store
 from base.uber_model import UberModel, ModelSharedInputs
 
 class TedSpeciesProperties(object):
@@ -33,24 +35,22 @@ class TedSpeciesProperties(object):
     def read_species_properties(self):
         # this is a temporary method to initiate the species/diet food items lists (this will be replaced with
         # a method to access a SQL database containing the properties
+        # (the table is loaded once per process and shared; the species properties are read-only views of it)
         #filename = './ted/tests/TEDSpeciesProperties.csv'
         filename = os.path.join(os.path.dirname(__file__),'tests/TEDSpeciesProperties.csv')
         try:
-            with open(filename,'rt') as csvfile:
-                # csv.DictReader uses first line in file for column headings by default
-                dr = pd.read_csv(csvfile) # comma is default delimiter
+            species = get_species_store(filename)
         except csv.Error as e:
-            sys.exit('file: %s, %s' (filename, e))
-
-        print(dr)
-        self.sci_name = dr.ix[:,'Scientific Name']
-        self.com_name = dr.ix[:,'Common Name']
-        self.taxa = dr.ix[:,'Taxa']
-        self.order = dr.ix[:,'Order']
-        self.usfws_id = dr.ix[:,'USFWS Species ID (ENTITY_ID)']
-        self.body_wgt= dr.ix[:,'BW (g)']
-        self.diet_item = dr.ix[:,'Food item']
-        self.h2o_cont = dr.ix[:,'Water content of diet']
+            sys.exit('file: %s, %s' % (filename, e))
+
+        self.sci_name = species.get_series('sci_name')
+        self.com_name = species.get_series('com_name')
+        self.taxa = species.get_series('taxa')
+        self.order = species.get_series('order')
+        self.usfws_id = species.get_series('usfws_id')
+        self.body_wgt= species.get_series('body_wgt')
+        self.diet_item = species.get_series('diet_item')
+        self.h2o_cont = species.get_series('h2o_cont')
 
 class TedInputs(ModelSharedInputs):
     """
@@ -339,12 +339,30 @@ class Ted(UberModel, TedInputs, TedOutputs, TedFunctions, TedAggregateMethods, T
     and resulting doses/risks for birds, mammals, amphibians, and reptiles
     """
 
-    def __init__(self, pd_obj, pd_obj_exp):
-        """Class representing the Ted model and containing all its methods"""
+    # species properties table (see read_species_properties)
+    version_sources = ('tests/TEDSpeciesProperties.csv',)
+
+    def __init__(self, pd_obj, pd_obj_exp, maxima_only=False, num_workers=1, result_sink=None):
+        """
+        Class representing the Ted model and containing all its methods
+        :param maxima_only: Boolean; when True only the maximum daily food item EECs are computed (analytically from the
+                            application scenarios) and the daily time series (and the per simulation worksheets that
+                            process them) are not generated
+        :param num_workers: number of worker processes among which the simulations are distributed (1 - simulations
+                            are processed in sequence in this process)
+        :param result_sink: sink receiving the results of each simulation as it finishes (see ted_result_sink; e.g., a
+                            TedResultSink collects them in memory, a TedNpyResultSink streams them to disk); default - the
+                            per simulation results are not collected (the per simulation attributes hold the results of
+                            the last simulation)
+        """
         super(Ted, self).__init__()
         self.pd_obj = pd_obj
         self.pd_obj_exp = pd_obj_exp
         self.pd_obj_out = None
+        self.maxima_only = maxima_only
+        self.num_workers = num_workers
+        self.result_sink = result_sink
+        self.sim_results = result_sink.results if result_sink is not None else {}
 
     def execute_model(self):
         """
@@ -376,10 +394,19 @@ class Ted(UberModel, TedInputs, TedOutputs, TedFunctions, TedAggregateMethods, T
         # (represents columns B, C, D, and F of worksheet 'aquatic organism tissue concs' of OPP TED Excel spreadsheet model)
         self.calc_aq_invert_fish_concs()          # for all simulations
 
+        # when only the yearly maxima are requested compute the maximum daily food item EECs for all simulations
+        # directly from the application scenarios; the daily time series are not generated
+        if self.maxima_only:
+            self.conc_based_eec_maxima()
+            return
+
         # read species properties from database
         # (represents data contained in columns A thru H of worksheets 'Min/Max rate doses' of OPP TED Excel spreadsheet model)
         self.read_species_properties()
 
+        # encode species taxa, intake parameter groups and diet items as integer categories (for table lookups per species)
+        self.set_species_categories()
+
         # calculate species body surface areas
         # (represents calculations needed within columns O & P of worksheet 'Min/Max rate doses' of OPP TED spreadsheet model
         self.calc_species_surface_area()
@@ -389,34 +416,120 @@ class Ted(UberModel, TedInputs, TedOutputs, TedFunctions, TedAggregateMethods, T
         self.calc_species_inhalation_vol()
 
         # process simulations--------------------------------------------------------------------
-        for sim_num in range(self.num_simulations):
+        # (per simulation results are passed to the result sink as each simulation finishes; see 'store_simulation_results')
+        if self.num_workers > 1 and self.num_simulations > 1:
+            self.run_simulations_parallel()
+        else:
+            for sim_num in range(self.num_simulations):
+                self.run_simulation(sim_num)
+                if self.result_sink is not None:  # (the results are copied only to be kept)
+                    self.store_simulation_results(sim_num, self.simulation_results())
+        if self.result_sink is not None:
+            self.result_sink.flush()
+
+    def run_simulation(self, sim_num):
+        """
+        :description executes the worksheets of the OPP TED Excel model for one simulation; results are left in the
+                     per simulation attributes (e.g., 'out_diet_eec_*', 'out_species_*'), which are overwritten by the next simulation
+        :param sim_num: number of simulation
+        :return:
+        """
+
+        # TODO: need to decide which of the following variables are to be outputs; currently they are (I guess we could populate
+        # TODO: an EXCEL spreadsheet to match that of OPP)
+
+        # (set spray drift parameters for calculations of distance from source area associated with pesticide concentrations)
+        self.spray_drift_params(sim_num)
+
+        # calculates runoff parameters used to calculate plant EECs for wet and dry areas (for min/max application scenarios)
+        # (found in worksheet 'plants' of OPP TED Excel spreadsheet model)
+        self.runoff_params(sim_num)
+
+        # execute plant related methods and functions related to worksheet 'plants' in OPP TED Excel model
+        self.plants(sim_num)
+
+        # calculate daily time series of concentration based EECs (worksheets 'min/max rate concentrations' in OPP TED Excel model
+        self.conc_based_eec_timeseries(sim_num)
+
+        # count number of exceedances of various risk thresholds within eec timeseries
+        # (this represents OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 3 - 54 and 58 - 109)
+        self.eec_exceedances(sim_num)
+
+        # calculate spray drfit distances from source area to max daily food item concentration
+        # (represents OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 113 - 164)
+        self.eec_drift_distances(sim_num)
 
-            # TODO: need to decide which of the following variables are to be outputs; currently they are (I guess we could populate
-            # TODO: an EXCEL spreadsheet to match that of OPP)
+        # calculate species/food item specific doses via intake pathways and related health measure ratios ; worksheets 'min/max rate doses' in OPP TED Excel model
+        self.species_doses(sim_num)
 
-            # (set spray drift parameters for calculations of distance from source area associated with pesticide concentrations)
-            self.spray_drift_params(sim_num)
+        # write simulation results (this is an organization of outputs that would produce the OPP TED spreadsheets)
+        ##   self.write_simulation_results()
 
-            # calculates runoff parameters used to calculate plant EECs for wet and dry areas (for min/max application scenarios)
-            # (found in worksheet 'plants' of OPP TED Excel spreadsheet model)
-            self.runoff_params(sim_num)
+    def simulation_results(self):
+        """
+        :description collects (copies of) the per simulation results of the current simulation
+        :return: dictionary of result name -> numpy array
+        """
+        return dict((name, np.array(value)) for name, value in vars(self).items()
+                    if name.startswith(self.sim_result_prefixes) and not name.endswith('_maxdaily'))
 
-            # execute plant related methods and functions related to worksheet 'plants' in OPP TED Excel model
-            self.plants(sim_num)
+    def store_simulation_results(self, sim_num, results):
+        """
+        :description passes the results of one simulation to the result sink, which collects them in the per simulation
+                     result arrays ('sim_results'; result name -> array with one row per simulation); without a
+                     result sink the results are not kept
+        :param sim_num: number of simulation
+        :param results: dictionary of result name -> numpy array (see 'simulation_results')
+        :return:
+        """
+        if self.result_sink is not None:
+            self.result_sink.write(sim_num, self.num_simulations, results)
 
-            # calculate daily time series of concentration based EECs (worksheets 'min/max rate concentrations' in OPP TED Excel model
-            self.conc_based_eec_timeseries(sim_num)
+    def run_simulations_parallel(self):
+        """
+        :description distributes the simulations among 'num_workers' processes; each process works on its own copy of the model
+                     (isolated per simulation state) and the results of each simulation are passed to the result sink as
+                     they arrive (in simulation order)
+        :return:
+        """
+        num_workers = min(self.num_workers, self.num_simulations)
+        chunksize = max(1, self.num_simulations // (4 * num_workers))
+        result_sink, self.result_sink = self.result_sink, None  # the sink stays in this process
+        try:
+            pool = multiprocessing.Pool(num_workers, initializer=init_ted_worker, initargs=(self,))
+        finally:
+            self.result_sink = result_sink
+        try:
+            sim_results = None
+            for sim_num, sim_results in enumerate(pool.imap(run_ted_simulation, range(self.num_simulations), chunksize)):
+                self.store_simulation_results(sim_num, sim_results)
+        finally:
+            pool.close()
+            pool.join()
 
-            # count number of exceedances of various risk thresholds within eec timeseries
-            # (this represents OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 3 - 54 and 58 - 109)
-            self.eec_exceedances(sim_num)
+        # leave the per simulation attributes with the results of the last simulation (as in the sequential processing)
+        for name, value in sim_results.items():
+            setattr(self, name, value)
 
-            # calculate spray drfit distances from source area to max daily food item concentration
-            # (represents OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 113 - 164)
-            self.eec_drift_distances(sim_num)
 
-            # calculate species/food item specific doses via intake pathways and related health measure ratios ; worksheets 'min/max rate doses' in OPP TED Excel model
-            self.species_doses(sim_num)
+_worker_ted = None
 
-            # write simulation results (this is an organization of outputs that would produce the OPP TED spreadsheets)
-            ##   self.write_simulation_results()
\ No newline at end of file
+
+def init_ted_worker(ted):
+    """
+    :description worker process initializer; keeps the (process local) copy of the Ted model the worker executes simulations on
+    :param ted: Ted model with simulation independent calculations completed
+    :return:
+    """
+    global _worker_ted
+    _worker_ted = ted
+
+
+def run_ted_simulation(sim_num):
+    """
+    :description worker process function; executes one simulation on the worker's copy of the Ted model
+    :param sim_num: number of simulation
+    :return: per simulation results (see 'Ted.simulation_results')
+    """
+    _worker_ted.run_simulation(sim_num)
+    return _worker_ted.simulation_results()
@@ -175,15 +175,66 @@ class TedFunctions(object):
         :return:
         """
 
-        conc = np.zeros(self.num_simulation_days)
+        return self.conc_initial_plant(application_rate, food_multiplier) * self.daily_decay_response(self.foliar_diss_hlife[i], daily_flag)
 
-        for day_index in range(self.num_simulation_days):
-            if(day_index==0):
-                conc[day_index] = self.conc_initial_plant(application_rate, food_multiplier)
-            else:
-                conc[day_index] = self.conc_timestep(conc[day_index-1], self.foliar_diss_hlife[i])
-                if(daily_flag[day_index]==1): conc[day_index] = conc[day_index] + conc[0]
-        return conc
+    def daily_decay_response(self, half_life, daily_flag):
+        """
+        :description generates annual timeseries of the daily response to applications of unit initial concentration
+                     (i.e., the decay/application pattern shared by all timeseries with the same half-life and daily flags)
+        :param half_life; halflife of pesiticde representing either foliar dissipation halflife or aerobic soil metabolism halflife (days)
+        :param daily_flag; daily flag denoting if pesticide is applied (0 - not applied, 1 - applied)
+
+        :Notes # closed form of the daily recursion conc[day] = conc[day-1] * exp(-ln(2)/half_life) + daily_flag[day] * conc[0]
+               # (day 0 is always an application day); i.e., the sum over application days of the first-order decay since that day
+        :return:
+        """
+
+        app_days = np.flatnonzero(daily_flag)
+        app_days = np.union1d(app_days, [0])
+        days_since_app = np.arange(self.num_simulation_days) - app_days[:, None]  # (application days x days)
+        decay_terms = np.exp(-(np.log(2) / half_life) * np.maximum(days_since_app, 0))
+        return np.where(days_since_app >= 0, decay_terms, 0.).sum(axis=0)
+
+    def daily_plant_timeseries_stack(self, application_rate, food_multipliers, decay_response):
+        """
+        :description generates annual timeseries of daily pesticide residue concentration (EECs) for a collection of food items
+                     at once (see 'daily_plant_timeseries')
+        :param application rate; active ingredient application rate (lbs a.i./acre)
+        :param food_multipliers; array of factors by which application rate of active ingredient is multiplied to estimate dietary based EECs
+        :param decay_response; daily response to applications of unit initial concentration (see 'daily_decay_response')
+
+        :return: array of daily EECs (food items x days)
+        """
+        return np.outer(self.conc_initial_plant(application_rate, np.asarray(food_multipliers, dtype=float)), decay_response)
+
+    def daily_plant_max(self, application_rate, food_multiplier, num_apps, app_interval, half_life):
+        """
+        :description calculates the maximum daily pesticide residue concentration (EEC) of the annual food item timeseries
+                     without generating the timeseries (see 'daily_plant_timeseries'); arguments may be arrays/series
+                     (e.g., across all simulations)
+        :param application rate; active ingredient application rate (lbs a.i./acre)
+        :param food_multiplier; factor by which application rate of active ingredient is multiplied to estimate dietary based EECs
+        :param num_apps; number of applications
+        :param app_interval; number of days between applications
+        :param half_life; foliar dissipation halflife (days)
+
+        :Notes # applications of equal rate occur every 'app_interval' days starting on day 0; with first-order decay the
+               # maximum occurs on the last application day within the year and equals the geometric sum
+               # conc_initial * (1 - r**n) / (1 - r), with r = exp(-(ln(2) / half_life) * app_interval)
+        :return:
+        """
+
+        num_apps = np.asarray(num_apps, dtype=int)
+        app_interval = np.asarray(app_interval, dtype=int)
+        conc_0 = self.conc_initial_plant(np.asarray(application_rate, dtype=float), food_multiplier)
+        decay = np.exp(-(np.log(2) / np.asarray(half_life, dtype=float)) * app_interval)
+
+        # number of application days within the year (day 0 is always an application day)
+        num_app_days = np.where(app_interval > 0, (self.num_simulation_days - 1) // np.maximum(app_interval, 1) + 1, 1)
+        num_app_days = np.maximum(np.minimum(num_apps, num_app_days), 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            geometric_sum = np.where(decay < 1., (1. - decay ** num_app_days) / (1. - decay), num_app_days)
+        return conc_0 * geometric_sum
 
     def daily_soil_h2o_timeseries(self, i, application_rate, daily_flag, water_type):
         """
@@ -200,15 +251,7 @@ class TedFunctions(object):
         :return:
         """
 
-        conc = np.zeros(self.num_simulation_days)
-
-        for day_index in range(self.num_simulation_days):
-            if(day_index==0):
-                conc[day_index] = self.conc_initial_soil_h2o(i, application_rate, water_type)
-            else:
-                conc[day_index] = self.conc_timestep(conc[day_index-1], self.aerobic_soil_meta_hlife[i])
-                if(daily_flag[day_index]==1): conc[day_index] = conc[day_index] + conc[0]
-        return conc
+        return self.conc_initial_soil_h2o(i, application_rate, water_type) * self.daily_decay_response(self.aerobic_soil_meta_hlife[i], daily_flag)
 
     def daily_plant_dew_timeseries(self, i, blp_conc):
         """
@@ -288,16 +331,42 @@ class TedFunctions(object):
 
         :return:
         """
-        dose = np.zeros(self.num_simulation_days)
-
-        # calculate daily consumption rate
-        food_intake_rate = self.animal_dietary_intake(a1, b1, body_wgt, frac_h2o)  # (g/day-ww) Eq 6
-
-        # calculate daily doses for the year
-        for day_index in range(self.num_simulation_days):
-            dose[day_index] = self.animal_dietary_dose(body_wgt, food_intake_rate, intake_food_conc[day_index])  #Eq 5
-            if(day_index != 0):
-                dose[day_index] = dose[day_index] + (dose[day_index-1] * frac_retained)  # 2nd part of this is the carry over from previous day
+        return self.daily_animal_dose_timeseries_stack(a1, b1, body_wgt, frac_h2o, np.asarray(intake_food_conc, dtype=float)[None, :], frac_retained)[0]
+
+    def daily_animal_dose_timeseries_stack(self, a1, b1, body_wgt, frac_h2o, intake_food_conc, frac_retained):
+        """
+        :description generates annual timeseries of daily pesticide concentrations in animals for a collection of animal/food item
+                     combinations at once (see 'daily_animal_dose_timeseries')
+        :param a1; coefficient(s) of allometric expression (scalar or one per row of 'intake_food_conc')
+        :param b1; exponent(s) of allometrice expression (scalar or one per row)
+        :param body_wgt; body weight(s) of species (g) (scalar or one per row)
+        :param frac_h2o; fraction(s) of water in food item (scalar or one per row)
+        :param intake_food_conc; pesticide concentrations in food items (rows x days; daily mg a.i./kg)
+        :param frac_retained; fraction(s) of ingested food retained by animal (scalar or one per row)
+
+        :Notes # the daily carry over dose[day] = intake_dose[day] + frac_retained * dose[day-1] is a first-order recursive (IIR)
+               # filter of the daily intake doses; it is applied to all rows sharing a retained fraction in a single filter call
+        :return: array of daily doses (rows x days)
+        """
+
+        intake_food_conc = np.asarray(intake_food_conc, dtype=float)
+        num_rows = intake_food_conc.shape[0]
+        body_wgt = np.broadcast_to(np.asarray(body_wgt, dtype=float), num_rows)[:, None]
+        frac_retained = np.broadcast_to(np.asarray(frac_retained, dtype=float), num_rows)
+
+        # calculate daily consumption rates and daily intake doses
+        food_intake_rate = self.animal_dietary_intake(np.asarray(a1, dtype=float), np.asarray(b1, dtype=float), body_wgt[:, 0],
+                                                      np.asarray(frac_h2o, dtype=float))  # (g/day-ww) Eq 6
+        intake_dose = self.animal_dietary_dose(body_wgt, np.broadcast_to(food_intake_rate, num_rows)[:, None], intake_food_conc)  #Eq 5
+
+        # accumulate daily doses for the year (carry over from previous day)
+        from scipy.signal import lfilter  # imported on first use (scipy.signal is most of the import time of ted)
+        dose = np.full_like(intake_dose, np.nan)
+        for frac in np.unique(frac_retained[~np.isnan(frac_retained)]):
+            rows = frac_retained == frac
+            dose[rows] = lfilter([1.], [1., -frac], intake_dose[rows], axis=1)
+        # a missing (NaN) retained fraction leaves only the first day's dose (no carry over can be computed)
+        dose[np.isnan(frac_retained), :1] = intake_dose[np.isnan(frac_retained), :1]
         return dose
 
     def animal_dietary_intake(self, a1, b1, body_wgt, frac_h2o):
@@ -369,15 +438,22 @@ class TedFunctions(object):
         :return:
         """
 
-        conc = np.zeros(self.num_simulation_days)
+        return self.conc_initial_canopy_air(i, application_rate) * self.daily_decay_response(self.foliar_diss_hlife[i], daily_flag)
 
-        for day_index in range(self.num_simulation_days):
-            if(day_index==0):
-                conc[day_index] = self.conc_initial_canopy_air(i, application_rate)
-            else:
-                conc[day_index] = self.conc_timestep(conc[day_index-1], self.foliar_diss_hlife[i])
-                if(daily_flag[day_index]==1): conc[day_index] = conc[day_index] + conc[0]
-        return conc
+    def min_max_scenario_params(self, num_dims):
+        """
+        :description collects the spray drift parameters (a, b, c) and maximum drift distances of the minimum and maximum
+                     application scenarios of the current simulation for bulk (array) drift distance calculations
+        :param num_dims; number of trailing dimensions (e.g., thresholds, species) the parameters are to be broadcast over
+
+        :return: tuple of arrays (param_a, param_b, param_c, max_distance); each of shape (2,) + num_dims * (1,) (row 0: minimum, row 1: maximum application scenario)
+        """
+
+        shape = (2,) + num_dims * (1,)
+        return (np.array([self.drift_param_a_min, self.drift_param_a_max], dtype='float').reshape(shape),
+                np.array([self.drift_param_b_min, self.drift_param_b_max], dtype='float').reshape(shape),
+                np.array([self.drift_param_c_min, self.drift_param_c_max], dtype='float').reshape(shape),
+                np.array([self.max_drift_distance_minapp, self.max_drift_distance_maxapp], dtype='float').reshape(shape))
 
     def drift_distance_calc(self, app_rate_frac, param_a, param_b, param_c, max_distance):
         """
@@ -392,16 +468,16 @@ class TedFunctions(object):
         :param max_distance; maximum distance from source area for which drift calculations are executed (feet)
 
         # this represents Eq 1 of Attachment 1-7 of 'Biological Evaluation Chapters for Diazinon ESA Assessment'
+        # all arguments may be scalars or arrays (broadcast against each other; e.g., species x thresholds x scenarios)
 
-        :return:
+        :return: distance(s) clamped to the range 0.0 - max_distance (NaN where the fraction is not available)
         """
-        distance = (((param_c / app_rate_frac) ** (1. / param_b)) - 1.) / param_a
 
-        # reset distance if outside bounds
-        if (distance < 0.0): distance = 0.0
-        if (distance > max_distance): distance = max_distance
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            distance = (((np.asarray(param_c, dtype='float') / app_rate_frac) ** (1. / np.asarray(param_b, dtype='float'))) - 1.) / param_a
 
-        return distance
+        # reset distance if outside bounds
+        return np.clip(distance, 0.0, max_distance)
 
     def calc_plant_tox_ratios(self):
         """
@@ -475,136 +551,37 @@ class TedFunctions(object):
         :return:
         """
 
-        # plant toxicity (pt) : monocots ; minimum application rate; threshold distance
-        self.pt_mono_pre_noec_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_pre_noec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_pre_loec_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_pre_loec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_pre_ec25_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_pre_ec25_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_post_noec_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_post_noec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_post_loec_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_post_loec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_post_ec25_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_post_ec25_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_dir_mort_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_dir_mort_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_indir_mort_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_indir_mort_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_dir_repro_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_dir_repro_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_mono_indir_repro_thres_dist_min = self.calc_plant_risk_distance(self.pt_mono_indir_repro_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        # plant toxicity (pt) : dicots ; minimum application rate; threshold distance
-        self.pt_dicot_pre_noec_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_pre_noec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_pre_loec_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_pre_loec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_pre_ec25_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_pre_ec25_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_post_noec_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_post_noec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_post_loec_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_post_loec_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_post_ec25_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_post_ec25_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_dir_mort_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_dir_mort_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_indir_mort_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_indir_mort_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_dir_repro_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_dir_repro_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        self.pt_dicot_indir_repro_thres_dist_min = self.calc_plant_risk_distance(self.pt_dicot_indir_repro_appratio_min[sim_num],
-                                        self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-        # plant toxicity (pt) : monocots ; maximum application rate; threshold distance
-        self.pt_mono_pre_noec_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_pre_noec_appratio_max[sim_num],
-                                               self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_pre_loec_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_pre_loec_appratio_max[sim_num],
-                                               self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_pre_ec25_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_pre_ec25_appratio_max[sim_num],
-                                               self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
+        # ratios of plant toxicity measures (monocots then dicots) to application rates (row 0: minimum, row 1: maximum application rate)
+        appratio = np.array([[self.pt_mono_pre_noec_appratio_min[sim_num], self.pt_mono_pre_loec_appratio_min[sim_num], self.pt_mono_pre_ec25_appratio_min[sim_num], self.pt_mono_post_noec_appratio_min[sim_num], self.pt_mono_post_loec_appratio_min[sim_num],
+                              self.pt_mono_post_ec25_appratio_min[sim_num], self.pt_mono_dir_mort_appratio_min[sim_num], self.pt_mono_indir_mort_appratio_min[sim_num], self.pt_mono_dir_repro_appratio_min[sim_num], self.pt_mono_indir_repro_appratio_min[sim_num],
+                              self.pt_dicot_pre_noec_appratio_min[sim_num], self.pt_dicot_pre_loec_appratio_min[sim_num], self.pt_dicot_pre_ec25_appratio_min[sim_num], self.pt_dicot_post_noec_appratio_min[sim_num], self.pt_dicot_post_loec_appratio_min[sim_num],
+                              self.pt_dicot_post_ec25_appratio_min[sim_num], self.pt_dicot_dir_mort_appratio_min[sim_num], self.pt_dicot_indir_mort_appratio_min[sim_num], self.pt_dicot_dir_repro_appratio_min[sim_num], self.pt_dicot_indir_repro_appratio_min[sim_num]],
+                             [self.pt_mono_pre_noec_appratio_max[sim_num], self.pt_mono_pre_loec_appratio_max[sim_num], self.pt_mono_pre_ec25_appratio_max[sim_num], self.pt_mono_post_noec_appratio_max[sim_num], self.pt_mono_post_loec_appratio_max[sim_num],
+                              self.pt_mono_post_ec25_appratio_max[sim_num], self.pt_mono_dir_mort_appratio_max[sim_num], self.pt_mono_indir_mort_appratio_max[sim_num], self.pt_mono_dir_repro_appratio_max[sim_num], self.pt_mono_indir_repro_appratio_max[sim_num],
+                              self.pt_dicot_pre_noec_appratio_max[sim_num], self.pt_dicot_pre_loec_appratio_max[sim_num], self.pt_dicot_pre_ec25_appratio_max[sim_num], self.pt_dicot_post_noec_appratio_max[sim_num], self.pt_dicot_post_loec_appratio_max[sim_num],
+                              self.pt_dicot_post_ec25_appratio_max[sim_num], self.pt_dicot_dir_mort_appratio_max[sim_num], self.pt_dicot_indir_mort_appratio_max[sim_num], self.pt_dicot_dir_repro_appratio_max[sim_num], self.pt_dicot_indir_repro_appratio_max[sim_num]]], dtype='float')
 
-        self.pt_mono_post_noec_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_post_noec_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
+        # threshold distances of all plant toxicity measures and both application scenarios (in one call)
+        thres_dist = self.calc_plant_risk_distance(appratio, *self.min_max_scenario_params(1))
 
-        self.pt_mono_post_loec_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_post_loec_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
+        # plant toxicity (pt) : monocots/dicots ; minimum application rate; threshold distance
+        (self.pt_mono_pre_noec_thres_dist_min, self.pt_mono_pre_loec_thres_dist_min, self.pt_mono_pre_ec25_thres_dist_min, self.pt_mono_post_noec_thres_dist_min, self.pt_mono_post_loec_thres_dist_min,
+         self.pt_mono_post_ec25_thres_dist_min, self.pt_mono_dir_mort_thres_dist_min, self.pt_mono_indir_mort_thres_dist_min, self.pt_mono_dir_repro_thres_dist_min, self.pt_mono_indir_repro_thres_dist_min,
+         self.pt_dicot_pre_noec_thres_dist_min, self.pt_dicot_pre_loec_thres_dist_min, self.pt_dicot_pre_ec25_thres_dist_min, self.pt_dicot_post_noec_thres_dist_min, self.pt_dicot_post_loec_thres_dist_min,
+         self.pt_dicot_post_ec25_thres_dist_min, self.pt_dicot_dir_mort_thres_dist_min, self.pt_dicot_indir_mort_thres_dist_min, self.pt_dicot_dir_repro_thres_dist_min, self.pt_dicot_indir_repro_thres_dist_min) = thres_dist[0]
 
-        self.pt_mono_post_ec25_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_post_ec25_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_dir_mort_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_dir_mort_appratio_max[sim_num],
-                                               self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_indir_mort_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_indir_mort_appratio_max[sim_num],
-                                                 self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_dir_repro_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_dir_repro_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_mono_indir_repro_thres_dist_max = self.calc_plant_risk_distance(self.pt_mono_indir_repro_appratio_max[sim_num],
-                                                  self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        # plant toxicity (pt) : dicots ; maximum application rate; threshold distance
-        self.pt_dicot_pre_noec_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_pre_noec_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_pre_loec_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_pre_loec_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_pre_ec25_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_pre_ec25_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_post_noec_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_post_noec_appratio_max[sim_num],
-                                                 self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_post_loec_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_post_loec_appratio_max[sim_num],
-                                                 self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_post_ec25_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_post_ec25_appratio_max[sim_num],
-                                                 self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_dir_mort_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_dir_mort_appratio_max[sim_num],
-                                                self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_indir_mort_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_indir_mort_appratio_max[sim_num],
-                                                  self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_dir_repro_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_dir_repro_appratio_max[sim_num],
-                                                 self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-
-        self.pt_dicot_indir_repro_thres_dist_max = self.calc_plant_risk_distance(self.pt_dicot_indir_repro_appratio_max[sim_num],
-                                                   self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
+        # plant toxicity (pt) : monocots/dicots ; maximum application rate; threshold distance
+        (self.pt_mono_pre_noec_thres_dist_max, self.pt_mono_pre_loec_thres_dist_max, self.pt_mono_pre_ec25_thres_dist_max, self.pt_mono_post_noec_thres_dist_max, self.pt_mono_post_loec_thres_dist_max,
+         self.pt_mono_post_ec25_thres_dist_max, self.pt_mono_dir_mort_thres_dist_max, self.pt_mono_indir_mort_thres_dist_max, self.pt_mono_dir_repro_thres_dist_max, self.pt_mono_indir_repro_thres_dist_max,
+         self.pt_dicot_pre_noec_thres_dist_max, self.pt_dicot_pre_loec_thres_dist_max, self.pt_dicot_pre_ec25_thres_dist_max, self.pt_dicot_post_noec_thres_dist_max, self.pt_dicot_post_loec_thres_dist_max,
+         self.pt_dicot_post_ec25_thres_dist_max, self.pt_dicot_dir_mort_thres_dist_max, self.pt_dicot_indir_mort_thres_dist_max, self.pt_dicot_dir_repro_thres_dist_max, self.pt_dicot_indir_repro_thres_dist_max) = thres_dist[1]
 
         return
 
     def calc_plant_risk_distance(self, toxicity_to_apprate_ratio, param_a, param_b, param_c, max_drift_distance):
         """
-        :description calculates the distance from the source area that plant toxicity thresholds occur
-        :param toxicity_to_app_ratio;
+        :description calculates the distance(s) from the source area that plant toxicity thresholds occur
+        :param toxicity_to_app_ratio; ratio (or array of ratios) of plant toxicity measure to application rate
         :param plant_thres_dist;
         :param param_a; spray drift parameter a
         :param param_b; spray drift parameter b
@@ -620,13 +597,11 @@ class TedFunctions(object):
         :return:
         """
 
-        if (math.isnan(toxicity_to_apprate_ratio)):
-            threshold_dist = np.nan
-        elif (toxicity_to_apprate_ratio > 1.0):
-            threshold_dist = 0.0
-        else:
-            threshold_dist = self.drift_distance_calc(toxicity_to_apprate_ratio, param_a, param_b, param_c, max_drift_distance)
-        return threshold_dist
+        # ratios, drift parameters and maximum distances may be arrays (e.g., all plant toxicity measures and min/max application scenarios)
+        toxicity_to_apprate_ratio = np.asarray(toxicity_to_apprate_ratio, dtype='float')
+        threshold_dist = np.where(toxicity_to_apprate_ratio > 1.0, 0.0,
+                                  self.drift_distance_calc(toxicity_to_apprate_ratio, param_a, param_b, param_c, max_drift_distance))
+        return threshold_dist[()]
 
     def calc_aquatic_vert_conc_thresholds(self):
         """
@@ -1030,80 +1005,62 @@ class TedFunctions(object):
             pass
         return max_respire_frac
 
-    def sum_exceedances(self, num_ts, num_tox, time_series, tox_series):
+    def sum_exceedances(self, time_series, tox_series):
         """
         :description this method accumulates the number of times various toxicity measures are exceeded within daily time
                      series of food item concentrations
-        :param num_ts number of time series included in the aggregate incoming 'time_series'
-        :param num_tox number of toxicity measures to be precessed per time series
-        :param a panda series representing an aggregation of time series representing the daily concentrations in food items (e.g., short grass, arthropods etc.)
-        :param tox_series a panda series representing the list of toxicity measures
+        :param time_series a 2-D array (food items x days) of the daily concentrations in food items (e.g., short grass, arthropods etc.);
+                           rows of NaN represent food items that are not applicable
+        :param tox_series a panda series representing the list of toxicity measures (NaN if not available)
 
         :NOTE this method is used to replicate the OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 3 - 54
-              (this method is a temporary solution for the need to populate a panda series with mixed data types;
-              when a more elegant solution comes available this method can simply be replaced without other changes - or so I think)
-
-              for example: the following line of code performs the same function when all series values are floats
-              exceedances = [(self.time_sesries[0][i] > self.tox_series[0][j]).sum() for i in range(11) for j in range(13)]
+              (each row of the returned matrix represents a food item (worksheet column), each column a toxicity measure (worksheet row))
 
-        :return:
+        :return: 2-D array (food items x toxicity measures) of the number of days with exceedances; NaN if either the food item is not
+                 applicable or the toxicity measure is not available
         """
 
-        # the indexes on the time_series are as follows: time_series[a][b]; a denotes the food item, b denotes the daily time series
+        time_series = np.asarray(time_series, dtype='float')
+        tox_series = np.asarray(tox_series, dtype='float')
+
+        # count the days each food item concentration exceeds each toxicity measure (broadcast over food items x days x toxicity measures)
+        exceedances = (time_series[:, :, np.newaxis] > tox_series[np.newaxis, np.newaxis, :]).sum(axis=1).astype('float')
 
-        k = -1
-        exceedances = pd.Series([])
-        for i in range(num_ts):       # process individual food item time series
-            for j in range(num_tox):  # process individual toxicity measures
-                k=k+1
-                if (time_series[i][0][0] != 'NA' and not math.isnan(tox_series[j])): # if either the food item is not applicable or the toxicity measure is not available
-                    exceedances[k] = (time_series[i][0] > tox_series[j]).sum() # place sums into series for subsequent slicing/shaping
-                                                                                  # each num_tox values represents a food item
-                else:
-                   exceedances[k] = 'NA'
+        # mask food item/toxicity measure combinations that are not applicable
+        not_applicable = np.isnan(time_series).all(axis=1)[:, np.newaxis] | np.isnan(tox_series)[np.newaxis, :]
+        exceedances[not_applicable] = np.nan
         return exceedances
 
-    def calc_eec_tox_frac(self, num_eec_max, num_tox, max_eec_series, tox_series):
-            """
-            :description calculates the ratio of toxicity measure and maximum of daily food item concentrations
-            :param num_eec_max number of food items included
-            :param num_tox number of toxicity measures to be processed
-            :param max_eec_series a panda series representing an aggregation of maximum concentrations in food items (e.g., short grass, arthropods etc.)
-            :param tox_series a panda series representing the list of toxicity measures
-
-            :return:
-            """
-
-            # the indexes on the time_series are as follows: time_series[a][b]; a denotes the food item, b denotes the daily time series
-
-            k = -1
-            ratio = pd.Series([])
-            for i in range(num_eec_max):  # process individual food item maximums
-                for j in range(num_tox):  # process individual toxicity measures
-                    k = k + 1
-                    if (max_eec_series[i] != 'NA' and not math.isnan(tox_series[j])):  # if either the food item is not applicable or the toxicity measure is not available
-                        ratio[k] = tox_series[j] / max_eec_series[i] # place ratio into series for subsequent slicing/shaping
-                    else:
-                        ratio[k] = 'NA'
-            return ratio
+    def calc_eec_tox_frac(self, max_eec_series, tox_series):
+        """
+        :description calculates the ratio of toxicity measure and maximum of daily food item concentrations
+        :param max_eec_series an array of the maximum concentrations in food items (e.g., short grass, arthropods etc.); NaN if food item is not applicable
+        :param tox_series a panda series representing the list of toxicity measures (NaN if not available)
+
+        :return: 2-D array (food items x toxicity measures) of ratios; NaN if either the food item is not applicable or the toxicity
+                 measure is not available
+        """
+
+        max_eec_series = np.asarray(max_eec_series, dtype='float')
+        tox_series = np.asarray(tox_series, dtype='float')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = tox_series[np.newaxis, :] / max_eec_series[:, np.newaxis]
+        return ratio
 
     def calc_maxeec_distance(self, toxicity_to_apprate_ratio, param_a, param_b, param_c, max_drift_distance):
         """
         :description calculates the distance from the source area that plant toxicity thresholds occur
-        :param toxicity_to_app_ratio; ratio of toxicity measure to scenarios application rate
+        :param toxicity_to_app_ratio; ratios of toxicity measure to scenarios application rate (NaN if not available)
         :param param_a; spray drift parameter a
         :param param_b; spray drift parameter b
         :param param_c; spray drift parameter c
         :param max_drift_distance;
 
-        :return:
+        :return: array of distances (of the same shape as the ratios); NaN where the ratio is not available
         """
-        dist = pd.Series([])
-        for i in range(len(toxicity_to_apprate_ratio)):
-            if (toxicity_to_apprate_ratio[i] != 'NA'):
-                dist[i] = self.drift_distance_calc(toxicity_to_apprate_ratio[i], param_a, param_b, param_c, max_drift_distance)
-            else:
-                dist[i] = 'NA'
+
+        dist = self.drift_distance_calc(np.asarray(toxicity_to_apprate_ratio, dtype='float'), param_a, param_b, param_c, max_drift_distance)
         return dist
 
     def initialize_simlation_panda_series(self):
@@ -1176,6 +1133,43 @@ class TedFunctions(object):
         self.air_conc_drops_min = pd.Series(self.num_simulations * [0.0], dtype='float')
         self.air_conc_drops_max = pd.Series(self.num_simulations * [0.0], dtype='float')
 
+    def set_species_categories(self):
+        """
+        :description encodes the taxa, the dietary intake parameter group and the diet item of each species as integer
+                     categories; the categories index the per taxa/intake group/diet category tables from which the per
+                     species doses and thresholds are taken (the last entry of each table applies to species/diet items
+                     without a category, category -1)
+        :return:
+        """
+
+        taxa = np.asarray(self.taxa, dtype='object')
+        order = np.asarray(self.order, dtype='object')
+
+        # taxa: 0 - birds, 1 - mammals, 2 - amphibians, 3 - reptiles
+        self.species_taxa = np.select([taxa == 'Birds', taxa == 'Mammals', taxa == 'Amphibians', taxa == 'Reptiles'],
+                                      [0, 1, 2, 3], -1)
+        # dietary intake parameter group (see 'intake_group_param_a1')
+        self.species_intake_group = np.select([(taxa == 'Birds') & (order == 'Passeriformes'), taxa == 'Birds',
+                                               (taxa == 'Amphibians') | (taxa == 'Reptiles'),
+                                               (taxa == 'Mammals') & (order == 'Rodentia'), taxa == 'Mammals'],
+                                              [0, 1, 2, 3, 4], -1)
+        # diet category (see 'diet_categories')
+        self.species_diet_category = np.array([self.diet_categories.index(self.diet_item_categories[diet_item])
+                                               if diet_item in self.diet_item_categories else -1 for diet_item in self.diet_item], dtype=int)
+
+        self.species_bodywgt = np.asarray(self.body_wgt, dtype='float')
+        self.species_h2o_cont = np.asarray(self.h2o_cont, dtype='float')
+        return
+
+    def species_taxa_values(self, birds, mammals, amphibians, reptiles, other):
+        """
+        :description assigns a value given per taxa to each species
+        :param birds, mammals, amphibians, reptiles; values for species of each taxa
+        :param other; value for species of unidentified taxa
+        :return: array of per species values
+        """
+        return np.array([birds, mammals, amphibians, reptiles, other], dtype='float')[self.species_taxa]
+
     def calc_species_diet_concs_minapp(self, sim_num):
         """
         :description calculates upper bound and mean concentrations of dietary items per species (for minimum application scenario)
@@ -1185,119 +1179,25 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_diet_conc_upper_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_diet_conc_mean_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        # collect the maximum concentrations from time series of upper bound and mean diet concentrations unique to each diet/food item (to minimize determination of time series maximums (tsmax))
-        upper_arthro_tsmax = self.out_diet_eec_upper_min_arthro.max()
-        mean_arthro_tsmax = self.out_diet_eec_mean_min_arthro.max()
-        upper_soil_inv_tsmax = self.out_diet_eec_min_soil_inv.max()
-        upper_sm_amphi_tsmax = self.out_diet_eec_upper_min_sm_amphi.max()
-        mean_sm_amphi_tsmax = self.out_diet_eec_mean_min_sm_amphi.max()
-        upper_sm_mamm_tsmax = self.out_diet_eec_upper_min_sm_mamm.max()
-        mean_sm_mamm_tsmax = self.out_diet_eec_mean_min_sm_mamm.max()
-        upper_inverts_tsmax = self.water_conc_1[sim_num] * (self.inv_bcf_upper[sim_num] / 1000.)
-        mean_inverts_tsmax = self.water_conc_1[sim_num] * (self.inv_bcf_mean[sim_num] / 1000.)
-        upper_sm_bird_tsmax = self.out_diet_eec_upper_min_sm_bird.max()
-        mean_sm_bird_tsmax = self.out_diet_eec_mean_min_sm_bird.max()
-        upper_fish_tsmax = self.water_conc_1[sim_num] * (self.fish_bcf_upper[sim_num] / 1000.)
-        mean_fish_tsmax = self.water_conc_1[sim_num] * (self.fish_bcf_mean[sim_num] / 1000.)
-        upper_plant_algae_tsmax = self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_upper[sim_num] / 1000.)
-        mean_plant_algae_tsmax = self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_mean[sim_num] / 1000.)
-        upper_sg_tsmax = self.out_diet_eec_upper_min_sg.max()
-        mean_sg_tsmax = self.out_diet_eec_mean_min_sg.max()
-        upper_blp_tsmax = self.out_diet_eec_upper_min_blp.max()
-        mean_blp_tsmax = self.out_diet_eec_mean_min_blp.max()
-        upper_fp_tsmax = self.out_diet_eec_upper_min_fp.max()
-        mean_fp_tsmax = self.out_diet_eec_mean_min_fp.max()
-        upper_lg_mamm_tsmax = self.out_diet_eec_upper_min_lg_mamm.max()
-        mean_lg_mamm_tsmax = self.out_diet_eec_mean_min_lg_mamm.max()
-        upper_tg_tsmax = self.out_diet_eec_upper_min_tg.max()
-        mean_tg_tsmax = self.out_diet_eec_mean_min_tg.max()
-
-        for i in range(len(self.com_name)):
-            if (self.diet_item[i] == 'arthropods'):
-                self.out_diet_conc_upper_min[i] = upper_arthro_tsmax
-                self.out_diet_conc_mean_min[i] = mean_arthro_tsmax
-            elif (self.diet_item[i] == 'soil inverts'):
-                self.out_diet_conc_upper_min[i] = upper_soil_inv_tsmax
-                self.out_diet_conc_mean_min[i] = 'NA'
-            elif (self.diet_item[i] == 'amphibians'):
-                self.out_diet_conc_upper_min[i] = upper_sm_amphi_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sm_amphi_tsmax
-            elif (self.diet_item[i] == 'mammals (small)'):
-                self.out_diet_conc_upper_min[i] = upper_sm_mamm_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sm_mamm_tsmax
-            elif (self.diet_item[i] == 'benthic inverts'):
-                self.out_diet_conc_upper_min[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_min[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'birds'):
-                self.out_diet_conc_upper_min[i] = upper_sm_bird_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sm_bird_tsmax
-            elif (self.diet_item[i] == 'fish, aq amphibians'):
-                self.out_diet_conc_upper_min[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'fish and aq amphibians'):
-                self.out_diet_conc_upper_min[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'fish'):
-                self.out_diet_conc_upper_min[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'filter feeders'):
-                self.out_diet_conc_upper_min[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_min[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'reptiles'):
-                self.out_diet_conc_upper_min[i] = upper_sm_amphi_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sm_amphi_tsmax
-            elif (self.diet_item[i] == 'algae'):
-                self.out_diet_conc_upper_min[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_min[i] = mean_plant_algae_tsmax
-            elif (self.diet_item[i] == 'grass'):
-                self.out_diet_conc_upper_min[i] = upper_sg_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sg_tsmax
-            elif (self.diet_item[i] == 'leaves'):
-                self.out_diet_conc_upper_min[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_min[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'seeds'):
-                self.out_diet_conc_upper_min[i] = upper_fp_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fp_tsmax
-            elif (self.diet_item[i] == 'fruit'):
-                self.out_diet_conc_upper_min[i] = upper_fp_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fp_tsmax
-            elif (self.diet_item[i] == 'leaves, flowers'):
-                self.out_diet_conc_upper_min[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_min[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'zooplankton'):
-                self.out_diet_conc_upper_min[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_min[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'aquatic plants'):
-                self.out_diet_conc_upper_min[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_min[i] = mean_plant_algae_tsmax
-            elif (self.diet_item[i] == 'carrion'):
-                self.out_diet_conc_upper_min[i] = upper_lg_mamm_tsmax
-                self.out_diet_conc_mean_min[i] = mean_lg_mamm_tsmax
-            elif (self.diet_item[i] == 'nectar'):
-                self.out_diet_conc_upper_min[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_min[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'leaves (surrogate for fungi)'):
-                self.out_diet_conc_upper_min[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_min[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'mammals (large)'):
-                self.out_diet_conc_upper_min[i] = upper_lg_mamm_tsmax
-                self.out_diet_conc_mean_min[i] = mean_lg_mamm_tsmax
-            elif (self.diet_item[i] == 'nectar, pollen'):
-                self.out_diet_conc_upper_min[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_min[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'pollen'):
-                self.out_diet_conc_upper_min[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_min[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'bark (twigs), pine  needles (grass as surrogate'):
-                self.out_diet_conc_upper_min[i] = upper_sg_tsmax
-                self.out_diet_conc_mean_min[i] = mean_sg_tsmax
-            elif (self.diet_item[i] == 'aquatic plants, algae'):
-                self.out_diet_conc_upper_min[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_min[i] = mean_plant_algae_tsmax
+        # maximum upper bound (column 0) and mean (column 1) concentrations from the time series of each diet category
+        # (rows in 'diet_categories' order; last row (NaN) for diet items without a category)
+        diet_conc = np.array([[self.out_diet_eec_upper_min_arthro.max(), self.out_diet_eec_mean_min_arthro.max()],
+                              [self.out_diet_eec_min_soil_inv.max(), np.nan],
+                              [self.out_diet_eec_upper_min_sm_amphi.max(), self.out_diet_eec_mean_min_sm_amphi.max()],
+                              [self.out_diet_eec_upper_min_sm_mamm.max(), self.out_diet_eec_mean_min_sm_mamm.max()],
+                              [self.water_conc_1[sim_num] * (self.inv_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.inv_bcf_mean[sim_num] / 1000.)],
+                              [self.out_diet_eec_upper_min_sm_bird.max(), self.out_diet_eec_mean_min_sm_bird.max()],
+                              [self.water_conc_1[sim_num] * (self.fish_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.fish_bcf_mean[sim_num] / 1000.)],
+                              [self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_mean[sim_num] / 1000.)],
+                              [self.out_diet_eec_upper_min_sg.max(), self.out_diet_eec_mean_min_sg.max()],
+                              [self.out_diet_eec_upper_min_blp.max(), self.out_diet_eec_mean_min_blp.max()],
+                              [self.out_diet_eec_upper_min_fp.max(), self.out_diet_eec_mean_min_fp.max()],
+                              [self.out_diet_eec_upper_min_lg_mamm.max(), self.out_diet_eec_mean_min_lg_mamm.max()],
+                              [self.out_diet_eec_upper_min_tg.max(), self.out_diet_eec_mean_min_tg.max()],
+                              [np.nan, np.nan]], dtype='float')
+
+        self.out_diet_conc_upper_min = pd.Series(diet_conc[self.species_diet_category, 0], dtype='float')
+        self.out_diet_conc_mean_min = pd.Series(diet_conc[self.species_diet_category, 1], dtype='float')
         return
 
     def calc_species_diet_concs_maxapp(self, sim_num):
@@ -1309,119 +1209,25 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_diet_conc_upper_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_diet_conc_mean_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        # collect the maximum concentrations from time series of upper bound and mean diet concentrations unique to each diet/food item (to minimize determination of time series maximums (tsmax))
-        upper_arthro_tsmax = self.out_diet_eec_upper_max_arthro.max()
-        mean_arthro_tsmax = self.out_diet_eec_mean_max_arthro.max()
-        upper_soil_inv_tsmax = self.out_diet_eec_max_soil_inv.max()
-        upper_sm_amphi_tsmax = self.out_diet_eec_upper_max_sm_amphi.max()
-        mean_sm_amphi_tsmax = self.out_diet_eec_mean_max_sm_amphi.max()
-        upper_sm_mamm_tsmax = self.out_diet_eec_upper_max_sm_mamm.max()
-        mean_sm_mamm_tsmax = self.out_diet_eec_mean_max_sm_mamm.max()
-        upper_inverts_tsmax = self.water_conc_1[sim_num] * (self.inv_bcf_upper[sim_num] / 1000.)
-        mean_inverts_tsmax = self.water_conc_1[sim_num] * (self.inv_bcf_mean[sim_num] / 1000.)
-        upper_sm_bird_tsmax = self.out_diet_eec_upper_max_sm_bird.max()
-        mean_sm_bird_tsmax = self.out_diet_eec_mean_max_sm_bird.max()
-        upper_fish_tsmax = self.water_conc_1[sim_num] * (self.fish_bcf_upper[sim_num] / 1000.)
-        mean_fish_tsmax = self.water_conc_1[sim_num] * (self.fish_bcf_mean[sim_num] / 1000.)
-        upper_plant_algae_tsmax = self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_upper[sim_num] / 1000.)
-        mean_plant_algae_tsmax = self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_mean[sim_num] / 1000.)
-        upper_sg_tsmax = self.out_diet_eec_upper_max_sg.max()
-        mean_sg_tsmax = self.out_diet_eec_mean_max_sg.max()
-        upper_blp_tsmax = self.out_diet_eec_upper_max_blp.max()
-        mean_blp_tsmax = self.out_diet_eec_mean_max_blp.max()
-        upper_fp_tsmax = self.out_diet_eec_upper_max_fp.max()
-        mean_fp_tsmax = self.out_diet_eec_mean_max_fp.max()
-        upper_lg_mamm_tsmax = self.out_diet_eec_upper_max_lg_mamm.max()
-        mean_lg_mamm_tsmax = self.out_diet_eec_mean_max_lg_mamm.max()
-        upper_tg_tsmax = self.out_diet_eec_upper_max_tg.max()
-        mean_tg_tsmax = self.out_diet_eec_mean_max_tg.max()
-
-        for i in range(len(self.com_name)):
-            if (self.diet_item[i] == 'arthropods'):
-                self.out_diet_conc_upper_max[i] = upper_arthro_tsmax
-                self.out_diet_conc_mean_max[i] = mean_arthro_tsmax
-            elif (self.diet_item[i] == 'soil inverts'):
-                self.out_diet_conc_upper_max[i] = upper_soil_inv_tsmax
-                self.out_diet_conc_mean_max[i] = 'NA'
-            elif (self.diet_item[i] == 'amphibians'):
-                self.out_diet_conc_upper_max[i] = upper_sm_amphi_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sm_amphi_tsmax
-            elif (self.diet_item[i] == 'mammals (small)'):
-                self.out_diet_conc_upper_max[i] = upper_sm_mamm_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sm_mamm_tsmax
-            elif (self.diet_item[i] == 'benthic inverts'):
-                self.out_diet_conc_upper_max[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_max[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'birds'):
-                self.out_diet_conc_upper_max[i] = upper_sm_bird_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sm_bird_tsmax
-            elif (self.diet_item[i] == 'fish, aq amphibians'):
-                self.out_diet_conc_upper_max[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_max[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'fish and aq amphibians'):
-                self.out_diet_conc_upper_min[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_min[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'fish'):
-                self.out_diet_conc_upper_max[i] = upper_fish_tsmax
-                self.out_diet_conc_mean_max[i] = mean_fish_tsmax
-            elif (self.diet_item[i] == 'filter feeders'):
-                self.out_diet_conc_upper_max[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_max[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'reptiles'):
-                self.out_diet_conc_upper_max[i] = upper_sm_amphi_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sm_amphi_tsmax
-            elif (self.diet_item[i] == 'algae'):
-                self.out_diet_conc_upper_max[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_max[i] = mean_plant_algae_tsmax
-            elif (self.diet_item[i] == 'grass'):
-                self.out_diet_conc_upper_max[i] = upper_sg_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sg_tsmax
-            elif (self.diet_item[i] == 'leaves'):
-                self.out_diet_conc_upper_max[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_max[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'seeds'):
-                self.out_diet_conc_upper_max[i] = upper_fp_tsmax
-                self.out_diet_conc_mean_max[i] = mean_fp_tsmax
-            elif (self.diet_item[i] == 'fruit'):
-                self.out_diet_conc_upper_max[i] = upper_fp_tsmax
-                self.out_diet_conc_mean_max[i] = mean_fp_tsmax
-            elif (self.diet_item[i] == 'leaves, flowers'):
-                self.out_diet_conc_upper_max[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_max[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'zooplankton'):
-                self.out_diet_conc_upper_max[i] = upper_inverts_tsmax
-                self.out_diet_conc_mean_max[i] = mean_inverts_tsmax
-            elif (self.diet_item[i] == 'aquatic plants'):
-                self.out_diet_conc_upper_max[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_max[i] = mean_plant_algae_tsmax
-            elif (self.diet_item[i] == 'carrion'):
-                self.out_diet_conc_upper_max[i] = upper_lg_mamm_tsmax
-                self.out_diet_conc_mean_max[i] = mean_lg_mamm_tsmax
-            elif (self.diet_item[i] == 'nectar'):
-                self.out_diet_conc_upper_max[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_max[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'leaves (surrogate for fungi)'):
-                self.out_diet_conc_upper_max[i] = upper_blp_tsmax
-                self.out_diet_conc_mean_max[i] = mean_blp_tsmax
-            elif (self.diet_item[i] == 'mammals (large)'):
-                self.out_diet_conc_upper_max[i] = upper_lg_mamm_tsmax
-                self.out_diet_conc_mean_max[i] = mean_lg_mamm_tsmax
-            elif (self.diet_item[i] == 'nectar, pollen'):
-                self.out_diet_conc_upper_max[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_max[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'pollen'):
-                self.out_diet_conc_upper_max[i] = upper_tg_tsmax
-                self.out_diet_conc_mean_max[i] = mean_tg_tsmax
-            elif (self.diet_item[i] == 'bark (twigs), pine  needles (grass as surrogate'):
-                self.out_diet_conc_upper_max[i] = upper_sg_tsmax
-                self.out_diet_conc_mean_max[i] = mean_sg_tsmax
-            elif (self.diet_item[i] == 'aquatic plants, algae'):
-                self.out_diet_conc_upper_max[i] = upper_plant_algae_tsmax
-                self.out_diet_conc_mean_max[i] = mean_plant_algae_tsmax
+        # maximum upper bound (column 0) and mean (column 1) concentrations from the time series of each diet category
+        # (rows in 'diet_categories' order; last row (NaN) for diet items without a category)
+        diet_conc = np.array([[self.out_diet_eec_upper_max_arthro.max(), self.out_diet_eec_mean_max_arthro.max()],
+                              [self.out_diet_eec_max_soil_inv.max(), np.nan],
+                              [self.out_diet_eec_upper_max_sm_amphi.max(), self.out_diet_eec_mean_max_sm_amphi.max()],
+                              [self.out_diet_eec_upper_max_sm_mamm.max(), self.out_diet_eec_mean_max_sm_mamm.max()],
+                              [self.water_conc_1[sim_num] * (self.inv_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.inv_bcf_mean[sim_num] / 1000.)],
+                              [self.out_diet_eec_upper_max_sm_bird.max(), self.out_diet_eec_mean_max_sm_bird.max()],
+                              [self.water_conc_1[sim_num] * (self.fish_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.fish_bcf_mean[sim_num] / 1000.)],
+                              [self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_upper[sim_num] / 1000.), self.water_conc_1[sim_num] * (self.aq_plant_algae_bcf_mean[sim_num] / 1000.)],
+                              [self.out_diet_eec_upper_max_sg.max(), self.out_diet_eec_mean_max_sg.max()],
+                              [self.out_diet_eec_upper_max_blp.max(), self.out_diet_eec_mean_max_blp.max()],
+                              [self.out_diet_eec_upper_max_fp.max(), self.out_diet_eec_mean_max_fp.max()],
+                              [self.out_diet_eec_upper_max_lg_mamm.max(), self.out_diet_eec_mean_max_lg_mamm.max()],
+                              [self.out_diet_eec_upper_max_tg.max(), self.out_diet_eec_mean_max_tg.max()],
+                              [np.nan, np.nan]], dtype='float')
+
+        self.out_diet_conc_upper_max = pd.Series(diet_conc[self.species_diet_category, 0], dtype='float')
+        self.out_diet_conc_mean_max = pd.Series(diet_conc[self.species_diet_category, 1], dtype='float')
         return
 
     def calc_species_diet_dose_minapp(self, sim_num):
@@ -1433,39 +1239,11 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_diet_dose_upper_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_diet_dose_mean_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Birds'):
-                if (self.order[i] == 'Passeriformes'):
-                    param_a = self.intake_param_a1_birds_pass
-                    param_b = self.intake_param_b1_birds_pass
-                else:  # must be non-Passeriformes
-                    param_a = self.intake_param_a1_birds_nonpass
-                    param_b = self.intake_param_b1_birds_nonpass
-            elif (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                param_a = self.intake_param_a1_rep_amphi
-                param_b = self.intake_param_b1_rep_amphi
-            elif (self.taxa[i] == 'Mammals'):
-                if (self.order[i] == 'Rodentia'):
-                    param_a = self.intake_param_a1_mamm_rodent
-                    param_b = self.intake_param_b1_mamm_rodent
-                else:  # must be non-Rodentia
-                    param_a = self.intake_param_a1_mamm_nonrodent
-                    param_b = self.intake_param_b1_mamm_nonrodent
-
-            # calculate intake and then dose
-            intake_rate = self.animal_dietary_intake(param_a, param_b, self.body_wgt[i], self.h2o_cont[i])
-            if (self.out_diet_conc_upper_min[i] == 'NA'):
-                self.out_diet_dose_upper_min[i] = 'NA'
-            else:
-                self.out_diet_dose_upper_min[i] = self.animal_dietary_dose(self.body_wgt[i], intake_rate, self.out_diet_conc_upper_min[i])
-            if (self.out_diet_conc_mean_min[i] == 'NA'):
-                self.out_diet_dose_mean_min[i] = 'NA'
-            else:
-                self.out_diet_dose_mean_min[i] = self.animal_dietary_dose(self.body_wgt[i], intake_rate, self.out_diet_conc_mean_min[i])
+        # calculate intake and then dose (NaN where the diet concentration is not available)
+        intake_rate = self.animal_dietary_intake(self.intake_group_param_a1[self.species_intake_group], self.intake_group_param_b1[self.species_intake_group],
+                                                 self.species_bodywgt, self.species_h2o_cont)
+        self.out_diet_dose_upper_min = pd.Series(self.animal_dietary_dose(self.species_bodywgt, intake_rate, self.out_diet_conc_upper_min.values), dtype='float')
+        self.out_diet_dose_mean_min = pd.Series(self.animal_dietary_dose(self.species_bodywgt, intake_rate, self.out_diet_conc_mean_min.values), dtype='float')
         return
 
     def calc_species_diet_dose_maxapp(self, sim_num):
@@ -1477,39 +1255,11 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_diet_dose_upper_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_diet_dose_mean_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Birds'):
-                if (self.order[i] == 'Passeriformes'):
-                    param_a = self.intake_param_a1_birds_pass
-                    param_b = self.intake_param_b1_birds_pass
-                else:  # must be non-Passeriformes
-                    param_a = self.intake_param_a1_birds_nonpass
-                    param_b = self.intake_param_b1_birds_nonpass
-            elif (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                param_a = self.intake_param_a1_rep_amphi
-                param_b = self.intake_param_b1_rep_amphi
-            elif (self.taxa[i] == 'Mammals'):
-                if (self.order[i] == 'Rodentia'):
-                    param_a = self.intake_param_a1_mamm_rodent
-                    param_b = self.intake_param_b1_mamm_rodent
-                else:  # must be non-Rodentia
-                    param_a = self.intake_param_a1_mamm_nonrodent
-                    param_b = self.intake_param_b1_mamm_nonrodent
-
-            # calculate intake and then dose
-            intake_rate = self.animal_dietary_intake(param_a, param_b, self.body_wgt[i], self.h2o_cont[i])
-            if (self.out_diet_conc_upper_max[i] == 'NA'):
-                self.out_diet_dose_upper_max[i] = 'NA'
-            else:
-                self.out_diet_dose_upper_max[i] = self.animal_dietary_dose(self.body_wgt[i], intake_rate, self.out_diet_conc_upper_max[i])
-            if (self.out_diet_conc_mean_max[i] == 'NA'):
-                self.out_diet_dose_mean_max[i] = 'NA'
-            else:
-                self.out_diet_dose_mean_max[i] = self.animal_dietary_dose(self.body_wgt[i], intake_rate, self.out_diet_conc_mean_max[i])
+        # calculate intake and then dose (NaN where the diet concentration is not available)
+        intake_rate = self.animal_dietary_intake(self.intake_group_param_a1[self.species_intake_group], self.intake_group_param_b1[self.species_intake_group],
+                                                 self.species_bodywgt, self.species_h2o_cont)
+        self.out_diet_dose_upper_max = pd.Series(self.animal_dietary_dose(self.species_bodywgt, intake_rate, self.out_diet_conc_upper_max.values), dtype='float')
+        self.out_diet_dose_mean_max = pd.Series(self.animal_dietary_dose(self.species_bodywgt, intake_rate, self.out_diet_conc_mean_max.values), dtype='float')
         return
 
     def calc_h2o_doses_minapp(self, sim_num):
@@ -1522,54 +1272,19 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_h2opuddles_dose_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_h2odew_dose_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        # collect the maximum concentrations from time series of upper bound and mean diet concentrations unique to each diet/food item (to minimize determination of time series maximums (tsmax))
+        # collect the maximum concentrations from time series of puddles and dew concentrations
         puddles_tsmax = self.out_conc_puddles_min.max()
         dew_tsmax = self.out_conc_dew_min.max()
 
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Birds'):
-                if (self.order[i] == 'Passeriformes'):
-                    param_a1 = self.intake_param_a1_birds_pass
-                    param_b1 = self.intake_param_b1_birds_pass
-                    param_a2 = self.h2ointake_param_a2_birds_pass
-                    param_b2 = self.h2ointake_param_b2_birds_pass
-                    param_c2 = self.h2ointake_param_c2_birds_pass
-                else:  # must be non-Passeriformes
-                    param_a1 = self.intake_param_a1_birds_nonpass
-                    param_b1 = self.intake_param_b1_birds_nonpass
-                    param_a2 = self.h2ointake_param_a2_birds_nonpass
-                    param_b2 = self.h2ointake_param_b2_birds_nonpass
-                    param_c2 = self.h2ointake_param_c2_birds_nonpass
-            elif (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                param_a1 = self.intake_param_a1_rep_amphi
-                param_b1 = self.intake_param_b1_rep_amphi
-                param_a2 = self.h2ointake_param_a2_rep_amphi
-                param_b2 = self.h2ointake_param_b2_rep_amphi
-                param_c2 = self.h2ointake_param_c2_rep_amphi
-            elif (self.taxa[i] == 'Mammals'):
-                if (self.order[i] == 'Rodentia'):
-                    param_a1 = self.intake_param_a1_mamm_rodent
-                    param_b1 = self.intake_param_b1_mamm_rodent
-                else:  # must be non-Rodentia
-                    param_a1 = self.intake_param_a1_mamm_nonrodent
-                    param_b1 = self.intake_param_b1_mamm_nonrodent
-                param_a2 = self.h2ointake_param_a2_mamm  # water intake paramaters are same for all mammals
-                param_b2 = self.h2ointake_param_b2_mamm
-                param_c2 = self.h2ointake_param_c2_mamm
-
-            # calculate water intake and then dose
-
-            h2o_flux = self.animal_h20_intake(param_a2, param_b2, param_c2, self.body_wgt[i])  # Eq 9
-            h2o_asfood = self.animal_dietary_intake(param_a1, param_b1, self.body_wgt[i], self.h2o_cont[i]) * self.h2o_cont[i]  # Eq 10
-
-            self.out_h2opuddles_dose_min[i] = ((h2o_flux - h2o_asfood) * puddles_tsmax) / self.body_wgt[i]
-            if (self.out_h2opuddles_dose_min[i] < 0.0): self.out_h2opuddles_dose_min[i] = 0.0
-            self.out_h2odew_dose_min[i] = ((h2o_flux - h2o_asfood) * dew_tsmax) / self.body_wgt[i]
-            if (self.out_h2odew_dose_min[i] < 0.0): self.out_h2odew_dose_min[i] = 0.0
+        # calculate water intake and then dose
+        group = self.species_intake_group
+        h2o_flux = self.animal_h20_intake(self.h2ointake_group_param_a2[group], self.h2ointake_group_param_b2[group],
+                                          self.h2ointake_group_param_c2[group], self.species_bodywgt)  # Eq 9
+        h2o_asfood = self.animal_dietary_intake(self.intake_group_param_a1[group], self.intake_group_param_b1[group],
+                                                self.species_bodywgt, self.species_h2o_cont) * self.species_h2o_cont  # Eq 10
+
+        self.out_h2opuddles_dose_min = pd.Series(np.maximum(((h2o_flux - h2o_asfood) * puddles_tsmax) / self.species_bodywgt, 0.0), dtype='float')
+        self.out_h2odew_dose_min = pd.Series(np.maximum(((h2o_flux - h2o_asfood) * dew_tsmax) / self.species_bodywgt, 0.0), dtype='float')
         return
 
     def calc_h2o_doses_maxapp(self, sim_num):
@@ -1582,54 +1297,19 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results
-        self.out_h2opuddles_dose_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_h2odew_dose_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        # collect the maximum concentrations from time series of upper bound and mean diet concentrations unique to each diet/food item (to minimize determination of time series maximums (tsmax))
+        # collect the maximum concentrations from time series of puddles and dew concentrations
         puddles_tsmax = self.out_conc_puddles_max.max()
         dew_tsmax = self.out_conc_dew_max.max()
 
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Birds'):
-                if (self.order[i] == 'Passeriformes'):
-                    param_a1 = self.intake_param_a1_birds_pass
-                    param_b1 = self.intake_param_b1_birds_pass
-                    param_a2 = self.h2ointake_param_a2_birds_pass
-                    param_b2 = self.h2ointake_param_b2_birds_pass
-                    param_c2 = self.h2ointake_param_c2_birds_pass
-                else:  # must be non-Passeriformes
-                    param_a1 = self.intake_param_a1_birds_nonpass
-                    param_b1 = self.intake_param_b1_birds_nonpass
-                    param_a2 = self.h2ointake_param_a2_birds_nonpass
-                    param_b2 = self.h2ointake_param_b2_birds_nonpass
-                    param_c2 = self.h2ointake_param_c2_birds_nonpass
-            elif (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                param_a1 = self.intake_param_a1_rep_amphi
-                param_b1 = self.intake_param_b1_rep_amphi
-                param_a2 = self.h2ointake_param_a2_rep_amphi
-                param_b2 = self.h2ointake_param_b2_rep_amphi
-                param_c2 = self.h2ointake_param_c2_rep_amphi
-            elif (self.taxa[i] == 'Mammals'):
-                if (self.order[i] == 'Rodentia'):
-                    param_a1 = self.intake_param_a1_mamm_rodent
-                    param_b1 = self.intake_param_b1_mamm_rodent
-                else:  # must be non-Rodentia
-                    param_a1 = self.intake_param_a1_mamm_nonrodent
-                    param_b1 = self.intake_param_b1_mamm_nonrodent
-                param_a2 = self.h2ointake_param_a2_mamm  # water intake paramaters are same for all mammals
-                param_b2 = self.h2ointake_param_b2_mamm
-                param_c2 = self.h2ointake_param_c2_mamm
-
-            # calculate water intake and then dose
-
-            h2o_flux = self.animal_h20_intake(param_a2, param_b2, param_c2, self.body_wgt[i])  # Eq 9
-            h2o_asfood = self.animal_dietary_intake(param_a1, param_b1, self.body_wgt[i], self.h2o_cont[i]) * self.h2o_cont[i]  # Eq 10
-
-            self.out_h2opuddles_dose_max[i] = ((h2o_flux - h2o_asfood) * puddles_tsmax) / self.body_wgt[i]
-            if (self.out_h2opuddles_dose_max[i] < 0.0): self.out_h2opuddles_dose_max[i] = 0.0
-            self.out_h2odew_dose_max[i] = ((h2o_flux - h2o_asfood) * dew_tsmax) / self.body_wgt[i]
-            if (self.out_h2odew_dose_max[i] < 0.0): self.out_h2odew_dose_max[i] = 0.0
+        # calculate water intake and then dose
+        group = self.species_intake_group
+        h2o_flux = self.animal_h20_intake(self.h2ointake_group_param_a2[group], self.h2ointake_group_param_b2[group],
+                                          self.h2ointake_group_param_c2[group], self.species_bodywgt)  # Eq 9
+        h2o_asfood = self.animal_dietary_intake(self.intake_group_param_a1[group], self.intake_group_param_b1[group],
+                                                self.species_bodywgt, self.species_h2o_cont) * self.species_h2o_cont  # Eq 10
+
+        self.out_h2opuddles_dose_max = pd.Series(np.maximum(((h2o_flux - h2o_asfood) * puddles_tsmax) / self.species_bodywgt, 0.0), dtype='float')
+        self.out_h2odew_dose_max = pd.Series(np.maximum(((h2o_flux - h2o_asfood) * dew_tsmax) / self.species_bodywgt, 0.0), dtype='float')
         return
 
     def calc_derm_route_equiv_factor(self, sim_num):
@@ -1642,8 +1322,6 @@ class TedFunctions(object):
         :return:
         """
 
-        self.derm_equiv_factor = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
         # equivalency factor for birds
         log10_derm_ld50 = 0.84 + 0.62 * np.log10(self.dbt_bird_low_ld50[sim_num])
         equiv_factor_bird = self.dbt_bird_low_ld50[sim_num] / (10. ** (log10_derm_ld50))
@@ -1653,18 +1331,11 @@ class TedFunctions(object):
         else:
             equiv_factor_mamm = self.dbt_mamm_rat_oral_ld50[sim_num] / self.dbt_mamm_rat_derm_ld50[sim_num]
         # amphibians and reptiles
-        equiv_factor_amphi_rep = 1.0
+        equiv_factor_amphi_rep = 1.0  # this assumption should be checked against text in Attachment 1-7 of Biological Evaluation Chapters for Diazinon ESA Assessment; Dermal equivalency factor
 
         # assign factors to individual species
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Birds'):
-                self.derm_equiv_factor[i] = equiv_factor_bird
-            elif (self.taxa[i] == 'Mammals'):
-                self.derm_equiv_factor[i] = equiv_factor_mamm
-            elif (self.taxa[i] == 'Amphibians'):
-                self.derm_equiv_factor[i] = equiv_factor_amphi_rep
-            elif (self.taxa[i] == 'Reptiles'):
-                self.derm_equiv_factor[i] = equiv_factor_amphi_rep  # this assumption should be checked against text in Attachment 1-7 of Biological Evaluation Chapters for Diazinon ESA Assessment; Dermal equivalency factor
+        self.derm_equiv_factor = pd.Series(self.species_taxa_values(equiv_factor_bird, equiv_factor_mamm, equiv_factor_amphi_rep,
+                                                                    equiv_factor_amphi_rep, 0.0), dtype='float')
         return
 
     def calc_species_derm_contact_dose_minapp(self, sim_num):
@@ -1674,26 +1345,21 @@ class TedFunctions(object):
 
         NOTE: this method implements Eqs 14 thru 16 of Attachment 1-7 of 'Biological Evaluation Chapters for Diazinon ESA Assessment'
               this method addresses columns O & P of worksheet 'Min rate doses' of OPP TED spreadsheet model
-              - only calculated for birds and mammals; 'NA' for reptiles and amphibians
+              - only calculated for birds and mammals; NaN for reptiles and amphibians
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results (all amphibians and reptiles remain 'NA')
-        self.out_derm_contact_dose_upper_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_derm_contact_dose_mean_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
         # set maximum plant (broad leaf plants) concentration from time series of EEC values
         max_plant_eec_upper = self.out_diet_eec_upper_min_blp.max()
         max_plant_eec_mean = self.out_diet_eec_mean_min_blp.max()
 
-        # calculate dermal contact dose (upper bound and mean) per species
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Mammals' or self.taxa[i] == 'Birds'):
-                factor = (self.foliar_residue_factor * self.foliar_contact_rate * self.derm_contact_hours * self.surface_area[i] * \
-                          self.frac_animal_foliage_contact * self.derm_contact_factor * self.derm_equiv_factor[i]) / self.body_wgt[i]
+        # calculate dermal contact dose (upper bound and mean) per species (all amphibians and reptiles are NaN)
+        factor = (self.foliar_residue_factor * self.foliar_contact_rate * self.derm_contact_hours * self.surface_area.values * \
+                  self.frac_animal_foliage_contact * self.derm_contact_factor * self.derm_equiv_factor.values) / self.species_bodywgt
+        factor = factor * self.species_taxa_values(1.0, 1.0, np.nan, np.nan, np.nan)
 
-                self.out_derm_contact_dose_upper_min[i] = max_plant_eec_upper * factor
-                self.out_derm_contact_dose_mean_min[i] = max_plant_eec_mean * factor
+        self.out_derm_contact_dose_upper_min = pd.Series(max_plant_eec_upper * factor, dtype='float')
+        self.out_derm_contact_dose_mean_min = pd.Series(max_plant_eec_mean * factor, dtype='float')
         return
 
     def calc_species_derm_contact_dose_maxapp(self, sim_num):
@@ -1703,26 +1369,21 @@ class TedFunctions(object):
 
         NOTE: this method implements Eqs 14 thru 16 of Attachment 1-7 of 'Biological Evaluation Chapters for Diazinon ESA Assessment'
               this method addresses columns O & P of worksheet 'Max rate doses' of OPP TED spreadsheet model
-              - only calculated for birds and mammals; 'NA' for reptiles and amphibians
+              - only calculated for birds and mammals; NaN for reptiles and amphibians
         :return:
         """
 
-        # initialize panda series to contain upper bound and mean results (all amphibians and reptiles remain 'NA')
-        self.out_derm_contact_dose_upper_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_derm_contact_dose_mean_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
         # set maximum plant (broad leaf plants) concentration from time series of EEC values
         max_plant_eec_upper = self.out_diet_eec_upper_max_blp.max()
         max_plant_eec_mean = self.out_diet_eec_mean_max_blp.max()
 
-        # calculate dermal contact dose (upper bound and mean) per species
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Mammals' or self.taxa[i] == 'Birds'):
-                factor = (self.foliar_residue_factor * self.foliar_contact_rate * self.derm_contact_hours * self.surface_area[i] * \
-                          self.frac_animal_foliage_contact * self.derm_contact_factor * self.derm_equiv_factor[i]) / self.body_wgt[i]
+        # calculate dermal contact dose (upper bound and mean) per species (all amphibians and reptiles are NaN)
+        factor = (self.foliar_residue_factor * self.foliar_contact_rate * self.derm_contact_hours * self.surface_area.values * \
+                  self.frac_animal_foliage_contact * self.derm_contact_factor * self.derm_equiv_factor.values) / self.species_bodywgt
+        factor = factor * self.species_taxa_values(1.0, 1.0, np.nan, np.nan, np.nan)
 
-                self.out_derm_contact_dose_upper_max[i] = max_plant_eec_upper * factor
-                self.out_derm_contact_dose_mean_max[i] = max_plant_eec_mean * factor
+        self.out_derm_contact_dose_upper_max = pd.Series(max_plant_eec_upper * factor, dtype='float')
+        self.out_derm_contact_dose_mean_max = pd.Series(max_plant_eec_mean * factor, dtype='float')
         return
 
     def calc_species_surface_area(self):
@@ -1768,18 +1429,12 @@ class TedFunctions(object):
         :return:
         """
 
-        # initialize panda series to contain results
-        self.out_derm_spray_dose_min = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-        self.out_derm_spray_dose_max = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
         # calculate dermal spray dose (upper bound and mean) per species
-        for i in range(len(self.com_name)):
-            factor = (self.app_rate_conv1 * self.surface_area[i] * self.frac_body_exposed * self.derm_absorp_factor * \
-                      self.derm_equiv_factor[i]) / self.body_wgt[i]
-
-            self.out_derm_spray_dose_min[i] = self.app_rate_min[sim_num] * factor
-            self.out_derm_spray_dose_max[i] = self.app_rate_max[sim_num] * factor
+        factor = (self.app_rate_conv1 * self.surface_area.values * self.frac_body_exposed * self.derm_absorp_factor * \
+                  self.derm_equiv_factor.values) / self.species_bodywgt
 
+        self.out_derm_spray_dose_min = pd.Series(self.app_rate_min[sim_num] * factor, dtype='float')
+        self.out_derm_spray_dose_max = pd.Series(self.app_rate_max[sim_num] * factor, dtype='float')
         return
 
     def calc_inhal_route_equiv_factor(self, sim_num):
@@ -1792,27 +1447,16 @@ class TedFunctions(object):
         :return:
         """
 
-        self.inhal_equiv_factor = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
         # set factors per taxa
         equiv_factor_mamm = self.dbt_mamm_rat_oral_ld50[sim_num] / self.dbt_mamm_rat_inhal_ld50[sim_num]
         equiv_factor_birds = equiv_factor_mamm * self.bird_to_mamm_pulmonary_diff_rate
-        equiv_factor_reptile = 1.0
+        if (self.dbt_mamm_rat_oral_ld50[sim_num] == 'NA' or self.dbt_mamm_rat_inhal_ld50[sim_num] == 'NA'):
+            equiv_factor_mamm = 1.0  # if either toxicity number is NA then default value of 1 is used
+        equiv_factor_reptile = 1.0  # this assumption should be checked against text in Attachment 1-7 of Biological Evaluation Chapters for Diazinon ESA Assessment; Dermal equivalency factor
         equiv_factor_amphi = 1.0
 
-        for i in range(len(self.com_name)):
-            # calculate dermal route equivalency factor
-            if (self.taxa[i] == 'Birds'):
-                self.inhal_equiv_factor[i] = equiv_factor_birds
-            elif (self.taxa[i] == 'Mammals'):
-                if (self.dbt_mamm_rat_oral_ld50[sim_num] == 'NA' or self.dbt_mamm_rat_inhal_ld50[sim_num] == 'NA'):
-                    self.inhal_equiv_factor[i] = 1.0  # if either toxicity number is NA then default value of 1 is used
-                else:
-                    self.inhal_equiv_factor[i] = equiv_factor_mamm
-            elif (self.taxa[i] == 'Amphibians'):
-                self.inhal_equiv_factor[i] = equiv_factor_amphi
-            elif (self.taxa[i] == 'Reptiles'):
-                self.inhal_equiv_factor[i] = equiv_factor_reptile  # this assumption should be checked against text in Attachment 1-7 of Biological Evaluation Chapters for Diazinon ESA Assessment; Dermal equivalency factor
+        self.inhal_equiv_factor = pd.Series(self.species_taxa_values(equiv_factor_birds, equiv_factor_mamm, equiv_factor_amphi,
+                                                                     equiv_factor_reptile, 0.0), dtype='float')
         return
 
     def calc_species_inhal_dose_vapor(self):
@@ -1824,18 +1468,14 @@ class TedFunctions(object):
         :return:
         """
 
-        self.out_inhal_vapor_dose_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_inhal_vapor_dose_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
         # get maximum of canopy air time series of concentrations
         canopy_air_conc_minapp_max = self.out_air_conc_min.max()
         canopy_air_conc_maxapp_max = self.out_air_conc_max.max()
 
-        for i in range(len(self.com_name)):
-            self.out_inhal_vapor_dose_min[i] = (canopy_air_conc_minapp_max * self.species_inhalation_vol[i] * self.inhal_dose_period * \
-                                                self.inhal_equiv_factor[i]) / self.body_wgt[i]
-            self.out_inhal_vapor_dose_max[i] = (canopy_air_conc_maxapp_max * self.species_inhalation_vol[i] * self.inhal_dose_period * \
-                                                self.inhal_equiv_factor[i]) / self.body_wgt[i]
+        self.out_inhal_vapor_dose_min = pd.Series((canopy_air_conc_minapp_max * self.species_inhalation_vol.values * self.inhal_dose_period * \
+                                                   self.inhal_equiv_factor.values) / self.species_bodywgt, dtype='float')
+        self.out_inhal_vapor_dose_max = pd.Series((canopy_air_conc_maxapp_max * self.species_inhalation_vol.values * self.inhal_dose_period * \
+                                                   self.inhal_equiv_factor.values) / self.species_bodywgt, dtype='float')
         return
 
     def calc_species_inhal_dose_spray(self, sim_num):
@@ -1849,18 +1489,14 @@ class TedFunctions(object):
         :return:
         """
 
-        self.out_inhal_spray_dose_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_inhal_spray_dose_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
         # get maximum of canopy air time series of concentrations
         spray_air_conc_minapp = self.air_conc_drops_min[sim_num]
         spray_air_conc_maxapp = self.air_conc_drops_max[sim_num]
 
-        for i in range(len(self.com_name)):
-            self.out_inhal_spray_dose_min[i] = (spray_air_conc_minapp * self.species_inhalation_vol[i] * self.max_respire_frac_minapp * \
-                                                self.inhal_equiv_factor[i]) / self.body_wgt[i]
-            self.out_inhal_spray_dose_max[i] = (spray_air_conc_maxapp * self.species_inhalation_vol[i] * self.max_respire_frac_maxapp * \
-                                                self.inhal_equiv_factor[i]) / self.body_wgt[i]
+        self.out_inhal_spray_dose_min = pd.Series((spray_air_conc_minapp * self.species_inhalation_vol.values * self.max_respire_frac_minapp * \
+                                                   self.inhal_equiv_factor.values) / self.species_bodywgt, dtype='float')
+        self.out_inhal_spray_dose_max = pd.Series((spray_air_conc_maxapp * self.species_inhalation_vol.values * self.max_respire_frac_maxapp * \
+                                                   self.inhal_equiv_factor.values) / self.species_bodywgt, dtype='float')
         return
 
     def determine_max_dose_minmaxapp(self):
@@ -1869,36 +1505,37 @@ class TedFunctions(object):
 
         NOTE: these maximum doses are used in calculations of distances to risk thresholds and ratios of doses to mortality/sublethal thresholds
               (these distances and thresholds are contained in the OPP TED spreadsheet model in worksheets 'Min/Max rate doses' columns T, U, Z, AA
+              doses that are not available (NaN) are skipped; the maximum is NaN only if no dose is available
         :return:
         """
 
-        self.out_species_max_dose_minapp = pd.Series(len(self.com_name) * [0.0], dtype='object')
-        self.out_species_max_dose_maxapp= pd.Series(len(self.com_name) * [0.0], dtype='object')
-
-        for i in range(len(self.com_name)):
-           # compile all doses for this species into a single series variable
-           temp_values = pd.Series([self.out_diet_dose_upper_min[i], self.out_diet_dose_mean_min[i], self.out_h2opuddles_dose_min[i], \
-                                     self.out_h2odew_dose_min[i], self.out_derm_contact_dose_upper_min[i], self.out_derm_contact_dose_mean_min[i], \
-                                     self.out_derm_spray_dose_min[i], self.out_inhal_vapor_dose_min[i], self.out_inhal_vapor_dose_min[i]])
-
-           # replace all 'NA' with np.nan to allow use of .max property for finding max dose (this is an inelegant solution for a list comprehension)
-           for j in range(len(temp_values)):
-               if (temp_values[j] == 'NA'):
-                   temp_values[j] = np.NaN
+        # compile all doses per species (doses x species) and take the maximum over the doses
+        doses_minapp = np.array([self.out_diet_dose_upper_min, self.out_diet_dose_mean_min, self.out_h2opuddles_dose_min,
+                                 self.out_h2odew_dose_min, self.out_derm_contact_dose_upper_min, self.out_derm_contact_dose_mean_min,
+                                 self.out_derm_spray_dose_min, self.out_inhal_vapor_dose_min, self.out_inhal_vapor_dose_min], dtype='float')
+        self.out_species_max_dose_minapp = pd.Series(np.fmax.reduce(doses_minapp, axis=0), dtype='float')
 
-           self.out_species_max_dose_minapp[i] = temp_values.max()
+        doses_maxapp = np.array([self.out_diet_dose_upper_max, self.out_diet_dose_mean_max, self.out_h2opuddles_dose_max,
+                                 self.out_h2odew_dose_max, self.out_derm_contact_dose_upper_max, self.out_derm_contact_dose_mean_max,
+                                 self.out_derm_spray_dose_max, self.out_inhal_vapor_dose_max, self.out_inhal_vapor_dose_max], dtype='float')
+        self.out_species_max_dose_maxapp = pd.Series(np.fmax.reduce(doses_maxapp, axis=0), dtype='float')
+        return
 
-           temp_values = pd.Series([self.out_diet_dose_upper_max[i], self.out_diet_dose_mean_max[i], self.out_h2opuddles_dose_max[i], \
-                                                   self.out_h2odew_dose_max[i], self.out_derm_contact_dose_upper_max[i], self.out_derm_contact_dose_mean_max[i], \
-                                                   self.out_derm_spray_dose_max[i], self.out_inhal_vapor_dose_max[i], self.out_inhal_vapor_dose_max[i]])
+    def species_tox_thres(self, sim_num, bird_tox, bird_tox_wgt, mamm_tox, mamm_tox_wgt, reptile_tox, reptile_tox_wgt):
+        """
+        :description scales a dose based toxicity threshold to the body weight of each species (amphibian thresholds are
+                     those of reptiles; species of unidentified taxa are assigned 0.0)
+        :param sim_num model simulation number
+        :param bird_tox, mamm_tox, reptile_tox; toxicity thresholds per taxa
+        :param bird_tox_wgt, mamm_tox_wgt, reptile_tox_wgt; body weights of the test species the thresholds are given for
 
-           # replace all 'NA' with np.nan to allow use of .max property for finding max dose (this is an inelegant solution for a list comprehension)
-           for j in range(len(temp_values)):
-               if (temp_values[j] == 'NA'):
-                   temp_values[j] = np.NaN
+        :return: array of per species thresholds
+        """
 
-           self.out_species_max_dose_maxapp[i] = temp_values.max()
-        return
+        tox = self.species_taxa_values(bird_tox, mamm_tox, reptile_tox, reptile_tox, 0.0)
+        tox_wgt = self.species_taxa_values(bird_tox_wgt, mamm_tox_wgt, reptile_tox_wgt, reptile_tox_wgt, 1.0)
+        scaling_exponent = self.species_taxa_values(self.mineau_sca_fact[sim_num] - 1., 0.25, 1.0, 1.0, 1.0)
+        return tox * (self.species_bodywgt / tox_wgt) ** scaling_exponent
 
     def calc_species_mortality_thres(self, sim_num):
         """
@@ -1910,15 +1547,9 @@ class TedFunctions(object):
 
         """
 
-        self.species_mortality_thres = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                self.species_mortality_thres[i] = self.dbt_reptile_1inmill_mort[sim_num] * (self.body_wgt[i] / self.dbt_reptile_1inmill_mort_wgt[sim_num]) # amphibian params same as reptile
-            elif (self.taxa[i] == 'Birds'):
-                self.species_mortality_thres[i] = self.dbt_bird_1inmill_mort[sim_num] * (self.body_wgt[i] / self.dbt_bird_1inmill_mort_wgt[sim_num])**(self.mineau_sca_fact[sim_num] - 1.)
-            elif (self.taxa[i] == 'Mammals'):
-                self.species_mortality_thres[i] = self.dbt_mamm_1inmill_mort[sim_num] * (self.body_wgt[i] / self.dbt_mamm_1inmill_mort_wgt[sim_num])**0.25
+        self.species_mortality_thres = pd.Series(self.species_tox_thres(sim_num, self.dbt_bird_1inmill_mort[sim_num], self.dbt_bird_1inmill_mort_wgt[sim_num],
+                                                                        self.dbt_mamm_1inmill_mort[sim_num], self.dbt_mamm_1inmill_mort_wgt[sim_num],
+                                                                        self.dbt_reptile_1inmill_mort[sim_num], self.dbt_reptile_1inmill_mort_wgt[sim_num]), dtype='float')
         return
 
     def calc_species_sublethal_thres(self, sim_num):
@@ -1932,15 +1563,9 @@ class TedFunctions(object):
 
         """
 
-        self.species_sublethal_thres = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                self.species_sublethal_thres[i] = self.dbt_reptile_sub_direct[sim_num] * (self.body_wgt[i] / self.dbt_reptile_sub_direct_wgt[sim_num]) # amphibian params same as reptile
-            elif (self.taxa[i] == 'Birds'):
-                self.species_sublethal_thres[i] = self.dbt_bird_sub_direct[sim_num] * (self.body_wgt[i] / self.dbt_bird_sub_direct_wgt[sim_num])**(self.mineau_sca_fact[sim_num] - 1.)
-            elif (self.taxa[i] == 'Mammals'):
-                self.species_sublethal_thres[i] = self.dbt_mamm_sub_direct[sim_num] * (self.body_wgt[i] / self.dbt_mamm_sub_direct_wgt[sim_num])**0.25
+        self.species_sublethal_thres = pd.Series(self.species_tox_thres(sim_num, self.dbt_bird_sub_direct[sim_num], self.dbt_bird_sub_direct_wgt[sim_num],
+                                                                        self.dbt_mamm_sub_direct[sim_num], self.dbt_mamm_sub_direct_wgt[sim_num],
+                                                                        self.dbt_reptile_sub_direct[sim_num], self.dbt_reptile_sub_direct_wgt[sim_num]), dtype='float')
         return
 
     def calc_species_lowld50_thres(self, sim_num):
@@ -1954,20 +1579,14 @@ class TedFunctions(object):
 
         """
 
-        self.species_lowld50_thres = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles'):
-                self.species_lowld50_thres[i] = self.dbt_reptile_low_ld50[sim_num] * (self.body_wgt[i] / self.dbt_reptile_low_ld50_wgt[sim_num]) # amphibian params same as reptile
-            elif (self.taxa[i] == 'Birds'):
-                self.species_lowld50_thres[i] = self.dbt_bird_low_ld50[sim_num] * (self.body_wgt[i] / self.dbt_bird_low_ld50_wgt[sim_num])**(self.mineau_sca_fact[sim_num] - 1.)
-            elif (self.taxa[i] == 'Mammals'):
-                self.species_lowld50_thres[i] = self.dbt_mamm_low_ld50[sim_num] * (self.body_wgt[i] / self.dbt_mamm_low_ld50_wgt[sim_num])**0.25
+        self.species_lowld50_thres = pd.Series(self.species_tox_thres(sim_num, self.dbt_bird_low_ld50[sim_num], self.dbt_bird_low_ld50_wgt[sim_num],
+                                                                      self.dbt_mamm_low_ld50[sim_num], self.dbt_mamm_low_ld50_wgt[sim_num],
+                                                                      self.dbt_reptile_low_ld50[sim_num], self.dbt_reptile_low_ld50_wgt[sim_num]), dtype='float')
         return
 
     def calc_species_hc50_thres(self, sim_num):
         """
-        :description calculate the HC50 threshold (only applicable to birds)
+        :description calculate the HC50 threshold (only applicable to birds; NaN for other taxa)
 
         NOTE: (these thresholds are contained in the OPP TED spreadsheet model in worksheets 'Min/Max rate doses' column Y
               they are the same value for both min and max application scenarios
@@ -1976,13 +1595,8 @@ class TedFunctions(object):
 
         """
 
-        self.species_hc50_thres = pd.Series(len(self.com_name) * ['NA'], dtype='object')
-
-        for i in range(len(self.com_name)):
-            if (self.taxa[i] == 'Amphibians' or self.taxa[i] == 'Reptiles' or self.taxa[i] == 'Mammals'):
-                self.species_hc50_thres[i] = 'NA'
-            elif (self.taxa[i] == 'Birds'):
-                self.species_hc50_thres[i] = self.dbt_bird_hc50[sim_num] * (self.body_wgt[i] / self.dbt_bird_hc50_wgt[sim_num])**(self.mineau_sca_fact[sim_num] - 1.)
+        self.species_hc50_thres = pd.Series(self.species_tox_thres(sim_num, self.dbt_bird_hc50[sim_num], self.dbt_bird_hc50_wgt[sim_num],
+                                                                   np.nan, 1.0, np.nan, 1.0), dtype='float')
         return
 
     def calc_distance_to_risk_thres(self, sim_num):
@@ -1994,24 +1608,19 @@ class TedFunctions(object):
 
         """
 
-        self.out_dist_to_mort_thres_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_dist_to_ld50_thres_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_dist_to_mort_thres_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_dist_to_ld50_thres_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
+        # ratios of toxicity thresholds to maximum doses (min/max application scenario x mortality/LD50 threshold x species)
+        tox_thres = np.array([self.species_mortality_thres, self.species_lowld50_thres], dtype='float')
+        max_dose = np.array([self.out_species_max_dose_minapp, self.out_species_max_dose_maxapp], dtype='float')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tox_ratio = tox_thres[np.newaxis, :, :] / max_dose[:, np.newaxis, :]
 
-        for i in range(len(self.com_name)):
-            mort_tox_ratio_min = self.species_mortality_thres[i] / self.out_species_max_dose_minapp[i]
-            ld50_tox_ratio_min = self.species_lowld50_thres[i] / self.out_species_max_dose_minapp[i]
+        # execute distance calculation method (for all species, both toxicity thresholds and min/max application scenarios at once)
+        distances = self.drift_distance_calc(tox_ratio, *self.min_max_scenario_params(2))
 
-            mort_tox_ratio_max = self.species_mortality_thres[i] / self.out_species_max_dose_maxapp[i]
-            ld50_tox_ratio_max = self.species_lowld50_thres[i] / self.out_species_max_dose_maxapp[i]
-
-            # execute distance calculation method (for two toxicity thresholds and min/max application scenarios)
-            self.out_dist_to_mort_thres_min[i] = self.drift_distance_calc(mort_tox_ratio_min, self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-            self.out_dist_to_ld50_thres_min[i] = self.drift_distance_calc(ld50_tox_ratio_min, self.drift_param_a_min, self.drift_param_b_min, self.drift_param_c_min, self.max_drift_distance_minapp)
-
-            self.out_dist_to_mort_thres_max[i] = self.drift_distance_calc(mort_tox_ratio_max, self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
-            self.out_dist_to_ld50_thres_max[i] = self.drift_distance_calc(ld50_tox_ratio_max, self.drift_param_a_max, self.drift_param_b_max, self.drift_param_c_max, self.max_drift_distance_maxapp)
+        self.out_dist_to_mort_thres_min = pd.Series(distances[0, 0], dtype='float')
+        self.out_dist_to_ld50_thres_min = pd.Series(distances[0, 1], dtype='float')
+        self.out_dist_to_mort_thres_max = pd.Series(distances[1, 0], dtype='float')
+        self.out_dist_to_ld50_thres_max = pd.Series(distances[1, 1], dtype='float')
         return
 
     def calc_maxdose_toxthres_ratios(self, sim_num):
@@ -2023,17 +1632,11 @@ class TedFunctions(object):
 
         """
 
-        self.out_maxdose_to_mort_ratio_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_maxdose_to_sublethal_ratio_min = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_maxdose_to_mort_ratio_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
-        self.out_maxdose_to_sublethal_ratio_max = pd.Series(len(self.com_name) * [0.0], dtype='float')
-
-        for i in range(len(self.com_name)):
-
-            self.out_maxdose_to_mort_ratio_min[i] = self.out_species_max_dose_minapp[i] / self.species_mortality_thres[i]
-            self.out_maxdose_to_sublethal_ratio_min[i] = self.out_species_max_dose_minapp[i] / self.species_sublethal_thres[i]
-            self.out_maxdose_to_mort_ratio_max[i] = self.out_species_max_dose_maxapp[i] / self.species_mortality_thres[i]
-            self.out_maxdose_to_sublethal_ratio_max[i] = self.out_species_max_dose_maxapp[i] / self.species_sublethal_thres[i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.out_maxdose_to_mort_ratio_min = pd.Series(self.out_species_max_dose_minapp.values / self.species_mortality_thres.values, dtype='float')
+            self.out_maxdose_to_sublethal_ratio_min = pd.Series(self.out_species_max_dose_minapp.values / self.species_sublethal_thres.values, dtype='float')
+            self.out_maxdose_to_mort_ratio_max = pd.Series(self.out_species_max_dose_maxapp.values / self.species_mortality_thres.values, dtype='float')
+            self.out_maxdose_to_sublethal_ratio_max = pd.Series(self.out_species_max_dose_maxapp.values / self.species_sublethal_thres.values, dtype='float')
         return
 
     def write_simulation_results(self):
@@ -2459,8 +2062,8 @@ class TedFunctions(object):
         self.out_diet_eec_mean_max_sm_amphi   # (column AE)
 
         # ------------------------OPP TED spreadsheet model : worksheet 'Min rate - deitary conc results'-----------------------------------
-        # each of these pd series contains each food item in a continuous stream from column D/rows to column N/rows (for one simulation -- varialbes are reset per simulation)
-        # (thus, for example, the first 13 values of each variable represents column D (Short Grass); the second 13 represents column E (Tall Grass, nectar and pollen), etc
+        # each of these arrays is a (food item x toxicity measure) matrix covering column D/rows to column N/rows (for one simulation -- varialbes are reset per simulation)
+        # (thus, for example, the first row of each variable represents column D (Short Grass); the second row represents column E (Tall Grass, nectar and pollen), etc
 
         self.eec_exc_upper_min_mamm      # (columns D thru N; rows 3 thru 15)
         self.eec_exc_upper_min_bird      # (columns D thru N; rows 16 thru 28)
@@ -2478,8 +2081,8 @@ class TedFunctions(object):
         self.eec_dist_upper_min_inv      # (columns D thru N; rows 152 thru 164)
 
         # ---------------------------OPP TED spreadsheet model : worksheet 'Max rate - deitary conc results'-----------------------------------
-        # each of these pd series contains each food item in a continuous stream from column D/rows to column N/rows (for one simulation -- varialbes are reset per simulation)
-        # (thus, for example, the first 13 values of each variable represents column D (Short Grass); the second 13 represents column E (Tall Grass, nectar and pollen), etc
+        # each of these arrays is a (food item x toxicity measure) matrix covering column D/rows to column N/rows (for one simulation -- varialbes are reset per simulation)
+        # (thus, for example, the first row of each variable represents column D (Short Grass); the second row represents column E (Tall Grass, nectar and pollen), etc
 
         self.eec_exc_upper_max_mamm      # (columns D thru N; rows 3 thru 15)
         self.eec_exc_upper_max_bird      # (columns D thru N; rows 16 thru 28)
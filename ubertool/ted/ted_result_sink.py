@@ -0,0 +1,100 @@
+"""
+Sinks for the per simulation results of TED.
+
+Each simulation produces a set of named results (daily time series, species doses, exceedance tables; see
+'Ted.simulation_results'); a result sink collects them, as each simulation finishes, into one array per result name
+with one row per simulation:
+    TedResultSink      holds the arrays in memory
+    TedNpyResultSink   writes the arrays to a directory of .npy files (one per result name) through memory-mapped views;
+                       each simulation is flushed to disk when it is written, so the memory used does not grow with the
+                       number of simulations; the files can be memory-mapped by downstream tools (see 'load_results')
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import logging
+import numpy as np
+import os
+
+
+class TedResultSink(object):
+    """
+    Collects the per simulation results of TED in memory (result name -> array with one row per simulation).
+    """
+
+    def __init__(self):
+        """Class representing an in memory sink of per simulation results"""
+        self.results = {}
+
+    def allocate(self, name, shape, dtype):
+        """
+        :description allocates the array of a result (for all simulations)
+        :param name: result name
+        :param shape: shape of array (number of simulations first)
+        :param dtype: data type of result
+        :return:
+        """
+        return np.zeros(shape, dtype=dtype)
+
+    def write(self, sim_num, num_simulations, results):
+        """
+        :description stores the results of one simulation; the arrays are allocated when the first results are stored
+        :param sim_num: number of simulation
+        :param num_simulations: total number of simulations
+        :param results: dictionary of result name -> numpy array
+        :return:
+        """
+        for name, value in results.items():
+            if name not in self.results:
+                self.results[name] = self.allocate(name, (num_simulations,) + value.shape, value.dtype)
+            self.results[name][sim_num] = value
+
+    def flush(self):
+        """
+        :description completes the storage of the results written so far
+        :return:
+        """
+        pass
+
+
+class TedNpyResultSink(TedResultSink):
+    """
+    Streams the per simulation results of TED to a directory of .npy files (one file per result name, one row per simulation).
+    """
+
+    def __init__(self, directory):
+        """
+        Class representing an on disk sink of per simulation results
+        :param directory: directory to hold the result files (created if it does not exist; existing result files are overwritten)
+        """
+        super(TedNpyResultSink, self).__init__()
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def allocate(self, name, shape, dtype):
+        if np.dtype(dtype).hasobject:
+            raise ValueError('TED result %s of type %s cannot be stored in a .npy result file' % (name, dtype))
+        return np.lib.format.open_memmap(os.path.join(self.directory, name + '.npy'), mode='w+', dtype=dtype, shape=shape)
+
+    def write(self, sim_num, num_simulations, results):
+        super(TedNpyResultSink, self).write(sim_num, num_simulations, results)
+        # write the simulation to disk as it finishes (memory mapped pages are not retained)
+        self.flush()
+
+    def flush(self):
+        for values in self.results.values():
+            values.flush()
+
+
+def load_results(directory):
+    """
+    :description opens the per simulation results written by a TedNpyResultSink (read-only, memory-mapped)
+    :param directory: directory holding the result files
+    :return: dictionary of result name -> array with one row per simulation
+    """
+    results = {}
+    for file_name in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(file_name)
+        if ext == '.npy':
+            results[name] = np.load(os.path.join(directory, file_name), mmap_mode='r')
+    logging.info('opened TED results: ' + str(directory))
+    return results
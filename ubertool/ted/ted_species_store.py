@@ -0,0 +1,152 @@
+"""
+Process-wide, read-only table of the TED species properties.
+
+The species properties table (see tests/TEDSpeciesProperties.csv) is parsed once per process and every column is held
+as a read-only numpy array; models receive pandas Series that are views of these arrays (no copies are made).
+A prebuilt binary (columnar) copy of the table can be stored next to the csv file:
+    <csv>.npz   (one array per column plus the checksum of the csv file content it was built from)
+The binary copy is used only if the content of the csv file has not changed since it was built.
+"""
+from __future__ import division  # brings in Python 3.0 mixed type calculation rules
+import hashlib
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+import threading
+
+# model attribute name and csv column heading of each species property
+species_columns = (('sci_name', 'Scientific Name'),
+                   ('com_name', 'Common Name'),
+                   ('taxa', 'Taxa'),
+                   ('order', 'Order'),
+                   ('usfws_id', 'USFWS Species ID (ENTITY_ID)'),
+                   ('body_wgt', 'BW (g)'),
+                   ('diet_item', 'Food item'),
+                   ('h2o_cont', 'Water content of diet'))
+
+
+def species_cache_path(filename):
+    """
+    :description name of the binary (.npz) copy of a species properties csv file
+    :param filename: path of species properties csv file
+    :return:
+    """
+    return os.path.splitext(filename)[0] + '.npz'
+
+
+def file_checksum(filename):
+    # content based identification of the csv file (file modification times do not survive copies/checkouts)
+    with open(filename, 'rb') as csv_file:
+        return hashlib.sha1(csv_file.read()).hexdigest()
+
+
+class TedSpeciesStore(object):
+    """
+    Read-only, in-memory copy of the TED species properties table; each property is held as a numpy array that is
+    served (as a pandas Series view) by model attribute name.
+    """
+
+    def __init__(self, filename):
+        """Load all species properties from the csv file 'filename' (or from its up to date binary copy)"""
+        self.filename = filename
+        self.mtime = os.path.getmtime(filename)
+        self.checksum = file_checksum(filename)
+
+        self.columns = self.read_cache()
+        if self.columns is None:
+            self.columns = self.read_csv()
+        for column in self.columns.values():
+            column.flags.writeable = False  # shared across model runs
+        self.num_species = len(self.columns['sci_name'])
+
+    def read_csv(self):
+        """
+        :description parses the species properties csv file
+        :return: dictionary of attribute name -> numpy array
+        """
+        table = pd.read_csv(self.filename)  # comma is default delimiter
+        logging.info('loaded TED species properties: ' + str(self.filename))
+        return dict((name, table[heading].values) for name, heading in species_columns)
+
+    def read_cache(self):
+        """
+        :description loads the binary copy of the species properties table (if it exists and is up to date)
+        :return: dictionary of attribute name -> numpy array, or None
+        """
+        cache_path = species_cache_path(self.filename)
+        if not os.path.isfile(cache_path):
+            return None
+
+        with np.load(cache_path, allow_pickle=False) as cache:
+            if str(cache['checksum']) != self.checksum:
+                logging.info('TED species properties cache is out of date: ' + cache_path)
+                return None
+            columns = {}
+            for name, heading in species_columns:
+                column = cache[name]
+                if column.dtype.kind == 'U':
+                    # text columns are held as python objects (as read by pandas); missing entries are restored as NaN
+                    column = column.astype('object')
+                    column[cache[name + '_isna']] = np.nan
+                columns[name] = column
+        logging.info('loaded TED species properties: ' + cache_path)
+        return columns
+
+    def write_cache(self):
+        """
+        :description stores the binary copy of the species properties table next to the csv file
+        :return: path of the binary copy
+        """
+        cache_path = species_cache_path(self.filename)
+        arrays = {'checksum': np.array(self.checksum)}
+        for name, column in self.columns.items():
+            if column.dtype == 'object':
+                isna = pd.isnull(column)
+                arrays[name] = np.where(isna, '', column).astype('U')
+                arrays[name + '_isna'] = isna
+            else:
+                arrays[name] = column
+        with open(cache_path, 'wb') as cache_file:
+            np.savez(cache_file, **arrays)
+        logging.info('wrote TED species properties cache: ' + cache_path)
+        return cache_path
+
+    def get_series(self, name):
+        """
+        :description returns a species property as a pandas Series (a view of the shared read-only array)
+        :param name: model attribute name of species property (see 'species_columns')
+        :return:
+        """
+        return pd.Series(self.columns[name], copy=False)
+
+
+_species_stores = {}
+_species_stores_lock = threading.Lock()
+
+
+def get_species_store(filename):
+    """
+    :description returns the process-wide species properties store of a csv file; the table is (re)loaded the first
+    :            time it is requested and whenever the modification time of the csv file changes
+    :param filename: path of species properties csv file
+    :return:
+    """
+    key = os.path.abspath(filename)
+    mtime = os.path.getmtime(filename)
+    with _species_stores_lock:
+        store = _species_stores.get(key)
+        if store is None or store.mtime != mtime:
+            store = TedSpeciesStore(filename)
+            _species_stores[key] = store
+    return store
+
+
+if __name__ == '__main__':
+    # build step: python -m ubertool.ted.ted_species_store [path to TEDSpeciesProperties.csv]
+    if len(sys.argv) > 1:
+        csv_name = sys.argv[1]
+    else:
+        csv_name = os.path.join(os.path.dirname(__file__), 'tests/TEDSpeciesProperties.csv')
+    print(TedSpeciesStore(csv_name).write_cache())
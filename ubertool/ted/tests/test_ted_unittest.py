@@ -5,14 +5,17 @@ import numpy as np
 import numpy.testing as npt
 import os.path
 import pandas as pd
+import shutil
 import sys
 from tabulate import tabulate
+import tempfile
 import unittest
 
 print("Python version: " + sys.version)
 print("Numpy version: " + np.__version__)
 
 from ..ted_exe import Ted
+from ..ted_result_sink import TedNpyResultSink, TedResultSink, load_results
 
 test = {}
 
@@ -829,6 +832,102 @@ class TestTed(unittest.TestCase):
                 print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_daily_plant_max(self):
+        """
+        :description calculates the maximum daily pesticide residue concentration (EEC) of the annual food item timeseries
+                     without generating the timeseries
+        :param application rate; active ingredient application rate (lbs a.i./acre)
+        :param food_multiplier; factor by which application rate of active ingredient is multiplied to estimate dietary based EECs
+        :param num_apps; number of applications
+        :param app_interval; number of days between applications
+        :param half_life; foliar dissipation halflife (days)
+
+        :Notes # the application scenarios are those of the 'daily_app_flag' & 'daily_plant_timeseries' tests; expected
+               # results are the maxima of the 'daily_plant_timeseries' expected results
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_results = pd.Series([7.096704, 193.6347, 300.], dtype='float')
+        result = pd.Series([], dtype='float')
+
+        try:
+            # internal model constants
+            ted_empty.num_simulation_days = 366
+
+            # input variables that change per simulation
+            food_multiplier = pd.Series([15., 110., 240.])
+            ted_empty.foliar_diss_hlife = pd.Series([15., 25., 35.])
+            ted_empty.app_rate_min = pd.Series([0.18, 0.5, 1.25]) # lbs a.i./acre
+            ted_empty.num_apps_min = pd.Series([3, 5, 1])
+            ted_empty.app_interval_min = pd.Series([3, 7, 1])
+
+            result = ted_empty.daily_plant_max(ted_empty.app_rate_min, food_multiplier, ted_empty.num_apps_min,
+                                               ted_empty.app_interval_min, ted_empty.foliar_diss_hlife)
+            npt.assert_allclose(result, expected_results, rtol=1e-4, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_daily_plant_timeseries_stack(self):
+        """
+        :description generates annual timeseries of daily pesticide residue concentration (EECs) for a collection of food items
+                     at once
+        :param application rate; active ingredient application rate (lbs a.i./acre)
+        :param food_multipliers; array of factors by which application rate of active ingredient is multiplied to estimate dietary based EECs
+        :param decay_response; daily response to applications of unit initial concentration
+
+        :Notes # expected results are the EECs of selected days computed day by day (conc_timestep from the previous day's
+               # EEC plus the initial EEC on application days) for each application scenario
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        days = [0, 1, 3, 6, 7, 28, 29, 365]
+        expected_results = [np.array([[43.2, 41.2492, 80.8078, 113.547, 108.42, 41.0834, 39.2281, 7.08803e-06],
+                                      [2.7, 2.57807, 5.05049, 7.0967, 6.77623, 2.56771, 2.45176, 4.43002e-07],
+                                      [1.26, 1.2031, 2.35689, 3.3118, 3.16224, 1.19826, 1.14415, 2.06734e-07]]),
+                            np.array([[120.0, 116.719, 110.423, 101.609, 218.831, 422.476, 410.923, 0.0369758],
+                                      [7.5, 7.29491, 6.90141, 6.35059, 13.6769, 26.4047, 25.6827, 0.00231099],
+                                      [3.5, 3.40429, 3.22066, 2.96361, 6.38257, 12.3222, 11.9853, 0.00107846]]),
+                            np.array([[300.0, 294.117, 282.695, 266.389, 261.165, 172.305, 168.926, 0.217675],
+                                      [18.75, 18.3823, 17.6685, 16.6493, 16.3228, 10.769, 10.5579, 0.0136047],
+                                      [8.75, 8.57842, 8.24528, 7.76968, 7.61732, 5.02556, 4.92701, 0.00634885]])]
+        result = []
+
+        try:
+            # internal model constants
+            ted_empty.num_simulation_days = 366
+
+            # input variables that change per simulation
+            food_multipliers = np.array([240., 15., 7.])
+            ted_empty.foliar_diss_hlife = pd.Series([15., 25., 35.])
+            ted_empty.app_rate_min = pd.Series([0.18, 0.5, 1.25]) # lbs a.i./acre
+            ted_empty.num_apps_min = pd.Series([3, 5, 1])
+            ted_empty.app_interval_min = pd.Series([3, 7, 1])
+
+            for i in range(3):
+                daily_flag = ted_empty.daily_app_flag(ted_empty.num_apps_min[i], ted_empty.app_interval_min[i])
+                decay_response = ted_empty.daily_decay_response(ted_empty.foliar_diss_hlife[i], daily_flag)
+                timeseries = ted_empty.daily_plant_timeseries_stack(ted_empty.app_rate_min[i], food_multipliers, decay_response)
+                self.assertEqual(timeseries.shape, (len(food_multipliers), ted_empty.num_simulation_days))
+                result.append(timeseries[:, days])
+                npt.assert_allclose(result[i], expected_results[i], rtol=1e-4, atol=0, err_msg='', verbose=True)
+        finally:
+            for i in range(len(result)):
+                tab = [result[i].ravel(), expected_results[i].ravel()]
+                print("\n")
+                print(inspect.currentframe().f_code.co_name)
+                print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_daily_soil_h2o_timeseries(self):
         """
         :description generates annual timeseries of daily pesticide concentrations in soil pore water and surface puddles
@@ -2788,6 +2887,102 @@ class TestTed(unittest.TestCase):
                 print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_daily_animal_dose_timeseries_stack(self):
+        """
+        :description generates annual timeseries of daily pesticide concentrations in animals for a collection of animal/food item
+                     combinations at once
+        :param a1; coefficient(s) of allometric expression
+        :param b1; exponent(s) of allometrice expression
+        :param body_wgt; body weight(s) of species (g)
+        :param frac_h2o; fraction(s) of water in food item
+        :param intake_food_conc; pesticide concentrations in food items (rows x days; daily mg a.i./kg)
+        :param frac_retained; fraction(s) of ingested food retained by animal
+
+        :Notes # expected results are the daily dose recursion (Eqs 5&6 of Attachment 1-7 of 'Biological Evaluation Chapters
+               # for Diazinon ESA Assessment') evaluated day by day for each row
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_results = np.zeros((4, 366))
+        result = np.zeros((4, 366))
+
+        try:
+            # internal model constants
+            ted_empty.num_simulation_days = 366
+
+            a1 = np.array([0.621, 0.621, 0.648, 0.013])
+            b1 = np.array([0.564, 0.564, 0.651, 0.773])
+            body_wgt = np.array([15., 1000., 20., 2.])
+            frac_h2o = np.array([0.8, 0.8, 0.69, 0.69])
+            frac_retained = np.array([0.95, 0.95, 0.7, 0.7])
+            daily_flag = ted_empty.daily_app_flag(4, 7)
+            intake_food_conc = ted_empty.daily_plant_timeseries_stack(0.5, [240., 240., 94., 94.], ted_empty.daily_decay_response(15., daily_flag))
+
+            for i in range(4):
+                food_intake_rate = (a1[i] * body_wgt[i]**b1[i]) / (1. - frac_h2o[i])
+                for day_index in range(366):
+                    expected_results[i, day_index] = (food_intake_rate * intake_food_conc[i, day_index]) / body_wgt[i]
+                    if(day_index != 0):
+                        expected_results[i, day_index] += expected_results[i, day_index-1] * frac_retained[i]
+
+            result = ted_empty.daily_animal_dose_timeseries_stack(a1, b1, body_wgt, frac_h2o, intake_food_conc, frac_retained)
+            npt.assert_allclose(result, expected_results, rtol=1e-10, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result.max(axis=1), expected_results.max(axis=1)]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_daily_animal_dose_timeseries_stack_nan_retained(self):
+        """
+        :description generates annual timeseries of daily pesticide concentrations in animals when a retained fraction is
+                     missing (NaN); the doses of that row are NaN after the first day (as in the daily dose recursion)
+        :param frac_retained; fraction(s) of ingested food retained by animal
+
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_results = np.zeros((3, 366))
+        result = np.zeros((3, 366))
+
+        try:
+            # internal model constants
+            ted_empty.num_simulation_days = 366
+
+            a1 = np.array([0.621, 0.621, 0.648])
+            b1 = np.array([0.564, 0.564, 0.651])
+            body_wgt = np.array([15., 1000., 20.])
+            frac_h2o = np.array([0.8, 0.8, 0.69])
+            frac_retained = np.array([0.5, np.nan, 0.5])
+            daily_flag = ted_empty.daily_app_flag(4, 7)
+            intake_food_conc = ted_empty.daily_plant_timeseries_stack(0.5, [240., 240., 94.], ted_empty.daily_decay_response(15., daily_flag))
+
+            for i in range(3):
+                food_intake_rate = (a1[i] * body_wgt[i]**b1[i]) / (1. - frac_h2o[i])
+                for day_index in range(366):
+                    expected_results[i, day_index] = (food_intake_rate * intake_food_conc[i, day_index]) / body_wgt[i]
+                    if(day_index != 0):
+                        expected_results[i, day_index] += expected_results[i, day_index-1] * frac_retained[i]
+
+            result = ted_empty.daily_animal_dose_timeseries_stack(a1, b1, body_wgt, frac_h2o, intake_food_conc, frac_retained)
+            npt.assert_allclose(result, expected_results, rtol=1e-10, atol=0, err_msg='', verbose=True)
+            self.assertTrue(np.isnan(result[1, 1:]).all())
+            result_single = ted_empty.daily_animal_dose_timeseries(a1[1], b1[1], body_wgt[1], frac_h2o[1], intake_food_conc[1], np.nan)
+            npt.assert_allclose(result_single, expected_results[1], rtol=1e-10, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result[:, 0], expected_results[:, 0]]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_daily_canopy_air_timeseries(self):
         """
         :description generates annual timeseries of daily pesticide concentrations in soil pore water and surface puddles
@@ -3256,17 +3451,12 @@ class TestTed(unittest.TestCase):
         """
         :description this method accumulates the number of time various toxicity measures are exceeded within daily time
                      series of food item concentrations
-        :param num_ts number of time series included in the aggregate incoming 'time_series'
-        :param num_tox number of toxicity measures to be precessed per time series
-        :param eec_ts_upper_min_1 a panda series representing an aggregation of time series representing the daily concentrations in food items (e.g., short grass, arthropods etc.)
+        :param eec_ts_upper_min_1 a 2-D array (food items x days) of the daily concentrations in food items (e.g., short grass, arthropods etc.)
         :param tox_cbt_mamm a panda series representing the list of toxicity measures
 
         :NOTE this method is used to replicate the OPP TED Excel model worksheet 'Min/Max rate - dietary conc results' columns D - N lines 3 - 54
-              (this method is a temporary solution for the need to populate a panda series with mixed data types;
-              when a more elegant solution comes available this method can simply be replaced without other changes - or so I think)
-
-              for example: the following line of code performs the same function when all series values are floats
-              exceedances = [(self.time_sesries[0][i] > self.tox_series[0][j]).sum() for i in range(11) for j in range(13)]
+              (each row of the result represents a food item, each column a toxicity measure; NaN for food items that are not
+              applicable or toxicity measures that are not available)
 
         :return:
         """
@@ -3276,29 +3466,29 @@ class TestTed(unittest.TestCase):
 
         self.num_simulation_days = 15
 
-        eec_ts_1 = pd.Series([10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5])
-        eec_ts_2 = pd.Series([10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5])
-        eec_ts_3 = pd.Series([10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5])
-        eec_ts_4 = pd.Series([10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5])
+        eec_ts_1 = [10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5]
+        eec_ts_2 = [10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5]
+        eec_ts_3 = [10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5]
+        eec_ts_4 = [10.,9.,8.,7.,6.,5.,4.,3.,2.,1.,0.9,0.8,0.7,0.6,0.5]
 
-        na_series = pd.Series(self.num_simulation_days * ['NA'])
+        na_series = self.num_simulation_days * [np.nan]
 
-        expected_results = pd.Series([9, 8, 7, 8, 9, 8, 7, 9, 8, 7, 9, 8, 7, 8, 9, 8, 7, 9, 8, 7,
-                                      9, 8, 7, 8, 9, 8, 7, 9, 8, 7, 9, 8, 7, 8, 9, 8, 7, 9, 8, 7,
-                                      'NA','NA','NA','NA','NA','NA','NA','NA','NA','NA',], dtype='object')
-        result = pd.Series([], dtype='object')
+        expected_results = np.array([[9, 8, 7, 8, 9, 8, 7, 9, 8, 7, np.nan],
+                                     [9, 8, 7, 8, 9, 8, 7, 9, 8, 7, np.nan],
+                                     [9, 8, 7, 8, 9, 8, 7, 9, 8, 7, np.nan],
+                                     [9, 8, 7, 8, 9, 8, 7, 9, 8, 7, np.nan],
+                                     [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan]])
+        result = np.zeros((5, 11))
 
         try:
-            num_ts = 5
-            num_tox = 10
-            tox_cbt_mamm = pd.Series([1., 2., 3., 2., 1., 2., 3., 1., 2., 3.])
-            eec_ts_upper_min_1 = pd.Series([[eec_ts_1], [eec_ts_2], [eec_ts_3], [eec_ts_4], [na_series]])
+            tox_cbt_mamm = pd.Series([1., 2., 3., 2., 1., 2., 3., 1., 2., 3., np.nan])
+            eec_ts_upper_min_1 = np.array([eec_ts_1, eec_ts_2, eec_ts_3, eec_ts_4, na_series])
 
-            result = ted_empty.sum_exceedances(num_ts, num_tox, eec_ts_upper_min_1, tox_cbt_mamm)
+            result = ted_empty.sum_exceedances(eec_ts_upper_min_1, tox_cbt_mamm)
             npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
 
         finally:
-            tab = [result, expected_results]
+            tab = [result.ravel(), expected_results.ravel()]
             print("\n")
             print(inspect.currentframe().f_code.co_name)
             print(tabulate(tab, headers='keys', tablefmt='rst'))
@@ -3307,9 +3497,7 @@ class TestTed(unittest.TestCase):
     def test_calc_eec_tox_frac(self):
             """
             :description calculates the ratio of toxicity measure and maximum of daily food item concentrations
-            :param num_eec_max number of food items included
-            :param num_tox number of toxicity measures to be processed
-            :param max_eec_series a panda series representing an aggregation of maximum concentrations in food items (e.g., short grass, arthropods etc.)
+            :param max_eec_series an array of the maximum concentrations in food items (e.g., short grass, arthropods etc.)
             :param tox_series a panda series representing the list of toxicity measures
 
             :return:
@@ -3318,21 +3506,21 @@ class TestTed(unittest.TestCase):
             # create empty pandas dataframes to create empty object for this unittest
             ted_empty = self.create_ted_object()
 
-            expected_results = pd.Series([0.2, 0.2, 0.2, 'NA', 8.0, 'NA', 'NA', 'NA', 'NA', 'NA', 'NA', 'NA',
-                                          1.0, 1.0, 1.0, 'NA', 40., 'NA', 0.02, 0.02, 0.02, 'NA', 0.8, 'NA'], dtype='object')
-            result = pd.Series([], dtype='object')
+            expected_results = np.array([[0.2, 0.2, 0.2, np.nan, 8.0, np.nan],
+                                         [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan],
+                                         [1.0, 1.0, 1.0, np.nan, 40., np.nan],
+                                         [0.02, 0.02, 0.02, np.nan, 0.8, np.nan]])
+            result = np.zeros((4, 6))
 
             try:
-                num_tox = 6
-                num_eec_max = 4
                 tox_series = pd.Series([1., 1., 1., np.nan, 40., np.nan]) # the toxicity numbers come from input as NaN
-                max_eec_series = pd.Series([5.0, 'NA', 1.0, 50.0, ])
+                max_eec_series = np.array([5.0, np.nan, 1.0, 50.0])
 
-                result = ted_empty.calc_eec_tox_frac(num_eec_max, num_tox, max_eec_series, tox_series)
-                npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
+                result = ted_empty.calc_eec_tox_frac(max_eec_series, tox_series)
+                npt.assert_allclose(result, expected_results, rtol=1e-12, atol=0, err_msg='', verbose=True)
 
             finally:
-                tab = [result, expected_results]
+                tab = [result.ravel(), expected_results.ravel()]
                 print("\n")
                 print(inspect.currentframe().f_code.co_name)
                 print(tabulate(tab, headers='keys', tablefmt='rst'))
@@ -3353,19 +3541,203 @@ class TestTed(unittest.TestCase):
         # create empty pandas dataframes to create empty object for this unittest
         ted_empty = self.create_ted_object()
 
-        expected_results = pd.Series([2600., 2348.357448005348, 110.46619534267889, 39.008907082694385, 0.0, 'NA'], dtype='object')
-        result = pd.Series([], dtype='object')
+        expected_results = np.array([2600., 2348.357448005348, 110.46619534267889, 39.008907082694385, 0.0, np.nan])
+        result = np.zeros(6)
 
         try:
-            toxicity_to_apprate_ratio = pd.Series([0.002, 0.02, 0.2, 0.35, 3., 'NA'])
+            toxicity_to_apprate_ratio = np.array([0.002, 0.02, 0.2, 0.35, 3., np.nan])
             param_a = 0.0292
             param_b = 0.822
             param_c = 0.6539
             max_drift_distance = 2600.
 
             result = ted_empty.calc_maxeec_distance(toxicity_to_apprate_ratio, param_a, param_b, param_c, max_drift_distance)
+            npt.assert_allclose(result, expected_results, rtol=1e-12, atol=0, err_msg='', verbose=True)
+
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_store_simulation_results(self):
+        """
+        :description collects the per simulation results of each simulation into arrays with one row per simulation
+        :param sim_num: number of simulation
+        :param results: dictionary of result name -> numpy array
+
+        :Notes # per simulation attributes are overwritten by each simulation; the stored results keep every simulation
+        :return:
+        """
+
+        # create empty ted object collecting the per simulation results in memory
+        ted_empty = Ted(pd.DataFrame(), pd.DataFrame(), result_sink=TedResultSink())
+
+        expected_results = np.array([[1., 2.], [3., 4.], [5., 6.]])
+        expected_exceedances = np.array([['NA', 1.5], [2.5, 'NA'], [0.5, 0.5]], dtype='object')
+        result = np.zeros((3, 2))
+
+        try:
+            ted_empty.num_simulations = 3
+            ted_empty.sim_result_prefixes = ('out_', 'eec_exc_')
+
+            for sim_num in range(3):
+                ted_empty.out_soil_conc_min = expected_results[sim_num]
+                ted_empty.eec_exc_upper_min_mamm = pd.Series(expected_exceedances[sim_num], dtype='object')
+                ted_empty.out_diet_eec_upper_min_sg_maxdaily = pd.Series([9.], dtype='float')  # not a per simulation result
+                ted_empty.store_simulation_results(sim_num, ted_empty.simulation_results())
+
+            result = ted_empty.sim_results['out_soil_conc_min']
+            self.assertEqual(sorted(ted_empty.sim_results), ['eec_exc_upper_min_mamm', 'out_soil_conc_min'])
+            npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
+            npt.assert_array_equal(ted_empty.sim_results['eec_exc_upper_min_mamm'], expected_exceedances, err_msg='', verbose=True)
+        finally:
+            tab = [result.ravel(), expected_results.ravel()]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_store_simulation_results_default(self):
+        """
+        :description without a result sink the per simulation results are not collected; the per simulation attributes
+                     hold the results of the last simulation
+        :param sim_num: number of simulation
+        :param results: dictionary of result name -> numpy array
+
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_results = np.array([5., 6.])
+        result = np.zeros(2)
+
+        try:
+            ted_empty.num_simulations = 3
+            ted_empty.sim_result_prefixes = ('out_', 'eec_exc_')
+
+            for sim_num in range(3):
+                ted_empty.out_soil_conc_min = np.array([1., 2.]) + 2. * sim_num
+                ted_empty.store_simulation_results(sim_num, ted_empty.simulation_results())
+
+            result = ted_empty.out_soil_conc_min
+            self.assertIsNone(ted_empty.result_sink)
+            self.assertEqual(ted_empty.sim_results, {})
             npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+
+    def test_run_simulations_parallel(self):
+        """
+        :description simulations distributed among worker processes give the results of the simulations run in sequence
+        :param num_workers; number of worker processes
+
+        :Notes # the qaqc inputs are replicated to give several simulations per worker
+        :return:
+        """
+
+        csv_path = os.path.join(os.path.dirname(__file__), "ted_qaqc_in_transpose.csv")
+        df_inputs = pd.concat([pd.read_csv(csv_path, index_col=0, engine='python')] * 3, ignore_index=True)
+
+        ted_serial = Ted(df_inputs.copy(), None, num_workers=1, result_sink=TedResultSink())
+        ted_serial.execute_model()
+        expected_results = ted_serial.sim_results
+        result = {}
+
+        try:
+            ted_parallel = Ted(df_inputs.copy(), None, num_workers=2, result_sink=TedResultSink())
+            ted_parallel.execute_model()
+            result = ted_parallel.sim_results
+            self.assertEqual(sorted(result), sorted(expected_results))
+            for name in sorted(expected_results):
+                self.assertEqual(len(result[name]), len(df_inputs))
+                npt.assert_array_equal(result[name], expected_results[name], err_msg=name, verbose=True)
+            self.assertTrue(ted_parallel.pd_obj_out.equals(ted_serial.pd_obj_out))
+        finally:
+            tab = [sorted(result), sorted(expected_results)]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_set_species_categories(self):
+        """
+        :description encodes the taxa, the dietary intake parameter group and the diet item of each species as integer
+                     categories
+        :param taxa; taxa of each species
+        :param order; order of each species
+        :param diet_item; diet item of each species
+
+        :Notes # species of unidentified taxa and diet items without a diet category are assigned category -1
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_taxa = np.array([0, 0, 1, 1, 2, 3, -1])
+        expected_intake_group = np.array([0, 1, 3, 4, 2, 2, -1])
+        expected_diet_category = np.array([0, 8, 1, 6, 6, -1, -1])
+        result_taxa = np.zeros(7, dtype=int)
+        result_intake_group = np.zeros(7, dtype=int)
+        result_diet_category = np.zeros(7, dtype=int)
+
+        try:
+            ted_empty.set_global_constants()
+            ted_empty.taxa = pd.Series(['Birds', 'Birds', 'Mammals', 'Mammals', 'Amphibians', 'Reptiles', 'Fungi'], dtype='object')
+            ted_empty.order = pd.Series(['Passeriformes', 'Anseriformes', 'Rodentia', 'Carnivora', 'Anura', 'Testudines', 'NA'], dtype='object')
+            ted_empty.diet_item = pd.Series(['arthropods', 'grass', 'soil inverts', 'fish', 'fish and aq amphibians', 'leaves ', 'NA'], dtype='object')
+            ted_empty.body_wgt = pd.Series([20., 1000., 15., 5000., 2., 6620., 1.], dtype='float')
+            ted_empty.h2o_cont = pd.Series([0.7, 0.7, 0.7, 0.7, 0.85, 0.66, 0.5], dtype='float')
+
+            ted_empty.set_species_categories()
+            result_taxa = ted_empty.species_taxa
+            result_intake_group = ted_empty.species_intake_group
+            result_diet_category = ted_empty.species_diet_category
+
+            npt.assert_array_equal(result_taxa, expected_taxa, err_msg='', verbose=True)
+            npt.assert_array_equal(result_intake_group, expected_intake_group, err_msg='', verbose=True)
+            npt.assert_array_equal(result_diet_category, expected_diet_category, err_msg='', verbose=True)
+            npt.assert_allclose(ted_empty.species_taxa_values(1., 2., 3., 4., 0.), [1., 1., 2., 2., 3., 4., 0.], rtol=1e-12, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result_taxa, expected_taxa, result_intake_group, expected_intake_group, result_diet_category, expected_diet_category]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_read_species_properties(self):
+        """
+        :description reads the species properties table (loaded once per process and shared by all model objects)
+
+        :Notes # the species properties of each model object are read-only views of the shared table
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+        ted_other = self.create_ted_object()
+
+        expected_results = np.array([819., 819.])
+        result = np.zeros(2)
+
+        try:
+            ted_empty.read_species_properties()
+            ted_other.read_species_properties()
+            result = np.array([len(ted_empty.com_name), len(ted_other.body_wgt)], dtype='float')
 
+            npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
+            self.assertEqual(ted_empty.taxa[0], 'Amphibians')
+            self.assertTrue(np.shares_memory(ted_empty.body_wgt.values, ted_other.body_wgt.values))
+            self.assertFalse(ted_empty.body_wgt.values.flags.writeable)
         finally:
             tab = [result, expected_results]
             print("\n")
@@ -3373,4 +3745,76 @@ class TestTed(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_calc_plant_risk_distance_bulk(self):
+        """
+        :description calculates the distances from the source area that plant toxicity thresholds occur for arrays of
+                     toxicity to application rate ratios and spray drift parameters (e.g., all toxicity measures and min/max
+                     application scenarios in one call)
+        :NOTE         ratios greater than 1.0 result in distance 0.0; distances are limited to the max spray drift distance;
+                      NaN ratios result in NaN distances
+
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        ted_empty = self.create_ted_object()
+
+        expected_results = np.array([[np.nan, 0.0, 0.229889, 1000.],
+                                     [np.nan, 0.0, 13.220768, 2600.]])
+        result = np.zeros((2, 4))
+
+        try:
+            # rows: scenarios (drift parameters broadcast across columns); columns: toxicity measures
+            health_to_app_ratio = np.array([[np.nan, 2.0, 0.5, 1.e-6],
+                                            [np.nan, 2.0, 0.5, 1.e-6]])
+            param_a = np.array([[5.5513], [0.0292]])
+            param_b = np.array([[0.8523], [0.822]])
+            param_c = np.array([[1.0079], [0.6539]])
+            max_distance = np.array([[1000.], [2600.]])
+
+            result = ted_empty.calc_plant_risk_distance(health_to_app_ratio, param_a, param_b, param_c, max_distance)
+            npt.assert_allclose(result, expected_results, rtol=1e-4, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result.ravel(), expected_results.ravel()]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_npy_result_sink(self):
+        """
+        :description streams the per simulation results of each simulation to .npy files (one per result name, one row per
+                     simulation) that can be memory-mapped after the run
+        :param sim_num: number of simulation
+        :param results: dictionary of result name -> numpy array
+
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        result_dir = tempfile.mkdtemp()
+        ted_empty = Ted(pd.DataFrame(), pd.DataFrame(), result_sink=TedNpyResultSink(result_dir))
+
+        expected_results = np.array([[1., 2.], [3., np.nan], [5., 6.]])
+        result = np.zeros((3, 2))
+
+        try:
+            ted_empty.num_simulations = 3
+            for sim_num in range(3):
+                ted_empty.store_simulation_results(sim_num, {'out_soil_conc_min': expected_results[sim_num]})
+            ted_empty.result_sink.flush()
+
+            stored = load_results(result_dir)
+            result = np.array(stored['out_soil_conc_min'])
+            self.assertEqual(sorted(stored), ['out_soil_conc_min'])
+            self.assertTrue(isinstance(stored['out_soil_conc_min'], np.memmap))
+            npt.assert_array_equal(result, expected_results, err_msg='', verbose=True)
+        finally:
+            shutil.rmtree(result_dir, ignore_errors=True)
+            tab = [result.ravel(), expected_results.ravel()]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
 
@@ -460,6 +460,46 @@ class Testtherps(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_eec_diet_max_analytic(self):
+        """
+        unit test for method eec_diet_max_analytic (maximum daily concentration computed from the application
+        schedule without generating the concentration timeseries);
+
+        * the 'maxima_only' model option routes eec_diet_max to this method
+        * the application schedules are those generated in 'test_convert_app_intervals' (equal application rates
+        * spaced 'app_interval' days apart); the 3rd simulation has more applications than fit within the year
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        therps_empty = self.create_therps_object()
+
+        result = pd.Series([], dtype = 'float')
+        expected_results = pd.Series([5.306971, 2.394, 3.60823], dtype = 'float')
+
+        try:
+            therps_empty.maxima_only = True
+            therps_empty.frac_act_ing = pd.Series([0.34, 0.84, 0.02], dtype = 'float')
+            therps_empty.food_multiplier_init_sg = 15.
+            therps_empty.foliar_diss_hlife = pd.Series([25., 5., 45.], dtype = 'float')
+            therps_empty.application_rate = pd.Series([0.34, 0.19, 2.34], dtype = 'float')
+            therps_empty.num_apps = pd.Series([4, 1, 40], dtype = 'int')
+            therps_empty.app_interval = pd.Series([7, 10, 14], dtype = 'int')
+
+            result = therps_empty.eec_diet_max(therps_empty.food_multiplier_init_sg)
+            npt.assert_allclose(result,expected_results,rtol=1e-4, atol=0, err_msg='', verbose=True)
+
+            # results match those extracted from the concentration timeseries
+            therps_empty.maxima_only = False
+            therps_empty.day_out, therps_empty.app_rates = therps_empty.convert_app_intervals()
+            npt.assert_allclose(result, therps_empty.eec_diet_max(therps_empty.food_multiplier_init_sg),
+                                rtol=1e-10, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_eec_dose_mamm(self):
         """
         unit test for function eec_dose_mamm;
@@ -1028,6 +1068,59 @@ class Testtherps(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_eec_dose_herp_classes(self):
+        """
+        unit test for function eec_dose_herp_classes; amphibian Dose based eecs of several size classes and food sources
+        internal calls to : "fi_herp";
+                            'eec_diet_max_foods' (maxima stored by 'set_diet_timeseries') are included
+
+        unit tests of this routine include the following approach:
+        * the inputs are those of 'test_eec_dose_herp' (repeated for a second size class); the food multipliers of the
+        * broadleaf plants are 15 (initial) and 30 (mean), thus the doses of the mean residues are twice the initial
+        :return:
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        therps_empty = self.create_therps_object()
+
+        result = pd.Series([], dtype = 'float')
+        expected_results = np.array([[[0.02284427, 4.089158, 0.02605842], [0.02284427, 4.089158, 0.02605842]],
+                                     [[0.04568854, 8.178316, 0.05211684], [0.04568854, 8.178316, 0.05211684]]])
+        num_app_days = pd.Series([], dtype='int')
+
+        try:
+            therps_empty.aw_herp_sm = pd.Series([1.5, 40., 250.], dtype = 'float')
+            therps_empty.frac_act_ing = pd.Series([0.34, 0.84, 0.02], dtype = 'float')
+            therps_empty.foliar_diss_hlife = pd.Series([25., 5., 45.], dtype = 'float')
+
+            therps_empty.awc_herp_sm = pd.Series([10., 80., 90.], dtype = 'float') # initialize as percent to match model input
+            therps_empty.awc_herp_sm = therps_empty.percent_to_frac(therps_empty.awc_herp_sm) # convert to mass fraction water content
+
+            #specifying 3 different application scenarios of 1, 4, and 2 applications
+            therps_empty.app_rates = pd.Series([[0.34], [0.78, 11.34, 3.54, 1.54], [2.34, 1.384]], dtype='object')
+            therps_empty.day_out = pd.Series([[5], [1, 11, 21, 51], [150, 250]], dtype='object')
+            for i in range(len(therps_empty.app_rates)):
+                therps_empty.num_apps[i] = len(therps_empty.app_rates[i])
+                num_app_days[i] = len(therps_empty.day_out[i])
+                assert (therps_empty.num_apps[i] == num_app_days[i]), 'list of app-rates and app_days do not match'
+
+            therps_empty.set_global_constants()
+            therps_empty.food_multiplier_init_blp = 15.
+            therps_empty.food_multiplier_mean_blp = 30.
+            therps_empty.set_diet_timeseries()
+
+            aw_herp = np.array([therps_empty.aw_herp_sm, therps_empty.aw_herp_sm])
+            awc_herp = np.array([therps_empty.awc_herp_sm, therps_empty.awc_herp_sm])
+            result = therps_empty.eec_dose_herp_classes(aw_herp, awc_herp, [therps_empty.food_multiplier_init_blp,
+                                                                            therps_empty.food_multiplier_mean_blp])
+            npt.assert_allclose(result,expected_results,rtol=1e-4, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [np.ravel(result), expected_results.ravel()]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_eec_diet_tp(self):
         """
 
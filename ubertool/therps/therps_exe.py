@@ -249,12 +249,17 @@ class Therps(UberModel, TherpsInputs, TherpsOutputs, TherpsFunctions):
     Estimate dietary exposure and risk to terrestrial-phase amphibians and reptiles from pesticide use.
     """
 
-    def __init__(self, pd_obj, pd_obj_exp):
-        """Class representing the Therps model and containing all its methods"""
+    def __init__(self, pd_obj, pd_obj_exp, maxima_only=False):
+        """
+        Class representing the Therps model and containing all its methods
+        :param maxima_only: Boolean; when True only the yearly maximum EECs are computed (analytically from the
+                            application schedules) and the daily concentration timeseries are not generated
+        """
         super(Therps, self).__init__()
         self.pd_obj = pd_obj
         self.pd_obj_exp = pd_obj_exp
         self.pd_obj_out = None
+        self.maxima_only = maxima_only
 
     def json(self, pd_obj, pd_obj_out, pd_obj_exp):
         """
@@ -302,60 +307,53 @@ class Therps(UberModel, TherpsInputs, TherpsOutputs, TherpsFunctions):
         # convert application rate and application interval to actual application rate and day of year object series/lists
         self.day_out, self.app_rates = self.convert_app_intervals()
 
-        # time series of daily concentrations (one year + one week) related to each food source
-        self.out_c_ts_sg = self.eec_diet_timeseries(self.food_multiplier_init_sg)  # short grass
-        self.out_c_ts_blp = self.eec_diet_timeseries(self.food_multiplier_init_blp)  # broad-leafed plants
-        self.out_c_ts_fp = self.eec_diet_timeseries(self.food_multiplier_init_fp)  # fruits/pods
-
-        self.out_c_ts_mean_sg = self.eec_diet_timeseries(self.food_multiplier_mean_sg)  # short grass
-        self.out_c_ts_mean_blp = self.eec_diet_timeseries(self.food_multiplier_mean_blp)  # broad-leafed plants
-        self.out_c_ts_mean_fp = self.eec_diet_timeseries(self.food_multiplier_mean_fp)  # fruits/pods
+        # time series of daily concentrations (one year + one week) of the six food sources (initial and mean residues)
+        # computed once per model execution; all dietary/dose based EECs and RQs are derived from their yearly maxima
+        # (only the maxima are computed when only the yearly maxima are requested)
+        self.set_diet_timeseries()
+        if not self.maxima_only:
+            self.out_c_ts_sg = self.eec_diet_timeseries(self.food_multiplier_init_sg)  # short grass
+            self.out_c_ts_blp = self.eec_diet_timeseries(self.food_multiplier_init_blp)  # broad-leafed plants
+            self.out_c_ts_fp = self.eec_diet_timeseries(self.food_multiplier_init_fp)  # fruits/pods
+
+            self.out_c_ts_mean_sg = self.eec_diet_timeseries(self.food_multiplier_mean_sg)  # short grass
+            self.out_c_ts_mean_blp = self.eec_diet_timeseries(self.food_multiplier_mean_blp)  # broad-leafed plants
+            self.out_c_ts_mean_fp = self.eec_diet_timeseries(self.food_multiplier_mean_fp)  # fruits/pods
+
+        # body weights and water contents of the small, medium and large herptiles as (size classes x num_sims) arrays;
+        # the doses (and dose based RQs) of all size classes are derived from them by broadcasting
+        aw_herp = np.array([self.aw_herp_sm, self.aw_herp_md, self.aw_herp_lg], dtype=float)
+        awc_herp = np.array([self.awc_herp_sm, self.awc_herp_md, self.awc_herp_lg], dtype=float)
+        at_bird = self.at_bird(aw_herp)
 
         # Table 5
         self.out_ld50_ad_sm = self.at_bird(self.aw_herp_sm)
         self.out_ld50_ad_md = self.at_bird(self.aw_herp_md)
         self.out_ld50_ad_lg = self.at_bird(self.aw_herp_lg)
 
-        self.out_eec_dose_bp_sm = self.eec_dose_herp(self.aw_herp_sm, self.awc_herp_sm, self.food_multiplier_init_blp)
-        self.out_eec_dose_bp_md = self.eec_dose_herp(self.aw_herp_md, self.awc_herp_md, self.food_multiplier_init_blp)
-        self.out_eec_dose_bp_lg = self.eec_dose_herp(self.aw_herp_lg, self.awc_herp_lg, self.food_multiplier_init_blp)
-        self.out_arq_dose_bp_sm = self.arq_dose_herp(self.aw_herp_sm, self.awc_herp_sm, self.food_multiplier_init_blp)
-        self.out_arq_dose_bp_md = self.arq_dose_herp(self.aw_herp_md, self.awc_herp_md, self.food_multiplier_init_blp)
-        self.out_arq_dose_bp_lg = self.arq_dose_herp(self.aw_herp_lg, self.awc_herp_lg, self.food_multiplier_init_blp)
-
-        self.out_eec_dose_fr_sm = self.eec_dose_herp(self.aw_herp_sm, self.awc_herp_sm, self.food_multiplier_init_fp)
-        self.out_eec_dose_fr_md = self.eec_dose_herp(self.aw_herp_md, self.awc_herp_md, self.food_multiplier_init_fp)
-        self.out_eec_dose_fr_lg = self.eec_dose_herp(self.aw_herp_lg, self.awc_herp_lg, self.food_multiplier_init_fp)
-        self.out_arq_dose_fr_sm = self.arq_dose_herp(self.aw_herp_sm, self.awc_herp_sm, self.food_multiplier_init_fp)
-        self.out_arq_dose_fr_md = self.arq_dose_herp(self.aw_herp_md, self.awc_herp_md, self.food_multiplier_init_fp)
-        self.out_arq_dose_fr_lg = self.arq_dose_herp(self.aw_herp_lg, self.awc_herp_lg, self.food_multiplier_init_fp)
-
-        self.out_eec_dose_hm_md = self.eec_dose_mamm(self.food_multiplier_init_sg, self.aw_herp_md,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_eec_dose_hm_lg = self.eec_dose_mamm(self.food_multiplier_init_sg, self.aw_herp_lg,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_hm_md = self.arq_dose_mamm(self.food_multiplier_init_sg, self.aw_herp_md,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_hm_lg = self.arq_dose_mamm(self.food_multiplier_init_sg, self.aw_herp_lg,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-
-        self.out_eec_dose_im_md = self.eec_dose_mamm(self.food_multiplier_init_fp, self.aw_herp_md,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_eec_dose_im_lg = self.eec_dose_mamm(self.food_multiplier_init_fp, self.aw_herp_lg,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_im_md = self.arq_dose_mamm(self.food_multiplier_init_fp, self.aw_herp_md,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_im_lg = self.arq_dose_mamm(self.food_multiplier_init_fp, self.aw_herp_lg,
-                                                     self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-
-        self.out_eec_dose_tp_md = self.eec_dose_tp(self.food_multiplier_init_blp, self.aw_herp_md,
-                                                   self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_eec_dose_tp_lg = self.eec_dose_tp(self.food_multiplier_init_blp, self.aw_herp_lg,
-                                                   self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_arq_dose_tp_md = self.arq_dose_tp(self.food_multiplier_init_blp, self.aw_herp_md,
-                                                   self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_arq_dose_tp_lg = self.arq_dose_tp(self.food_multiplier_init_blp, self.aw_herp_lg,
-                                                   self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
+        # (broadleaf plants, fruits) x (small, medium, large herptiles)
+        eec_dose_herp = self.eec_dose_herp_classes(aw_herp, awc_herp, [self.food_multiplier_init_blp,
+                                                                       self.food_multiplier_init_fp])
+        (self.out_eec_dose_bp_sm, self.out_eec_dose_bp_md, self.out_eec_dose_bp_lg,
+         self.out_eec_dose_fr_sm, self.out_eec_dose_fr_md, self.out_eec_dose_fr_lg) = \
+            self.array_to_series(eec_dose_herp)
+        (self.out_arq_dose_bp_sm, self.out_arq_dose_bp_md, self.out_arq_dose_bp_lg,
+         self.out_arq_dose_fr_sm, self.out_arq_dose_fr_md, self.out_arq_dose_fr_lg) = \
+            self.array_to_series(eec_dose_herp / at_bird)
+
+        # (herbivorous, insectivorous mammals) x (medium, large herptiles)
+        eec_dose_mamm = self.eec_dose_mamm_classes([self.food_multiplier_init_sg, self.food_multiplier_init_fp],
+                                                   aw_herp[1:], self.bw_frog_prey_mamm, self.mf_w_mamm_2)
+        (self.out_eec_dose_hm_md, self.out_eec_dose_hm_lg,
+         self.out_eec_dose_im_md, self.out_eec_dose_im_lg) = self.array_to_series(eec_dose_mamm)
+        (self.out_arq_dose_hm_md, self.out_arq_dose_hm_lg,
+         self.out_arq_dose_im_md, self.out_arq_dose_im_lg) = self.array_to_series(eec_dose_mamm / at_bird[1:])
+
+        # terrestrial phase amphibians x (medium, large herptiles)
+        eec_dose_tp = self.eec_dose_tp_classes([self.food_multiplier_init_blp], aw_herp[1:], self.bw_frog_prey_herp,
+                                               self.awc_herp_sm, awc_herp[[1, 1]])
+        self.out_eec_dose_tp_md, self.out_eec_dose_tp_lg = self.array_to_series(eec_dose_tp)
+        self.out_arq_dose_tp_md, self.out_arq_dose_tp_lg = self.array_to_series(eec_dose_tp / at_bird[1:])
 
         # Table 6
         self.out_eec_diet_herp_bl = self.eec_diet_max(self.food_multiplier_init_blp)
@@ -394,58 +392,30 @@ class Therps(UberModel, TherpsInputs, TherpsOutputs, TherpsFunctions):
                                                     self.bw_frog_prey_herp, self.awc_herp_sm)
 
         # Table 8
-        self.out_eec_dose_bp_sm_mean = self.eec_dose_herp(self.aw_herp_sm, self.awc_herp_sm,
-                                                          self.food_multiplier_mean_blp)
-        self.out_eec_dose_bp_md_mean = self.eec_dose_herp(self.aw_herp_md, self.awc_herp_md,
-                                                          self.food_multiplier_mean_blp)
-        self.out_eec_dose_bp_lg_mean = self.eec_dose_herp(self.aw_herp_lg, self.awc_herp_lg,
-                                                          self.food_multiplier_mean_blp)
-        self.out_arq_dose_bp_sm_mean = self.arq_dose_herp(self.aw_herp_sm, self.awc_herp_sm,
-                                                          self.food_multiplier_mean_blp)
-        self.out_arq_dose_bp_md_mean = self.arq_dose_herp(self.aw_herp_md, self.awc_herp_md,
-                                                          self.food_multiplier_mean_blp)
-        self.out_arq_dose_bp_lg_mean = self.arq_dose_herp(self.aw_herp_lg, self.awc_herp_lg,
-                                                          self.food_multiplier_mean_blp)
-
-        self.out_eec_dose_fr_sm_mean = self.eec_dose_herp(self.aw_herp_sm, self.awc_herp_sm,
-                                                          self.food_multiplier_mean_fp)
-        self.out_eec_dose_fr_md_mean = self.eec_dose_herp(self.aw_herp_md, self.awc_herp_md,
-                                                          self.food_multiplier_mean_fp)
-        self.out_eec_dose_fr_lg_mean = self.eec_dose_herp(self.aw_herp_lg, self.awc_herp_lg,
-                                                          self.food_multiplier_mean_fp)
-        self.out_arq_dose_fr_sm_mean = self.arq_dose_herp(self.aw_herp_sm, self.awc_herp_sm,
-                                                          self.food_multiplier_mean_fp)
-        self.out_arq_dose_fr_md_mean = self.arq_dose_herp(self.aw_herp_md, self.awc_herp_md,
-                                                          self.food_multiplier_mean_fp)
-        self.out_arq_dose_fr_lg_mean = self.arq_dose_herp(self.aw_herp_lg, self.awc_herp_lg,
-                                                          self.food_multiplier_mean_fp)
-
-        self.out_eec_dose_hm_md_mean = self.eec_dose_mamm(self.food_multiplier_mean_sg, self.aw_herp_md,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_eec_dose_hm_lg_mean = self.eec_dose_mamm(self.food_multiplier_mean_sg, self.aw_herp_lg,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_hm_md_mean = self.arq_dose_mamm(self.food_multiplier_mean_sg, self.aw_herp_md,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_hm_lg_mean = self.arq_dose_mamm(self.food_multiplier_mean_sg, self.aw_herp_lg,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-
-        self.out_eec_dose_im_md_mean = self.eec_dose_mamm(self.food_multiplier_mean_fp, self.aw_herp_md,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_eec_dose_im_lg_mean = self.eec_dose_mamm(self.food_multiplier_mean_fp, self.aw_herp_lg,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_im_md_mean = self.arq_dose_mamm(self.food_multiplier_mean_fp, self.aw_herp_md,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-        self.out_arq_dose_im_lg_mean = self.arq_dose_mamm(self.food_multiplier_mean_fp, self.aw_herp_lg,
-                                                          self.bw_frog_prey_mamm, self.mf_w_mamm_2)
-
-        self.out_eec_dose_tp_md_mean = self.eec_dose_tp(self.food_multiplier_mean_blp, self.aw_herp_md,
-                                                        self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_eec_dose_tp_lg_mean = self.eec_dose_tp(self.food_multiplier_mean_blp, self.aw_herp_lg,
-                                                        self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_arq_dose_tp_md_mean = self.arq_dose_tp(self.food_multiplier_mean_blp, self.aw_herp_md,
-                                                        self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
-        self.out_arq_dose_tp_lg_mean = self.arq_dose_tp(self.food_multiplier_mean_blp, self.aw_herp_lg,
-                                                        self.bw_frog_prey_herp, self.awc_herp_sm, self.awc_herp_md)
+        # (broadleaf plants, fruits) x (small, medium, large herptiles)
+        eec_dose_herp = self.eec_dose_herp_classes(aw_herp, awc_herp, [self.food_multiplier_mean_blp,
+                                                                       self.food_multiplier_mean_fp])
+        (self.out_eec_dose_bp_sm_mean, self.out_eec_dose_bp_md_mean, self.out_eec_dose_bp_lg_mean,
+         self.out_eec_dose_fr_sm_mean, self.out_eec_dose_fr_md_mean, self.out_eec_dose_fr_lg_mean) = \
+            self.array_to_series(eec_dose_herp)
+        (self.out_arq_dose_bp_sm_mean, self.out_arq_dose_bp_md_mean, self.out_arq_dose_bp_lg_mean,
+         self.out_arq_dose_fr_sm_mean, self.out_arq_dose_fr_md_mean, self.out_arq_dose_fr_lg_mean) = \
+            self.array_to_series(eec_dose_herp / at_bird)
+
+        # (herbivorous, insectivorous mammals) x (medium, large herptiles)
+        eec_dose_mamm = self.eec_dose_mamm_classes([self.food_multiplier_mean_sg, self.food_multiplier_mean_fp],
+                                                   aw_herp[1:], self.bw_frog_prey_mamm, self.mf_w_mamm_2)
+        (self.out_eec_dose_hm_md_mean, self.out_eec_dose_hm_lg_mean,
+         self.out_eec_dose_im_md_mean, self.out_eec_dose_im_lg_mean) = self.array_to_series(eec_dose_mamm)
+        (self.out_arq_dose_hm_md_mean, self.out_arq_dose_hm_lg_mean,
+         self.out_arq_dose_im_md_mean, self.out_arq_dose_im_lg_mean) = \
+            self.array_to_series(eec_dose_mamm / at_bird[1:])
+
+        # terrestrial phase amphibians x (medium, large herptiles)
+        eec_dose_tp = self.eec_dose_tp_classes([self.food_multiplier_mean_blp], aw_herp[1:], self.bw_frog_prey_herp,
+                                               self.awc_herp_sm, awc_herp[[1, 1]])
+        self.out_eec_dose_tp_md_mean, self.out_eec_dose_tp_lg_mean = self.array_to_series(eec_dose_tp)
+        self.out_arq_dose_tp_md_mean, self.out_arq_dose_tp_lg_mean = self.array_to_series(eec_dose_tp / at_bird[1:])
 
         # Table 9
         self.out_eec_diet_herp_bl_mean = self.eec_diet_max(self.food_multiplier_mean_blp)
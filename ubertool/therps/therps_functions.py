@@ -8,6 +8,16 @@ class TherpsFunctions(object):
     Function class for Therps.
     """
 
+    def __init__(self):
+        """Class representing the functions for Therps"""
+        super(TherpsFunctions, self).__init__()
+        # food multipliers of the food source timeseries computed once per model execution, the timeseries
+        # ((food sources x num_sims x 371) array) and their yearly maxima ((food sources x num_sims) array)
+        # (see 'set_diet_timeseries')
+        self.food_multipliers = None
+        self.c_ts_foods = None
+        self.c_max_foods = None
+
     def percent_to_frac(self, percent):
         fraction = percent / 100.
         return fraction
@@ -41,25 +51,30 @@ class TherpsFunctions(object):
         """
         method converts number of applications and application interval into application rates and day of year number
         this is so that the same concentration timeseries method from trex_functions can be reused here
+        (per model simulation run views of the compressed sparse row arrays built by 'convert_app_intervals_csr')
         :return:
         """
-        day_out_temp = pd.Series([], dtype = 'object')
-        app_rates_temp = pd.Series([], dtype = 'object')
-
-        for i in range(len(self.num_apps)):  # iterate over number of simulations to process
-            app_rate_temp = pd.Series([self.num_apps[i]*0], dtype='float')
-            app_days_temp = pd.Series([self.num_apps[i]*0], dtype='int')
-            for k in range (0, self.num_apps[i]):  # assign rates and app days per simulation
-                app_rate_temp[k] = self.application_rate[i]
-                if k == 0:
-                    app_days_temp[k] = 1  #changed to 1 to reflect day number rather than list index                       #elif k == 1:
-                        #    app_days_temp[k] = (self.app_interval[i] + app_days_temp[k-1]) - 1
-                else:
-                    app_days_temp[k] = self.app_interval[i] + app_days_temp[k-1]
-            day_out_temp[i] = app_days_temp  #move simulation specific data lists into model objects
-            app_rates_temp[i] = app_rate_temp
+        offsets, day_values, rate_values = self.convert_app_intervals_csr()
+        day_out_temp = pd.Series(np.split(day_values, offsets[1:-1]), dtype='object')
+        app_rates_temp = pd.Series(np.split(rate_values, offsets[1:-1]), dtype='object')
         return day_out_temp, app_rates_temp
 
+    def convert_app_intervals_csr(self):
+        """
+        method converts number of applications and application interval of all model simulation runs into a
+        compressed sparse row (CSR) representation of the application schedules: the application day numbers and
+        rates of run i are day_values[offsets[i]:offsets[i + 1]] and rate_values[offsets[i]:offsets[i + 1]]
+        (applications occur on day 1 and every 'app_interval' days thereafter)
+        :return: offsets, day_values, rate_values
+        """
+        num_apps = np.maximum(np.asarray(self.num_apps, dtype=int), 0)
+        offsets = np.zeros(len(num_apps) + 1, dtype=int)
+        offsets[1:] = np.cumsum(num_apps)
+        sims = np.repeat(np.arange(len(num_apps)), num_apps)  # model simulation run of each application
+        app_number = np.arange(offsets[-1]) - offsets[sims]
+        day_values = 1 + app_number * np.asarray(self.app_interval, dtype=int)[sims]
+        rate_values = np.asarray(self.application_rate, dtype=float)[sims]
+        return offsets, day_values, rate_values
 
     def convert_app_intervals_original(self):
         """
@@ -116,8 +131,11 @@ class TherpsFunctions(object):
         # Acute adjusted toxicity value for birds
         # Note: bird toxicity data is used as surrogate for herptiles due to lack of herptile data
         """
+        # aw_herp may also be a (size classes x num_sims) array of body weights
         adjusted_toxicity = pd.Series([], dtype='float')
-        adjusted_toxicity = self.ld50_bird * ((aw_herp / self.tw_bird_ld50) ** (self.mineau_sca_fact - 1))
+        adjusted_toxicity = np.asarray(self.ld50_bird, dtype=float) * \
+            ((aw_herp / np.asarray(self.tw_bird_ld50, dtype=float)) **
+             (np.asarray(self.mineau_sca_fact, dtype=float) - 1))
         return adjusted_toxicity
 
     def conc_initial(self, i, application_rate, food_multiplier):
@@ -136,57 +154,161 @@ class TherpsFunctions(object):
         method ported from trex_functions
         method calls method to produce a concentration timeseries (daily for 1 yr + a week)
         then scans the time series and extracts the maximum daily concentration for the year
+        (the maxima stored by 'set_diet_timeseries' are used when available)
         """
-        max_concs = pd.Series([], dtype = 'float')
-        temp_ts = pd.Series([], dtype = 'float')
 
-        #get timeseries of daily concentrations for the year (+ a week)
-        temp_ts = self.eec_diet_timeseries(food_multiplier)
         # get maximum daily concentration that occurs during the year for each simulation
-        max_concs = pd.Series([temp_ts[i].max() for i in range(temp_ts.__len__())])
+        max_concs = pd.Series(self.eec_diet_max_foods([food_multiplier])[0], dtype='float')
         return max_concs
 
+    def eec_diet_max_foods(self, food_multipliers):
+        """
+        maximum daily dietary based EECs for the year of several food sources as one (food sources x num_sims) array
+        :param food_multipliers: sequence of food multipliers
+        """
+
+        food_indices = [self.food_index(food_multiplier) for food_multiplier in food_multipliers]
+        if None not in food_indices:
+            return self.c_max_foods[food_indices]
+        if self.maxima_only:
+            # compute the maxima directly from the application schedules (no daily timeseries)
+            return np.array([self.eec_diet_max_analytic(food_multiplier) for food_multiplier in food_multipliers])
+        return self.eec_diet_timeseries_batch(food_multipliers).max(axis=2)
+
+    def food_index(self, food_multiplier):
+        """
+        index of the food source timeseries/maxima stored by 'set_diet_timeseries' (None if not stored)
+        """
+
+        if self.c_max_foods is None:
+            return None
+        matches = np.flatnonzero(self.food_multipliers == food_multiplier)
+        return matches[0] if len(matches) else None
+
+    def eec_diet_max_analytic(self, food_multiplier):
+        """
+        maximum daily dietary based EEC for the year computed without generating the daily timeseries
+        applications are of equal rate and spaced 'app_interval' days apart starting on day 1; with first-order decay
+        the maximum occurs on the last application day within the 371 day window and equals the geometric sum
+            conc_initial * (1 - r**n) / (1 - r), with r = exp(-(ln(2) / foliar_diss_hlife) * app_interval)
+        where n is the number of applications that fall within the window
+        """
+
+        num_apps = np.asarray(self.num_apps, dtype=int)
+        app_interval = np.asarray(self.app_interval, dtype=int)
+        conc_0 = (np.asarray(self.application_rate, dtype=float) * np.asarray(self.frac_act_ing, dtype=float) *
+                  food_multiplier)
+        decay = np.exp(-(np.log(2) / np.asarray(self.foliar_diss_hlife, dtype=float)) * app_interval)
+
+        # applications on non-increasing days (app_interval <= 0) are not processed beyond the first
+        num_apps_window = np.minimum(num_apps, np.where(app_interval > 0, 370 // np.maximum(app_interval, 1) + 1, 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            geometric_sum = np.where(decay < 1., (1. - decay ** num_apps_window) / (1. - decay), num_apps_window)
+        return pd.Series(conc_0 * geometric_sum, dtype='float')
+
     def eec_diet_timeseries(self, food_multiplier):
         """
         method ported from trex_functions
         method produces a concentration timeseries (daily for 1 yr + a week) and extracts the maximum concentration value
         """
         # Dietary based EECs
-        # calculations are performed daily from day of first application through the last day of the year
-        # note: day numbers are synchronized with 0-based array indexing; thus January 1 is the 0th array index
+        # the concentrations are computed for all model simulation runs at once (see 'eec_diet_timeseries_batch') or
+        # taken from the food source timeseries stored by 'set_diet_timeseries'; here each row is repackaged as a
+        # (371,1) array per model simulation run (e.g., for plotting)
         c_temp_1 = pd.Series([], dtype='object')
-        c_temp = pd.Series([], dtype='float')
-        temp_app_indices = pd.Series([], dtype='float')
-        temp_app_rates = pd.Series([], dtype='float')
-        temp_num_apps = pd.Series([], dtype='float')
+        food_index = self.food_index(food_multiplier)
+        if food_index is not None and self.c_ts_foods is not None:
+            c_temp = self.c_ts_foods[food_index]
+        else:
+            c_temp = self.eec_diet_timeseries_batch([food_multiplier])[0]
+        for i in range(len(c_temp)):  #i denotes model simulation run (e.g., within a monte carlo simulation)
+            c_temp_1[i] = c_temp[i].reshape(371, 1)
+        return c_temp_1
+
+    def app_day_rates(self):
+        """
+        method converts the application schedules (self.day_out/self.app_rates) of all model simulation runs into one
+        (num_sims x 371) array of the application rate applied on each day of the year (+ a week), zero on days
+        without an application; only the first 'num_apps' applications on strictly increasing days are used
+        (an application out of sequence ends the processing of the remaining applications of that run)
+        """
 
-        for i in range(len(self.num_apps)):  #i denotes model simulation run (e.g., within a monte carlo simulation)
+        num_sims = len(self.num_apps)
+        num_days = np.array([len(self.day_out[i]) for i in range(num_sims)], dtype=int)
+        num_rates = np.array([len(self.app_rates[i]) for i in range(num_sims)], dtype=int)
+        max_apps = max(min(num_days.max(), num_rates.max()), 1) if num_sims else 1
 
-            c_temp = np.zeros((371, 1))  # empty array to hold the concentrations over days of year (index 0 = Jan 1)
-            app_counter = 0  #iniitalize application number counter for this model simulation run (i)
-            temp_num_apps = self.num_apps[i]
+        # (num_sims x application number) arrays of day indices and rates, padded past the end of each schedule
+        app_indices = np.full((num_sims, max_apps), 371, dtype=int)
+        app_rates = np.zeros((num_sims, max_apps))
+        for i in range(num_sims):  #i denotes model simulation run (e.g., within a monte carlo simulation)
+            num_apps = min(num_days[i], num_rates[i], max_apps)
             #day_out is input as the day number, i.e., 1 - 365, the array indices start at 0, thus the '- 1'
-            #should note that the user input for 'day_out' should be actual day number (i.e., 1 <- day_out <-365)
-            temp_app_indices = np.asarray(self.day_out[i]) - 1
-            temp_app_rates = np.asarray(self.app_rates[i])
-
-            for day_index in range(temp_app_indices[0], 371):     # day number of first application
-                if day_index == temp_app_indices[0]:  # first day of application (single or multiple application model simulation run)
-                    c_temp[day_index] = self.conc_initial(i, temp_app_rates[0], food_multiplier)
-                    app_counter += 1
-                elif app_counter <= temp_num_apps - 1:  # next application day
-                    if day_index == temp_app_indices[app_counter]:
-                        c_temp[day_index] = (self.conc_timestep(i, c_temp[day_index - 1]) +
-                                             self.conc_initial(i, temp_app_rates[app_counter], food_multiplier))
-                        app_counter += 1
-                    else:
-                        c_temp[day_index] = self.conc_timestep(i, c_temp[day_index - 1])
-                else:
-                    #following line allows for all days after last application to be computed
-                    c_temp[day_index] = self.conc_timestep(i, c_temp[day_index - 1])
-            c_temp_1[i] = c_temp #complete set of time series (e.g., for plotting)
-        return c_temp_1
+            app_indices[i, :num_apps] = np.asarray(self.day_out[i][:num_apps], dtype=int) - 1
+            app_rates[i, :num_apps] = np.asarray(self.app_rates[i][:num_apps], dtype=float)
+
+        app_number = np.arange(max_apps)
+        in_sequence = np.ones(app_indices.shape, dtype=bool)
+        in_sequence[:, 1:] = np.diff(app_indices, axis=1) > 0
+        valid_apps = (np.logical_and.accumulate(in_sequence, axis=1) & (app_indices >= 0) & (app_indices < 371) &
+                      ((app_number == 0) | (app_number < np.asarray(self.num_apps, dtype=int)[:, None])))
+
+        day_rates = np.zeros((num_sims, 371))
+        sims, apps = np.nonzero(valid_apps)
+        day_rates[sims, app_indices[sims, apps]] = app_rates[sims, apps]
+        return day_rates
+
+    def eec_diet_timeseries_batch(self, food_multipliers):
+        """
+        Dietary based EECs of several food sources for all model simulation runs as one
+        (food sources x num_sims x 371) array
+        calculations are performed daily for all food sources and model simulation runs at once; each day the
+        concentration of the previous day decays and the residues of an application on that day are added:
+            conc[day] = conc[day - 1] * exp(-ln(2) / foliar_diss_hlife) + conc_initial(app_rate[day], food_multiplier)
+        note: day numbers are synchronized with 0-based array indexing; thus January 1 is the 0th array index
+        :param food_multipliers: sequence of food multipliers
+        """
+
+        food_multipliers = np.asarray(food_multipliers, dtype=float)
+        day_rates = self.app_day_rates()
+        decay = np.exp(-(np.log(2) / np.asarray(self.foliar_diss_hlife, dtype=float)) * 1)
+        # initial concentrations from the applications of each day (see 'conc_initial')
+        conc_0 = (day_rates * np.asarray(self.frac_act_ing, dtype=float)[:, None])[None, :, :] * \
+            food_multipliers[:, None, None]
+
+        c_temp = np.zeros((len(food_multipliers),) + day_rates.shape)
+        c_prev = np.zeros((len(food_multipliers), len(day_rates)))
+        for day_index in range(371):
+            c_prev = c_prev * decay + conc_0[:, :, day_index]
+            c_temp[:, :, day_index] = c_prev
+        return c_temp
+
+    def set_diet_timeseries(self):
+        """
+        compute the concentration timeseries of the six (initial and mean residue) food sources and their yearly
+        maxima once per model execution; all dietary/dose based EECs and RQs are then derived from the maxima
+        (in 'maxima only' runs the maxima are computed from the application schedules and no timeseries are stored)
+        """
+
+        self.food_multipliers = np.array([self.food_multiplier_init_sg, self.food_multiplier_init_blp,
+                                          self.food_multiplier_init_fp, self.food_multiplier_mean_sg,
+                                          self.food_multiplier_mean_blp, self.food_multiplier_mean_fp])
+        self.c_ts_foods = None
+        self.c_max_foods = None
+        if self.maxima_only:
+            self.c_max_foods = self.eec_diet_max_foods(self.food_multipliers)
+        else:
+            self.c_ts_foods = self.eec_diet_timeseries_batch(self.food_multipliers)
+            self.c_max_foods = self.c_ts_foods.max(axis=2)
+        return
+
+    def array_to_series(self, values):
+        """
+        split a (... x num_sims) array into a list of float Series (one per num_sims row, in row-major order)
+        """
 
+        values = np.asarray(values)
+        return [pd.Series(row, dtype='float') for row in values.reshape(int(np.prod(values.shape[:-1])), values.shape[-1])]
 
     def eec_diet_mamm(self, food_multiplier, bw_frog_prey, mf_w_mamm):
         """
@@ -264,6 +386,50 @@ class TherpsFunctions(object):
         amphibian_dose_eec = eec_diet_tp_temp * fi_herp_temp / aw_herp
         return amphibian_dose_eec
 
+    def eec_dose_herp_classes(self, aw_herp, awc_herp, food_multipliers):
+        """
+        amphibian Dose based eecs of several herptile size classes and food sources at once
+        (the dietary maxima of the food sources are broadcast against the body weights of the size classes)
+
+        :param aw_herp: (size classes x num_sims) array of herptile body weights
+        :param awc_herp: (size classes x num_sims) array of herptile water content (fraction)
+        :param food_multipliers: sequence of food multipliers
+        :return: (food sources x size classes x num_sims) array
+        """
+        eec_diet_temp = self.eec_diet_max_foods(food_multipliers)[:, None, :]
+        amphibian_dose = eec_diet_temp * self.fi_herp(aw_herp, awc_herp) / aw_herp
+        return amphibian_dose
+
+    def eec_dose_mamm_classes(self, food_multipliers, aw_herp, bw_frog_prey, mf_w_mamm):
+        """
+        amphibian Dose based eecs for mammals of several herptile size classes and food sources at once
+
+        :param food_multipliers: sequence of food multipliers
+        :param aw_herp: (size classes x num_sims) array of herptile body weights
+        :return: (food sources x size classes x num_sims) array
+        """
+        bw_frog_prey = np.asarray(bw_frog_prey, dtype=float)
+        fi_mamm_temp = self.fi_mamm(bw_frog_prey, np.asarray(mf_w_mamm, dtype=float))
+        eec_diet_mamm_temp = self.eec_diet_max_foods(food_multipliers) * fi_mamm_temp / bw_frog_prey
+        amphibian_dose_eec = (eec_diet_mamm_temp * bw_frog_prey)[:, None, :] / aw_herp
+        return amphibian_dose_eec
+
+    def eec_dose_tp_classes(self, food_multipliers, aw_herp, bw_frog_prey, awc_herp_prey, awc_herp):
+        """
+        amphibian Dose based eecs for terrestrial of several herptile size classes and food sources at once
+
+        :param food_multipliers: sequence of food multipliers
+        :param aw_herp: (size classes x num_sims) array of herptile body weights
+        :param awc_herp_prey: water content (fraction) of the terrestrial phase prey
+        :param awc_herp: (size classes x num_sims) array of herptile water content (fraction)
+        :return: (food sources x size classes x num_sims) array
+        """
+        bw_frog_prey = np.asarray(bw_frog_prey, dtype=float)
+        fi_herp_temp = self.fi_herp(bw_frog_prey, np.asarray(awc_herp_prey, dtype=float))
+        eec_diet_tp_temp = self.eec_diet_max_foods(food_multipliers) * fi_herp_temp / bw_frog_prey
+        amphibian_dose_eec = eec_diet_tp_temp[:, None, :] * self.fi_herp(aw_herp, awc_herp) / aw_herp
+        return amphibian_dose_eec
+
     def arq_dose_herp(self, aw_herp, awc_herp, food_multiplier):
         """
         amphibian acute dose-based risk quotients
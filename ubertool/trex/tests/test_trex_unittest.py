@@ -1003,6 +1003,139 @@ class TestTrex(unittest.TestCase):
             print(tabulate(tab, headers='keys', tablefmt='rst'))
         return
 
+    def test_convert_strlist_csr(self):
+        """
+        unit test for function convert_strlist_csr (series of lists as strings to compressed sparse row arrays);
+        the elements of list i are values[offsets[i]:offsets[i + 1]]; also checks the padded 2-D expansion
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        trex_empty = self.create_trex_object()
+
+        expected_offsets = np.array([0, 1, 4, 6])
+        expected_values = pd.Series([0.34, 0.78, 11.34, 3.54, 2.34, 1.384], dtype='float')
+        expected_padded = np.array([[5, 0, 0], [1, 10, 20], [150, 100, 0]])
+        values = pd.Series([], dtype='float')
+        try:
+            app_rates = pd.Series(['[0.34]', '[0.78, 11.34, 3.54]', '[2.34,1.384]'], dtype='object')
+            day_out = pd.Series(['[5]', '[1, 10, 20]', '[150,100]'], dtype='object')
+            offsets, values = trex_empty.convert_strlist_csr(app_rates, float)
+            npt.assert_array_equal(offsets, expected_offsets, err_msg='', verbose=True)
+            npt.assert_allclose(values, expected_values, rtol=1e-12, err_msg='', verbose=True)
+
+            day_offsets, day_values = trex_empty.convert_strlist_csr(day_out, int)
+            padded, lengths = trex_empty.csr_to_padded(day_offsets, day_values)
+            npt.assert_array_equal(padded, expected_padded, err_msg='', verbose=True)
+            npt.assert_array_equal(lengths, [1, 3, 2], err_msg='', verbose=True)
+        finally:
+            tab = [values, expected_values]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_eec_diet_timeseries_batch(self):
+        """
+        unit test for function eec_diet_timeseries_batch (concentration timeseries for all model simulation runs
+        as a single 2-D array);
+
+        * the application scenarios are those of 'test_eec_diet_max'; selected daily concentrations are checked
+        * days prior to the first application hold zero concentration
+        * the 3rd model simulation run lists its applications out of order, which (as in the daily iteration of the
+        * timeseries) ends the processing of the remaining applications of that run
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        trex_empty = self.create_trex_object()
+
+        expected_results = pd.Series([0., 1.734, 6.791566e-05, 8.555771, 145.341, 17.993127, 0.702, 0.702],
+                                     dtype='float')
+        result = pd.Series([], dtype='float')
+        try:
+            trex_empty.app_rates = pd.Series([[0.34], [0.78, 11.34, 3.54, 1.54], [2.34, 1.384]], dtype='object')
+            trex_empty.day_out = pd.Series([[5], [0, 10, 20, 50], [150, 100]], dtype='object')
+            trex_empty.num_apps = pd.Series([1, 4, 2], dtype='int')
+            trex_empty.frac_act_ing = pd.Series([0.34, 0.84, 0.02])
+            trex_empty.food_multiplier_init_sg = 15.
+            trex_empty.foliar_diss_hlife = pd.Series([25., 5., 45.])
+
+            ts = trex_empty.eec_diet_timeseries_batch(trex_empty.food_multiplier_init_sg)
+            npt.assert_equal(ts.shape, (3, 371), err_msg='', verbose=True)
+            result = pd.Series([ts[0, 3], ts[0, 4], ts[0, 370], ts[1, 0], ts[1, 9], ts[1, 50],
+                                ts[2, 149], ts[2].max()], dtype='float')
+            npt.assert_allclose(result, expected_results, rtol=1e-4, atol=1e-10, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_eec_diet_unit_maxima(self):
+        """
+        unit test for function eec_diet_unit_maxima (maximum daily concentration per unit food multiplier computed from
+        the application schedules without generating the concentration timeseries);
+
+        * the application scenarios are those of 'test_eec_diet_max' (expected results there are for a food multiplier
+        * of 15); the 2nd model simulation run applies on day 0, i.e., prior to Jan 1, and thus peaks on a later
+        * application day; results must match the maxima of the unit-rate timeseries
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        trex_empty = self.create_trex_object()
+
+        expected_results = pd.Series([1.734, 145.3409, 0.702], dtype='float') / 15.
+        result = pd.Series([], dtype='float')
+        try:
+            trex_empty.app_rates = pd.Series([[0.34], [0.78, 11.34, 3.54, 1.54], [2.34, 1.384]], dtype='object')
+            trex_empty.day_out = pd.Series([[5], [0, 10, 20, 50], [150, 250]], dtype='object')
+            trex_empty.num_apps = pd.Series([1, 4, 2], dtype='int')
+            trex_empty.frac_act_ing = pd.Series([0.34, 0.84, 0.02])
+            trex_empty.foliar_diss_hlife = pd.Series([25., 5., 45.])
+
+            result = pd.Series(trex_empty.eec_diet_unit_maxima(), dtype='float')
+            npt.assert_allclose(result, expected_results, rtol=1e-4, atol=0, err_msg='', verbose=True)
+            npt.assert_allclose(result, trex_empty.eec_diet_unit_timeseries().max(axis=1),
+                                rtol=1e-10, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
+    def test_set_unit_timeseries(self):
+        """
+        unit test for function set_unit_timeseries;
+        the unit-rate timeseries is computed once and every food item timeseries/maximum is scaled from it,
+        so the results must match those computed directly for each food multiplier (see 'test_eec_diet_max')
+        """
+
+        # create empty pandas dataframes to create empty object for this unittest
+        trex_empty = self.create_trex_object()
+
+        expected_results = pd.Series([1.734, 145.3409, 0.702, 0.2023, 16.95645, 0.0819], dtype='float')
+        result = pd.Series([], dtype='float')
+        try:
+            trex_empty.app_rates = pd.Series([[0.34], [0.78, 11.34, 3.54, 1.54], [2.34, 1.384]], dtype='object')
+            trex_empty.day_out = pd.Series([[5], [0, 10, 20, 50], [150, 250]], dtype='object')
+            trex_empty.num_apps = pd.Series([1, 4, 2], dtype='int')
+            trex_empty.frac_act_ing = pd.Series([0.34, 0.84, 0.02])
+            trex_empty.foliar_diss_hlife = pd.Series([25., 5., 45.])
+
+            trex_empty.set_unit_timeseries()
+            npt.assert_equal(trex_empty.c_ts_unit.shape, (3, 371), err_msg='', verbose=True)
+            result = pd.concat([trex_empty.eec_diet_max(15.), trex_empty.eec_diet_max(1.75)], ignore_index=True)
+            npt.assert_allclose(result, expected_results, rtol=1e-4, atol=0, err_msg='', verbose=True)
+            npt.assert_allclose(trex_empty.eec_diet_timeseries_batch(15.), 15. * trex_empty.c_ts_unit,
+                                rtol=1e-12, atol=0, err_msg='', verbose=True)
+        finally:
+            tab = [result, expected_results]
+            print("\n")
+            print(inspect.currentframe().f_code.co_name)
+            print(tabulate(tab, headers='keys', tablefmt='rst'))
+        return
+
     def test_eec_dose_bird(self):
         """
         unit test for function eec_dose_bird;
@@ -300,12 +300,17 @@ class Trex(UberModel, TrexInputs, TrexOutputs, TrexFunctions):
     Estimate exposure concentrations and risk quotients for birds and mammals.
     """
 
-    def __init__(self, pd_obj, pd_obj_exp):
-        """Class representing the Trex model and containing all its methods"""
+    def __init__(self, pd_obj, pd_obj_exp, maxima_only=False):
+        """
+        Class representing the Trex model and containing all its methods
+        :param maxima_only: Boolean; when True only the yearly maximum EECs are computed (analytically from the
+                            application schedules) and the daily concentration timeseries are not generated
+        """
         super(Trex, self).__init__()
         self.pd_obj = pd_obj
         self.pd_obj_exp = pd_obj_exp
         self.pd_obj_out = None
+        self.maxima_only = maxima_only
 
     def execute_model(self):
         """
@@ -325,11 +330,12 @@ class Trex(UberModel, TrexInputs, TrexOutputs, TrexFunctions):
     def run_methods(self):
 
         # convert user supplied app_rates/day_out from series of lists as
-        # strings to series of lists as floats/integers
-        self.app_rates = self.convert_strlist_float(self.app_rates)
-        print(self.app_rates)
-        self.day_out = self.convert_strlist_int(self.day_out)
-        print(self.day_out)
+        # strings to compressed sparse row (offsets, values) arrays and to
+        # per model simulation run lists of floats/integers (views of the values)
+        self.app_rates_csr = self.convert_strlist_csr(self.app_rates, float)
+        self.day_out_csr = self.convert_strlist_csr(self.day_out, int)
+        self.app_rates = self.csr_to_lists(*self.app_rates_csr)
+        self.day_out = self.csr_to_lists(*self.day_out_csr)
 
         # Define constants and perform units conversions on necessary raw inputs
         self.set_global_constants()
@@ -359,12 +365,21 @@ class Trex(UberModel, TrexInputs, TrexOutputs, TrexFunctions):
             self.out_c_mean_fp[i] = self.conc_initial(i, self.first_app_rate[i], self.food_multiplier_mean_fp)
             self.out_c_mean_arthro[i] = self.conc_initial(i, self.first_app_rate[i], self.food_multiplier_mean_arthro)
 
-        # time series of daily concentrations (one year + one week) related to each food source
-        self.out_c_ts_sg = self.eec_diet_timeseries(self.food_multiplier_init_sg)  # short grass
-        self.out_c_ts_tg = self.eec_diet_timeseries(self.food_multiplier_init_tg)  # tall grass
-        self.out_c_ts_blp = self.eec_diet_timeseries(self.food_multiplier_init_blp)  # broad-leafed plants
-        self.out_c_ts_fp = self.eec_diet_timeseries(self.food_multiplier_init_fp)  # fruits/pods
-        self.out_c_ts_arthro = self.eec_diet_timeseries(self.food_multiplier_init_arthro)  # arthropods
+        if self.maxima_only:
+            # yearly maxima of the unit-rate concentrations computed directly from the application schedules;
+            # the daily concentration time series are not generated
+            self.set_unit_maxima()
+        else:
+            # unit-rate time series of daily concentrations (one year + one week), computed once per model execution;
+            # the food source time series below and all dietary/dose based EECs and RQs are scaled from it
+            self.set_unit_timeseries()
+
+            # time series of daily concentrations (one year + one week) related to each food source
+            self.out_c_ts_sg = self.eec_diet_timeseries(self.food_multiplier_init_sg)  # short grass
+            self.out_c_ts_tg = self.eec_diet_timeseries(self.food_multiplier_init_tg)  # tall grass
+            self.out_c_ts_blp = self.eec_diet_timeseries(self.food_multiplier_init_blp)  # broad-leafed plants
+            self.out_c_ts_fp = self.eec_diet_timeseries(self.food_multiplier_init_fp)  # fruits/pods
+            self.out_c_ts_arthro = self.eec_diet_timeseries(self.food_multiplier_init_arthro)  # arthropods
 
         # Table5
         self.out_sa_bird_1_s = self.sa_bird_1("small") # Seed treatment acute RQ for small birds method 1
@@ -11,17 +11,67 @@ class TrexFunctions(object):
     def __init__(self):
         """Class representing the functions for Trex"""
         super(TrexFunctions, self).__init__()
+        # unit-rate (food multiplier = 1) concentration timeseries and their maxima; residues scale linearly with
+        # the food multiplier so every food item timeseries is derived from these (see 'set_unit_timeseries')
+        self.c_ts_unit = None
+        self.c_max_unit = None
+        # application schedules of all model simulation runs in compressed sparse row form, i.e., (offsets, values)
+        # pairs where the entries of run i are values[offsets[i]:offsets[i + 1]] (see 'convert_strlist_csr')
+        self.app_rates_csr = None
+        self.day_out_csr = None
 
     def app_rate_parsing(self):
         # extract first day and maximum application rates from each model simulation run
         # these variables are needed in various methods
-        self.first_app_rate = pd.Series([], dtype='float') #series of first_day app rates across model simulations
-        self.max_app_rate = pd.Series([], dtype='float') #series of maximum app_rates across model simulations
-        for i in range(len(self.app_rates)):
-            self.first_app_rate[i] = self.app_rates[i][0]
-            self.max_app_rate[i] = max(self.app_rates[i])
+        offsets, values = self.app_rates_csr if self.app_rates_csr is not None else \
+            self.convert_lists_csr(self.app_rates, float)
+        if len(values) == 0:
+            offsets, values = np.zeros(1, dtype=int), np.zeros(0, dtype=float)  # no application rates supplied
+        self.first_app_rate = pd.Series(values[offsets[:-1]], dtype='float') #series of first_day app rates across model simulations
+        self.max_app_rate = pd.Series(np.maximum.reduceat(values, offsets[:-1]), dtype='float') #series of maximum app_rates across model simulations
         return
 
+    def convert_strlist_csr(self, pd_series_strings, dtype=float):
+        """
+        method converts a panda series of lists whose elements are strings (e.g., '[0.34, 1.2]') into a
+        compressed sparse row (CSR) pair of arrays: 'values' holds the elements of all lists end to end and
+        'offsets' (length = number of lists + 1) marks where each list starts, i.e., the elements of list i
+        are values[offsets[i]:offsets[i + 1]]; all lists are split and converted in one pass
+        """
+        strings = pd.Series(pd_series_strings).astype(str).str.replace('[', '', regex=False).str.replace(']', '', regex=False)
+        offsets = np.zeros(len(strings) + 1, dtype=int)
+        offsets[1:] = np.cumsum(strings.str.count(',').values + 1)
+        if len(strings) == 0:
+            return offsets, np.zeros(0, dtype=dtype)
+        values = np.array(','.join(strings.tolist()).split(',')).astype(dtype)
+        return offsets, values
+
+    def convert_lists_csr(self, lists, dtype=float):
+        """
+        method converts a sequence of lists (e.g., the series of lists of floats/integers returned by
+        'convert_strlist_float'/'convert_strlist_int') into the (offsets, values) pair of 'convert_strlist_csr'
+        """
+        rows = [np.asarray(lists[i], dtype=dtype).ravel() for i in range(len(lists))]
+        offsets = np.zeros(len(rows) + 1, dtype=int)
+        offsets[1:] = np.cumsum([len(row) for row in rows])
+        values = np.concatenate(rows) if rows else np.zeros(0, dtype=dtype)
+        return offsets, values
+
+    def csr_to_lists(self, offsets, values):
+        # per model simulation run views (lists) of a compressed sparse row pair
+        return np.split(values, offsets[1:-1])
+
+    def csr_to_padded(self, offsets, values, fill=0):
+        """
+        method expands a compressed sparse row pair into a 2-D array (model simulation runs x entry number);
+        lists shorter than the longest one are padded with 'fill'; also returns the number of entries per run
+        """
+        lengths = np.diff(offsets)
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        padded = np.full((len(lengths), max(lengths.max() if len(lengths) else 0, 1)), fill, dtype=values.dtype)
+        padded[rows, np.arange(len(values)) - offsets[rows]] = values
+        return padded, lengths
+
     def convert_strlist_float_python27(self, pd_series_strings):
         #method converts a panda series of lists whose elements are strings
         #to a series of lists of floats
@@ -294,47 +344,134 @@ class TrexFunctions(object):
 
         #temp_ts = pd.Series([], dtype = 'float')
 
-        #get timeseries of daily concentrations for the year (+ a week)
-        temp_ts = self.eec_diet_timeseries(food_multiplier)
-        # get maximum daily concentration that occurs during the year
-        max_concs = pd.Series([temp_ts[i].max() for i in range(len(temp_ts))])
+        # get maximum daily concentration that occurs during the year (+ a week); as residues scale linearly with
+        # the food multiplier this is the scaled maximum of the unit-rate timeseries
+        if self.c_max_unit is not None:
+            return pd.Series(food_multiplier * self.c_max_unit, dtype='float')
+        temp_ts = self.eec_diet_timeseries_batch(food_multiplier)
+        max_concs = pd.Series(temp_ts.max(axis=1), dtype='float')
         return max_concs
 
     def eec_diet_timeseries(self, food_multiplier):
         # Dietary based EECs
         # calculations are performed daily from day of first application through the last day of the year
         # note: day numbers are synchronized with 0-based array indexing; thus January 1 is the 0th array index
+        # the concentrations are computed for all model simulation runs at once (see 'eec_diet_timeseries_batch');
+        # here each row is repackaged as a (371,1) array per model simulation run (e.g., for plotting)
         c_temp_1 = pd.Series([], dtype='object')
-        c_temp = pd.Series([], dtype='float')
-        temp_app_indices = pd.Series([], dtype='float')
-        temp_app_rates = pd.Series([], dtype='float')
-        temp_num_apps = pd.Series([], dtype='float')
-
-        for i in range(len(self.num_apps)):  #i denotes model simulation run (e.g., within a monte carlo simulation)
-
-            c_temp = np.zeros((371, 1))  # empty array to hold the concentrations over days of year (index 0 = Jan 1)
-            app_counter = 0  #iniitalize application number counter for this model simulation run (i)
-            temp_num_apps = self.num_apps[i]
-            temp_app_indices = np.asarray(self.day_out[i]) - 1
-            temp_app_rates = np.asarray(self.app_rates[i])
-
-            for day_index in range(temp_app_indices[0], 371):     # day number of first application
-                if day_index == temp_app_indices[0]:  # first day of application (single or multiple application model simulation run)
-                    c_temp[day_index] = self.conc_initial(i, temp_app_rates[0], food_multiplier)
-                    app_counter += 1
-                elif app_counter <= temp_num_apps - 1:  # next application day
-                    if day_index == temp_app_indices[app_counter]:
-                        c_temp[day_index] = (self.conc_timestep(i, c_temp[day_index - 1]) +
-                                             self.conc_initial(i, temp_app_rates[app_counter], food_multiplier))
-                        app_counter += 1
-                    else:
-                        c_temp[day_index] = self.conc_timestep(i, c_temp[day_index - 1])
-                else:
-                    #following line allows for all days after last application to be computed
-                    c_temp[day_index] = self.conc_timestep(i, c_temp[day_index - 1])
-            c_temp_1[i] = c_temp #complete set of time series (e.g., for plotting)
+        c_temp = self.eec_diet_timeseries_batch(food_multiplier)
+        for i in range(len(c_temp)):  #i denotes model simulation run (e.g., within a monte carlo simulation)
+            c_temp_1[i] = c_temp[i].reshape(371, 1)
         return c_temp_1
 
+    def app_schedule_arrays(self):
+        """
+        method converts the application schedules (self.day_out/self.app_rates) of all model simulation runs
+        into 2-D arrays (model simulation runs x application number) of day indices and application rates;
+        the returned boolean mask identifies the applications that the daily timeseries actually uses, i.e.,
+        the first 'num_apps' applications on strictly increasing days that fall within the 371 day window
+        (an application out of sequence ends the processing of the remaining applications of that run)
+        """
+
+        day_offsets, day_values = self.day_out_csr if self.day_out_csr is not None else \
+            self.convert_lists_csr(self.day_out, int)
+        rate_offsets, rate_values = self.app_rates_csr if self.app_rates_csr is not None else \
+            self.convert_lists_csr(self.app_rates, float)
+
+        app_days, num_days = self.csr_to_padded(day_offsets, day_values.astype(int))
+        app_rates, num_rates = self.csr_to_padded(rate_offsets, rate_values.astype(float))
+        max_apps = min(app_days.shape[1], app_rates.shape[1])
+        app_indices = app_days[:, :max_apps] - 1  # day numbers to 0-based array indices
+        app_rates = app_rates[:, :max_apps]
+
+        app_number = np.arange(max_apps)
+        in_sequence = np.ones(app_indices.shape, dtype=bool)
+        in_sequence[:, 1:] = np.diff(app_indices, axis=1) > 0
+        valid_apps = (np.logical_and.accumulate(in_sequence, axis=1) & (app_indices < 371) &
+                      (app_number < np.minimum(num_days, num_rates)[:, None]) &
+                      ((app_number == 0) | (app_number < np.asarray(self.num_apps, dtype=int)[:, None])))
+        return app_indices, app_rates, valid_apps
+
+    def eec_diet_timeseries_batch(self, food_multiplier):
+        """
+        Dietary based EECs for all model simulation runs as one (num_sims x 371) array
+        residues scale linearly with the food multiplier, so the unit-rate timeseries is scaled here; the unit-rate
+        timeseries stored by 'set_unit_timeseries' is used when available
+        """
+
+        if self.c_ts_unit is not None:
+            return food_multiplier * self.c_ts_unit
+        return food_multiplier * self.eec_diet_unit_timeseries()
+
+    def eec_diet_unit_timeseries(self):
+        """
+        Dietary based EECs per unit food multiplier for all model simulation runs as one (num_sims x 371) array
+        concentrations are the superposition of the first-order decay of each application:
+            conc[day] = sum over applications (day >= app_day) of conc_initial(app_rate) * exp(-k * (day - app_day))
+        where k = ln(2) / foliar_diss_hlife; days prior to the first application hold zero concentration
+        """
+
+        app_indices, app_rates, valid_apps = self.app_schedule_arrays()
+        decay_rate = (np.log(2) / np.asarray(self.foliar_diss_hlife, dtype=float))[:, None]
+        frac_act_ing = np.asarray(self.frac_act_ing, dtype=float)
+        days = np.arange(371)
+
+        c_temp = np.zeros((len(app_indices), 371))
+        for k in range(app_indices.shape[1]):  #k denotes application number; each adds its own decay curve
+            elapsed = days - app_indices[:, k][:, None]
+            conc_0 = app_rates[:, k] * frac_act_ing
+            applied = (elapsed >= 0) & valid_apps[:, k][:, None]
+            c_temp += np.where(applied, conc_0[:, None] * np.exp(-decay_rate * np.maximum(elapsed, 0)), 0.)
+        return c_temp
+
+    def eec_diet_unit_maxima(self):
+        """
+        Maximum daily dietary based EEC per unit food multiplier for all model simulation runs, without generating the
+        daily timeseries; with first-order decay between impulse applications the yearly maximum can only occur on an
+        application day (or on Jan 1 for an application preceding it), so the concentration is propagated from one
+        application to the next:
+            conc(app_k) = conc(app_k-1) * exp(-k * (app_day_k - app_day_k-1)) + conc_initial(app_rate_k)
+        """
+
+        app_indices, app_rates, valid_apps = self.app_schedule_arrays()
+        decay_rate = np.log(2) / np.asarray(self.foliar_diss_hlife, dtype=float)
+        frac_act_ing = np.asarray(self.frac_act_ing, dtype=float)
+
+        num_sims = len(app_indices)
+        c_max = np.zeros(num_sims)
+        c_app = np.zeros(num_sims)  # concentration on the day of the most recent application
+        prev_index = app_indices[:, 0]
+        for k in range(app_indices.shape[1]):  #k denotes application number
+            valid = valid_apps[:, k]
+            app_index = app_indices[:, k]
+            c_next = c_app * np.exp(-decay_rate * (app_index - prev_index)) + app_rates[:, k] * frac_act_ing
+            # an application preceding Jan 1 (e.g., day number 0) peaks within the year on Jan 1
+            c_peak = c_next * np.exp(-decay_rate * np.maximum(-app_index, 0))
+            c_max = np.where(valid, np.maximum(c_max, c_peak), c_max)
+            c_app = np.where(valid, c_next, c_app)
+            prev_index = np.where(valid, app_index, prev_index)
+        return c_max
+
+    def set_unit_maxima(self):
+        """
+        'maxima only' counterpart of 'set_unit_timeseries'; stores the yearly maxima of the unit-rate concentrations
+        computed directly from the application schedules (the daily timeseries are not generated)
+        """
+
+        self.c_ts_unit = None
+        self.c_max_unit = self.eec_diet_unit_maxima()
+        return
+
+    def set_unit_timeseries(self):
+        """
+        compute the unit-rate concentration timeseries (and its yearly maxima) once per model execution;
+        all food item timeseries, dietary maxima, doses and risk quotients are then scaled from it
+        """
+
+        self.c_ts_unit = self.eec_diet_unit_timeseries()
+        self.c_max_unit = self.c_ts_unit.max(axis=1)
+        return
+
     def eec_dose_bird(self, aw_bird, mf_w_bird, food_multiplier):
     # Dose based EECs for birds
         fi_bird_temp = self.fi_bird(aw_bird, mf_w_bird)
@@ -1,7 +1,6 @@
 from __future__ import division  #brings in Python 3.0 mixed type calculation rules
 import logging
 import json
-import requests
 import math
 import pandas as pd
 import os
@@ -33,6 +32,7 @@ class VarroapopFunctions(object):
         http_headers = {'Content-Type': 'application/json'}
         logging.info("JSON payload:")
         print(input_json)
+        import requests  # the REST client is only needed when varroapop runs
         return requests.post(called_endpoint, headers=http_headers, data=input_json, timeout=60)
 
 
@@ -159,16 +159,19 @@ class VarroapopFunctions(object):
 
     def get_input_file(self, api_sessionid):
         file_endpoint = (rest_url_varroapop + '/varroapop/files/input/{}'.format(api_sessionid))
+        import requests
         return requests.get(file_endpoint)
 
 
     def get_log_file(self, api_sessionid):
         file_endpoint = (rest_url_varroapop + '/varroapop/files/logs/{}'.format(api_sessionid))
+        import requests
         return requests.get(file_endpoint)
 
 
     def get_results_file(self, api_sessionid):
         file_endpoint = (rest_url_varroapop + '/varroapop/files/output/{}'.format(api_sessionid))
+        import requests
         return requests.get(file_endpoint)
 
 